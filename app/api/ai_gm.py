@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.ai_gm_service import AIGMService
+from .schemas import AIWeekResult, TeamStrategyInfo
+
+router = APIRouter()
+
+@router.post("/week", response_model=AIWeekResult)
+def run_ai_week(
+    season: int,
+    week: int = Query(..., ge=1),
+    user_team_id: Optional[int] = Query(None, description="Team run by the user, skipped by the AI"),
+    workers: Optional[int] = Query(None, ge=1, le=32),
+    seed: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """Run every AI team's weekly roster, injury, extension and cut decisions"""
+    ai_gm_service = AIGMService(db, seed)
+    return ai_gm_service.run_week(season, week, user_team_id, workers)
+
+@router.get("/strategies", response_model=List[TeamStrategyInfo])
+def get_strategies(db: Session = Depends(get_db)):
+    """Get every team's front office philosophy"""
+    ai_gm_service = AIGMService(db)
+    strategies = ai_gm_service.get_strategies()
+    db.commit()
+    return [
+        {"team_id": s.team_id, "philosophy": s.philosophy, "is_user_controlled": s.is_user_controlled}
+        for s in sorted(strategies.values(), key=lambda s: s.team_id)
+    ]
+
+@router.put("/strategies/{team_id}", response_model=TeamStrategyInfo)
+def set_strategy(
+    team_id: int,
+    philosophy: Optional[str] = None,
+    is_user_controlled: Optional[bool] = None,
+    db: Session = Depends(get_db)
+):
+    """Change a team's philosophy or whether the user controls it"""
+    ai_gm_service = AIGMService(db)
+    result = ai_gm_service.set_strategy(team_id, philosophy, is_user_controlled)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.analytics_service import AnalyticsService
+from .schemas import ExpectedPointsTable, TeamEfficiency, PlayerWar
+
+router = APIRouter()
+
+@router.get("/season/{season}/expected-points", response_model=ExpectedPointsTable)
+def get_expected_points(season: int, db: Session = Depends(get_db)):
+    """Get the expected points lookup table built from a season's plays"""
+    analytics_service = AnalyticsService(db)
+    table = analytics_service.get_expected_points_table(season)
+    if not table:
+        raise HTTPException(status_code=404, detail="No plays recorded for season")
+    return table
+
+@router.get("/season/{season}/teams", response_model=List[TeamEfficiency])
+def get_team_efficiency(season: int, db: Session = Depends(get_db)):
+    """Get EPA-based team efficiency ratings for a season"""
+    analytics_service = AnalyticsService(db)
+    return analytics_service.get_team_efficiency(season)
+
+@router.get("/season/{season}/players", response_model=List[PlayerWar])
+def get_player_metrics(
+    season: int,
+    position: Optional[str] = Query(None),
+    limit: int = Query(50),
+    db: Session = Depends(get_db)
+):
+    """Get player EPA and WAR for a season"""
+    analytics_service = AnalyticsService(db)
+    return analytics_service.get_player_metrics(season, position, limit)
+
+@router.get("/player/{player_id}", response_model=PlayerWar)
+def get_player_analytics(player_id: int, season: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Get a player's EPA and WAR line"""
+    analytics_service = AnalyticsService(db)
+    metrics = analytics_service.get_player_war(player_id, season)
+    if not metrics:
+        raise HTTPException(status_code=404, detail="No analytics for player")
+    return metrics
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from ..services.response_cache import response_cache
+from .schemas import CacheMetrics, SuccessResponse
+
+router = APIRouter()
+
+@router.get("/metrics", response_model=CacheMetrics)
+def get_cache_metrics():
+    """Response cache hit ratio, size, evictions and invalidations"""
+    return response_cache.get_metrics()
+
+@router.delete("/", response_model=SuccessResponse)
+def clear_cache():
+    """Drop every cached response"""
+    response_cache.clear()
+    return {"success": True}
@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.draft_class_service import DraftClassService
+from ..services.draft_service import DraftService
+from ..services.compensatory_pick_service import CompensatoryPickService
+from .schemas import (
+    DraftClassResult, DraftProspectItem, CompensatoryPicks, CompensatoryAward, MockDraftResult,
+    DraftRunResult, DraftResultItem, DraftSigningResult
+)
+
+router = APIRouter()
+
+@router.post("/classes", response_model=DraftClassResult)
+def generate_draft_class(
+    year: Optional[int] = Query(None, description="Draft year; defaults to the current league year"),
+    size: int = Query(300, ge=1, le=100000, description="Number of prospects"),
+    class_strength: Optional[float] = Query(None, description="Class strength in standard deviations"),
+    seed: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Generate and store a draft class"""
+    draft_class_service = DraftClassService(db, seed)
+    result = draft_class_service.generate_class(year, size, class_strength)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@router.get("/classes/{year}", response_model=List[DraftProspectItem])
+def get_draft_class(
+    year: int,
+    position: Optional[str] = Query(None),
+    available_only: bool = Query(False),
+    limit: int = Query(100),
+    db: Session = Depends(get_db)
+):
+    """Get a draft class ordered by consensus rank"""
+    draft_class_service = DraftClassService(db)
+    return draft_class_service.get_draft_class(year, position, limit, available_only)
+
+@router.get("/compensatory/{year}", response_model=CompensatoryPicks)
+def get_compensatory_picks(year: int, db: Session = Depends(get_db)):
+    """Compensatory picks earned in a free agency period, for the following year's draft"""
+    compensatory_pick_service = CompensatoryPickService(db)
+    return compensatory_pick_service.calculate(year)
+
+@router.post("/compensatory/{year}/award", response_model=CompensatoryAward)
+def award_compensatory_picks(year: int, db: Session = Depends(get_db)):
+    """Award a free agency period's compensatory picks into the next draft"""
+    compensatory_pick_service = CompensatoryPickService(db)
+    return compensatory_pick_service.award(year)
+
+@router.get("/{year}/mock", response_model=MockDraftResult)
+def run_mock_drafts(
+    year: int,
+    simulations: int = Query(1000, ge=1, le=20000),
+    workers: Optional[int] = Query(None, ge=1),
+    limit: int = Query(100),
+    seed: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Run Monte Carlo mock drafts and report each prospect's pick range"""
+    draft_service = DraftService(db, seed)
+    result = draft_service.run_mock_drafts(year, simulations, workers, limit)
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    return result
+
+@router.post("/{year}/run", response_model=DraftRunResult)
+def run_draft(year: int, seed: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Hold the draft: all 7 rounds picked by the AI teams"""
+    draft_service = DraftService(db, seed)
+    result = draft_service.run_draft(year)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@router.get("/{year}/results", response_model=List[DraftResultItem])
+def get_draft_results(year: int, team_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Get the picks made in a draft"""
+    draft_service = DraftService(db)
+    return draft_service.get_draft_results(year, team_id)
+
+@router.post("/{year}/sign", response_model=DraftSigningResult)
+def sign_draft_class(year: int, db: Session = Depends(get_db)):
+    """Sign every drafted rookie to a slotted contract and report each team's rookie cap impact"""
+    draft_service = DraftService(db)
+    result = draft_service.sign_draft_class(year)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
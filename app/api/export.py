@@ -0,0 +1,38 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Iterator, Optional
+from ..database.connection import session_factory
+from ..services.export_service import ExportService, EXPORT_FORMATS, DEFAULT_CHUNK_SIZE
+
+router = APIRouter()
+
+def _stream(sessions, table: str, format: str, filters: dict, chunk_size: int) -> Iterator[bytes]:
+    # The stream outlives the request handler, so it holds its own session
+    db = sessions()
+    try:
+        yield from ExportService(db, chunk_size).export(table, format, filters)
+    finally:
+        db.close()
+
+@router.get("/{table}")
+def export_table(
+    table: str,
+    format: str = Query("csv", description="csv, ndjson or parquet"),
+    season: Optional[int] = Query(None, description="Season, or league year for cap tables"),
+    team_id: Optional[int] = Query(None),
+    player_id: Optional[int] = Query(None),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=100000),
+):
+    """Stream a whole table as a file download"""
+    filters = {"season": season, "team_id": team_id, "player_id": player_id}
+    try:
+        ExportService.check_export(table, format, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        _stream(session_factory(), table, format, filters, chunk_size),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{table}.{extension}"'}
+    )
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..database.connection import get_db
+from ..services.free_agency_service import FreeAgencyService, FREE_AGENCY_DAYS, benchmark_market
+from .schemas import FreeAgencyResult, MarketBenchmark
+
+router = APIRouter()
+
+@router.post("/run", response_model=FreeAgencyResult, response_model_exclude_unset=True)
+def run_free_agency(
+    days: int = Query(FREE_AGENCY_DAYS, ge=1, le=120),
+    seed: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """Run the whole league's free agency: every team bids, players choose, signings cascade"""
+    free_agency_service = FreeAgencyService(db, seed)
+    return free_agency_service.run_free_agency(days=days)
+
+@router.get("/benchmark", response_model=MarketBenchmark)
+def benchmark(
+    free_agents: int = Query(500, ge=1, le=20000),
+    teams: int = Query(32, ge=2, le=64),
+    days: int = Query(FREE_AGENCY_DAYS, ge=1, le=120),
+    seed: Optional[int] = None
+):
+    """Time the market engine on a synthetic league without touching the database"""
+    return benchmark_market(free_agents, teams, days=days, seed=seed)
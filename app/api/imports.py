@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..database.connection import get_db
+from ..services.import_service import ImportService, DEFAULT_BATCH_SIZE
+from .schemas import ImportResult
+
+router = APIRouter()
+
+@router.post("/{table}", response_model=ImportResult)
+def import_table(
+    table: str,
+    file: UploadFile = File(..., description="NDJSON or CSV rows"),
+    format: Optional[str] = Query(None, description="ndjson or csv; defaults to the file extension"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=100000),
+    db: Session = Depends(get_db)
+):
+    """Upsert players or contracts from an uploaded file, reporting rows that fail validation"""
+    format = format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    try:
+        ImportService.check_import(table, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ImportService(db, batch_size).import_rows(table, file.file, format)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.injury_service import InjuryService
+from .schemas import InjuryReportItem, InjuryWeekResult
+
+router = APIRouter()
+
+@router.get("/report", response_model=List[InjuryReportItem])
+def get_injury_report(team_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Get active injuries, league-wide or for one team"""
+    injury_service = InjuryService(db)
+    return injury_service.get_injury_report(team_id)
+
+@router.post("/process-week", response_model=InjuryWeekResult)
+def process_injury_week(
+    season: int = Query(...),
+    week: int = Query(...),
+    seed: Optional[int] = Query(None, description="Seed for a reproducible injury draw"),
+    db: Session = Depends(get_db)
+):
+    """Run the weekly injury simulation for every rostered player"""
+    injury_service = InjuryService(db, seed)
+    return injury_service.process_week(season, week)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.journal_service import TransactionJournal, EVENT_TYPES, DEFAULT_CONSUMER_BATCH
+from ..services.response_cache import response_cache
+from .schemas import JournalEventItem, JournalConsumerState, JournalCatchUp, JournalCapTotals
+
+router = APIRouter()
+
+@router.get("/events", response_model=List[JournalEventItem])
+def get_events(
+    after: int = Query(0, ge=0, description="Offset to read from; only later events are returned"),
+    limit: int = Query(DEFAULT_CONSUMER_BATCH, ge=1, le=10000),
+    event_type: Optional[str] = Query(None, description=", ".join(EVENT_TYPES)),
+    team_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Journal events past an offset, oldest first"""
+    if event_type and event_type not in EVENT_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unknown event type: {event_type}")
+    return TransactionJournal(db).events(after, limit, event_type, team_id)
+
+@router.get("/consumers", response_model=List[JournalConsumerState])
+def get_consumers(db: Session = Depends(get_db)):
+    """Derived views fed by the journal, with their offsets and lag"""
+    return TransactionJournal(db).get_consumers()
+
+@router.post("/consumers/{name}/catch-up", response_model=JournalCatchUp)
+def catch_up(name: str, db: Session = Depends(get_db)):
+    """Apply the events a consumer has not seen yet"""
+    try:
+        result = TransactionJournal(db).catch_up(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result["events_applied"]:
+        response_cache.clear()
+    return result
+
+@router.post("/consumers/{name}/replay", response_model=JournalCatchUp)
+def replay(
+    name: str,
+    to_offset: Optional[int] = Query(None, ge=0, description="Offset to rebuild the view as of; the latest by default"),
+    db: Session = Depends(get_db)
+):
+    """Rebuild a consumer's view from the journal as it stood at an offset"""
+    try:
+        result = TransactionJournal(db).replay(name, to_offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result["events_applied"]:
+        response_cache.clear()
+    return result
+
+@router.get("/cap-ledger", response_model=List[JournalCapTotals])
+def get_cap_ledger(year: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Team cap totals folded from the journal by the team_cap_totals consumer"""
+    return TransactionJournal(db).get_cap_ledger(year)
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from ..database.connection import get_db
+from ..services.salary_cap_service import SalaryCapService
+from ..services.offseason_service import OffseasonService
+from ..services.season_service import SeasonService
+from .schemas import LeagueSeason, RolloverResult, ScheduleResult, WeekSimulation, StandingsRow, PlayoffResult
+
+router = APIRouter()
+
+@router.get("/season", response_model=LeagueSeason)
+def get_current_season(db: Session = Depends(get_db)):
+    """Get the current league year"""
+    salary_service = SalaryCapService(db)
+    return {
+        "current_year": salary_service.current_year,
+        "salary_cap": salary_service.get_current_salary_cap()
+    }
+
+@router.post("/rollover", response_model=RolloverResult)
+def rollover_season(
+    seed: Optional[int] = Query(None, description="Seed for reproducible progression"),
+    db: Session = Depends(get_db)
+):
+    """Advance the league to the next season"""
+    offseason_service = OffseasonService(db, seed)
+    
+    try:
+        return offseason_service.rollover_season()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error rolling over season: {str(e)}")
+
+@router.post("/schedule", response_model=ScheduleResult)
+def generate_schedule(season: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Generate the regular season schedule"""
+    season_service = SeasonService(db)
+    result = season_service.generate_schedule(season)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@router.post("/week/{week}/simulate", response_model=WeekSimulation)
+def simulate_week(
+    week: int,
+    season: Optional[int] = Query(None),
+    seed: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Simulate all unplayed games in a week"""
+    season_service = SeasonService(db, seed)
+    if season is None:
+        season = season_service.salary_cap_service.current_year
+    return season_service.simulate_week(season, week)
+
+@router.get("/standings", response_model=Dict[str, List[StandingsRow]])
+def get_standings(season: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Get standings by conference"""
+    season_service = SeasonService(db)
+    if season is None:
+        season = season_service.salary_cap_service.current_year
+    return season_service.get_standings(season)
+
+@router.post("/playoffs", response_model=PlayoffResult)
+def run_playoffs(
+    season: Optional[int] = Query(None),
+    seed: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Simulate the playoffs for a season"""
+    season_service = SeasonService(db, seed)
+    if season is None:
+        season = season_service.salary_cap_service.current_year
+    result = season_service.run_playoffs(season)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
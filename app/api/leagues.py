@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+from ..database.connection import league_pool
+from ..services.league_service import LeagueService
+from .schemas import LeagueInfo, LeaguePoolMetrics
+
+router = APIRouter()
+
+@router.get("/", response_model=List[LeagueInfo])
+def list_leagues():
+    """Every hosted league; send its id in the X-League-Id header to use it"""
+    return LeagueService().list_leagues()
+
+@router.get("/pool", response_model=LeaguePoolMetrics)
+def get_pool_metrics():
+    """Open leagues, most recently used first, with open, evicted and idle-closed counts"""
+    return league_pool.get_metrics()
+
+@router.post("/pool/close-idle", response_model=List[str])
+def close_idle_leagues(max_idle_seconds: Optional[float] = Query(None, ge=0)):
+    """Close leagues idle for this long (the pool's idle timeout by default)"""
+    return league_pool.close_idle(max_idle_seconds)
+
+@router.post("/{league_id}", response_model=LeagueInfo)
+def create_league(league_id: str, template: Optional[str] = Query(None, description="League to copy")):
+    """Create a hosted league, seeded with the default teams and players or copied from another league"""
+    try:
+        return LeagueService().create_league(league_id, template)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
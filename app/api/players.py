@@ -1,51 +1,63 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..database.connection import get_db
 from ..database.models import Player, Team
-from ..services.player_service import PlayerService
+from ..services.player_service import PlayerService, parse_player_fields
 from ..services.player_evaluation import PlayerEvaluationService
+from .schemas import (
+    PlayerListItem, PlayerDetail, PlayerEvaluation, PlayerSearchResult, TopPlayer, DepthChartPlayer
+)
 
 router = APIRouter()
 
-@router.get("/")
+def player_fields(
+    fields: Optional[str] = Query(None, description="Comma separated fields to return, e.g. id,name,position")
+) -> Optional[List[str]]:
+    """Sparse fieldset dependency shared by the player and roster endpoints
+    
+    Sparse rows are plain JSON values already, so they are returned as they
+    are rather than through the endpoint's response model.
+    """
+    try:
+        return parse_player_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=List[PlayerListItem])
 def get_players(
     team_id: Optional[int] = Query(None),
     position: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     limit: int = Query(50),
     offset: int = Query(0),
+    fields: Optional[List[str]] = Depends(player_fields),
     db: Session = Depends(get_db)
 ):
     """Get players with filtering options"""
-    query = db.query(Player)
-    
+    criteria = []
     if team_id:
-        query = query.filter(Player.team_id == team_id)
+        criteria.append(Player.team_id == team_id)
     if position:
-        query = query.filter(Player.position == position.upper())
+        criteria.append(Player.position == position.upper())
     if status:
-        query = query.filter(Player.roster_status == status)
+        criteria.append(Player.roster_status == status)
     
-    players = query.offset(offset).limit(limit).all()
+    if fields:
+        return ORJSONResponse(PlayerService(db).select_player_fields(fields, *criteria, offset=offset, limit=limit))
     
-    return [
-        {
-            "id": player.id,
-            "name": f"{player.first_name} {player.last_name}",
-            "position": player.position,
-            "jersey_number": player.jersey_number,
-            "age": player.age,
-            "overall_rating": player.overall_rating,
-            "team_id": player.team_id,
-            "roster_status": player.roster_status
-        }
-        for player in players
-    ]
+    return db.query(Player).filter(*criteria).offset(offset).limit(limit).all()
 
-@router.get("/{player_id}")
-def get_player(player_id: int, db: Session = Depends(get_db)):
+@router.get("/{player_id}", response_model=PlayerDetail)
+def get_player(player_id: int, fields: Optional[List[str]] = Depends(player_fields), db: Session = Depends(get_db)):
     """Get detailed player information"""
+    if fields:
+        selected = PlayerService(db).select_player_fields(fields, Player.id == player_id)
+        if not selected:
+            raise HTTPException(status_code=404, detail="Player not found")
+        return ORJSONResponse(selected[0])
+    
     player = db.query(Player).filter(Player.id == player_id).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -81,7 +93,7 @@ def get_player(player_id: int, db: Session = Depends(get_db)):
         }
     }
 
-@router.get("/{player_id}/evaluation")
+@router.get("/{player_id}/evaluation", response_model=PlayerEvaluation, response_model_exclude_unset=True)
 def get_player_evaluation(player_id: int, db: Session = Depends(get_db)):
     """Get comprehensive player evaluation"""
     player = db.query(Player).filter(Player.id == player_id).first()
@@ -115,53 +127,40 @@ def get_player_evaluation(player_id: int, db: Session = Depends(get_db)):
     
     return evaluation
 
-@router.get("/search/{search_term}")
+@router.get("/search/{search_term}", response_model=List[PlayerSearchResult])
 def search_players(
     search_term: str,
     team_id: Optional[int] = Query(None),
+    fields: Optional[List[str]] = Depends(player_fields),
     db: Session = Depends(get_db)
 ):
     """Search players by name"""
     player_service = PlayerService(db)
-    players = player_service.search_players(search_term, team_id)
-    
-    return [
-        {
-            "id": player.id,
-            "name": f"{player.first_name} {player.last_name}",
-            "position": player.position,
-            "age": player.age,
-            "overall_rating": player.overall_rating,
-            "team_id": player.team_id
-        }
-        for player in players
-    ]
+    if fields:
+        return ORJSONResponse(
+            player_service.select_player_fields(fields, *player_service.search_criteria(search_term, team_id))
+        )
+    return player_service.search_players(search_term, team_id)
 
-@router.get("/positions/{position}/top")
+@router.get("/positions/{position}/top", response_model=List[TopPlayer])
 def get_top_players_by_position(
     position: str,
     limit: int = Query(10),
+    fields: Optional[List[str]] = Depends(player_fields),
     db: Session = Depends(get_db)
 ):
     """Get top players by position"""
-    players = db.query(Player).filter(
+    if fields:
+        return ORJSONResponse(PlayerService(db).select_player_fields(
+            fields, Player.position == position.upper(), Player.roster_status == "active",
+            order_by=Player.overall_rating.desc(), limit=limit
+        ))
+    return db.query(Player).filter(
         Player.position == position.upper(),
         Player.roster_status == "active"
     ).order_by(Player.overall_rating.desc()).limit(limit).all()
-    
-    return [
-        {
-            "id": player.id,
-            "name": f"{player.first_name} {player.last_name}",
-            "overall_rating": player.overall_rating,
-            "age": player.age,
-            "years_pro": player.years_pro,
-            "team_id": player.team_id
-        }
-        for player in players
-    ]
 
-@router.get("/team/{team_id}/depth-chart")
+@router.get("/team/{team_id}/depth-chart", response_model=Dict[str, List[DepthChartPlayer]])
 def get_team_depth_chart(team_id: int, db: Session = Depends(get_db)):
     """Get team depth chart by position"""
     player_service = PlayerService(db)
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database.connection import get_db
+from ..services.roster_service import RosterService, CONTRACT_MOVES
+from ..services.contract_service import ContractService
+from .schemas import TeamRosterLimits, RosterMoveBatch
+
+router = APIRouter()
+
+class RosterMove(BaseModel):
+    type: str  # sign, sign_practice_squad, release, promote, demote, move_to_ir, activate_from_ir
+    player_id: int
+    team_id: Optional[int] = None
+    # Terms of a signing's contract; the league minimum for one year if left out
+    base_salary: Optional[int] = None
+    years: Optional[int] = None
+
+@router.get("/team/{team_id}/limits", response_model=TeamRosterLimits)
+def get_team_limits(team_id: int, db: Session = Depends(get_db)):
+    """A team's roster counts against the active, practice squad, IR and position limits"""
+    roster_service = RosterService(db)
+    return roster_service.get_team_limits(team_id)
+
+@router.post("/moves/validate", response_model=RosterMoveBatch, response_model_exclude_unset=True)
+def validate_moves(moves: List[RosterMove], db: Session = Depends(get_db)):
+    """Dry-run a batch of roster moves in order and report every violation"""
+    roster_service = RosterService(db, contract_moves=True)
+    return roster_service.validate_moves([move.model_dump() for move in moves])
+
+@router.post("/moves", response_model=RosterMoveBatch, response_model_exclude_unset=True)
+def execute_moves(moves: List[RosterMove], db: Session = Depends(get_db)):
+    """Apply a batch of roster moves, all or nothing; signings and releases also make or end contracts"""
+    if any(move.type in CONTRACT_MOVES for move in moves):
+        return ContractService(db).execute_roster_moves([move.model_dump() for move in moves])
+    roster_service = RosterService(db)
+    return roster_service.execute_moves([move.model_dump() for move in moves])
@@ -1,23 +1,40 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional, Union
 from ..database.connection import get_db
 from ..services.salary_cap_service import SalaryCapService
 from ..services.contract_service import ContractService
+from .schemas import (
+    ErrorMessage, Message, SalaryCapOverview, TeamSalaryCap, TeamCapSummary, TeamContractSummary,
+    ContractAnalysis, RestructureResult, ReleaseResult, FranchiseTagResult, ExtensionResult,
+    OfferOptimization, ContractHistoryItem, LeagueCapOverview, CapTransactionBatch
+)
 
 router = APIRouter()
 
-@router.get("/overview")
+class CapTransaction(BaseModel):
+    type: str  # restructure, release, extend, franchise_tag
+    contract_id: Optional[int] = None
+    restructure_amount: Optional[int] = None
+    post_june_1: bool = False
+    player_id: Optional[int] = None
+    team_id: Optional[int] = None
+    base_salary: Optional[int] = None
+    years: Optional[int] = None
+    signing_bonus: int = 0
+
+@router.get("/overview", response_model=SalaryCapOverview)
 def get_salary_cap_overview(db: Session = Depends(get_db)):
     """Get overall salary cap information"""
     salary_service = SalaryCapService(db)
     
     return {
         "current_salary_cap": salary_service.get_current_salary_cap(),
-        "cap_year": "2024"
+        "cap_year": str(salary_service.current_year)
     }
 
-@router.get("/team/{team_id}")
+@router.get("/team/{team_id}", response_model=TeamSalaryCap)
 def get_team_salary_cap(team_id: int, db: Session = Depends(get_db)):
     """Get salary cap information for a specific team"""
     salary_service = SalaryCapService(db)
@@ -28,7 +45,7 @@ def get_team_salary_cap(team_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating salary cap: {str(e)}")
 
-@router.get("/team/{team_id}/summary")
+@router.get("/team/{team_id}/summary", response_model=TeamCapSummary)
 def get_team_cap_summary(team_id: int, db: Session = Depends(get_db)):
     """Get comprehensive cap summary for a team"""
     salary_service = SalaryCapService(db)
@@ -39,7 +56,7 @@ def get_team_cap_summary(team_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting cap summary: {str(e)}")
 
-@router.get("/team/{team_id}/contracts")
+@router.get("/team/{team_id}/contracts", response_model=Union[TeamContractSummary, ErrorMessage])
 def get_team_contracts(team_id: int, db: Session = Depends(get_db)):
     """Get all contracts for a team"""
     contract_service = ContractService(db)
@@ -50,7 +67,7 @@ def get_team_contracts(team_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving contracts: {str(e)}")
 
-@router.get("/contract/{contract_id}")
+@router.get("/contract/{contract_id}", response_model=Union[ContractAnalysis, ErrorMessage])
 def get_contract_analysis(contract_id: int, db: Session = Depends(get_db)):
     """Get detailed analysis of a specific contract"""
     contract_service = ContractService(db)
@@ -61,7 +78,7 @@ def get_contract_analysis(contract_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing contract: {str(e)}")
 
-@router.post("/contract/{contract_id}/restructure")
+@router.post("/contract/{contract_id}/restructure", response_model=RestructureResult)
 def restructure_contract(
     contract_id: int, 
     restructure_amount: int = Query(..., description="Amount to restructure in dollars"),
@@ -78,7 +95,7 @@ def restructure_contract(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error restructuring contract: {str(e)}")
 
-@router.post("/contract/{contract_id}/release")
+@router.post("/contract/{contract_id}/release", response_model=ReleaseResult)
 def release_player(
     contract_id: int,
     post_june_1: bool = Query(False, description="Whether to use post-June 1 designation"),
@@ -95,7 +112,7 @@ def release_player(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error releasing player: {str(e)}")
 
-@router.post("/player/{player_id}/franchise-tag")
+@router.post("/player/{player_id}/franchise-tag", response_model=FranchiseTagResult)
 def franchise_tag_player(
     player_id: int,
     team_id: int = Query(..., description="Team ID to apply franchise tag"),
@@ -112,17 +129,18 @@ def franchise_tag_player(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error applying franchise tag: {str(e)}")
 
-@router.post("/player/{player_id}/extend")
+@router.post("/player/{player_id}/extend", response_model=ExtensionResult, response_model_exclude_unset=True)
 def extend_player_contract(
     player_id: int,
     team_id: int = Query(..., description="Team ID for the extension"),
     base_salary: int = Query(..., description="Base salary per year"),
     years: int = Query(..., description="Contract length in years"),
     signing_bonus: int = Query(0, description="Signing bonus amount"),
+    seed: Optional[int] = Query(None, description="Seed to make the player's decision reproducible"),
     db: Session = Depends(get_db)
 ):
     """Negotiate a contract extension with a player"""
-    contract_service = ContractService(db)
+    contract_service = ContractService(db, seed)
     
     try:
         result = contract_service.negotiate_contract_extension(
@@ -134,7 +152,38 @@ def extend_player_contract(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error negotiating extension: {str(e)}")
 
-@router.get("/player/{player_id}/contract")
+@router.post("/transactions", response_model=CapTransactionBatch)
+def execute_transactions(
+    operations: List[CapTransaction],
+    seed: Optional[int] = Query(None, description="Seed to make extension decisions reproducible"),
+    db: Session = Depends(get_db)
+):
+    """Apply restructures, releases, extensions and franchise tags in order, all or nothing"""
+    contract_service = ContractService(db, seed)
+    
+    try:
+        return contract_service.execute_transactions([op.model_dump() for op in operations])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error applying transactions: {str(e)}")
+
+@router.get("/player/{player_id}/offer-optimizer", response_model=OfferOptimization)
+def optimize_offer(
+    player_id: int,
+    team_id: int = Query(..., description="Team making the offer"),
+    targets: Optional[List[float]] = Query(None, description="Target acceptance probabilities (0-1)"),
+    db: Session = Depends(get_db)
+):
+    """Cheapest offers by contract length that reach each target acceptance chance"""
+    contract_service = ContractService(db)
+    
+    if targets and any(not 0 < target < 1 for target in targets):
+        raise HTTPException(status_code=400, detail="Targets must be between 0 and 1")
+    result = contract_service.optimize_offer(player_id, team_id, targets)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@router.get("/player/{player_id}/contract", response_model=Union[ContractAnalysis, Message, ErrorMessage])
 def get_player_contract(player_id: int, db: Session = Depends(get_db)):
     """Get current contract for a player"""
     contract_service = ContractService(db)
@@ -150,7 +199,7 @@ def get_player_contract(player_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving player contract: {str(e)}")
 
-@router.get("/player/{player_id}/contract-history")
+@router.get("/player/{player_id}/contract-history", response_model=List[ContractHistoryItem])
 def get_player_contract_history(player_id: int, db: Session = Depends(get_db)):
     """Get contract history for a player"""
     contract_service = ContractService(db)
@@ -173,7 +222,7 @@ def get_player_contract_history(player_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving contract history: {str(e)}")
 
-@router.get("/league/overview")
+@router.get("/league/overview", response_model=LeagueCapOverview)
 def get_league_cap_overview(db: Session = Depends(get_db)):
     """Get league-wide salary cap overview"""
     salary_service = SalaryCapService(db)
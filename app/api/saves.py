@@ -0,0 +1,50 @@
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from typing import List, Optional
+from ..services.save_service import SaveService
+from .schemas import SaveSlotInfo, SaveSlotResult, SuccessResponse
+
+router = APIRouter()
+
+@router.get("/", response_model=List[SaveSlotInfo])
+def list_saves():
+    """Every save slot with its league metadata, most recently used first"""
+    return SaveService().list_slots()
+
+@router.post("/{name}", response_model=SaveSlotResult)
+def save_league(
+    name: str,
+    background_tasks: BackgroundTasks,
+    description: Optional[str] = Query(None),
+    overwrite: bool = Query(False, description="Replace an existing save with the same name"),
+):
+    """Snapshot the league into a named save slot"""
+    save_service = SaveService()
+    try:
+        result = save_service.save(name, description, overwrite)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Gzip slots that fell out of recent use once the response is sent
+    background_tasks.add_task(save_service.compress_old_slots)
+    return result
+
+@router.post("/{name}/load", response_model=SaveSlotResult)
+def load_league(name: str):
+    """Replace the league with a saved slot"""
+    save_service = SaveService()
+    try:
+        if save_service.get_slot(name) is None:
+            raise HTTPException(status_code=404, detail=f"No save named {name}")
+        return save_service.load(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.delete("/{name}", response_model=SuccessResponse)
+def delete_save(name: str):
+    """Delete a save slot"""
+    try:
+        deleted = SaveService().delete(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"No save named {name}")
+    return {"success": True}
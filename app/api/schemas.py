@@ -0,0 +1,954 @@
+"""Response models for the API routers.
+
+Endpoints declare these as response_model so FastAPI validates and
+serializes responses with pydantic-core instead of walking them with
+jsonable_encoder. Row models marked from_attributes map ORM objects
+directly, without building a dict per player first.
+"""
+from datetime import datetime
+import json
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+
+class ErrorMessage(BaseModel):
+    error: str
+
+class Message(BaseModel):
+    message: str
+
+class SuccessResponse(BaseModel):
+    success: bool
+
+# Players
+
+class PlayerRow(BaseModel):
+    """A player read straight from a Player object, with first and last name combined"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    first_name: str = Field(exclude=True)
+    last_name: str = Field(exclude=True)
+
+    @computed_field
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+class PlayerListItem(PlayerRow):
+    position: str
+    jersey_number: Optional[int] = None
+    age: Optional[int] = None
+    overall_rating: Optional[int] = None
+    team_id: Optional[int] = None
+    roster_status: Optional[str] = None
+
+class RosterPlayer(PlayerRow):
+    position: str
+    jersey_number: Optional[int] = None
+    age: Optional[int] = None
+    overall_rating: Optional[int] = None
+    roster_status: Optional[str] = None
+
+class PlayerSearchResult(PlayerRow):
+    position: str
+    age: Optional[int] = None
+    overall_rating: Optional[int] = None
+    team_id: Optional[int] = None
+
+class TopPlayer(PlayerRow):
+    overall_rating: Optional[int] = None
+    age: Optional[int] = None
+    years_pro: Optional[int] = None
+    team_id: Optional[int] = None
+
+class DepthChartPlayer(BaseModel):
+    id: int
+    name: str
+    overall_rating: Optional[int] = None
+    age: Optional[int] = None
+    jersey_number: Optional[int] = None
+
+class PlayerRatings(BaseModel):
+    overall: Optional[int] = None
+    potential: Optional[int] = None
+    speed: Optional[int] = None
+    strength: Optional[int] = None
+    agility: Optional[int] = None
+    football_iq: Optional[int] = None
+    leadership: Optional[int] = None
+    work_ethic: Optional[int] = None
+
+class PlayerStatusInfo(BaseModel):
+    roster_status: Optional[str] = None
+    injury_status: Optional[str] = None
+    injury_prone: Optional[bool] = None
+
+class PlayerDetail(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    position: str
+    jersey_number: Optional[int] = None
+    age: Optional[int] = None
+    height: Optional[int] = None
+    weight: Optional[int] = None
+    years_pro: Optional[int] = None
+    college: Optional[str] = None
+    team: Optional[str] = None
+    ratings: PlayerRatings
+    status: PlayerStatusInfo
+
+class CurrentRatings(BaseModel):
+    overall: Optional[int] = None
+    potential: Optional[int] = None
+    calculated_overall: int
+    calculated_potential: int
+
+class EvaluationSummary(BaseModel):
+    grade: str
+    development_trajectory: str
+    injury_risk: str
+
+class TradeValue(BaseModel):
+    estimated_value: int
+    age_multiplier: float
+    position_multiplier: float
+    contract_multiplier: float
+    performance_multiplier: float
+    war: Optional[float] = None
+
+class PositionComparison(BaseModel):
+    position: Optional[str] = None
+    total_players: Optional[int] = None
+    average_rating: Optional[float] = None
+    player_percentile: Optional[float] = None
+    rank: Optional[int] = None
+
+class PlayerEvaluation(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    current_ratings: CurrentRatings
+    evaluation: EvaluationSummary
+    trade_value: TradeValue
+    comparison: PositionComparison
+
+# Teams
+
+class TeamColors(BaseModel):
+    primary: Optional[str] = None
+    secondary: Optional[str] = None
+
+class TeamListItem(BaseModel):
+    id: int
+    name: str
+    city: str
+    abbreviation: str
+    conference: str
+    division: str
+    colors: TeamColors
+
+class TeamDetail(BaseModel):
+    id: int
+    name: str
+    city: str
+    abbreviation: str
+    conference: str
+    division: str
+    stadium: Optional[str] = None
+    capacity: Optional[int] = None
+    roster_count: int
+    salary_cap_used: int
+
+class TeamRef(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    abbreviation: str
+
+class TeamRoster(BaseModel):
+    team: TeamRef
+    roster: List[RosterPlayer]
+
+# Salary cap and contracts
+
+class SalaryCapYear(BaseModel):
+    year: int
+    base_cap: int
+    minimum_spend: int
+    rookie_pool: int
+
+class SalaryCapOverview(BaseModel):
+    current_salary_cap: SalaryCapYear
+    cap_year: str
+
+class CapContract(BaseModel):
+    player_id: int
+    cap_hit: int
+    base_salary: Optional[int] = None
+    contract_type: Optional[str] = None
+
+class TeamSalaryCap(BaseModel):
+    team_id: int
+    year: int
+    adjusted_cap: int
+    total_cap_used: int
+    top_51_cap_used: int
+    dead_money: int
+    cap_space: int
+    cap_percentage: float
+    contracts: List[CapContract]
+
+class CapEfficiency(BaseModel):
+    utilization_percentage: float
+    health_status: str
+    flexibility: str
+
+class TeamCapSummary(TeamSalaryCap):
+    top_contracts: List[CapContract]
+    position_breakdown: Dict[str, int]
+    cap_efficiency: CapEfficiency
+
+class ContractGroup(BaseModel):
+    count: int
+    total_value: int
+
+class TeamContractSummary(BaseModel):
+    team_id: int
+    total_contracts: int
+    total_value: int
+    total_guaranteed: int
+    guaranteed_percentage: float
+    contract_types: Dict[str, ContractGroup]
+    position_breakdown: Dict[str, ContractGroup]
+    average_contract_value: int
+
+class ContractYear(BaseModel):
+    base_salary: Optional[int] = None
+    cap_hit: Optional[int] = None
+    dead_money: Optional[int] = None
+
+class ContractCapAnalysis(BaseModel):
+    total_cap_hit: int
+    average_cap_hit: int
+    guaranteed_percentage: float
+
+class DeadMoneyAnalysis(BaseModel):
+    total_dead_money: int
+    dead_money_percentage: float
+
+class ContractAnalysis(BaseModel):
+    contract_id: int
+    player_name: str
+    position: str
+    team_id: int
+    contract_type: Optional[str] = None
+    total_value: Optional[int] = None
+    guaranteed_money: Optional[int] = None
+    years: int
+    annual_breakdown: Dict[str, ContractYear]
+    cap_analysis: ContractCapAnalysis
+    dead_money_analysis: DeadMoneyAnalysis
+
+class ContractHistoryItem(BaseModel):
+    contract_id: int
+    team_id: int
+    total_value: Optional[int] = None
+    years: int
+    contract_type: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+class LeagueCapTeam(BaseModel):
+    team_id: int
+    team_name: str
+    cap_used: int
+    cap_space: int
+    cap_percentage: float
+
+class LeagueCapOverview(BaseModel):
+    total_teams: int
+    salary_cap: SalaryCapYear
+    teams: List[LeagueCapTeam]
+
+class RestructureResult(BaseModel):
+    success: bool
+    cap_savings: int
+    new_cap_hit: int
+    restructure_amount: int
+
+class ReleaseResult(BaseModel):
+    success: bool
+    cap_savings: int
+    dead_money_current: int
+    dead_money_next: int
+    post_june_1: bool
+
+class FranchiseTagResult(BaseModel):
+    success: bool
+    message: str
+    franchise_tag_amount: int
+    cap_hit: Optional[int] = None
+
+class ExtensionResult(BaseModel):
+    """A signed extension, or the player's rejection with the market value and acceptance chance"""
+    success: bool
+    message: str
+    market_value: Optional[int] = None
+    acceptance_chance: Optional[float] = None
+    contract_id: Optional[int] = None
+    total_value: Optional[int] = None
+    cap_hit_year_1: Optional[int] = None
+
+class CapTransactionResult(BaseModel):
+    index: int
+    type: Optional[str] = None
+    success: bool
+    result: Dict[str, Any]
+
+class TeamCapTotals(BaseModel):
+    team_id: int
+    adjusted_cap: int
+    total_cap_used: int
+    cap_space: int
+    total_dead_money: int
+    top_51_count: int
+    total_contracts: int
+
+class CapTransactionBatch(BaseModel):
+    """Per-operation results, and the refreshed cap totals of every team touched when the batch committed"""
+    success: bool
+    operations: int
+    failed_index: Optional[int] = None
+    seed: int
+    results: List[CapTransactionResult]
+    cap: List[TeamCapTotals]
+
+class OptimizedOffer(BaseModel):
+    base_salary: int
+    years: int
+    signing_bonus: int
+    total_value: int
+    year_1_cap_hit: int
+    cap_hits: List[int]
+    acceptance_chance: float
+    fits_cap: bool
+
+class OfferTarget(BaseModel):
+    target: float
+    reachable: bool
+    offers: List[OptimizedOffer]
+
+class OfferOptimization(BaseModel):
+    player_id: int
+    team_id: int
+    market_value: int
+    max_acceptance_chance: float
+    cap_space: int
+    grid_size: int
+    targets: List[OfferTarget]
+
+class TeamDashboardTeam(TeamDetail):
+    colors: TeamColors
+
+class TeamDashboard(BaseModel):
+    team: TeamDashboardTeam
+    roster: List[RosterPlayer]
+    salary_cap: TeamSalaryCap
+
+# Stats
+
+class PlayerStatLeader(BaseModel):
+    rank: int
+    player_id: int
+    name: str
+    position: str
+    team_id: Optional[int] = None
+    value: int
+
+class PlayerStatLeaders(BaseModel):
+    stat: str
+    season: Optional[int] = None
+    position: Optional[str] = None
+    leaders: List[PlayerStatLeader]
+
+class TeamStatLeader(BaseModel):
+    rank: int
+    team_id: int
+    team_name: str
+    value: int
+
+class TeamStatLeaders(BaseModel):
+    stat: str
+    season: int
+    leaders: List[TeamStatLeader]
+
+class PlayerSeasonLine(BaseModel):
+    season: int
+    team_id: Optional[int] = None
+    stats: Dict[str, int]
+
+class PlayerStats(BaseModel):
+    player_id: int
+    seasons: List[PlayerSeasonLine]
+    career: Dict[str, int]
+
+class TeamStats(BaseModel):
+    team_id: int
+    season: Optional[int] = None
+    stats: Dict[str, int]
+
+class BoxScorePlayer(BaseModel):
+    player_id: int
+    team_id: Optional[int] = None
+    stats: Dict[str, int]
+
+class BoxScore(BaseModel):
+    game_id: int
+    season: int
+    week: int
+    game_type: str
+    home_team_id: int
+    away_team_id: int
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+    is_final: Optional[bool] = None
+    teams: Dict[int, Dict[str, int]]
+    players: List[BoxScorePlayer]
+
+# Analytics
+
+class ExpectedPointsRow(BaseModel):
+    down: int
+    distance: str
+    expected_points: List[float]
+
+class ExpectedPointsTable(BaseModel):
+    season: int
+    yardline: str
+    field_buckets: List[str]
+    rows: List[ExpectedPointsRow]
+
+class TeamEfficiency(BaseModel):
+    team_id: int
+    offensive_plays: int
+    offense_epa: float
+    offense_epa_per_play: float
+    offense_success_rate: float
+    pass_epa_per_play: float
+    run_epa_per_play: float
+    defense_epa_per_play: float
+    offense_efficiency: float
+    defense_efficiency: float
+    total_efficiency: float
+    team_name: Optional[str] = None
+
+class PlayerWar(BaseModel):
+    player_id: int
+    position: Optional[str] = None
+    plays: int
+    epa: float
+    epa_per_play: float
+    replacement_epa_per_play: float
+    war: float
+
+# Injuries
+
+class SeasonWeek(BaseModel):
+    season: int
+    week: int
+
+class InjuryReportItem(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    team_id: Optional[int] = None
+    injury_type: Optional[str] = None
+    injury_status: Optional[str] = None
+    weeks_out: int
+    injured: SeasonWeek
+    expected_return: SeasonWeek
+
+class NewInjury(BaseModel):
+    player_id: int
+    team_id: Optional[int] = None
+    injury_type: str
+    injury_status: str
+    weeks_out: int
+
+class InjuryWeekResult(BaseModel):
+    season: int
+    week: int
+    recovered: int
+    new_injuries: int
+    newly_injury_prone: int
+    injuries: List[NewInjury]
+
+# League
+
+class LeagueSeason(BaseModel):
+    current_year: int
+    salary_cap: SalaryCapYear
+
+class RolloverResult(BaseModel):
+    success: bool
+    previous_year: int
+    current_year: int
+    players_aged: int
+    players_progressed: int
+    players_regressed: int
+    players_retired: int
+    contracts_advanced: int
+    contracts_expired: int
+    new_free_agents: int
+    elapsed_seconds: float
+
+class ScheduleResult(BaseModel):
+    season: int
+    weeks: int
+    games: int
+
+class SimulatedGame(BaseModel):
+    game_id: int
+    home_team_id: int
+    away_team_id: int
+    home_score: int
+    away_score: int
+    total_plays: int
+
+class WeekSimulation(BaseModel):
+    season: int
+    week: int
+    games: List[SimulatedGame]
+    new_injuries: int
+
+class StandingsRow(BaseModel):
+    team_id: int
+    team_name: str
+    division: str
+    wins: int
+    losses: int
+    ties: int
+    win_percentage: float
+    point_differential: int
+
+class PlayoffSeed(StandingsRow):
+    seed: int
+
+class PlayoffGame(BaseModel):
+    game_id: int
+    home_team_id: int
+    away_team_id: int
+    home_score: int
+    away_score: int
+    winner_team_id: int
+
+class PlayoffRound(BaseModel):
+    round: str
+    week: int
+    games: List[PlayoffGame]
+
+class PlayoffResult(BaseModel):
+    season: int
+    seeds: Dict[str, List[PlayoffSeed]]
+    rounds: List[PlayoffRound]
+    champion_team_id: Optional[int] = None
+
+# Draft
+
+class DraftClassResult(BaseModel):
+    draft_year: int
+    size: int
+    class_strength: float
+    average_overall: float
+    average_potential: float
+    position_counts: Dict[str, int]
+    elapsed_seconds: float
+
+class CombineResults(BaseModel):
+    forty_yard_dash: Optional[float] = None
+    bench_press: Optional[int] = None
+    vertical_jump: Optional[float] = None
+    broad_jump: Optional[int] = None
+    three_cone: Optional[float] = None
+    shuttle: Optional[float] = None
+
+class DraftProspectItem(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    college: Optional[str] = None
+    age: Optional[int] = None
+    overall_rating: Optional[int] = None
+    potential: Optional[int] = None
+    class_rank: int
+    position_rank: int
+    projected_round: int
+    combine: CombineResults
+    injury_flag: bool
+    character_flag: bool
+    is_drafted: bool
+
+class CompensatoryPickItem(BaseModel):
+    draft_year: int
+    round: int
+    order_in_round: int
+    team_id: int
+    lost_player_id: int
+    lost_player_name: str
+    position: str
+    signed_with_team_id: int
+    value: int
+
+class CompensatoryTeam(BaseModel):
+    team_id: int
+    qualifying_losses: int
+    qualifying_gains: int
+    uncancelled_losses: int
+
+class CompensatoryPicks(BaseModel):
+    free_agency_year: int
+    draft_year: int
+    qualifying_signings: int
+    picks: List[CompensatoryPickItem]
+    teams: List[CompensatoryTeam]
+
+class CompensatoryAward(BaseModel):
+    draft_year: int
+    awarded: int
+    picks: List[CompensatoryPickItem]
+
+class MockDraftProspect(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    drafted_probability: float
+    average_pick: float
+    earliest_pick: int
+    pick_10th_percentile: int
+    median_pick: int
+    pick_90th_percentile: int
+    latest_pick: int
+    round_probabilities: Dict[int, float]
+
+class MockDraftResult(BaseModel):
+    draft_year: int
+    simulations: int
+    workers: int
+    prospects: List[MockDraftProspect]
+    elapsed_seconds: float
+
+class DraftPickMade(BaseModel):
+    draft_year: int
+    round: int
+    pick_in_round: int
+    overall_pick: int
+    team_id: int
+    player_id: int
+
+class DraftRunResult(BaseModel):
+    draft_year: int
+    drafted: int
+    undrafted_free_agents: int
+    picks: List[DraftPickMade]
+    elapsed_seconds: float
+
+class DraftResultItem(BaseModel):
+    overall_pick: int
+    round: int
+    pick_in_round: int
+    team_id: int
+    player_id: int
+    name: str
+    position: str
+    overall_rating: Optional[int] = None
+    potential: Optional[int] = None
+    contract_id: Optional[int] = None
+
+class RookieSigningTeam(BaseModel):
+    team_id: int
+    picks_signed: int
+    rookie_cap_hit: int
+    rookie_pool_allocation: int
+    rookie_pool_remaining: int
+    cap_space_before: int
+    cap_space_after: int
+
+class DraftSigningResult(BaseModel):
+    draft_year: int
+    contracts_signed: int
+    total_rookie_cap_hit: int
+    league_rookie_pool: int
+    scale_factor: float
+    teams: List[RookieSigningTeam]
+    elapsed_seconds: float
+
+# Scouting
+
+class ScoutInfo(BaseModel):
+    id: int
+    name: str
+    accuracy: Optional[int] = None
+    specialty: Optional[str] = None
+
+class AttributeEstimate(BaseModel):
+    estimate: int
+    low: int
+    high: int
+
+class ScoutingReport(BaseModel):
+    team_id: int
+    player_id: int
+    name: str
+    position: str
+    player_team_id: Optional[int] = None
+    scouting_hours: float
+    confidence: float
+    attributes: Dict[str, AttributeEstimate]
+
+class DraftBoardReport(ScoutingReport):
+    grade: float
+
+class ScoutingResult(BaseModel):
+    team_id: int
+    player_id: int
+    hours: float
+
+class ScoutingCacheInfo(BaseModel):
+    cached_reports: int
+    max_reports: int
+    reports_by_team: Dict[int, int]
+
+# Trades
+
+class TradePlayer(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    overall_rating: Optional[int] = None
+    age: Optional[int] = None
+    trade_value: int
+    cap_hit: int
+
+class TradeProposal(BaseModel):
+    team_id: int
+    partner_team_id: int
+    team_gives: List[TradePlayer]
+    team_receives: List[TradePlayer]
+    value_given: int
+    value_received: int
+    value_balance: float
+    team_cap_space_after: int
+    partner_cap_space_after: int
+    team_need_improvement: float
+    partner_need_improvement: float
+    score: float
+
+class TradeSearchResult(BaseModel):
+    team_id: int
+    target_player_id: Optional[int] = None
+    target_position: Optional[str] = None
+    partners_searched: int
+    packages_considered: int
+    packages_evaluated: int
+    proposals: List[TradeProposal]
+    elapsed_seconds: float
+
+# AI general managers
+
+class TeamStrategyInfo(BaseModel):
+    team_id: int
+    philosophy: str
+    is_user_controlled: bool
+
+class AIWeekResult(BaseModel):
+    season: int
+    week: int
+    teams_planned: int
+    actions_proposed: int
+    actions_applied: int
+    actions_rejected: int
+    applied: Dict[str, int]
+    timings: Dict[str, float]
+
+# Free agency
+
+class FreeAgentSigningItem(BaseModel):
+    player_id: int
+    name: str
+    position: str
+    overall_rating: Optional[int] = None
+    team_id: int
+    salary: int
+    years: int
+    day: int
+
+class FreeAgencyDay(BaseModel):
+    day: int
+    offers: int
+    signings: int
+
+class FreeAgencyResult(BaseModel):
+    """Totals, the biggest signings and the daily market; only year and counts when nobody is available"""
+    year: int
+    free_agents: int
+    signed: int
+    roster_rejected: Optional[int] = None
+    total_salary: Optional[int] = None
+    top_signings: Optional[List[FreeAgentSigningItem]] = None
+    daily: List[FreeAgencyDay]
+    timings: Optional[Dict[str, float]] = None
+
+class MarketBenchmark(BaseModel):
+    free_agents: int
+    teams: int
+    days: int
+    signed: int
+    offers: int
+    seconds: float
+    signings_per_second: float
+
+# Roster
+
+class LimitCount(BaseModel):
+    count: int
+    limit: int
+
+class TeamRosterLimits(BaseModel):
+    team_id: int
+    statuses: Dict[str, LimitCount]
+    positions: Dict[str, LimitCount]
+
+class RosterMoveError(BaseModel):
+    """A rule a move breaks; limit errors also carry the team, limit and current count"""
+    type: Optional[str] = None
+    player_id: Optional[int] = None
+    code: str
+    message: str
+    status: Optional[str] = None
+    team_id: Optional[int] = None
+    position: Optional[str] = None
+    limit: Optional[int] = None
+    current: Optional[int] = None
+
+class RosterMoveResult(BaseModel):
+    index: int
+    valid: bool
+    errors: List[RosterMoveError]
+
+class RosterMoveBatch(BaseModel):
+    valid: bool
+    moves: int
+    rejected: int
+    results: List[RosterMoveResult]
+
+# Response cache
+
+class CacheMetrics(BaseModel):
+    hits: int
+    misses: int
+    not_modified: int
+    evictions: int
+    invalidations: int
+    entries: int
+    max_entries: int
+    hit_ratio: Optional[float] = None
+
+# Bulk import
+
+class ImportRowError(BaseModel):
+    line: int
+    errors: List[str]
+
+class ImportResult(BaseModel):
+    table: str
+    rows: int
+    inserted: int
+    updated: int
+    rejected: int
+    errors: List[ImportRowError]
+    teams_refreshed: int
+    elapsed_seconds: float
+
+# Transaction journal
+
+class JournalEventItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    event_type: str
+    team_id: Optional[int] = None
+    player_id: Optional[int] = None
+    contract_id: Optional[int] = None
+    data: Dict[str, Any] = Field(default_factory=dict)
+    created_at: Optional[datetime] = None
+
+    @field_validator("data", mode="before")
+    @classmethod
+    def parse_data(cls, value):
+        # Stored as JSON text
+        return json.loads(value) if isinstance(value, str) else (value or {})
+
+class JournalConsumerState(BaseModel):
+    name: str
+    offset: int
+    lag: int
+
+class JournalCatchUp(BaseModel):
+    name: str
+    from_offset: int
+    offset: int
+    events_applied: int
+
+class JournalCapTotals(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    team_id: int
+    year: int
+    adjusted_cap: int
+    total_cap_used: int
+    total_dead_money: int
+    total_contracts: int
+    cap_space: int
+    last_event_id: Optional[int] = None
+
+# Save slots
+
+class SaveSlotInfo(BaseModel):
+    name: str
+    description: Optional[str] = None
+    created_at: datetime
+    loaded_at: Optional[datetime] = None
+    league_year: Optional[int] = None
+    seasons: Optional[int] = None
+    players: Optional[int] = None
+    journal_offset: Optional[int] = None
+    size_bytes: int
+    file_bytes: int
+    compressed: bool
+
+class SaveSlotResult(SaveSlotInfo):
+    elapsed_seconds: float
+
+# Leagues
+
+class LeagueInfo(BaseModel):
+    league_id: str
+    open: bool
+    size_bytes: int
+
+class OpenLeague(BaseModel):
+    league_id: str
+    idle_seconds: float
+    connections: int
+
+class LeaguePoolMetrics(BaseModel):
+    opened: int
+    evicted: int
+    closed_idle: int
+    open: int
+    max_open: int
+    idle_seconds: float
+    leagues: List[OpenLeague]
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List
+from ..database.connection import get_db
+from ..services.scouting_service import ScoutingService
+from .schemas import ScoutInfo, ScoutingReport, ScoutingResult, DraftBoardReport, ScoutingCacheInfo
+
+router = APIRouter()
+
+@router.get("/team/{team_id}/scouts", response_model=List[ScoutInfo])
+def get_team_scouts(team_id: int, db: Session = Depends(get_db)):
+    """Get a team's scouting staff"""
+    scouting_service = ScoutingService(db)
+    return [
+        {
+            "id": scout.id,
+            "name": f"{scout.first_name} {scout.last_name}",
+            "accuracy": scout.accuracy,
+            "specialty": scout.specialty
+        }
+        for scout in scouting_service.get_team_scouts(team_id)
+    ]
+
+@router.get("/team/{team_id}/player/{player_id}", response_model=ScoutingReport)
+def get_scouting_report(team_id: int, player_id: int, db: Session = Depends(get_db)):
+    """Get a team's scouting report on a player"""
+    scouting_service = ScoutingService(db)
+    report = scouting_service.get_report(team_id, player_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return report
+
+@router.post("/team/{team_id}/player/{player_id}/scout", response_model=ScoutingResult)
+def scout_player(
+    team_id: int,
+    player_id: int,
+    hours: float = Query(..., gt=0, le=200, description="Scouting hours to invest"),
+    db: Session = Depends(get_db)
+):
+    """Invest scouting time in a player to sharpen the team's report"""
+    scouting_service = ScoutingService(db)
+    result = scouting_service.add_scouting_time(team_id, player_id, hours)
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    return result
+
+@router.get("/team/{team_id}/draft/{year}", response_model=List[DraftBoardReport])
+def get_team_draft_board(team_id: int, year: int, limit: int = Query(100, le=1000), db: Session = Depends(get_db)):
+    """Get a team's own draft board built from its scouting reports"""
+    scouting_service = ScoutingService(db)
+    return scouting_service.get_draft_board(team_id, year, limit)
+
+@router.get("/cache", response_model=ScoutingCacheInfo)
+def get_scouting_cache_info():
+    """Get scouting report cache usage"""
+    return ScoutingService.get_cache_info()
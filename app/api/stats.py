@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..database.connection import get_db
+from ..services.stats_service import StatsService, PLAYER_STATS, TEAM_STATS
+from .schemas import PlayerStatLeaders, TeamStatLeaders, PlayerStats, TeamStats, BoxScore
+
+router = APIRouter()
+
+@router.get("/leaders", response_model=PlayerStatLeaders)
+def get_stat_leaders(
+    stat: str = Query(..., description="Stat to rank by, e.g. passing_yards"),
+    season: Optional[int] = Query(None, description="Season to rank; omit for career leaders"),
+    position: Optional[str] = Query(None),
+    limit: int = Query(10),
+    db: Session = Depends(get_db)
+):
+    """Get player leaders for a stat by season and position"""
+    if stat not in PLAYER_STATS:
+        raise HTTPException(status_code=400, detail=f"Unknown stat: {stat}")
+
+    stats_service = StatsService(db)
+    return {
+        "stat": stat,
+        "season": season,
+        "position": position.upper() if position else None,
+        "leaders": stats_service.get_player_leaders(stat, season, position, limit)
+    }
+
+@router.get("/teams/leaders", response_model=TeamStatLeaders)
+def get_team_stat_leaders(
+    stat: str = Query(..., description="Stat to rank by, e.g. points_for"),
+    season: int = Query(...),
+    limit: int = Query(32),
+    db: Session = Depends(get_db)
+):
+    """Get team rankings for a stat in a season"""
+    if stat not in TEAM_STATS:
+        raise HTTPException(status_code=400, detail=f"Unknown stat: {stat}")
+
+    stats_service = StatsService(db)
+    return {
+        "stat": stat,
+        "season": season,
+        "leaders": stats_service.get_team_leaders(stat, season, limit)
+    }
+
+@router.get("/player/{player_id}", response_model=PlayerStats)
+def get_player_stats(player_id: int, db: Session = Depends(get_db)):
+    """Get season and career stat lines for a player"""
+    stats_service = StatsService(db)
+    return stats_service.get_player_stats(player_id)
+
+@router.get("/team/{team_id}", response_model=TeamStats)
+def get_team_stats(team_id: int, season: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """Get season or franchise stat totals for a team"""
+    stats_service = StatsService(db)
+    return stats_service.get_team_stats(team_id, season)
+
+@router.get("/game/{game_id}", response_model=BoxScore)
+def get_game_box_score(game_id: int, db: Session = Depends(get_db)):
+    """Get the box score for a game"""
+    stats_service = StatsService(db)
+    box_score = stats_service.get_game_box_score(game_id)
+    if not box_score:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return box_score
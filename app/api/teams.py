@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database.connection import get_db
-from ..database.models import Team
+from ..database.models import Team, Player
 from ..services.team_service import TeamService
+from ..services.player_service import PlayerService
+from .players import player_fields
+from .schemas import TeamListItem, TeamDetail, TeamDashboard, TeamRoster
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+@router.get("/", response_model=List[TeamListItem])
 def get_all_teams(db: Session = Depends(get_db)):
     """Get all NFL teams"""
     teams = db.query(Team).all()
@@ -27,7 +31,7 @@ def get_all_teams(db: Session = Depends(get_db)):
         for team in teams
     ]
 
-@router.get("/{team_id}")
+@router.get("/{team_id}", response_model=TeamDetail)
 def get_team(team_id: int, db: Session = Depends(get_db)):
     """Get specific team details"""
     team = db.query(Team).filter(Team.id == team_id).first()
@@ -51,31 +55,37 @@ def get_team(team_id: int, db: Session = Depends(get_db)):
         "salary_cap_used": salary_cap_used
     }
 
-@router.get("/{team_id}/roster")
-def get_team_roster(team_id: int, status: str = "active", db: Session = Depends(get_db)):
+@router.get("/{team_id}/dashboard", response_model=TeamDashboard)
+def get_team_dashboard(team_id: int, status: str = "active", db: Session = Depends(get_db)):
+    """Get team overview, roster and salary cap in a single request"""
+    dashboard = TeamService(db).get_team_dashboard(team_id, status)
+    if not dashboard:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return dashboard
+
+@router.get("/{team_id}/roster", response_model=TeamRoster)
+def get_team_roster(
+    team_id: int,
+    status: str = "active",
+    fields: Optional[List[str]] = Depends(player_fields),
+    db: Session = Depends(get_db)
+):
     """Get team roster"""
     team_service = TeamService(db)
     team = team_service.get_team_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    players = team_service.get_team_roster(team_id, status)
-    return {
-        "team": {
-            "id": team.id,
-            "name": team.name,
-            "abbreviation": team.abbreviation
-        },
-        "roster": [
-            {
-                "id": player.id,
-                "name": f"{player.first_name} {player.last_name}",
-                "position": player.position,
-                "jersey_number": player.jersey_number,
-                "age": player.age,
-                "overall_rating": player.overall_rating,
-                "roster_status": player.roster_status
-            }
-            for player in players
-        ]
-    }
+    if fields:
+        return ORJSONResponse({
+            "team": {
+                "id": team.id,
+                "name": team.name,
+                "abbreviation": team.abbreviation
+            },
+            "roster": PlayerService(db).select_player_fields(
+                fields, Player.team_id == team_id, Player.roster_status == status
+            )
+        })
+    
+    return {"team": team, "roster": team_service.get_team_roster(team_id, status)}
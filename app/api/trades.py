@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..database.connection import get_db
+from ..services.trade_service import TradeService, DEFAULT_VALUE_TOLERANCE
+from .schemas import TradeSearchResult
+
+router = APIRouter()
+
+@router.get("/finder/{team_id}", response_model=TradeSearchResult)
+def find_trades(
+    team_id: int,
+    target_player_id: Optional[int] = Query(None, description="Player the team wants to acquire"),
+    target_position: Optional[str] = Query(None, description="Position the team wants to add"),
+    limit: int = Query(10, ge=1, le=50),
+    value_tolerance: float = Query(DEFAULT_VALUE_TOLERANCE, gt=0, lt=1),
+    db: Session = Depends(get_db)
+):
+    """Find balanced, cap-legal trades that improve both teams' positional needs"""
+    trade_service = TradeService(db)
+    result = trade_service.find_trades(team_id, target_player_id, target_position, limit, value_tolerance)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
@@ -0,0 +1,372 @@
+"""Command line benchmarks for the simulation engines.
+
+    python -m app.benchmarks free-agency --free-agents 500 --teams 32
+    python -m app.benchmarks dashboard --database nfl_gm.db
+    python -m app.benchmarks serialization --players 10000
+    python -m app.benchmarks leagues --leagues 500 --max-open 64 --template nfl_gm.db
+    python -m app.benchmarks saves --database league20.db
+"""
+import argparse
+import json
+import os
+import time
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulation engines without the web server")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    free_agency = subparsers.add_parser("free-agency", help="Full-market free agency on a synthetic league")
+    free_agency.add_argument("--free-agents", type=int, default=500)
+    free_agency.add_argument("--teams", type=int, default=32)
+    free_agency.add_argument("--days", type=int, default=30)
+    free_agency.add_argument("--runs", type=int, default=5, help="Repeat with consecutive seeds")
+    free_agency.add_argument("--seed", type=int, default=0)
+
+    dashboard = subparsers.add_parser("dashboard", help="Team dashboard load: three requests against the composite endpoint")
+    dashboard.add_argument("--database", default=None, help="SQLite file to run against (defaults to the app database)")
+    dashboard.add_argument("--runs", type=int, default=5, help="Passes over every team")
+
+    serialization = subparsers.add_parser("serialization", help="Encode a player list the old and new response paths")
+    serialization.add_argument("--players", type=int, default=10000)
+    serialization.add_argument("--runs", type=int, default=5)
+
+    leagues = subparsers.add_parser("leagues", help="Many hosted leagues served by one process through the league pool")
+    leagues.add_argument("--leagues", type=int, default=500)
+    leagues.add_argument("--max-open", type=int, default=64, help="Open league limit of the pool")
+    leagues.add_argument("--requests", type=int, default=20000)
+    leagues.add_argument("--workers", type=int, default=16, help="Concurrent clients")
+    leagues.add_argument("--zipf", type=float, default=1.0, help="Skew of league popularity; 0 is uniform")
+    leagues.add_argument("--template", default=None, help="SQLite file copied into every league (defaults to a new seeded league)")
+    leagues.add_argument("--league-dir", default=None, help="Directory for the league files (defaults to a temporary one)")
+    leagues.add_argument("--seed", type=int, default=0)
+
+    saves = subparsers.add_parser("saves", help="Save a league into a slot and load it back")
+    saves.add_argument("--database", default=None, help="SQLite file to run against (defaults to the app database)")
+    saves.add_argument("--runs", type=int, default=5)
+    saves.add_argument("--target-seconds", type=float, default=1.0, help="Budget for each save and each load")
+    return parser.parse_args(argv)
+
+def run_free_agency_benchmark(args) -> list:
+    from .services.free_agency_service import benchmark_market
+
+    return [
+        benchmark_market(args.free_agents, args.teams, days=args.days, seed=args.seed + run)
+        for run in range(args.runs)
+    ]
+
+def run_dashboard_benchmark(args) -> list:
+    """End-to-end dashboard load for every team, through the full ASGI stack.
+
+    Cold numbers clear the response cache before each load; warm numbers
+    repeat the load with the cache populated.
+    """
+    # Point the app at the requested database before any engine is created
+    if args.database:
+        os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{args.database}"
+    from fastapi.testclient import TestClient
+    from .main import app
+    from .database.connection import SessionLocal
+    from .database.models import Team
+    from .services.response_cache import response_cache
+
+    db = SessionLocal()
+    team_ids = [team_id for (team_id,) in db.query(Team.id).order_by(Team.id).all()]
+    db.close()
+
+    variants = {
+        "separate": lambda team_id: [
+            f"/api/teams/{team_id}", f"/api/teams/{team_id}/roster", f"/api/salary-cap/team/{team_id}"
+        ],
+        "composite": lambda team_id: [f"/api/teams/{team_id}/dashboard"]
+    }
+
+    results = []
+    with TestClient(app) as client:
+        for run in range(args.runs):
+            for name, urls in variants.items():
+                for cache in ("cold", "warm"):
+                    if cache == "warm":
+                        for team_id in team_ids:
+                            for url in urls(team_id):
+                                client.get(url)
+                    start = time.perf_counter()
+                    requests = 0
+                    for team_id in team_ids:
+                        if cache == "cold":
+                            response_cache.clear()
+                        for url in urls(team_id):
+                            client.get(url).raise_for_status()
+                            requests += 1
+                    elapsed = time.perf_counter() - start
+                    results.append({
+                        "run": run,
+                        "variant": name,
+                        "cache": cache,
+                        "teams": len(team_ids),
+                        "requests": requests,
+                        "seconds": round(elapsed, 4),
+                        "ms_per_dashboard": round(elapsed * 1000 / max(1, len(team_ids)), 2)
+                    })
+    return results
+
+def run_serialization_benchmark(args) -> list:
+    """Encode a synthetic player list the way each response path does.
+
+    "dict" is the old route body: build a dict per player, then FastAPI's
+    jsonable_encoder and json.dumps. "model" is the typed path the routes use
+    now: validate the Player objects into PlayerListItem rows, dump them in
+    JSON mode and render with orjson. "model_json" dumps straight to bytes.
+    """
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+    from typing import List
+    from .api.schemas import PlayerListItem
+    from .database.models import Player
+
+    positions = ["QB", "RB", "WR", "TE", "OT", "OG", "C", "DE", "DT", "LB", "CB", "S", "K", "P"]
+    players = [
+        Player(
+            id=i + 1, first_name=f"First{i}", last_name=f"Last{i}", position=positions[i % len(positions)],
+            jersey_number=i % 99 + 1, age=21 + i % 15, overall_rating=40 + i % 60,
+            team_id=i % 32 + 1, roster_status="active"
+        )
+        for i in range(args.players)
+    ]
+    adapter = TypeAdapter(List[PlayerListItem])
+
+    def legacy():
+        rows = [
+            {
+                "id": player.id,
+                "name": f"{player.first_name} {player.last_name}",
+                "position": player.position,
+                "jersey_number": player.jersey_number,
+                "age": player.age,
+                "overall_rating": player.overall_rating,
+                "team_id": player.team_id,
+                "roster_status": player.roster_status
+            }
+            for player in players
+        ]
+        return json.dumps(jsonable_encoder(rows), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def typed():
+        rows = adapter.validate_python(players, from_attributes=True)
+        return orjson.dumps(adapter.dump_python(rows, mode="json"))
+
+    def typed_json():
+        return adapter.dump_json(adapter.validate_python(players, from_attributes=True))
+
+    variants = {"dict": legacy, "model": typed, "model_json": typed_json}
+    results = []
+    for run in range(args.runs):
+        for name, encode in variants.items():
+            start = time.perf_counter()
+            body = encode()
+            elapsed = time.perf_counter() - start
+            results.append({
+                "run": run,
+                "variant": name,
+                "players": len(players),
+                "bytes": len(body),
+                "seconds": round(elapsed, 4),
+                "players_per_second": int(len(players) / elapsed)
+            })
+    return results
+
+def run_leagues_benchmark(args) -> list:
+    """Mixed reads and writes spread over many leagues, through the full ASGI stack.
+
+    Each request carries a league id drawn with Zipf-skewed popularity, so a
+    hot set of leagues stays open while the long tail keeps the pool evicting.
+    Open file descriptors and open leagues are sampled throughout; after the
+    load every league is left idle and swept to check that they all close.
+    Every league's teams are renamed after the league, so any response that
+    names another league shows data or a cached response leaking across.
+    """
+    import random
+    import re
+    import shutil
+    import sqlite3
+    import statistics
+    import tempfile
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from .dynasty import current_rss_mb
+
+    league_dir = args.league_dir or tempfile.mkdtemp(prefix="nfl_gm_leagues_")
+    # Configure the pool before the app creates it
+    os.environ["NFL_GM_LEAGUE_DIR"] = league_dir
+    os.environ["NFL_GM_MAX_OPEN_LEAGUES"] = str(args.max_open)
+    from fastapi.testclient import TestClient
+    from .main import app
+    from .database.connection import league_pool
+    from .services.league_service import LeagueService
+
+    def open_files() -> int:
+        return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else -1
+
+    league_ids = [f"league-{number:04d}" for number in range(args.leagues)]
+    start = time.perf_counter()
+    template = args.template
+    if template is None:
+        LeagueService().create_league(league_ids[0])
+        league_pool.close(league_ids[0])
+        template = league_pool.league_path(league_ids[0])
+    for league_id in league_ids:
+        path = league_pool.league_path(league_id)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copyfile(template, path)
+        db = sqlite3.connect(path)
+        try:
+            db.execute("UPDATE teams SET name = ?", (league_id,))
+            db.commit()
+        finally:
+            db.close()
+    setup_seconds = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.leagues)]
+    # Reads of the cached and uncached kinds, plus a journal catch-up that commits
+    routes = [
+        (0.4, "GET", lambda team_id: f"/api/teams/{team_id}"),
+        (0.3, "GET", lambda team_id: f"/api/salary-cap/team/{team_id}"),
+        (0.2, "GET", lambda team_id: f"/api/teams/{team_id}/roster"),
+        (0.1, "POST", lambda team_id: "/api/journal/consumers/team_cap_totals/catch-up")
+    ]
+    plan = [
+        (league_id, route, rng.randint(1, 32))
+        for league_id, route in zip(
+            rng.choices(league_ids, weights=weights, k=args.requests),
+            rng.choices(routes, weights=[route[0] for route in routes], k=args.requests)
+        )
+    ]
+
+    league_name = re.compile(rb"league-\d{4}")
+    samples = {"open_files": open_files(), "open_leagues": 0}
+    baseline_files = samples["open_files"]
+    sampling = threading.Event()
+
+    def sample():
+        while not sampling.wait(0.01):
+            samples["open_files"] = max(samples["open_files"], open_files())
+            samples["open_leagues"] = max(samples["open_leagues"], len(league_pool.leagues))
+
+    results = []
+    with TestClient(app) as client:
+        def call(item):
+            league_id, (_, method, url), team_id = item
+            started = time.perf_counter()
+            response = client.request(method, url(team_id), headers={"X-League-Id": league_id})
+            latency = time.perf_counter() - started
+            names = set(league_name.findall(response.content))
+            return response.status_code, latency, bool(names), bool(names - {league_id.encode()})
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.workers) as executor:
+            responses = list(executor.map(call, plan))
+        elapsed = time.perf_counter() - start
+        sampling.set()
+        sampler.join()
+
+        latencies = sorted(latency for _, latency, _, _ in responses)
+        percentiles = statistics.quantiles(latencies, n=100)
+        statuses = {}
+        for status, _, _, _ in responses:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        metrics = league_pool.get_metrics()
+        results.append({
+            "phase": "load",
+            "leagues": args.leagues,
+            "leagues_touched": len({league_id for league_id, _, _ in plan}),
+            "max_open": args.max_open,
+            "requests": len(responses),
+            "workers": args.workers,
+            "statuses": statuses,
+            "isolation_checked": sum(named for _, _, named, _ in responses),
+            "cross_league_responses": sum(leaked for _, _, _, leaked in responses),
+            "seconds": round(elapsed, 3),
+            "requests_per_second": int(len(responses) / elapsed),
+            "p50_ms": round(percentiles[49] * 1000, 2),
+            "p99_ms": round(percentiles[98] * 1000, 2),
+            "leagues_opened": metrics["opened"],
+            "leagues_evicted": metrics["evicted"],
+            "peak_open_leagues": samples["open_leagues"],
+            "peak_open_files": samples["open_files"],
+            "baseline_open_files": baseline_files,
+            "rss_mb": round(current_rss_mb(), 1),
+            "setup_seconds": round(setup_seconds, 3)
+        })
+
+        closed = league_pool.close_idle(0)
+        results.append({
+            "phase": "idle_sweep",
+            "leagues_closed": len(closed),
+            "open_leagues": len(league_pool.leagues),
+            "open_files": open_files(),
+            "rss_mb": round(current_rss_mb(), 1)
+        })
+
+    if args.league_dir is None:
+        shutil.rmtree(league_dir, ignore_errors=True)
+    return results
+
+def run_saves_benchmark(args) -> list:
+    """Save the league into a slot and load it straight back, through SaveService.
+
+    The budget is for a 20-season league, which the dynasty CLI builds:
+
+        python -m app.dynasty --seasons 20 --database league20.db
+
+    Loading a slot of the league's own state leaves the database as it was.
+    """
+    # Point the app at the requested database before any engine is created
+    if args.database:
+        os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{args.database}"
+    import shutil
+    import tempfile
+    from .database.connection import database_path
+    from .services.save_service import SaveService
+
+    save_dir = tempfile.mkdtemp(prefix="nfl_gm_saves_")
+    saves = SaveService(save_dir)
+    size_mb = os.path.getsize(database_path()) / (1024 * 1024)
+    results = []
+    try:
+        for run in range(args.runs):
+            saved = saves.save("benchmark", overwrite=True)
+            loaded = saves.load("benchmark")
+            results.append({
+                "run": run,
+                "seasons": saved["seasons"],
+                "players": saved["players"],
+                "db_size_mb": round(size_mb, 2),
+                "save_seconds": saved["elapsed_seconds"],
+                "load_seconds": loaded["elapsed_seconds"],
+                "target_seconds": args.target_seconds,
+                "within_target": max(saved["elapsed_seconds"], loaded["elapsed_seconds"]) < args.target_seconds
+            })
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+    return results
+
+BENCHMARKS = {
+    "free-agency": run_free_agency_benchmark,
+    "dashboard": run_dashboard_benchmark,
+    "serialization": run_serialization_benchmark,
+    "leagues": run_leagues_benchmark,
+    "saves": run_saves_benchmark
+}
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = BENCHMARKS[args.benchmark](args)
+    for result in results:
+        print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
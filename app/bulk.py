@@ -0,0 +1,95 @@
+"""Bulk data transfer without the web server.
+
+    python -m app.bulk export players --format parquet --output players.parquet
+    python -m app.bulk export player_season_stats --season 2030 > stats.csv
+    python -m app.bulk import contracts contracts.ndjson
+
+Exports stream through a server-side cursor, so any table size runs in
+constant memory. Imports upsert by id in batches and report rows that fail
+validation instead of stopping.
+"""
+import argparse
+import json
+import os
+import sys
+
+def parse_args(argv=None):
+    from .services.export_service import EXPORT_TABLES, EXPORT_FORMATS, DEFAULT_CHUNK_SIZE
+    from .services.import_service import IMPORT_TABLES, IMPORT_FORMATS, DEFAULT_BATCH_SIZE
+
+    parser = argparse.ArgumentParser(description="Export and import league data in bulk")
+    parser.add_argument("--database", default=None, help="SQLite file to run against (defaults to the app database)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Stream a table to a file or stdout")
+    export.add_argument("table", choices=sorted(EXPORT_TABLES))
+    export.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    export.add_argument("--output", default=None, help="File to write (defaults to stdout)")
+    export.add_argument("--season", type=int, default=None, help="Season, or league year for cap tables")
+    export.add_argument("--team-id", type=int, default=None)
+    export.add_argument("--player-id", type=int, default=None)
+    export.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    import_ = subparsers.add_parser("import", help="Upsert players or contracts from a file or stdin")
+    import_.add_argument("table", choices=sorted(IMPORT_TABLES))
+    import_.add_argument("input", nargs="?", default="-", help="File to read (defaults to stdin)")
+    import_.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Defaults to the file extension")
+    import_.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+def run_export(args):
+    from .database.connection import SessionLocal
+    from .services.export_service import ExportService
+
+    filters = {"season": args.season, "team_id": args.team_id, "player_id": args.player_id}
+    db = SessionLocal()
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        written = 0
+        for chunk in ExportService(db, args.chunk_size).export(args.table, args.format, filters):
+            output.write(chunk)
+            written += len(chunk)
+        if args.output:
+            print(f"Wrote {written} bytes to {args.output}", file=sys.stderr)
+    finally:
+        if args.output:
+            output.close()
+        db.close()
+
+def run_import(args):
+    from .database.connection import SessionLocal
+    from .services.import_service import ImportService
+
+    format = args.format or (args.input.rsplit(".", 1)[-1].lower() if args.input != "-" else "ndjson")
+    ImportService.check_import(args.table, format)
+    db = SessionLocal()
+    source = open(args.input, "rb") if args.input != "-" else sys.stdin.buffer
+    try:
+        print(json.dumps(ImportService(db, args.batch_size).import_rows(args.table, source, format), indent=2))
+    finally:
+        if args.input != "-":
+            source.close()
+        db.close()
+
+COMMANDS = {
+    "export": run_export,
+    "import": run_import
+}
+
+def main(argv=None):
+    # Point the app at the requested database before any engine is created:
+    # parse_args imports the services for their table lists, and importing
+    # them creates the engine
+    early = argparse.ArgumentParser(add_help=False)
+    early.add_argument("--database", default=None)
+    database = early.parse_known_args(argv)[0].database
+    if database:
+        os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{database}"
+    args = parse_args(argv)
+    try:
+        COMMANDS[args.command](args)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+if __name__ == "__main__":
+    main()
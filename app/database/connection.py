@@ -1,25 +1,246 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Set
 from .models import Base
 import os
+import re
+import threading
+import time
 
-DATABASE_URL = "sqlite:///./nfl_gm.db"
+DATABASE_URL = os.environ.get("NFL_GM_DATABASE_URL", "sqlite:///./nfl_gm.db")
 
-engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False},
-    echo=False  # Set to True for SQL logging during development
-)
+# Hosted leagues: one SQLite file per league under LEAGUE_DIR/<league id>/
+LEAGUE_DIR = os.environ.get("NFL_GM_LEAGUE_DIR", "leagues")
+MAX_OPEN_LEAGUES = int(os.environ.get("NFL_GM_MAX_OPEN_LEAGUES", "64"))
+LEAGUE_IDLE_SECONDS = float(os.environ.get("NFL_GM_LEAGUE_IDLE_SECONDS", "300"))
+
+# Connections kept per open league; a league is one user's game, so few are busy at once
+LEAGUE_POOL_SIZE = 2
+LEAGUE_MAX_OVERFLOW = 8
+
+LEAGUE_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$")
+
+# League the current request is bound to; None is the app database
+current_league: ContextVar[Optional[str]] = ContextVar("current_league", default=None)
+
+def make_engine(url: str, **pool_options):
+    return create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        echo=False,  # Set to True for SQL logging during development
+        **pool_options
+    )
+
+engine = make_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def create_tables():
+# Per-league state of the app database, see LeagueDatabase.state
+_default_state: Dict[str, any] = {}
+
+class LeagueDatabase:
+    """Engine, session factory and in-process state of one open league"""
+
+    def __init__(self, league_id: str, path: str):
+        self.league_id = league_id
+        self.path = path
+        self.engine = make_engine(
+            f"sqlite:///{path}", pool_size=LEAGUE_POOL_SIZE, max_overflow=LEAGUE_MAX_OVERFLOW
+        )
+        self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Caches and anything else that must not leak between leagues; dropped with the engine
+        self.state: Dict[str, any] = {}
+        self.last_used = time.monotonic()
+
+    def close(self):
+        # Checked-out connections finish their request and are closed when returned
+        self.engine.dispose()
+
+class LeaguePool:
+    """Bounded LRU of open leagues.
+
+    Opening a league creates its engine; past max_open leagues the least
+    recently used is closed, and leagues idle for longer than idle_seconds
+    are closed on the next lookup or sweep. Open file descriptors and cached
+    data therefore scale with the leagues in use, not the leagues hosted.
+    """
+
+    def __init__(self, league_dir: str = LEAGUE_DIR, max_open: int = MAX_OPEN_LEAGUES,
+                 idle_seconds: float = LEAGUE_IDLE_SECONDS):
+        self.league_dir = league_dir
+        self.max_open = max_open
+        self.idle_seconds = idle_seconds
+        self.leagues: "OrderedDict[str, LeagueDatabase]" = OrderedDict()
+        # Leagues whose tables were brought up to date since the process started
+        self.migrated: Set[str] = set()
+        self.lock = threading.Lock()
+        self.metrics = {"opened": 0, "evicted": 0, "closed_idle": 0}
+
+    @staticmethod
+    def check_league_id(league_id: str):
+        """Raise ValueError for an id that cannot name a league directory"""
+        if not LEAGUE_ID.match(league_id):
+            raise ValueError(f"Invalid league id: {league_id!r}, use up to 64 letters, digits, '_' or '-'")
+
+    def league_path(self, league_id: str) -> str:
+        return os.path.join(self.league_dir, league_id, "league.db")
+
+    def exists(self, league_id: str) -> bool:
+        return os.path.exists(self.league_path(league_id))
+
+    def list_leagues(self) -> List[str]:
+        """Ids of every league on disk"""
+        if not os.path.isdir(self.league_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.league_dir)
+            if LEAGUE_ID.match(name) and self.exists(name)
+        )
+
+    def get(self, league_id: str, create: bool = False) -> LeagueDatabase:
+        """The open league, opening it (and closing the least recently used) if needed"""
+        closing = []
+        with self.lock:
+            league = self.leagues.get(league_id)
+            if league is not None:
+                self.leagues.move_to_end(league_id)
+            else:
+                self.check_league_id(league_id)
+                if not create and not self.exists(league_id):
+                    raise LookupError(f"League {league_id} not found")
+                os.makedirs(os.path.dirname(self.league_path(league_id)), exist_ok=True)
+                league = LeagueDatabase(league_id, self.league_path(league_id))
+                if league_id not in self.migrated:
+                    # Like the app database at startup: add tables newer than the league file
+                    Base.metadata.create_all(bind=league.engine)
+                    self.migrated.add(league_id)
+                self.leagues[league_id] = league
+                self.metrics["opened"] += 1
+                while len(self.leagues) > self.max_open:
+                    closing.append(self.leagues.popitem(last=False)[1])
+                    self.metrics["evicted"] += 1
+            league.last_used = time.monotonic()
+            closing += self._pop_idle(self.idle_seconds)
+        for stale in closing:
+            stale.close()
+        return league
+
+    def _pop_idle(self, max_idle: float) -> List[LeagueDatabase]:
+        # Least recently used first, so the idle leagues are all at the front
+        cutoff = time.monotonic() - max_idle
+        idle = []
+        while self.leagues:
+            league = next(iter(self.leagues.values()))
+            if league.last_used > cutoff:
+                break
+            idle.append(self.leagues.popitem(last=False)[1])
+        self.metrics["closed_idle"] += len(idle)
+        return idle
+
+    def close_idle(self, max_idle: Optional[float] = None) -> List[str]:
+        """Close leagues unused for max_idle seconds; returns their ids"""
+        with self.lock:
+            idle = self._pop_idle(self.idle_seconds if max_idle is None else max_idle)
+        for league in idle:
+            league.close()
+        return [league.league_id for league in idle]
+
+    def close(self, league_id: str) -> bool:
+        """Close one league; its next request opens it again"""
+        with self.lock:
+            league = self.leagues.pop(league_id, None)
+        if league is None:
+            return False
+        league.close()
+        return True
+
+    def close_all(self):
+        with self.lock:
+            leagues = list(self.leagues.values())
+            self.leagues.clear()
+        for league in leagues:
+            league.close()
+
+    def get_metrics(self) -> Dict[str, any]:
+        now = time.monotonic()
+        with self.lock:
+            return {
+                **self.metrics,
+                "open": len(self.leagues),
+                "max_open": self.max_open,
+                "idle_seconds": self.idle_seconds,
+                "leagues": [
+                    {
+                        "league_id": league.league_id,
+                        "idle_seconds": round(now - league.last_used, 1),
+                        "connections": league.engine.pool.checkedin() + league.engine.pool.checkedout()
+                    }
+                    for league in reversed(self.leagues.values())
+                ]
+            }
+
+league_pool = LeaguePool()
+
+def session_factory() -> sessionmaker:
+    """sessionmaker for the league bound to the current request"""
+    league_id = current_league.get()
+    return SessionLocal if league_id is None else league_pool.get(league_id).session_factory
+
+def league_state() -> Dict[str, any]:
+    """In-process state (caches) of the league bound to the current request"""
+    league_id = current_league.get()
+    return _default_state if league_id is None else league_pool.get(league_id).state
+
+def database_path(url: str = None) -> str:
+    """File behind a SQLite database URL, by default the current league's database"""
+    if url is None and current_league.get() is not None:
+        return league_pool.league_path(current_league.get())
+    url = make_url(url or DATABASE_URL)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        raise ValueError(f"Not a SQLite database file: {url}")
+    return url.database
+
+def dispose_engine():
+    """Close the current league's pooled connections; sessions opened later reconnect"""
+    league_id = current_league.get()
+    if league_id is not None:
+        league_pool.close(league_id)
+    else:
+        engine.dispose()
+
+def swap_engine(url: str = None):
+    """Point the current league's sessions at a fresh engine for `url` (its own database by default).
+
+    Sessions already open finish on the old engine, whose connections are
+    closed as they are returned; new sessions connect through the new one.
+    The league's in-process state is dropped with the old engine, since its
+    caches describe the old database. A hosted league is simply closed and
+    reopens with empty state on its next request.
+    """
+    global engine, DATABASE_URL
+    league_id = current_league.get()
+    if league_id is not None and url is None:
+        league_pool.close(league_id)
+        return league_pool.get(league_id).engine
+
+    old_engine = engine
+    DATABASE_URL = url or DATABASE_URL
+    engine = make_engine(DATABASE_URL)
+    SessionLocal.configure(bind=engine)
+    _default_state.clear()
+    old_engine.dispose()
+    return engine
+
+def create_tables(bind=None):
     """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=bind or engine)
 
 def get_db():
-    """Database dependency for FastAPI"""
-    db = SessionLocal()
+    """Database dependency for FastAPI, bound to the request's league"""
+    db = session_factory()()
     try:
         yield db
     finally:
@@ -3,13 +3,14 @@ import os
 from sqlalchemy.orm import Session
 from .connection import SessionLocal, create_tables
 from .models import Team, Player, Position, Contract
+from ..services.journal_service import TransactionJournal
 from datetime import datetime
 
-def init_database():
-    """Initialize database with default data"""
-    create_tables()
+def init_database(bind=None, session_factory=None):
+    """Initialize database with default data (the app database unless given a league's engine)"""
+    create_tables(bind)
     
-    db = SessionLocal()
+    db = (session_factory or SessionLocal)()
     try:
         # Check if data already exists
         if db.query(Team).first():
@@ -77,6 +78,8 @@ def init_database():
         else:
             print("contracts.json not found, skipping contract initialization")
         
+        # Starting cap totals, which journal consumers fold later changes onto
+        TransactionJournal(db).record_cap_totals()
         db.commit()
         print("Database initialized successfully")
         
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -185,3 +185,349 @@ class TeamSalaryCap(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Game(Base):
+    __tablename__ = "games"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    season = Column(Integer, nullable=False, index=True)
+    week = Column(Integer, nullable=False)
+    game_type = Column(String(10), default="regular")  # regular, playoff
+    
+    home_team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    away_team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    home_score = Column(Integer, default=0)
+    away_score = Column(Integer, default=0)
+    
+    is_final = Column(Boolean, default=False)
+    played_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class PlayerGameStat(Base):
+    __tablename__ = "player_game_stats"
+    __table_args__ = (
+        UniqueConstraint("game_id", "player_id", "stat", name="uq_player_game_stat"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    season = Column(Integer, nullable=False)
+    stat = Column(String(30), nullable=False)  # passing_yards, rushing_tds, etc.
+    value = Column(Integer, default=0)
+
+class TeamGameStat(Base):
+    __tablename__ = "team_game_stats"
+    __table_args__ = (
+        UniqueConstraint("game_id", "team_id", "stat", name="uq_team_game_stat"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    season = Column(Integer, nullable=False)
+    stat = Column(String(30), nullable=False)
+    value = Column(Integer, default=0)
+
+class PlayerSeasonStat(Base):
+    __tablename__ = "player_season_stats"
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", "stat", name="uq_player_season_stat"),
+        Index("ix_player_season_stats_leaders", "season", "stat", "value"),
+        Index("ix_player_season_stats_position_leaders", "season", "position", "stat", "value"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    season = Column(Integer, nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"))  # Most recent team that season
+    position = Column(String(5))  # Denormalized so leaderboards never join players
+    stat = Column(String(30), nullable=False)
+    value = Column(Integer, default=0)
+
+class PlayerCareerStat(Base):
+    __tablename__ = "player_career_stats"
+    __table_args__ = (
+        UniqueConstraint("player_id", "stat", name="uq_player_career_stat"),
+        Index("ix_player_career_stats_leaders", "stat", "value"),
+        Index("ix_player_career_stats_position_leaders", "position", "stat", "value"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    position = Column(String(5))
+    stat = Column(String(30), nullable=False)
+    value = Column(Integer, default=0)
+
+class TeamSeasonStat(Base):
+    __tablename__ = "team_season_stats"
+    __table_args__ = (
+        UniqueConstraint("team_id", "season", "stat", name="uq_team_season_stat"),
+        Index("ix_team_season_stats_leaders", "season", "stat", "value"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    season = Column(Integer, nullable=False)
+    stat = Column(String(30), nullable=False)
+    value = Column(Integer, default=0)
+
+class TeamCareerStat(Base):
+    __tablename__ = "team_career_stats"
+    __table_args__ = (
+        UniqueConstraint("team_id", "stat", name="uq_team_career_stat"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    stat = Column(String(30), nullable=False)
+    value = Column(Integer, default=0)
+
+class Play(Base):
+    __tablename__ = "plays"
+    __table_args__ = (
+        Index("ix_plays_season_game", "season", "game_id", "play_number"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    play_number = Column(Integer, nullable=False)  # Order within the game
+    
+    # Situation before the snap
+    offense_team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    defense_team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    quarter = Column(Integer, nullable=False)
+    seconds_remaining = Column(Integer)  # Seconds left in the quarter
+    down = Column(Integer)
+    distance = Column(Integer)
+    yardline = Column(Integer)  # Yards from the opponent's end zone
+    
+    # Result
+    play_type = Column(String(12))  # run, pass, punt, field_goal
+    yards_gained = Column(Integer, default=0)
+    passer_id = Column(Integer, ForeignKey("players.id"))
+    rusher_id = Column(Integer, ForeignKey("players.id"))
+    receiver_id = Column(Integer, ForeignKey("players.id"))
+    kicker_id = Column(Integer, ForeignKey("players.id"))
+    is_complete = Column(Boolean, default=False)
+    is_sack = Column(Boolean, default=False)
+    is_touchdown = Column(Boolean, default=False)
+    is_turnover = Column(Boolean, default=False)
+    is_first_down = Column(Boolean, default=False)
+    points = Column(Integer, default=0)
+    scoring_team_id = Column(Integer, ForeignKey("teams.id"))
+
+class PlayerInjury(Base):
+    __tablename__ = "player_injuries"
+    __table_args__ = (
+        Index("ix_player_injuries_recovery", "is_active", "return_key"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"))
+    
+    injury_type = Column(String(30))  # hamstring, ankle, knee, etc.
+    injury_status = Column(String(50))  # questionable, out, season_ending
+    weeks_out = Column(Integer, nullable=False)
+    
+    # When it happened and when the player is due back
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+    return_season = Column(Integer, nullable=False)
+    return_week = Column(Integer, nullable=False)
+    return_key = Column(Integer, nullable=False)  # season * 100 + week, orders the recovery queue
+    
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class DraftProspect(Base):
+    __tablename__ = "draft_prospects"
+    __table_args__ = (
+        Index("ix_draft_prospects_class_rank", "draft_year", "class_rank"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False, unique=True)
+    draft_year = Column(Integer, nullable=False)
+    
+    # Consensus board
+    class_rank = Column(Integer)
+    position_rank = Column(Integer)
+    projected_round = Column(Integer)  # 8 = projected undrafted
+    class_strength = Column(Float)  # Standard deviations above an average class
+    
+    # Combine results
+    forty_yard_dash = Column(Float)  # Seconds
+    bench_press = Column(Integer)  # 225 lb reps
+    vertical_jump = Column(Float)  # Inches
+    broad_jump = Column(Integer)  # Inches
+    three_cone = Column(Float)  # Seconds
+    shuttle = Column(Float)  # Seconds
+    
+    # Flags
+    injury_flag = Column(Boolean, default=False)
+    character_flag = Column(Boolean, default=False)
+    
+    # Draft result
+    is_drafted = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class DraftPick(Base):
+    __tablename__ = "draft_picks"
+    __table_args__ = (
+        UniqueConstraint("draft_year", "overall_pick", name="uq_draft_picks_year_pick"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    draft_year = Column(Integer, nullable=False, index=True)
+    round = Column(Integer, nullable=False)
+    pick_in_round = Column(Integer, nullable=False)
+    overall_pick = Column(Integer, nullable=False)
+    
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    player_id = Column(Integer, ForeignKey("players.id"))
+    
+    # Rookie contract signed for this pick
+    contract_id = Column(Integer, ForeignKey("contracts.id"))
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class TeamRookiePool(Base):
+    __tablename__ = "team_rookie_pools"
+    __table_args__ = (
+        UniqueConstraint("team_id", "year", name="uq_team_rookie_pools_team_year"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    
+    # Year-one rookie compensation allowed by the team's picks, and what was signed
+    allocation = Column(Integer, default=0)
+    used = Column(Integer, default=0)
+    picks_signed = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Scout(Base):
+    __tablename__ = "scouts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
+    first_name = Column(String(50), nullable=False)
+    last_name = Column(String(50), nullable=False)
+    
+    # Evaluation ability (0-100 scale)
+    accuracy = Column(Integer, default=50)
+    specialty = Column(String(20))  # offense, defense, special_teams
+    
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class ScoutingEffort(Base):
+    __tablename__ = "scouting_efforts"
+    __table_args__ = (
+        UniqueConstraint("team_id", "player_id", name="uq_scouting_efforts_team_player"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    
+    hours = Column(Float, default=0)  # Scouting time invested in the player
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class TeamStrategy(Base):
+    __tablename__ = "team_strategies"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, unique=True)
+    
+    # AI front office philosophy: win_now, rebuild, balanced, cap_conscious
+    philosophy = Column(String(20), nullable=False, default="balanced")
+    is_user_controlled = Column(Boolean, default=False)  # Skipped by the AI GM engine
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class FreeAgentSigning(Base):
+    __tablename__ = "free_agent_signings"
+    __table_args__ = (
+        Index("ix_free_agent_signings_year_salary", "year", "average_salary"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    year = Column(Integer, nullable=False)  # League year of the free agency period
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    former_team_id = Column(Integer, ForeignKey("teams.id"))  # Team whose contract expired, if any
+    contract_id = Column(Integer, ForeignKey("contracts.id"))
+    
+    average_salary = Column(Integer, default=0)  # Average per year, signing bonus included
+    years = Column(Integer)
+    day = Column(Integer)  # Day of the free agency period
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class CompensatoryPick(Base):
+    __tablename__ = "compensatory_picks"
+    __table_args__ = (
+        UniqueConstraint("draft_year", "team_id", "lost_player_id", name="uq_compensatory_picks_year_team_player"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    draft_year = Column(Integer, nullable=False, index=True)
+    round = Column(Integer, nullable=False)
+    order_in_round = Column(Integer, nullable=False)  # Comp picks follow the round's regular picks
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    
+    # Free agent loss the pick compensates for
+    lost_player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    value = Column(Integer, default=0)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class JournalEvent(Base):
+    __tablename__ = "journal_events"
+    
+    # Append-only: rows are never updated, and the id is the event's offset
+    id = Column(Integer, primary_key=True, index=True)
+    event_type = Column(String(20), nullable=False)  # signing, release, cap_snapshot, roster_move, ... (EVENT_TYPES)
+    team_id = Column(Integer, ForeignKey("teams.id"))
+    player_id = Column(Integer, ForeignKey("players.id"))
+    contract_id = Column(Integer, ForeignKey("contracts.id"))
+    data = Column(Text)  # JSON details of the change
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class JournalConsumer(Base):
+    __tablename__ = "journal_consumers"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(50), nullable=False, unique=True)
+    last_event_id = Column(Integer, default=0)  # Offset of the last event applied to the consumer's view
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class TeamCapLedger(Base):
+    __tablename__ = "team_cap_ledger"
+    __table_args__ = (
+        UniqueConstraint("team_id", "year", name="uq_team_cap_ledger_year"),
+    )
+    
+    # Cap totals folded from journal events by the team_cap_totals consumer
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    
+    adjusted_cap = Column(Integer, nullable=False)
+    total_cap_used = Column(Integer, nullable=False, default=0)
+    total_dead_money = Column(Integer, nullable=False, default=0)
+    total_contracts = Column(Integer, nullable=False, default=0)
+    cap_space = Column(Integer, nullable=False)
+    
+    last_event_id = Column(Integer)  # Offset of the last event folded into the row
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
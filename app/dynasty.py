@@ -0,0 +1,256 @@
+"""Headless multi-season dynasty simulation.
+
+Runs the league unattended without the web server:
+
+    python -m app.dynasty --seasons 40 --checkpoint-every 5
+
+Each season goes schedule -> regular season -> playoffs -> rollover ->
+draft -> free agency, so the draft and free agency happen in the new
+league year. League state is checkpointed before the first season and
+every N seasons after it, keeping the last K snapshots, and --resume picks
+up from the latest checkpoint after a crash.
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import sqlite3
+import time
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the league for many seasons without the web server")
+    parser.add_argument("--seasons", type=int, default=30, help="Total number of seasons to simulate")
+    parser.add_argument("--checkpoint-every", type=int, default=5, help="Checkpoint league state every N seasons")
+    parser.add_argument("--checkpoint-dir", default="checkpoints", help="Directory for checkpoint databases")
+    parser.add_argument("--keep-checkpoints", type=int, default=3, help="Season snapshots to keep; older ones are deleted")
+    parser.add_argument("--database", default=None, help="SQLite file to run against (defaults to the app database)")
+    parser.add_argument("--metrics-file", default=None, help="Append per-season metrics as JSON lines")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible runs")
+    parser.add_argument("--resume", action="store_true", help="Resume from the latest checkpoint")
+    return parser.parse_args(argv)
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in megabytes"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        # No procfs (macOS): fall back to peak RSS, reported in bytes there
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024)
+
+def database_size_mb(path: str) -> float:
+    """Size of the database file plus any write-ahead log"""
+    total = 0
+    for suffix in ("", "-wal"):
+        if os.path.exists(path + suffix):
+            total += os.path.getsize(path + suffix)
+    return total / (1024 * 1024)
+
+def copy_database(source_path: str, target_path: str):
+    """Copy a live SQLite database with the online backup API"""
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+SNAPSHOT_NAME = re.compile(r"^season_(\d+)\.db$")
+
+class DynastyRunner:
+    def __init__(self, database_path: str, checkpoint_dir: str, checkpoint_every: int,
+                 metrics_file: str = None, seed: int = None, keep_checkpoints: int = 3):
+        from .database.connection import SessionLocal, engine
+
+        self.session_factory = SessionLocal
+        self.engine = engine
+        self.database_path = database_path
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        self.keep_checkpoints = keep_checkpoints
+        self.metrics_file = metrics_file
+        self.seed = seed
+        self.state_file = os.path.join(checkpoint_dir, "latest.json")
+
+    def current_season(self) -> int:
+        from .services.salary_cap_service import SalaryCapService
+
+        db = self.session_factory()
+        try:
+            return SalaryCapService(db).current_year
+        finally:
+            db.close()
+
+    def _season_seed(self, season: int):
+        return None if self.seed is None else self.seed * 1000 + season
+
+    def run_season(self) -> dict:
+        """Play one full league year and roll over into the next"""
+        from .services.salary_cap_service import SalaryCapService
+        from .services.season_service import SeasonService
+        from .services.offseason_service import OffseasonService
+
+        db = self.session_factory()
+        try:
+            season = SalaryCapService(db).current_year
+            seed = self._season_seed(season)
+            season_service = SeasonService(db, seed)
+
+            stages = {}
+            started = time.perf_counter()
+
+            stage_start = time.perf_counter()
+            season_service.generate_schedule(season)
+            stages["schedule"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            regular_season = season_service.simulate_regular_season(season)
+            stages["regular_season"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            playoffs = season_service.run_playoffs(season)
+            stages["playoffs"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            rollover = OffseasonService(db, seed).rollover_season()
+            stages["rollover"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            draft = self.run_draft(db, rollover["current_year"])
+            stages["draft"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            free_agency = self.run_free_agency(db, rollover["current_year"])
+            stages["free_agency"] = time.perf_counter() - stage_start
+
+            return {
+                "season": season,
+                "champion_team_id": playoffs.get("champion_team_id"),
+                "games": regular_season["games"],
+                "plays": regular_season["plays"],
+                "drafted": draft.get("drafted", 0),
+                "free_agents_signed": free_agency.get("signed", 0),
+                "players_retired": rollover["players_retired"],
+                "seconds": round(time.perf_counter() - started, 3),
+                "stage_seconds": {name: round(value, 3) for name, value in stages.items()}
+            }
+        finally:
+            db.close()
+
+    def run_draft(self, db, year: int) -> dict:
+        """Generate the year's draft class, let every team pick and sign the rookies"""
+        from .services.draft_class_service import DraftClassService
+        from .services.draft_service import DraftService
+
+        from .database.models import DraftProspect
+
+        seed = self._season_seed(year)
+        if not db.query(DraftProspect).filter(DraftProspect.draft_year == year).first():
+            DraftClassService(db, seed).generate_class(year)
+
+        draft_service = DraftService(db, seed)
+        draft = draft_service.run_draft(year)
+        if "error" not in draft:
+            draft["signed"] = draft_service.sign_draft_class(year).get("contracts_signed", 0)
+        return draft
+
+    def run_free_agency(self, db, year: int) -> dict:
+        """Run the league-wide free agency market and award next year's compensatory picks"""
+        from .services.free_agency_service import FreeAgencyService
+        from .services.compensatory_pick_service import CompensatoryPickService
+
+        free_agency = FreeAgencyService(db, self._season_seed(year)).run_free_agency(year)
+        free_agency["compensatory_picks"] = CompensatoryPickService(db).award(year)["awarded"]
+        return free_agency
+
+    def checkpoint(self, completed: int, target: int, season: int):
+        """Snapshot the database and atomically record progress"""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        snapshot = os.path.join(self.checkpoint_dir, f"season_{season}.db")
+        copy_database(self.database_path, snapshot)
+
+        state = {"completed_seasons": completed, "target_seasons": target, "last_season": season, "snapshot": snapshot}
+        temp_file = self.state_file + ".tmp"
+        with open(temp_file, "w") as f:
+            json.dump(state, f)
+        os.replace(temp_file, self.state_file)
+        self.prune_checkpoints()
+
+    def prune_checkpoints(self):
+        """Delete all but the newest keep_checkpoints season snapshots"""
+        seasons = sorted(
+            int(match.group(1)) for match in map(SNAPSHOT_NAME.match, os.listdir(self.checkpoint_dir)) if match
+        )
+        for season in seasons[:-self.keep_checkpoints]:
+            os.remove(os.path.join(self.checkpoint_dir, f"season_{season}.db"))
+
+    def restore(self) -> dict:
+        """Restore the database from the latest checkpoint"""
+        with open(self.state_file) as f:
+            state = json.load(f)
+
+        # Close pooled connections before overwriting the live database
+        self.engine.dispose()
+        copy_database(state["snapshot"], self.database_path)
+        return state
+
+    def record_metrics(self, metrics: dict):
+        """Print a season's throughput line and append it to the metrics file"""
+        print(
+            f"Season {metrics['season']}: {metrics['seconds']:.2f}s, "
+            f"{metrics['games']} games, {metrics['plays']} plays, "
+            f"DB {metrics['db_size_mb']:.1f} MB, RSS {metrics['rss_mb']:.1f} MB"
+        )
+        if self.metrics_file:
+            with open(self.metrics_file, "a") as f:
+                f.write(json.dumps(metrics) + "\n")
+
+    def run(self, seasons: int, resume: bool = False):
+        """Simulate until `seasons` seasons are complete, counting any resumed progress"""
+        completed = 0
+        target = seasons
+        if resume and os.path.exists(self.state_file):
+            state = self.restore()
+            completed = state["completed_seasons"]
+            print(f"Resumed after season {state['last_season']} ({completed}/{target} seasons complete)")
+        else:
+            # A crash in the first seasons can still resume from the starting league
+            self.checkpoint(completed, target, self.current_season() - 1)
+
+        while completed < target:
+            metrics = self.run_season()
+            completed += 1
+            metrics["completed_seasons"] = completed
+            metrics["db_size_mb"] = round(database_size_mb(self.database_path), 2)
+            metrics["rss_mb"] = round(current_rss_mb(), 1)
+            self.record_metrics(metrics)
+
+            if completed % self.checkpoint_every == 0 or completed == target:
+                self.checkpoint(completed, target, metrics["season"])
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Point the app at the requested database before any engine is created
+    if args.database:
+        os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{args.database}"
+    database_path = args.database or "nfl_gm.db"
+
+    from .database.init_db import init_database
+    init_database()
+
+    runner = DynastyRunner(
+        database_path=database_path,
+        checkpoint_dir=args.checkpoint_dir,
+        checkpoint_every=max(1, args.checkpoint_every),
+        keep_checkpoints=max(1, args.keep_checkpoints),
+        metrics_file=args.metrics_file,
+        seed=args.seed
+    )
+    runner.run(args.seasons, resume=args.resume)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 
-from .api import teams, players, salary_cap
+from .api import teams, players, salary_cap, stats, analytics, injuries, league, draft, scouting, trades, ai_gm, free_agency, roster, cache, export, imports, journal, saves, leagues
+from .services.response_cache import ResponseCacheMiddleware
+from .services.league_service import LeagueMiddleware, close_idle_leagues
+from .database.connection import league_pool
 from .database.init_db import init_database
 
 @asynccontextmanager
@@ -15,9 +19,23 @@ async def lifespan(app: FastAPI):
         print("✅ Database initialized successfully")
     except Exception as e:
         print(f"❌ Error initializing database: {e}")
+    sweeper = asyncio.create_task(close_idle_leagues())
     yield
+    sweeper.cancel()
+    league_pool.close_all()
 
-app = FastAPI(title="NFL GM Simulator", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="NFL GM Simulator",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Serve repeat reads of hot GET endpoints from the response cache
+app.add_middleware(ResponseCacheMiddleware)
+
+# Bind each request to its league before anything touches a database or cache
+app.add_middleware(LeagueMiddleware)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -29,6 +47,22 @@ templates = Jinja2Templates(directory="app/templates")
 app.include_router(teams.router, prefix="/api/teams", tags=["teams"])
 app.include_router(players.router, prefix="/api/players", tags=["players"])
 app.include_router(salary_cap.router, prefix="/api/salary-cap", tags=["salary-cap"])
+app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
+app.include_router(injuries.router, prefix="/api/injuries", tags=["injuries"])
+app.include_router(league.router, prefix="/api/league", tags=["league"])
+app.include_router(draft.router, prefix="/api/draft", tags=["draft"])
+app.include_router(scouting.router, prefix="/api/scouting", tags=["scouting"])
+app.include_router(trades.router, prefix="/api/trades", tags=["trades"])
+app.include_router(ai_gm.router, prefix="/api/ai-gm", tags=["ai-gm"])
+app.include_router(free_agency.router, prefix="/api/free-agency", tags=["free-agency"])
+app.include_router(roster.router, prefix="/api/roster", tags=["roster"])
+app.include_router(cache.router, prefix="/api/cache", tags=["cache"])
+app.include_router(export.router, prefix="/api/export", tags=["export"])
+app.include_router(imports.router, prefix="/api/import", tags=["import"])
+app.include_router(journal.router, prefix="/api/journal", tags=["journal"])
+app.include_router(saves.router, prefix="/api/saves", tags=["saves"])
+app.include_router(leagues.router, prefix="/api/leagues", tags=["leagues"])
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard_page(request: Request):
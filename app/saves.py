@@ -0,0 +1,77 @@
+"""Save slots without the web server.
+
+    python -m app.saves save before-deadline --description "Week 8, pre-trade"
+    python -m app.saves load before-deadline
+    python -m app.saves list
+
+Saves are consistent snapshots taken with the SQLite online backup API, so
+they can be taken while the server is running. Slots past the most
+recently used few are gzipped after each save.
+"""
+import argparse
+import json
+import os
+import sys
+
+def parse_args(argv=None):
+    # The save service connects on import, so its defaults are applied there rather than here
+    parser = argparse.ArgumentParser(description="Save, load and list league save slots")
+    parser.add_argument("--database", default=None, help="SQLite file to run against (defaults to the app database)")
+    parser.add_argument("--save-dir", default=None, help="Directory holding the save slots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    save = subparsers.add_parser("save", help="Snapshot the league into a named slot")
+    save.add_argument("name")
+    save.add_argument("--description", default=None)
+    save.add_argument("--overwrite", action="store_true", help="Replace an existing save with the same name")
+    save.add_argument("--keep", type=int, default=None, help="Slots left uncompressed (default 3)")
+
+    load = subparsers.add_parser("load", help="Replace the league with a saved slot")
+    load.add_argument("name")
+
+    subparsers.add_parser("list", help="List save slots, most recently used first")
+
+    delete = subparsers.add_parser("delete", help="Delete a save slot")
+    delete.add_argument("name")
+
+    compress = subparsers.add_parser("compress", help="Gzip slots past the most recently used")
+    compress.add_argument("--keep", type=int, default=None, help="Slots left uncompressed (default 3)")
+    return parser.parse_args(argv)
+
+def run_save(service, args):
+    result = service.save(args.name, args.description, args.overwrite)
+    result["compressed_slots"] = service.compress_old_slots(args.keep)
+    return result
+
+def run_load(service, args):
+    if service.get_slot(args.name) is None:
+        raise ValueError(f"No save named {args.name}")
+    return service.load(args.name)
+
+def run_delete(service, args):
+    if not service.delete(args.name):
+        raise ValueError(f"No save named {args.name}")
+    return {"deleted": args.name}
+
+COMMANDS = {
+    "save": run_save,
+    "load": run_load,
+    "list": lambda service, args: service.list_slots(),
+    "delete": run_delete,
+    "compress": lambda service, args: {"compressed_slots": service.compress_old_slots(args.keep)}
+}
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Point the app at the requested database before any engine is created
+    if args.database:
+        os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{args.database}"
+
+    from .services.save_service import SaveService
+    try:
+        print(json.dumps(COMMANDS[args.command](SaveService(args.save_dir), args), indent=2))
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,546 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, insert, func, bindparam, Integer
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+from ..database.models import Player, Position, Contract, Team, TeamStrategy
+from ..services.salary_cap_service import SalaryCapService
+from ..services.contract_service import ContractService, MARKET_POSITION_MULTIPLIERS
+from ..services.roster_service import RosterService, ACTIVE_ROSTER_LIMIT
+from ..services.response_cache import response_cache
+from ..services.journal_service import TransactionJournal, journal_entry, cap_change
+import math
+import os
+import numpy as np
+import time
+
+VETERAN_MINIMUM_SALARY = 1125000
+
+# Status codes in the shared snapshot
+ACTIVE, PRACTICE_SQUAD, INJURED_RESERVE, FREE_AGENT = 0, 1, 2, 3
+ROSTER_STATUS_CODES = {
+    "active": ACTIVE, "practice_squad": PRACTICE_SQUAD,
+    "injured_reserve": INJURED_RESERVE, "free_agent": FREE_AGENT
+}
+INJURY_CODES = {"healthy": 0, "questionable": 1, "out": 2, "season_ending": 3}
+
+# Front office philosophies
+PHILOSOPHIES = ["win_now", "rebuild", "balanced", "cap_conscious"]
+STRATEGY_PROFILES = {
+    "win_now": {
+        "extension_min_overall": 70, "extension_max_age": 33, "offer_ratio": 1.05, "bonus_ratio": 0.5,
+        "youth_weight": 0.1, "cap_buffer": 0.0, "free_agent_ratio": 0.8, "restructure_to_clear_cap": True
+    },
+    "rebuild": {
+        "extension_min_overall": 65, "extension_max_age": 27, "offer_ratio": 0.95, "bonus_ratio": 0.2,
+        "youth_weight": 0.6, "cap_buffer": 0.05, "free_agent_ratio": 0.5, "restructure_to_clear_cap": False
+    },
+    "balanced": {
+        "extension_min_overall": 68, "extension_max_age": 30, "offer_ratio": 1.0, "bonus_ratio": 0.3,
+        "youth_weight": 0.3, "cap_buffer": 0.02, "free_agent_ratio": 0.6, "restructure_to_clear_cap": True
+    },
+    "cap_conscious": {
+        "extension_min_overall": 72, "extension_max_age": 29, "offer_ratio": 0.9, "bonus_ratio": 0.1,
+        "youth_weight": 0.4, "cap_buffer": 0.08, "free_agent_ratio": 0.5, "restructure_to_clear_cap": False
+    }
+}
+
+# Weekly limits per team
+MAX_EXTENSIONS_PER_WEEK = 1
+FREE_AGENT_ALTERNATIVES = 3
+
+# Action priorities when the writer resolves conflicts (higher goes first)
+ACTION_PRIORITY = {
+    "move_to_ir": 100, "release": 90, "restructure": 85, "activate_from_ir": 70,
+    "promote": 60, "sign_free_agent": 50, "extend": 40
+}
+
+def _attach_snapshot(name: str, layout: Dict[str, tuple]):
+    """Attach to the shared snapshot and return read-only array views"""
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers every attach with the resource tracker. Forked
+        # workers share the parent's tracker, but spawned ones would unlink the
+        # block when they exit
+        import multiprocessing
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        if multiprocessing.get_start_method() != "fork":
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+    arrays = {}
+    for key, (offset, dtype, length) in layout.items():
+        array = np.ndarray((length,), dtype=dtype, buffer=shm.buf, offset=offset)
+        array.flags.writeable = False
+        arrays[key] = array
+    return shm, arrays
+
+def _plan_teams_worker(name: str, layout: Dict[str, tuple], team_indices: List[int],
+                       season: int, week: int, seed: int) -> List[Dict[str, any]]:
+    """Process pool worker: plan a batch of teams against the shared snapshot"""
+    shm, arrays = _attach_snapshot(name, layout)
+    try:
+        actions = []
+        for team_index in team_indices:
+            actions.extend(plan_team_week(arrays, team_index, season, week, seed))
+        return actions
+    finally:
+        del arrays
+        shm.close()
+
+def plan_team_week(arrays: Dict[str, np.ndarray], team_index: int, season: int,
+                   week: int, seed: int) -> List[Dict[str, any]]:
+    """Decide one AI team's moves for the week from the read-only snapshot.
+
+    Season-ending injuries go to IR and healed IR players come back; thin
+    positions are filled from the practice squad, then free agency; rosters
+    over the limit and cap overages are fixed by cuts or restructures; and
+    expiring players the philosophy values are offered extensions on
+    ContractService terms (market value, acceptance chance).
+    """
+    team_id = int(arrays["team_ids"][team_index])
+    profile = STRATEGY_PROFILES[PHILOSOPHIES[int(arrays["philosophy"][team_index])]]
+    rng = np.random.default_rng([seed, season, week, team_id])
+
+    team, status, injury = arrays["team_index"], arrays["status"], arrays["injury"]
+    positions = arrays["position_index"]
+    typical = arrays["typical_roster"]
+    mine = team == team_index
+    active = mine & (status == ACTIVE)
+
+    actions = []
+    def propose(action_type, player, **details):
+        actions.append({
+            "type": action_type,
+            "team_id": team_id,
+            "player_id": int(arrays["player_id"][player]),
+            "contract_id": int(arrays["contract_id"][player]) or None,
+            "priority": ACTION_PRIORITY[action_type],
+            **details
+        })
+
+    # Injured reserve moves
+    to_ir = np.flatnonzero(active & (injury == INJURY_CODES["season_ending"]))
+    for player in to_ir:
+        propose("move_to_ir", player)
+    healed = np.flatnonzero(mine & (status == INJURED_RESERVE) & (injury == INJURY_CODES["healthy"]))
+    for player in healed:
+        propose("activate_from_ir", player)
+
+    roster_count = int(active.sum()) - len(to_ir) + len(healed)
+    cap_space = int(arrays["cap_space"][team_index]) - int(profile["cap_buffer"] * arrays["adjusted_cap"][team_index])
+    available = active & (injury < INJURY_CODES["out"])
+    available[healed] = True
+
+    # Fill positions that can no longer field their starters
+    starters_needed = np.ceil(typical / 2).astype(int)
+    counts = np.bincount(positions[available], minlength=len(typical))
+    practice_squad = mine & (status == PRACTICE_SQUAD)
+    free_agents = status == FREE_AGENT
+    asking = np.maximum(VETERAN_MINIMUM_SALARY, arrays["market_value"] * profile["free_agent_ratio"]).astype(np.int64)
+    for position in np.flatnonzero(counts < starters_needed):
+        for _ in range(int(starters_needed[position] - counts[position])):
+            promotable = np.flatnonzero(practice_squad & (positions == position))
+            if len(promotable):
+                player = promotable[np.argmax(arrays["overall"][promotable])]
+                practice_squad[player] = False
+                propose("promote", player)
+                roster_count += 1
+                continue
+
+            candidates = np.flatnonzero(free_agents & (positions == position) & (asking <= cap_space))
+            if not len(candidates):
+                break
+            ranked = candidates[np.argsort(-arrays["overall"][candidates], kind="stable")][:FREE_AGENT_ALTERNATIVES]
+            propose(
+                "sign_free_agent", ranked[0],
+                alternatives=[int(arrays["player_id"][p]) for p in ranked],
+                salaries=[int(asking[p]) for p in ranked]
+            )
+            free_agents[ranked[0]] = False
+            cap_space -= int(asking[ranked[0]])
+            roster_count += 1
+
+    # Keep score: current ability, plus upside for teams that value youth
+    overall, potential, age = arrays["overall"], arrays["potential"], arrays["age"]
+    keep_score = overall + profile["youth_weight"] * np.maximum(0, potential - overall) - np.maximum(0, age - 30)
+    dead_money = arrays["signing_bonus"]
+    cap_savings = arrays["cap_hit"] - dead_money
+
+    cuttable = available.copy()
+    cuttable[to_ir] = False
+    released = set()
+    while roster_count > ACTIVE_ROSTER_LIMIT:
+        position_counts = np.bincount(positions[cuttable], minlength=len(typical))
+        candidates = np.flatnonzero(cuttable & (position_counts[positions] > starters_needed[positions]) & (cap_savings >= 0))
+        if not len(candidates):
+            break
+        player = candidates[np.argmin(keep_score[candidates])]
+        propose("release", player)
+        released.add(player)
+        cuttable[player] = False
+        cap_space += int(cap_savings[player])
+        roster_count -= 1
+
+    # Get back under the cap
+    contracted = np.flatnonzero(mine & (arrays["contract_id"] > 0) & (status != FREE_AGENT))
+    contracted = np.array([p for p in contracted if p not in released], dtype=int)
+    if cap_space < 0 and len(contracted):
+        if profile["restructure_to_clear_cap"]:
+            room = arrays["base_salary"] - VETERAN_MINIMUM_SALARY
+            for player in contracted[np.argsort(-room[contracted], kind="stable")]:
+                if cap_space >= 0 or room[player] <= 0:
+                    break
+                amount = int(min(room[player], -cap_space * 2))
+                propose("restructure", player, restructure_amount=amount)
+                cap_space += amount // 2
+        else:
+            efficiency = cap_savings[contracted] / np.maximum(keep_score[contracted], 1)
+            for player in contracted[np.argsort(-efficiency, kind="stable")]:
+                if cap_space >= 0 or cap_savings[player] <= 0:
+                    break
+                propose("release", player)
+                released.add(player)
+                cap_space += int(cap_savings[player])
+
+    # Extensions for expiring players the philosophy wants to keep
+    expiring = np.flatnonzero(
+        mine & (status != FREE_AGENT) & (arrays["contract_id"] > 0) & (arrays["years_left"] <= 1)
+        & (overall >= profile["extension_min_overall"]) & (age <= profile["extension_max_age"])
+    )
+    expiring = np.array([p for p in expiring if p not in released], dtype=int)
+    if len(expiring):
+        market = arrays["market_value"][expiring].astype(float)
+        offers = market * profile["offer_ratio"]
+        chances = ContractService.calculate_acceptance_chance_batch(
+            market, offers, np.ones(len(expiring), dtype=bool), arrays["work_ethic"][expiring]
+        )
+        accepted = rng.random(len(expiring)) < chances
+        extended = 0
+        for i in np.argsort(-keep_score[expiring], kind="stable"):
+            if extended >= MAX_EXTENSIONS_PER_WEEK:
+                break
+            if not accepted[i]:
+                continue
+            player = expiring[i]
+            years = 4 if age[player] <= 27 else 3 if age[player] <= 30 else 2
+            signing_bonus = int(offers[i] * profile["bonus_ratio"])
+            base_salary = int(offers[i])
+            new_cap_hit = base_salary + signing_bonus // years
+            if new_cap_hit - arrays["cap_hit"][player] > cap_space:
+                continue
+            propose("extend", player, base_salary=base_salary, years=years, signing_bonus=signing_bonus)
+            cap_space -= int(new_cap_hit - arrays["cap_hit"][player])
+            extended += 1
+
+    return actions
+
+class AIGMService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.seed = seed or 0
+        self.salary_cap_service = SalaryCapService(db)
+
+    def get_strategies(self) -> Dict[int, TeamStrategy]:
+        """Get every team's strategy, assigning default philosophies the first time"""
+        strategies = {s.team_id: s for s in self.db.query(TeamStrategy).all()}
+        missing = [team.id for team in self.db.query(Team.id).all() if team.id not in strategies]
+        if missing:
+            self.db.execute(TeamStrategy.__table__.insert(), [
+                {"team_id": team_id, "philosophy": PHILOSOPHIES[team_id % len(PHILOSOPHIES)], "is_user_controlled": False}
+                for team_id in missing
+            ])
+            self.db.flush()
+            strategies = {s.team_id: s for s in self.db.query(TeamStrategy).all()}
+        return strategies
+
+    def set_strategy(self, team_id: int, philosophy: Optional[str] = None,
+                     is_user_controlled: Optional[bool] = None) -> Dict[str, any]:
+        """Change a team's philosophy or hand it to (or take it from) the user"""
+        if philosophy is not None and philosophy not in STRATEGY_PROFILES:
+            return {"error": f"Unknown philosophy, expected one of {', '.join(PHILOSOPHIES)}"}
+        strategy = self.get_strategies().get(team_id)
+        if not strategy:
+            return {"error": "Team not found"}
+        if philosophy is not None:
+            strategy.philosophy = philosophy
+        if is_user_controlled is not None:
+            strategy.is_user_controlled = is_user_controlled
+        self.db.commit()
+        return {"team_id": team_id, "philosophy": strategy.philosophy, "is_user_controlled": strategy.is_user_controlled}
+
+    def build_snapshot(self, user_team_id: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Read the league once into flat arrays for the planners"""
+        strategies = self.get_strategies()
+        team_ids = sorted(strategies)
+        team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+
+        positions = self.db.query(Position).order_by(Position.id).all()
+        position_index = {p.code: i for i, p in enumerate(positions)}
+
+        end_year = func.cast(func.strftime('%Y', Contract.end_date), Integer)
+        rows = self.db.execute(
+            select(
+                Player.id, Player.team_id, Player.position, Player.roster_status, Player.injury_status,
+                Player.overall_rating, Player.potential, Player.age, Player.years_pro, Player.work_ethic,
+                Contract.id, self.salary_cap_service.current_cap_hit(), Contract.year_1_salary,
+                Contract.signing_bonus, end_year
+            )
+            .outerjoin(Contract, (Contract.player_id == Player.id) & (Contract.is_active == True))
+            .where(Player.roster_status.in_(list(ROSTER_STATUS_CODES)))
+        ).all()
+
+        current_year = self.salary_cap_service.current_year
+        columns = list(zip(*rows)) if rows else [()] * 15
+        overall = np.array([v or 50 for v in columns[5]], dtype=float)
+        age = np.array([v or 25 for v in columns[7]], dtype=float)
+        position_codes = columns[2]
+        market_value = ContractService.calculate_market_value_batch(
+            overall,
+            np.array([MARKET_POSITION_MULTIPLIERS.get(code, 1.0) for code in position_codes]),
+            age,
+            np.array([v or 0 for v in columns[8]], dtype=float)
+        )
+
+        cap_totals = self.salary_cap_service.calculate_team_cap_totals(team_ids)
+        return {
+            "player_id": np.array(columns[0], dtype=np.int64),
+            "team_index": np.array([team_index.get(v, -1) if v else -1 for v in columns[1]], dtype=np.int64),
+            "position_index": np.array([position_index.get(code, 0) for code in position_codes], dtype=np.int64),
+            "status": np.array([ROSTER_STATUS_CODES[v] for v in columns[3]], dtype=np.int64),
+            "injury": np.array([INJURY_CODES.get(v or "healthy", 0) for v in columns[4]], dtype=np.int64),
+            "overall": overall,
+            "potential": np.array([v or 50 for v in columns[6]], dtype=float),
+            "age": age,
+            "work_ethic": np.array([v or 50 for v in columns[9]], dtype=float),
+            "contract_id": np.array([v or 0 for v in columns[10]], dtype=np.int64),
+            "cap_hit": np.array([int(v or 0) for v in columns[11]], dtype=np.int64),
+            "base_salary": np.array([int(v or 0) for v in columns[12]], dtype=np.int64),
+            "signing_bonus": np.array([int(v or 0) for v in columns[13]], dtype=np.int64),
+            "years_left": np.array([(v - current_year) if v else 0 for v in columns[14]], dtype=np.int64),
+            "market_value": market_value.astype(np.int64),
+            "team_ids": np.array(team_ids, dtype=np.int64),
+            "cap_space": np.array([cap_totals[t]["cap_space"] for t in team_ids], dtype=np.int64),
+            "adjusted_cap": np.array([cap_totals[t]["adjusted_cap"] for t in team_ids], dtype=np.int64),
+            "philosophy": np.array([PHILOSOPHIES.index(strategies[t].philosophy) for t in team_ids], dtype=np.int64),
+            "is_ai": np.array([
+                not strategies[t].is_user_controlled and t != user_team_id for t in team_ids
+            ], dtype=np.int64),
+            "typical_roster": np.array([p.typical_roster or 1 for p in positions], dtype=np.int64)
+        }
+
+    def plan_week(self, snapshot: Dict[str, np.ndarray], season: int, week: int,
+                  workers: Optional[int] = None) -> List[Dict[str, any]]:
+        """Plan every AI team in parallel workers reading one shared-memory snapshot"""
+        ai_teams = np.flatnonzero(snapshot["is_ai"]).tolist()
+        workers = min(workers or os.cpu_count() or 1, len(ai_teams)) if ai_teams else 1
+        if workers <= 1:
+            actions = []
+            for team_index in ai_teams:
+                actions.extend(plan_team_week(snapshot, team_index, season, week, self.seed))
+            return actions
+
+        layout = {}
+        offset = 0
+        for key, array in snapshot.items():
+            offset = math.ceil(offset / 8) * 8
+            layout[key] = (offset, array.dtype.str, len(array))
+            offset += array.nbytes
+
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for key, array in snapshot.items():
+                start = layout[key][0]
+                shm.buf[start:start + array.nbytes] = array.tobytes()
+
+            batches = [ai_teams[i::workers] for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    _plan_teams_worker,
+                    [shm.name] * workers, [layout] * workers, batches,
+                    [season] * workers, [week] * workers, [self.seed] * workers
+                )
+                return [action for batch in results for action in batch]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def run_week(self, season: int, week: int, user_team_id: Optional[int] = None,
+                 workers: Optional[int] = None, commit: bool = True) -> Dict[str, any]:
+        """Snapshot the league, plan all AI teams in parallel and apply the moves in one transaction"""
+        started = time.perf_counter()
+        snapshot = self.build_snapshot(user_team_id)
+        snapshot_seconds = time.perf_counter() - started
+
+        plan_start = time.perf_counter()
+        actions = self.plan_week(snapshot, season, week, workers)
+        plan_seconds = time.perf_counter() - plan_start
+
+        write_start = time.perf_counter()
+        try:
+            result = self.apply_actions(actions, week)
+            if commit:
+                self.db.commit()
+                response_cache.clear()
+        except Exception:
+            self.db.rollback()
+            RosterService.clear_counters()
+            raise
+
+        return {
+            "season": season,
+            "week": week,
+            "teams_planned": int(snapshot["is_ai"].sum()),
+            "actions_proposed": len(actions),
+            **result,
+            "timings": {
+                "snapshot": round(snapshot_seconds, 3),
+                "plan": round(plan_seconds, 3),
+                "write": round(time.perf_counter() - write_start, 3),
+                "total": round(time.perf_counter() - started, 3)
+            }
+        }
+
+    def apply_actions(self, actions: List[Dict[str, any]], week: int = 0) -> Dict[str, any]:
+        """Merge every team's proposals in one writer pass.
+
+        Higher priority moves go first, with team order rotating by week so no
+        team always wins ties. A player can only be moved once, free agents go
+        to the first team that still has cap and roster room (losers fall back
+        to their alternatives), and every move is re-checked against the
+        current database state rather than the snapshot.
+        """
+        team_ids = sorted({a["team_id"] for a in actions})
+        if not actions:
+            return {"actions_applied": 0, "actions_rejected": 0, "applied": {}}
+
+        rotation = {team_id: (i + week) % len(team_ids) for i, team_id in enumerate(team_ids)}
+        actions = sorted(actions, key=lambda a: (-a["priority"], rotation[a["team_id"]]))
+
+        player_ids = set()
+        for action in actions:
+            player_ids.add(action["player_id"])
+            player_ids.update(action.get("alternatives", []))
+        players = {p.id: p for p in self.db.query(Player).filter(Player.id.in_(player_ids)).all()}
+        contracts = {
+            c.player_id: c for c in self.db.query(Contract).filter(
+                Contract.player_id.in_(player_ids), Contract.is_active == True
+            ).all()
+        }
+
+        cap = self.salary_cap_service
+        cap_space = {team_id: totals["cap_space"] for team_id, totals in cap.calculate_team_cap_totals(team_ids).items()}
+        roster = RosterService(self.db, contract_moves=True)
+
+        claimed = set()
+        releases = []
+        deactivations = []
+        new_contracts = []
+        # Journal entries for new_contracts, in the same order, awaiting their ids
+        new_contract_events = []
+        events = []
+        applied = {}
+        rejected = 0
+
+        for action in actions:
+            team_id, kind = action["team_id"], action["type"]
+            player_id = action["player_id"]
+            ok = False
+
+            if kind == "sign_free_agent":
+                for alternative, salary in zip(action["alternatives"], action["salaries"]):
+                    if alternative in claimed or alternative not in players or salary > cap_space[team_id]:
+                        continue
+                    if roster.apply_move({"type": "sign", "player_id": alternative, "team_id": team_id}):
+                        continue
+                    contract = cap.create_veteran_contract(players[alternative], team_id, salary, 1)
+                    new_contracts.append(cap.contract_values(contract))
+                    new_contract_events.append(journal_entry(
+                        "signing", team_id, alternative, contract_type="veteran", salary=salary, years=1,
+                        **cap_change(cap.current_year, cap.contract_cap_hit(contract), contracts=1)
+                    ))
+                    claimed.add(alternative)
+                    cap_space[team_id] -= contract.year_1_cap_hit or salary
+                    ok = True
+                    break
+            elif player_id not in claimed and player_id in players:
+                contract = contracts.get(player_id)
+                if kind in ("move_to_ir", "activate_from_ir", "promote"):
+                    ok = not roster.apply_move({"type": kind, "player_id": player_id, "team_id": team_id})
+                elif kind == "release" and contract and contract.team_id == team_id:
+                    if not roster.apply_move({"type": kind, "player_id": player_id, "team_id": team_id}):
+                        # Pre-June 1 release semantics: remaining bonus accelerates
+                        dead_money = contract.signing_bonus or 0
+                        releases.append({"b_id": contract.id, "b_dead_1": dead_money, "b_dead_2": 0})
+                        events.append(journal_entry(
+                            "release", team_id, player_id, contract.id, post_june_1=False, dead_money_year_1=dead_money,
+                            **cap_change(cap.current_year, -cap.contract_cap_hit(contract), dead_money, -1)
+                        ))
+                        cap_space[team_id] += (contract.year_1_cap_hit or 0) - dead_money
+                        ok = True
+                elif kind == "restructure" and contract and contract.team_id == team_id:
+                    cap_hit = cap.contract_cap_hit(contract)
+                    result = cap.restructure_contract(contract, action["restructure_amount"])
+                    if result.get("success"):
+                        cap_space[team_id] += result["cap_savings"]
+                        events.append(journal_entry(
+                            "restructure", team_id, player_id, contract.id,
+                            restructure_amount=action["restructure_amount"], cap_savings=result["cap_savings"],
+                            **cap_change(cap.current_year, cap.contract_cap_hit(contract) - cap_hit)
+                        ))
+                        ok = True
+                elif kind == "extend" and contract and contract.team_id == team_id:
+                    extension = cap.create_veteran_contract(
+                        players[player_id], team_id, action["base_salary"], action["years"], action["signing_bonus"]
+                    )
+                    added_cap = (extension.year_1_cap_hit or 0) - (contract.year_1_cap_hit or 0)
+                    if added_cap <= cap_space[team_id]:
+                        deactivations.append(contract.id)
+                        new_contracts.append(cap.contract_values(extension))
+                        new_contract_events.append(journal_entry(
+                            "extension", team_id, player_id, replaced_contract_id=contract.id,
+                            total_value=extension.total_value, years=action["years"],
+                            **cap_change(cap.current_year, cap.contract_cap_hit(extension) - cap.contract_cap_hit(contract))
+                        ))
+                        cap_space[team_id] -= added_cap
+                        ok = True
+
+            if ok:
+                # A signing claimed the alternative it signed, which may not be the first choice
+                if kind != "sign_free_agent":
+                    claimed.add(player_id)
+                applied[kind] = applied.get(kind, 0) + 1
+            else:
+                rejected += 1
+
+        contract_table = Contract.__table__
+        if releases:
+            self.db.execute(
+                update(contract_table)
+                .where(contract_table.c.id == bindparam("b_id"))
+                .values(is_active=False, dead_money_year_1=bindparam("b_dead_1"), dead_money_year_2=bindparam("b_dead_2")),
+                releases
+            )
+        if deactivations:
+            self.db.execute(
+                update(Contract).where(Contract.id.in_(deactivations)).values(is_active=False),
+                execution_options={"synchronize_session": False}
+            )
+        if new_contracts:
+            contract_ids = self.db.execute(
+                insert(contract_table).returning(contract_table.c.id, sort_by_parameter_order=True), new_contracts
+            ).scalars().all()
+            for event, contract_id in zip(new_contract_events, contract_ids):
+                event["contract_id"] = contract_id
+            events.extend(new_contract_events)
+        TransactionJournal(self.db).record_many(events)
+        roster.flush()
+        self.db.flush()
+        cap.refresh_team_cap_totals(team_ids)
+
+        return {
+            "actions_applied": sum(applied.values()),
+            "actions_rejected": rejected,
+            "applied": applied
+        }
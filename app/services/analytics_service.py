@@ -0,0 +1,335 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case
+from typing import Dict, List, Optional, Tuple
+from ..database.connection import league_state
+from ..database.models import Play, Player, Team
+import numpy as np
+
+# Play type codes used in the play matrix
+PLAY_TYPE_CODES = {"pass": 1, "run": 2, "punt": 3, "field_goal": 4}
+
+# Expected points state space: down x distance bucket x 10-yard field bucket
+DISTANCE_BINS = [4, 7, 11]  # 1-3, 4-6, 7-10, 11+
+FIELD_BUCKETS = 10
+STATE_COUNT = 4 * (len(DISTANCE_BINS) + 1) * FIELD_BUCKETS
+
+# Plays worth of league-average prior blended into sparse states
+PRIOR_WEIGHT = 10
+
+# Rule of thumb: roughly 38 points of margin per win
+POINTS_PER_WIN = 38.0
+
+# Players need this many plays to help set the replacement level
+MIN_QUALIFYING_PLAYS = 20
+REPLACEMENT_PERCENTILE = 20
+
+# Column order of the play matrix loaded for a season
+_COLUMNS = [
+    "game_id", "offense_team_id", "defense_team_id", "quarter", "down", "distance",
+    "yardline", "play_type", "passer_id", "rusher_id", "receiver_id", "kicker_id",
+    "is_complete", "points", "scoring_team_id"
+]
+
+def _season_cache() -> Dict[int, Tuple[Tuple[int, int], Dict[str, any]]]:
+    """The current league's season results, keyed by season -> (fingerprint, analytics)"""
+    return league_state().setdefault("season_analytics", {})
+
+class AnalyticsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def load_season_plays(self, season: int) -> Optional[Dict[str, np.ndarray]]:
+        """Load a season's play store as column arrays in game order"""
+        play_type = case(
+            *[(Play.play_type == name, code) for name, code in PLAY_TYPE_CODES.items()],
+            else_=0
+        )
+        columns = [
+            Play.game_id, Play.offense_team_id, Play.defense_team_id, Play.quarter,
+            func.coalesce(Play.down, 1), func.coalesce(Play.distance, 10), func.coalesce(Play.yardline, 75),
+            play_type,
+            func.coalesce(Play.passer_id, -1), func.coalesce(Play.rusher_id, -1),
+            func.coalesce(Play.receiver_id, -1), func.coalesce(Play.kicker_id, -1),
+            func.coalesce(Play.is_complete, 0), func.coalesce(Play.points, 0),
+            func.coalesce(Play.scoring_team_id, -1)
+        ]
+        rows = self.db.execute(
+            select(*columns).where(Play.season == season).order_by(Play.game_id, Play.play_number)
+        ).all()
+        if not rows:
+            return None
+
+        matrix = np.array(rows, dtype=np.int64)
+        return {name: matrix[:, i] for i, name in enumerate(_COLUMNS)}
+
+    def _state_index(self, plays: Dict[str, np.ndarray]) -> np.ndarray:
+        """Map each play's down, distance and field position to an expected points state"""
+        down = np.clip(plays["down"], 1, 4) - 1
+        distance = np.digitize(plays["distance"], DISTANCE_BINS)
+        field = np.clip((plays["yardline"] - 1) // 10, 0, FIELD_BUCKETS - 1)
+        return (down * (len(DISTANCE_BINS) + 1) + distance) * FIELD_BUCKETS + field
+
+    def _drive_groups(self, plays: Dict[str, np.ndarray]) -> np.ndarray:
+        """Group key for each play: one group per game half (overtime is its own half)"""
+        half = np.where(plays["quarter"] <= 2, 0, np.where(plays["quarter"] <= 4, 1, 2))
+        return plays["game_id"] * 3 + half
+
+    def _signed_points(self, plays: Dict[str, np.ndarray]) -> np.ndarray:
+        """Points on each play from the offense's point of view"""
+        return np.where(plays["scoring_team_id"] == plays["offense_team_id"], plays["points"], -plays["points"])
+
+    def build_expected_points_table(self, plays: Dict[str, np.ndarray]) -> np.ndarray:
+        """Build the expected points lookup from the next score in the same half"""
+        count = len(plays["game_id"])
+        index = np.arange(count)
+        groups = self._drive_groups(plays)
+
+        # Find the next scoring play at or after each play
+        scoring_positions = index[plays["points"] > 0]
+        if len(scoring_positions):
+            following = np.searchsorted(scoring_positions, index)
+            has_score = following < len(scoring_positions)
+            next_score = scoring_positions[np.minimum(following, len(scoring_positions) - 1)]
+            same_half = has_score & (groups[next_score] == groups)
+            sign = np.where(plays["scoring_team_id"][next_score] == plays["offense_team_id"], 1, -1)
+            next_points = np.where(same_half, plays["points"][next_score] * sign, 0).astype(float)
+        else:
+            next_points = np.zeros(count)
+
+        states = self._state_index(plays)
+        field = states % FIELD_BUCKETS
+
+        # Field-position-only prior for states without enough samples
+        field_counts = np.bincount(field, minlength=FIELD_BUCKETS)
+        field_sums = np.bincount(field, weights=next_points, minlength=FIELD_BUCKETS)
+        league_mean = next_points.mean()
+        field_prior = np.where(field_counts > 0, field_sums / np.maximum(field_counts, 1), league_mean)
+
+        state_counts = np.bincount(states, minlength=STATE_COUNT)
+        state_sums = np.bincount(states, weights=next_points, minlength=STATE_COUNT)
+        prior = np.tile(field_prior, STATE_COUNT // FIELD_BUCKETS)
+
+        return (state_sums + prior * PRIOR_WEIGHT) / (state_counts + PRIOR_WEIGHT)
+
+    def calculate_epa(self, plays: Dict[str, np.ndarray], ep_table: np.ndarray) -> np.ndarray:
+        """Calculate expected points added for every play"""
+        count = len(plays["game_id"])
+        index = np.arange(count)
+        groups = self._drive_groups(plays)
+
+        ep_before = ep_table[self._state_index(plays)]
+
+        following = np.minimum(index + 1, count - 1)
+        same_half = (groups[following] == groups) & (index < count - 1)
+        same_offense = plays["offense_team_id"][following] == plays["offense_team_id"]
+        ep_next = ep_before[following]
+        ep_after = np.where(same_half, np.where(same_offense, ep_next, -ep_next), 0.0)
+
+        scored = plays["points"] > 0
+        ep_after = np.where(scored, self._signed_points(plays), ep_after)
+
+        return ep_after - ep_before
+
+    def get_season_analytics(self, season: int, cached_only: bool = False) -> Optional[Dict[str, any]]:
+        """Get EPA, efficiency and WAR for a season, recomputing only when its plays change.
+
+        With cached_only the season is never computed: callers serving a
+        single player get None unless analytics for the season's current
+        plays are already cached.
+        """
+        fingerprint = tuple(self.db.query(func.count(Play.id), func.max(Play.id)).filter(
+            Play.season == season
+        ).one())
+
+        cached = _season_cache().get(season)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+        if cached_only:
+            return None
+
+        plays = self.load_season_plays(season)
+        if plays is None:
+            _season_cache().pop(season, None)
+            return None
+
+        ep_table = self.build_expected_points_table(plays)
+        epa = self.calculate_epa(plays, ep_table)
+
+        analytics = {
+            "season": season,
+            "total_plays": len(epa),
+            "league_epa_per_play": float(epa.mean()),
+            "expected_points": ep_table,
+            "teams": self._team_efficiency(plays, epa),
+            "players": self._player_metrics(plays, epa)
+        }
+        _season_cache()[season] = (fingerprint, analytics)
+        return analytics
+
+    def _team_efficiency(self, plays: Dict[str, np.ndarray], epa: np.ndarray) -> Dict[int, Dict[str, any]]:
+        """Group EPA by offense and defense for DVOA-style efficiency ratings"""
+        size = int(max(plays["offense_team_id"].max(), plays["defense_team_id"].max())) + 1
+        offense, defense = plays["offense_team_id"], plays["defense_team_id"]
+        success = (epa > 0).astype(float)
+        passes = plays["play_type"] == PLAY_TYPE_CODES["pass"]
+        runs = plays["play_type"] == PLAY_TYPE_CODES["run"]
+
+        off_plays = np.bincount(offense, minlength=size)
+        off_epa = np.bincount(offense, weights=epa, minlength=size)
+        off_success = np.bincount(offense, weights=success, minlength=size)
+        def_plays = np.bincount(defense, minlength=size)
+        def_epa = np.bincount(defense, weights=epa, minlength=size)
+        pass_plays = np.bincount(offense[passes], minlength=size)
+        pass_epa = np.bincount(offense[passes], weights=epa[passes], minlength=size)
+        run_plays = np.bincount(offense[runs], minlength=size)
+        run_epa = np.bincount(offense[runs], weights=epa[runs], minlength=size)
+
+        league = epa.mean()
+        off_per_play = off_epa / np.maximum(off_plays, 1)
+        def_per_play = def_epa / np.maximum(def_plays, 1)
+
+        teams = {}
+        for team_id in np.nonzero(off_plays + def_plays)[0]:
+            offense_efficiency = off_per_play[team_id] - league
+            defense_efficiency = league - def_per_play[team_id]
+            teams[int(team_id)] = {
+                "team_id": int(team_id),
+                "offensive_plays": int(off_plays[team_id]),
+                "offense_epa": round(float(off_epa[team_id]), 2),
+                "offense_epa_per_play": round(float(off_per_play[team_id]), 3),
+                "offense_success_rate": round(float(off_success[team_id] / max(off_plays[team_id], 1)) * 100, 1),
+                "pass_epa_per_play": round(float(pass_epa[team_id] / max(pass_plays[team_id], 1)), 3),
+                "run_epa_per_play": round(float(run_epa[team_id] / max(run_plays[team_id], 1)), 3),
+                "defense_epa_per_play": round(float(def_per_play[team_id]), 3),
+                "offense_efficiency": round(float(offense_efficiency), 3),
+                "defense_efficiency": round(float(defense_efficiency), 3),
+                "total_efficiency": round(float(offense_efficiency + defense_efficiency), 3)
+            }
+        return teams
+
+    def _player_metrics(self, plays: Dict[str, np.ndarray], epa: np.ndarray) -> Dict[int, Dict[str, any]]:
+        """Credit EPA to involved players and convert it to wins above replacement"""
+        play_type = plays["play_type"]
+        passes = play_type == PLAY_TYPE_CODES["pass"]
+        catches = passes & (plays["is_complete"] == 1)
+        runs = play_type == PLAY_TYPE_CODES["run"]
+        kicks = play_type == PLAY_TYPE_CODES["field_goal"]
+
+        player_ids = np.concatenate([
+            plays["passer_id"][passes], plays["receiver_id"][catches],
+            plays["rusher_id"][runs], plays["kicker_id"][kicks]
+        ])
+        credited = np.concatenate([epa[passes], epa[catches], epa[runs], epa[kicks]])
+        known = player_ids >= 0
+        player_ids, credited = player_ids[known], credited[known]
+        if not len(player_ids):
+            return {}
+
+        unique_ids, inverse = np.unique(player_ids, return_inverse=True)
+        epa_totals = np.bincount(inverse, weights=credited)
+        play_counts = np.bincount(inverse)
+        per_play = epa_totals / play_counts
+
+        position_lookup = dict(self.db.query(Player.id, Player.position).filter(
+            Player.id.in_(unique_ids.tolist())
+        ).all())
+        positions = np.array([position_lookup.get(int(pid), "") for pid in unique_ids])
+
+        # Replacement level per position from qualified players
+        qualified = play_counts >= MIN_QUALIFYING_PLAYS
+        fallback = np.percentile(per_play[qualified], REPLACEMENT_PERCENTILE) if qualified.any() else 0.0
+        position_codes, position_index = np.unique(positions, return_inverse=True)
+        replacement_levels = np.full(len(position_codes), fallback)
+        for code_index in range(len(position_codes)):
+            members = qualified & (position_index == code_index)
+            if members.any():
+                replacement_levels[code_index] = np.percentile(per_play[members], REPLACEMENT_PERCENTILE)
+        replacement = replacement_levels[position_index]
+
+        war = (epa_totals - replacement * play_counts) / POINTS_PER_WIN
+
+        return {
+            int(pid): {
+                "player_id": int(pid),
+                "position": positions[i] or None,
+                "plays": int(play_counts[i]),
+                "epa": round(float(epa_totals[i]), 2),
+                "epa_per_play": round(float(per_play[i]), 3),
+                "replacement_epa_per_play": round(float(replacement[i]), 3),
+                "war": round(float(war[i]), 2)
+            }
+            for i, pid in enumerate(unique_ids)
+        }
+
+    def get_latest_season(self) -> Optional[int]:
+        """Get the most recent season with stored plays"""
+        return self.db.query(func.max(Play.season)).scalar()
+
+    def get_expected_points_table(self, season: int) -> Optional[Dict[str, any]]:
+        """Get the expected points lookup as labelled rows"""
+        analytics = self.get_season_analytics(season)
+        if not analytics:
+            return None
+
+        table = analytics["expected_points"].reshape(4, len(DISTANCE_BINS) + 1, FIELD_BUCKETS)
+        distance_labels = ["1-3", "4-6", "7-10", "11+"]
+        field_labels = [f"{i * 10 + 1}-{(i + 1) * 10}" for i in range(FIELD_BUCKETS)]
+
+        return {
+            "season": season,
+            "yardline": "yards from opponent end zone",
+            "field_buckets": field_labels,
+            "rows": [
+                {
+                    "down": down + 1,
+                    "distance": distance_labels[distance],
+                    "expected_points": [round(float(v), 2) for v in table[down, distance]]
+                }
+                for down in range(4)
+                for distance in range(len(DISTANCE_BINS) + 1)
+            ]
+        }
+
+    def get_team_efficiency(self, season: int) -> List[Dict[str, any]]:
+        """Get team efficiency ratings for a season, best first"""
+        analytics = self.get_season_analytics(season)
+        if not analytics:
+            return []
+
+        names = {team.id: f"{team.city} {team.name}" for team in self.db.query(Team).all()}
+        teams = [{**team, "team_name": names.get(team_id)} for team_id, team in analytics["teams"].items()]
+        return sorted(teams, key=lambda x: x["total_efficiency"], reverse=True)
+
+    def get_player_metrics(self, season: int, position: Optional[str] = None,
+                           limit: Optional[int] = None) -> List[Dict[str, any]]:
+        """Get per-player EPA and WAR for a season, best first"""
+        analytics = self.get_season_analytics(season)
+        if not analytics:
+            return []
+
+        players = analytics["players"].values()
+        if position:
+            players = [p for p in players if p["position"] == position.upper()]
+        players = sorted(players, key=lambda x: x["war"], reverse=True)
+        return players[:limit] if limit else players
+
+    def get_player_war(self, player_id: int, season: Optional[int] = None,
+                       cached_only: bool = False) -> Optional[Dict[str, any]]:
+        """Get a player's EPA and WAR line for a season (latest season by default)"""
+        if season is None:
+            season = self.get_latest_season()
+            if season is None:
+                return None
+
+        analytics = self.get_season_analytics(season, cached_only)
+        if not analytics:
+            return None
+        return analytics["players"].get(player_id)
+
+    @staticmethod
+    def clear_cache(season: Optional[int] = None):
+        """Drop cached analytics for one season or all seasons"""
+        if season is None:
+            _season_cache().clear()
+        else:
+            _season_cache().pop(season, None)
@@ -0,0 +1,169 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, func
+from typing import Dict, List, Optional, Tuple
+from ..database.connection import league_state
+from ..database.models import Player, Contract, FreeAgentSigning, CompensatoryPick, PlayerSeasonStat
+import bisect
+import heapq
+
+# Accrued seasons before a player counts as an unrestricted free agent
+UNRESTRICTED_YEARS_PRO = 4
+
+# Round by where a signing's value ranks among all league contracts (top share of the league)
+COMPENSATORY_ROUND_CUTOFFS = [(0.03, 3), (0.06, 4), (0.10, 5), (0.15, 6), (0.25, 7)]
+
+# Playing time proxy: share of last season's games played moves value by up to +/-20%
+SNAP_WEIGHT = 0.4
+SEASON_GAMES = 17
+
+MAX_PICKS_PER_TEAM = 4
+MAX_COMPENSATORY_PICKS = 32
+
+def _offseason_cache() -> Dict[Tuple[int, tuple], Dict[str, any]]:
+    """The current league's results, keyed by (year, fingerprint of the period's signings)"""
+    return league_state().setdefault("compensatory_picks", {})
+
+class CompensatoryPickService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _fingerprint(self, year: int) -> tuple:
+        """Changes whenever the period's signings change"""
+        return tuple(self.db.query(
+            func.count(FreeAgentSigning.id), func.max(FreeAgentSigning.id)
+        ).filter(FreeAgentSigning.year == year).one())
+
+    def calculate(self, year: int) -> Dict[str, any]:
+        """Compensatory picks earned in a free agency period, for the next year's draft.
+
+        The period's qualifying signings (unrestricted free agents whose
+        contracts expired) are valued by average salary adjusted for playing
+        time, placed in a round by binary search against every league contract's
+        average salary, and walked once from most to least valuable, so each
+        team's losses and gains come out already sorted. Each gain cancels a
+        loss in the same round, or else the best loss in a later round; teams
+        that still lost more than they gained get a pick for each remaining
+        loss (at most four), and the 32 best league-wide are awarded.
+        """
+        key = (year, self._fingerprint(year))
+        cached = _offseason_cache().get(key)
+        if cached:
+            return cached
+
+        league_salaries = sorted(
+            total // years for total, years in self.db.query(Contract.total_value, Contract.years).filter(
+                Contract.is_active == True, Contract.years > 0
+            ).all()
+        )
+        games = dict(self.db.query(PlayerSeasonStat.player_id, PlayerSeasonStat.value).filter(
+            PlayerSeasonStat.season == year - 1,
+            PlayerSeasonStat.stat == "games_played"
+        ).all())
+
+        signings = self.db.query(
+            FreeAgentSigning.player_id, FreeAgentSigning.team_id, FreeAgentSigning.former_team_id,
+            FreeAgentSigning.average_salary, Player.first_name, Player.last_name, Player.position, Player.years_pro
+        ).join(Player, Player.id == FreeAgentSigning.player_id).filter(
+            FreeAgentSigning.year == year,
+            FreeAgentSigning.former_team_id != None,
+            FreeAgentSigning.former_team_id != FreeAgentSigning.team_id,
+            Player.years_pro >= UNRESTRICTED_YEARS_PRO
+        ).all()
+
+        qualifying = []
+        for signing in signings:
+            snap_share = min(1.0, games.get(signing.player_id, SEASON_GAMES / 2) / SEASON_GAMES)
+            value = int(signing.average_salary * (1 + SNAP_WEIGHT * (snap_share - 0.5)))
+            league_share = 1 - bisect.bisect_left(league_salaries, value) / max(1, len(league_salaries))
+            draft_round = next((r for cutoff, r in COMPENSATORY_ROUND_CUTOFFS if league_share <= cutoff), None)
+            if draft_round:
+                qualifying.append((value, draft_round, signing))
+        qualifying.sort(key=lambda q: q[0], reverse=True)
+
+        # Single pass: losses and gains land in each team's lists best first
+        losses: Dict[int, List[tuple]] = {}
+        gains: Dict[int, List[tuple]] = {}
+        for value, draft_round, signing in qualifying:
+            losses.setdefault(signing.former_team_id, []).append((value, draft_round, signing))
+            gains.setdefault(signing.team_id, []).append((value, draft_round, signing))
+
+        candidates = []
+        teams = {}
+        for team_id, lost in losses.items():
+            gained = gains.get(team_id, [])
+            cancelled = [False] * len(lost)
+            for _, gain_round, _ in gained:
+                same = next((i for i, l in enumerate(lost) if not cancelled[i] and l[1] == gain_round), None)
+                if same is None:
+                    same = next((i for i, l in enumerate(lost) if not cancelled[i] and l[1] > gain_round), None)
+                if same is not None:
+                    cancelled[same] = True
+
+            remaining = [l for i, l in enumerate(lost) if not cancelled[i]]
+            teams[team_id] = {
+                "team_id": team_id,
+                "qualifying_losses": len(lost),
+                "qualifying_gains": len(gained),
+                "uncancelled_losses": len(remaining)
+            }
+            if len(lost) <= len(gained):
+                continue
+            for value, draft_round, signing in remaining[:MAX_PICKS_PER_TEAM]:
+                candidates.append((draft_round, -value, signing.player_id, team_id, signing))
+
+        awarded = heapq.nsmallest(MAX_COMPENSATORY_PICKS, candidates)
+        picks = []
+        order_in_round = {}
+        for draft_round, negative_value, player_id, team_id, signing in awarded:
+            order_in_round[draft_round] = order_in_round.get(draft_round, 0) + 1
+            picks.append({
+                "draft_year": year + 1,
+                "round": draft_round,
+                "order_in_round": order_in_round[draft_round],
+                "team_id": team_id,
+                "lost_player_id": player_id,
+                "lost_player_name": f"{signing.first_name} {signing.last_name}",
+                "position": signing.position,
+                "signed_with_team_id": signing.team_id,
+                "value": -negative_value
+            })
+
+        result = {
+            "free_agency_year": year,
+            "draft_year": year + 1,
+            "qualifying_signings": len(qualifying),
+            "picks": picks,
+            "teams": sorted(teams.values(), key=lambda t: t["team_id"])
+        }
+        _offseason_cache()[key] = result
+        return result
+
+    def award(self, year: int, commit: bool = True) -> Dict[str, any]:
+        """Store the period's compensatory picks so next year's draft includes them"""
+        result = self.calculate(year)
+        try:
+            self.db.execute(delete(CompensatoryPick).where(CompensatoryPick.draft_year == year + 1))
+            if result["picks"]:
+                self.db.execute(insert(CompensatoryPick.__table__), [
+                    {key: pick[key] for key in ("draft_year", "round", "order_in_round", "team_id", "lost_player_id", "value")}
+                    for pick in result["picks"]
+                ])
+            if commit:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return {"draft_year": year + 1, "awarded": len(result["picks"]), "picks": result["picks"]}
+
+    def get_picks(self, draft_year: int) -> List[CompensatoryPick]:
+        """Awarded compensatory picks for a draft, in draft order"""
+        return self.db.query(CompensatoryPick).filter(
+            CompensatoryPick.draft_year == draft_year
+        ).order_by(CompensatoryPick.round, CompensatoryPick.order_in_round).all()
+
+    @staticmethod
+    def clear_cache(year: Optional[int] = None):
+        """Drop cached calculations, for one offseason or all"""
+        cache = _offseason_cache()
+        for key in [key for key in cache if year is None or key[0] == year]:
+            del cache[key]
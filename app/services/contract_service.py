@@ -1,16 +1,74 @@
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Tuple
 from ..database.models import Contract, Player, Team
-from ..services.salary_cap_service import SalaryCapService
+from ..services.salary_cap_service import SalaryCapService, VETERAN_SALARY_ESCALATION
 from ..services.player_evaluation import PlayerEvaluationService
+from ..services.response_cache import response_cache
+from ..services.journal_service import TransactionJournal, cap_change
+from ..services.roster_service import RosterService
 from datetime import datetime, timedelta
+import numpy as np
 import random
 
+# Market value premium by position
+MARKET_POSITION_MULTIPLIERS = {
+    'QB': 1.5, 'DE': 1.3, 'WR': 1.2, 'CB': 1.1,
+    'LT': 1.2, 'TE': 1.0, 'RB': 0.9, 'ILB': 0.9
+}
+
+# Players value guaranteed signing bonus money above the same amount in base salary
+GUARANTEE_PREMIUM = 1.25
+
+# Offer optimizer grid: base salary as a share of market value, and signing
+# bonus as a share of the base salary over the contract
+OFFER_SALARY_RANGE = (0.25, 1.5)
+OFFER_SALARY_STEPS = 61
+OFFER_BONUS_SHARES = np.linspace(0, 0.5, 11)
+OFFER_MAX_YEARS = 5
+DEFAULT_ACCEPTANCE_TARGETS = [0.5, 0.6, 0.7]
+
+# League minimum base salary, for signings made without terms
+MINIMUM_SALARY = 795000
+
+# Batch transaction operation type -> fields it requires
+CAP_TRANSACTION_FIELDS = {
+    "restructure": ["contract_id", "restructure_amount"],
+    "release": ["contract_id"],
+    "extend": ["player_id", "team_id", "base_salary", "years"],
+    "franchise_tag": ["player_id", "team_id"]
+}
+
 class ContractService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, seed: Optional[int] = None):
         self.db = db
+        # Draw a seed when none is given so a run can still be reproduced from the one it reports
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
         self.salary_cap_service = SalaryCapService(db)
         self.player_evaluation_service = PlayerEvaluationService(db)
+        self.journal = TransactionJournal(db)
+        self._roster = None
+    
+    @property
+    def roster(self) -> RosterService:
+        """Roster limits every signing and release goes through, loaded on first use"""
+        if self._roster is None:
+            self._roster = RosterService(self.db, contract_moves=True)
+        return self._roster
+    
+    def _signing_move(self, player: Player, team_id: int) -> Tuple[Optional[Dict[str, any]], Optional[str]]:
+        """The roster move signing a player to a team takes, if any, or why the roster refuses it"""
+        if player.team_id == team_id:
+            return None, None
+        move = {"type": "sign", "player_id": player.id, "team_id": team_id}
+        errors = self.roster.check_move(move)
+        return move, errors[0]["message"] if errors else None
+    
+    def _apply_roster_move(self, move: Optional[Dict[str, any]]):
+        """Write a checked signing or release to the players table and the roster counters"""
+        if move is not None:
+            self.roster.apply_move(move)
+            self.roster.flush()
     
     def get_player_contract(self, player_id: int) -> Optional[Contract]:
         """Get current active contract for a player"""
@@ -27,7 +85,7 @@ class ContractService:
     
     def negotiate_contract_extension(self, player_id: int, team_id: int, 
                                    base_salary: int, years: int,
-                                   signing_bonus: int = 0) -> Dict[str, any]:
+                                   signing_bonus: int = 0, commit: bool = True) -> Dict[str, any]:
         """Negotiate a contract extension with a player"""
         player = self.db.query(Player).filter(Player.id == player_id).first()
         if not player:
@@ -38,12 +96,17 @@ class ContractService:
         if existing_contract and existing_contract.team_id != team_id:
             return {"error": "Player is under contract with another team"}
         
+        # A new deal with another team's player or a free agent is a signing, within roster limits
+        signing, roster_error = self._signing_move(player, team_id) if not existing_contract else (None, None)
+        if roster_error:
+            return {"error": roster_error}
+        
         # Calculate market value based on player attributes
         market_value = self.calculate_market_value(player, base_salary, years)
         
         # Determine if player accepts the offer
         acceptance_chance = self.calculate_acceptance_chance(player, market_value, base_salary)
-        accepted = random.random() < acceptance_chance
+        accepted = self.rng.random() < acceptance_chance
         
         if not accepted:
             return {
@@ -69,7 +132,26 @@ class ContractService:
         
         # Save to database
         self.db.add(new_contract)
-        self.db.commit()
+        self.db.flush()
+        self._apply_roster_move(signing)
+        cap_hit = self.salary_cap_service.contract_cap_hit
+        replaced_cap_hit = cap_hit(existing_contract) if existing_contract else 0
+        self.journal.record(
+            "extension", team_id, player_id, new_contract.id,
+            replaced_contract_id=existing_contract.id if existing_contract else None,
+            total_value=new_contract.total_value, years=new_contract.years,
+            **cap_change(self.salary_cap_service.current_year, cap_hit(new_contract) - replaced_cap_hit,
+                         contracts=0 if existing_contract else 1)
+        )
+        if commit:
+            self.db.commit()
+            response_cache.invalidate(
+                team_ids=[team_id, player.team_id], player_ids=[player_id],
+                contract_ids=[new_contract.id, existing_contract.id if existing_contract else None],
+                league=True
+            )
+        else:
+            self.db.flush()
         
         return {
             "success": True,
@@ -85,11 +167,7 @@ class ContractService:
         base_value = player.overall_rating * 1000000  # $1M per overall point
         
         # Position multipliers
-        position_multipliers = {
-            'QB': 1.5, 'DE': 1.3, 'WR': 1.2, 'CB': 1.1,
-            'LT': 1.2, 'TE': 1.0, 'RB': 0.9, 'ILB': 0.9
-        }
-        position_multiplier = position_multipliers.get(player.position, 1.0)
+        position_multiplier = MARKET_POSITION_MULTIPLIERS.get(player.position, 1.0)
         
         # Age adjustment
         if player.age <= 25:
@@ -114,6 +192,32 @@ class ContractService:
         market_value = int(base_value * position_multiplier * age_multiplier * experience_multiplier)
         return market_value
     
+    @staticmethod
+    def calculate_market_value_batch(overall: np.ndarray, position_multiplier: np.ndarray,
+                                     age: np.ndarray, years_pro: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_market_value"""
+        age_multiplier = np.select(
+            [age <= 25, age <= 28, age <= 31, age <= 34],
+            [1.3, 1.1, 1.0, 0.8],
+            default=0.6
+        )
+        experience_multiplier = np.select([years_pro <= 3, years_pro <= 6], [1.2, 1.0], default=0.9)
+        market_value = overall * 1000000 * position_multiplier * age_multiplier * experience_multiplier
+        return market_value.astype(np.int64)
+    
+    @staticmethod
+    def calculate_acceptance_chance_batch(market_value: np.ndarray, offered_salary: np.ndarray,
+                                          loyal: np.ndarray, work_ethic: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_acceptance_chance; loyal marks players re-signing with their team"""
+        salary_factor = np.where(
+            offered_salary >= market_value,
+            1.0,
+            np.maximum(0.1, offered_salary / np.maximum(market_value, 1))
+        )
+        loyalty_factor = np.where(loyal, 1.2, 1.0)
+        work_ethic_factor = 0.8 + (work_ethic / 100) * 0.4
+        return np.clip(0.5 * salary_factor * loyalty_factor * work_ethic_factor, 0.05, 0.95)
+    
     def calculate_acceptance_chance(self, player: Player, market_value: int, offered_salary: int) -> float:
         """Calculate the chance a player accepts a contract offer"""
         # Base acceptance chance
@@ -140,7 +244,87 @@ class ContractService:
         acceptance_chance = base_chance * salary_factor * loyalty_factor * work_ethic_factor
         return min(0.95, max(0.05, acceptance_chance))  # Clamp between 5% and 95%
     
-    def restructure_contract(self, contract_id: int, restructure_amount: int) -> Dict[str, any]:
+    def optimize_offer(self, player_id: int, team_id: int,
+                       targets: Optional[List[float]] = None) -> Dict[str, any]:
+        """Find the cheapest offers that reach each target acceptance chance.
+
+        Every combination of base salary, length and signing bonus on the grid
+        is scored in one vectorized pass. A player judges an offer by its
+        average yearly base (with the veteran raises) plus the prorated bonus,
+        which counts extra because it is guaranteed. For each target and
+        contract length the offer with the lowest first-year cap hit wins.
+        """
+        player = self.db.query(Player).filter(Player.id == player_id).first()
+        if not player:
+            return {"error": "Player not found"}
+
+        existing_contract = self.get_player_contract(player_id)
+        if existing_contract and existing_contract.team_id != team_id:
+            return {"error": "Player is under contract with another team"}
+
+        targets = sorted(targets or DEFAULT_ACCEPTANCE_TARGETS)
+        market_value = self.calculate_market_value(player, 0, 0)
+        loyal = bool(existing_contract and existing_contract.team_id == player.team_id)
+
+        # Grid axes: salary x years x bonus share
+        low, high = OFFER_SALARY_RANGE
+        base = np.linspace(low, high, OFFER_SALARY_STEPS)[:, None, None] * market_value
+        years = np.arange(1, OFFER_MAX_YEARS + 1)[None, :, None]
+        bonus = np.floor(OFFER_BONUS_SHARES[None, None, :] * base * years)
+
+        escalation = np.cumsum(VETERAN_SALARY_ESCALATION)[:OFFER_MAX_YEARS] / np.arange(1, OFFER_MAX_YEARS + 1)
+        proration = bonus // years
+        perceived = base * escalation[None, :, None] + proration * GUARANTEE_PREMIUM
+        chance = self.calculate_acceptance_chance_batch(
+            np.array(market_value), perceived, np.array(loyal), np.array(player.work_ethic or 50)
+        )
+        year_1_cap_hit = np.floor(base) + proration
+        total_value = np.floor(base) * years + bonus
+
+        cap_space = self.salary_cap_service.calculate_team_cap_totals([team_id])[team_id]["cap_space"]
+        current_cap_hit = (existing_contract.year_1_cap_hit or existing_contract.year_1_salary or 0) if existing_contract else 0
+
+        results = []
+        for target in targets:
+            # Cheapest first-year hit per length, ties broken by total value
+            cost = np.where(chance >= target, year_1_cap_hit + total_value / 1e12, np.inf)
+            offers = []
+            for y in range(OFFER_MAX_YEARS):
+                index = np.argmin(cost[:, y, :])
+                s, b = np.unravel_index(index, cost[:, y, :].shape)
+                if not np.isfinite(cost[s, y, b]):
+                    continue
+                length = y + 1
+                offer_base = int(base[s, 0, 0])
+                offer_bonus = int(bonus[s, y, b])
+                cap_hits = [
+                    int(offer_base * VETERAN_SALARY_ESCALATION[year]) + offer_bonus // length
+                    for year in range(length)
+                ]
+                offers.append({
+                    "base_salary": offer_base,
+                    "years": length,
+                    "signing_bonus": offer_bonus,
+                    "total_value": int(total_value[s, y, b]),
+                    "year_1_cap_hit": cap_hits[0],
+                    "cap_hits": cap_hits,
+                    "acceptance_chance": round(float(chance[s, y, b]) * 100, 1),
+                    "fits_cap": cap_hits[0] - current_cap_hit <= cap_space
+                })
+            offers.sort(key=lambda o: (o["year_1_cap_hit"], o["total_value"]))
+            results.append({"target": target, "reachable": bool(offers), "offers": offers})
+
+        return {
+            "player_id": player_id,
+            "team_id": team_id,
+            "market_value": market_value,
+            "max_acceptance_chance": round(float(chance.max()) * 100, 1),
+            "cap_space": cap_space,
+            "grid_size": int(chance.size),
+            "targets": results
+        }
+    
+    def restructure_contract(self, contract_id: int, restructure_amount: int, commit: bool = True) -> Dict[str, any]:
         """Restructure an existing contract to create cap space"""
         contract = self.db.query(Contract).filter(Contract.id == contract_id).first()
         if not contract:
@@ -150,28 +334,49 @@ class ContractService:
             return {"error": "Contract is not active"}
         
         # Use salary cap service to restructure
+        cap_hit = self.salary_cap_service.contract_cap_hit(contract)
         result = self.salary_cap_service.restructure_contract(contract, restructure_amount)
         
         if result.get("success"):
-            self.db.commit()
+            self.journal.record(
+                "restructure", contract.team_id, contract.player_id, contract.id,
+                restructure_amount=restructure_amount, cap_savings=result["cap_savings"],
+                **cap_change(self.salary_cap_service.current_year,
+                             self.salary_cap_service.contract_cap_hit(contract) - cap_hit)
+            )
+            self._save(contract, commit)
         
         return result
     
-    def release_player(self, contract_id: int, post_june_1: bool = False) -> Dict[str, any]:
+    def release_player(self, contract_id: int, post_june_1: bool = False, commit: bool = True) -> Dict[str, any]:
         """Release a player and calculate dead money"""
         contract = self.db.query(Contract).filter(Contract.id == contract_id).first()
         if not contract:
             return {"error": "Contract not found"}
         
+        # The player goes to free agency through the roster limits, so the counters stay current
+        release = {"type": "release", "player_id": contract.player_id, "team_id": contract.team_id}
+        if contract.is_active:
+            errors = self.roster.check_move(release)
+            if errors:
+                return {"error": errors[0]["message"]}
+        
         # Use salary cap service to release player
+        cap_hit = self.salary_cap_service.contract_cap_hit(contract)
         result = self.salary_cap_service.release_player(contract, post_june_1)
         
         if result.get("success"):
-            self.db.commit()
+            self._apply_roster_move(release)
+            self.journal.record(
+                "release", contract.team_id, contract.player_id, contract.id, post_june_1=post_june_1,
+                dead_money_current=result["dead_money_current"], dead_money_next=result["dead_money_next"],
+                **cap_change(self.salary_cap_service.current_year, -cap_hit, result["dead_money_current"], -1)
+            )
+            self._save(contract, commit)
         
         return result
     
-    def franchise_tag_player(self, player_id: int, team_id: int) -> Dict[str, any]:
+    def franchise_tag_player(self, player_id: int, team_id: int, commit: bool = True) -> Dict[str, any]:
         """Apply franchise tag to a player"""
         player = self.db.query(Player).filter(Player.id == player_id).first()
         if not player:
@@ -181,6 +386,9 @@ class ContractService:
         existing_contract = self.get_player_contract(player_id)
         if existing_contract:
             return {"error": "Player is already under contract"}
+        signing, roster_error = self._signing_move(player, team_id)
+        if roster_error:
+            return {"error": roster_error}
         
         # Calculate franchise tag amount (average of top 5 salaries at position)
         franchise_tag_amount = self.calculate_franchise_tag_amount(player.position)
@@ -193,6 +401,7 @@ class ContractService:
             guaranteed_money=franchise_tag_amount,
             years=1,
             year_1_salary=franchise_tag_amount,
+            signing_bonus=0,
             contract_type="franchise_tag",
             start_date=datetime.now(),
             end_date=datetime.now() + timedelta(days=365),
@@ -204,7 +413,13 @@ class ContractService:
         
         # Save to database
         self.db.add(contract)
-        self.db.commit()
+        self.db.flush()
+        self._apply_roster_move(signing)
+        self.journal.record(
+            "franchise_tag", team_id, player_id, contract.id, amount=franchise_tag_amount,
+            **cap_change(self.salary_cap_service.current_year, self.salary_cap_service.contract_cap_hit(contract), contracts=1)
+        )
+        self._save(contract, commit)
         
         return {
             "success": True,
@@ -213,6 +428,165 @@ class ContractService:
             "cap_hit": contract.year_1_cap_hit
         }
     
+    def execute_transactions(self, operations: List[Dict[str, any]]) -> Dict[str, any]:
+        """Apply an ordered batch of contract operations all-or-nothing.
+
+        Each operation is flushed so the ones after it see its effects, but
+        nothing is committed until every one succeeds; the first failure
+        (including a rejected extension) rolls the whole batch back. Cap
+        totals for every team touched are refreshed once at the end.
+
+        Extension decisions are drawn from the service seed, reset at the
+        start of the batch, so the same seed and operations always give the
+        same result; the seed is returned with it.
+        """
+        handlers = {
+            "restructure": lambda op: self.restructure_contract(
+                op["contract_id"], op["restructure_amount"], commit=False),
+            "release": lambda op: self.release_player(
+                op["contract_id"], bool(op.get("post_june_1")), commit=False),
+            "extend": lambda op: self.negotiate_contract_extension(
+                op["player_id"], op["team_id"], op["base_salary"], op["years"], op.get("signing_bonus") or 0, commit=False),
+            "franchise_tag": lambda op: self.franchise_tag_player(op["player_id"], op["team_id"], commit=False)
+        }
+
+        self.rng.seed(self.seed)
+        results = []
+        team_ids, player_ids, contract_ids = set(), set(), set()
+        try:
+            for index, op in enumerate(operations):
+                op_type = op.get("type")
+                missing = [field for field in CAP_TRANSACTION_FIELDS.get(op_type, []) if op.get(field) is None]
+                if op_type not in handlers:
+                    result = {"error": f"Unknown operation type, expected one of {', '.join(handlers)}"}
+                elif missing:
+                    result = {"error": f"Missing {', '.join(missing)}"}
+                else:
+                    # Contracts this operation replaces or changes, for cache invalidation
+                    if op.get("contract_id") is not None:
+                        touched = [self.db.query(Contract).filter(Contract.id == op["contract_id"]).first()]
+                    else:
+                        touched = [self.get_player_contract(op["player_id"])]
+                        player = self.db.query(Player).filter(Player.id == op["player_id"]).first()
+                        team_ids.update([op["team_id"], player.team_id if player else None])
+                        player_ids.add(op["player_id"])
+                    result = handlers[op_type](op)
+                    if result.get("contract_id"):
+                        contract_ids.add(result["contract_id"])
+                    for contract in touched:
+                        if contract is not None:
+                            team_ids.add(contract.team_id)
+                            player_ids.add(contract.player_id)
+                            contract_ids.add(contract.id)
+
+                success = bool(result.get("success"))
+                results.append({"index": index, "type": op_type, "success": success, "result": result})
+                if not success:
+                    self._rollback()
+                    return {
+                        "success": False,
+                        "operations": len(operations),
+                        "failed_index": index,
+                        "seed": self.seed,
+                        "results": results,
+                        "cap": []
+                    }
+
+            team_ids.discard(None)
+            totals = self.salary_cap_service.refresh_team_cap_totals(sorted(team_ids)) if team_ids else {}
+            self.db.commit()
+        except Exception:
+            self._rollback()
+            raise
+
+        response_cache.invalidate(team_ids=team_ids, player_ids=player_ids, contract_ids=contract_ids, league=True)
+        return {
+            "success": True,
+            "operations": len(operations),
+            "failed_index": None,
+            "seed": self.seed,
+            "results": results,
+            "cap": [{"team_id": team_id, **values} for team_id, values in totals.items()]
+        }
+    
+    def execute_roster_moves(self, moves: List[Dict[str, any]]) -> Dict[str, any]:
+        """Apply a batch of roster moves all-or-nothing, signings and releases included.
+
+        The whole batch is checked against the roster limits first. Signings
+        then create a contract (base_salary and years from the move, or the
+        league minimum for one year) and releases end the player's active
+        contract with its dead money, as the salary cap endpoints do.
+        """
+        result = self.roster.validate_moves(moves)
+        if not result["valid"]:
+            return result
+
+        team_ids, player_ids, contract_ids = set(), set(), set()
+        try:
+            for move in moves:
+                player_id = move["player_id"]
+                current_team = self.roster.players[player_id][0]
+                team_id = move.get("team_id") or current_team
+                team_ids.update([team_id, current_team])
+                player_ids.add(player_id)
+                contract = self.get_player_contract(player_id)
+
+                if move["type"] in ("sign", "sign_practice_squad"):
+                    base_salary, years = move.get("base_salary") or MINIMUM_SALARY, move.get("years") or 1
+                    contract = self.salary_cap_service.create_veteran_contract(
+                        self.db.get(Player, player_id), team_id, base_salary, years
+                    )
+                    self.db.add(contract)
+                    self.db.flush()
+                    self.journal.record(
+                        "signing", team_id, player_id, contract.id, contract_type="veteran", salary=base_salary, years=years,
+                        **cap_change(self.salary_cap_service.current_year, self.salary_cap_service.contract_cap_hit(contract), contracts=1)
+                    )
+                    contract_ids.add(contract.id)
+                    self.roster.apply_move(move)
+                elif move["type"] == "release" and contract is not None:
+                    released = self.release_player(contract.id, commit=False)
+                    if not released.get("success"):
+                        raise ValueError(released.get("error"))
+                    contract_ids.add(contract.id)
+                else:
+                    self.roster.apply_move(move)
+
+            self.roster.flush()
+            team_ids.discard(None)
+            if contract_ids:
+                self.salary_cap_service.refresh_team_cap_totals(sorted(team_ids))
+            self.db.commit()
+        except Exception:
+            self._rollback()
+            raise
+
+        response_cache.invalidate(
+            team_ids=team_ids, player_ids=player_ids, contract_ids=contract_ids, league=bool(contract_ids)
+        )
+        return result
+    
+    def _rollback(self):
+        """Roll back the transaction, and the roster counters if moves already reached them"""
+        self.db.rollback()
+        if self._roster is not None:
+            RosterService.clear_counters()
+            self._roster = None
+    
+    def _save(self, contract: Contract, commit: bool):
+        """Commit a single operation, or only flush it when it is part of a batch"""
+        if commit:
+            self.db.commit()
+            self._invalidate_cached_responses(contract)
+        else:
+            self.db.flush()
+    
+    def _invalidate_cached_responses(self, contract: Contract):
+        """Drop cached API responses showing this contract, its player or its team, and league cap totals"""
+        response_cache.invalidate(
+            team_ids=[contract.team_id], player_ids=[contract.player_id], contract_ids=[contract.id], league=True
+        )
+    
     def calculate_franchise_tag_amount(self, position: str) -> int:
         """Calculate franchise tag amount for a position"""
         # Simplified franchise tag calculation
@@ -0,0 +1,289 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from typing import Dict, List, Optional
+from ..database.models import Player, Position, DraftProspect
+from ..services.player_evaluation import PlayerEvaluationService
+from ..services.salary_cap_service import SalaryCapService
+import numpy as np
+import time
+
+# Attribute order used by the sampling matrix
+ATTRIBUTES = [
+    "speed", "strength", "agility",
+    "football_iq", "leadership", "work_ethic",
+    "skill_1", "skill_2", "skill_3"
+]
+PHYSICAL = slice(0, 3)
+MENTAL = slice(3, 6)
+SKILL = slice(6, 9)
+
+# Correlation between attributes in the same group and across groups
+WITHIN_GROUP_CORRELATION = 0.55
+ACROSS_GROUP_CORRELATION = 0.2
+ATTRIBUTE_SPREAD = 9
+
+# Physical profile by position: (speed, strength, agility) offsets and (height, weight) means
+POSITION_PROFILES = {
+    'QB': ((-3, -5, 0), (75, 220)),
+    'RB': ((8, 0, 8), (70, 212)),
+    'FB': ((-5, 8, -3), (72, 245)),
+    'WR': ((10, -6, 8), (72, 198)),
+    'TE': ((0, 5, 0), (77, 250)),
+    'LT': ((-12, 14, -8), (78, 315)),
+    'LG': ((-14, 15, -9), (76, 315)),
+    'C': ((-14, 13, -8), (75, 305)),
+    'RG': ((-14, 15, -9), (76, 315)),
+    'RT': ((-12, 14, -8), (78, 315)),
+    'DE': ((2, 9, 2), (76, 265)),
+    'DT': ((-8, 14, -5), (75, 305)),
+    'NT': ((-12, 16, -8), (74, 325)),
+    'OLB': ((4, 5, 4), (75, 245)),
+    'ILB': ((0, 6, 2), (73, 240)),
+    'CB': ((11, -7, 10), (71, 192)),
+    'SS': ((5, 0, 5), (72, 208)),
+    'FS': ((7, -3, 6), (72, 202)),
+    'K': ((-10, -12, -6), (72, 195)),
+    'P': ((-10, -12, -6), (74, 210)),
+    'LS': ((-10, 0, -8), (74, 240)),
+}
+
+FIRST_NAMES = [
+    "James", "John", "Michael", "David", "Chris", "Marcus", "Tyler", "Jordan", "Brandon", "Justin",
+    "Derrick", "Malik", "Isaiah", "Jalen", "Caleb", "Trey", "Darius", "Andre", "Cameron", "Xavier",
+    "Devin", "Elijah", "Jaylen", "Kyle", "Logan", "Mason", "Nathan", "Omar", "Quinton", "Ryan",
+    "Samuel", "Terrell", "Zach", "Aaron", "Bryce", "Cole", "Dante", "Evan", "Garrett", "Hunter"
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Davis", "Miller", "Wilson", "Moore", "Taylor",
+    "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin", "Thompson", "Robinson", "Clark", "Lewis",
+    "Walker", "Hall", "Allen", "Young", "King", "Wright", "Hill", "Scott", "Green", "Adams",
+    "Baker", "Nelson", "Carter", "Mitchell", "Turner", "Phillips", "Campbell", "Parker", "Evans", "Edwards"
+]
+COLLEGES = [
+    "Alabama", "Georgia", "Ohio State", "Michigan", "LSU", "Clemson", "Texas", "Oklahoma", "USC", "Oregon",
+    "Penn State", "Florida", "Notre Dame", "Auburn", "Miami", "Florida State", "Wisconsin", "Iowa",
+    "Texas A&M", "Tennessee", "Washington", "Utah", "TCU", "Boise State", "North Dakota State"
+]
+
+DRAFT_ROUNDS = 7
+TEAMS = 32
+
+def board_grade(overall, potential, injury_flag, character_flag):
+    """Consensus board grade: current ability plus discounted upside, flags cost draft stock"""
+    return overall * 0.7 + potential * 0.3 - injury_flag * 3 - character_flag * 2
+
+class DraftClassService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.rng = np.random.default_rng(seed)
+
+    def _attribute_covariance(self) -> np.ndarray:
+        """Covariance of the nine attributes: strong within a group, weaker across groups"""
+        correlation = np.full((len(ATTRIBUTES), len(ATTRIBUTES)), ACROSS_GROUP_CORRELATION)
+        for group in (PHYSICAL, MENTAL, SKILL):
+            correlation[group, group] = WITHIN_GROUP_CORRELATION
+        np.fill_diagonal(correlation, 1.0)
+        return correlation * ATTRIBUTE_SPREAD ** 2
+
+    def generate_class(self, year: int = None, size: int = 300, class_strength: float = None,
+                       persist: bool = True) -> Dict[str, any]:
+        """Generate a draft class and bulk insert it as prospects"""
+        started = time.perf_counter()
+        if year is None:
+            year = SalaryCapService(self.db).current_year
+        if class_strength is None:
+            class_strength = float(self.rng.normal(0, 1))
+
+        positions = self.db.query(Position).order_by(Position.id).all()
+        if not positions:
+            return {"error": "No positions defined"}
+
+        # Position scarcity follows how many of each position teams carry
+        codes = [p.code for p in positions]
+        typical = np.array([p.typical_roster or 1 for p in positions], dtype=float)
+        position_index = self.rng.choice(len(codes), size=size, p=typical / typical.sum())
+
+        # Correlated attributes: shared talent plus group-correlated noise, shifted by class strength
+        talent = self.rng.normal(0, 6, size)
+        attributes = self.rng.multivariate_normal(np.zeros(len(ATTRIBUTES)), self._attribute_covariance(), size)
+        attributes += 50 + class_strength * 3 + talent[:, None]
+
+        profiles = np.array([POSITION_PROFILES.get(code, ((0, 0, 0), (74, 230)))[0] for code in codes], dtype=float)
+        attributes[:, PHYSICAL] += profiles[position_index]
+        attributes = np.clip(np.rint(attributes), 1, 99)
+
+        overall = self._overall_ratings(positions, position_index, attributes)
+
+        ages = self.rng.choice([21, 22, 23], size=size, p=[0.35, 0.45, 0.2])
+        work_ethic = attributes[:, ATTRIBUTES.index("work_ethic")]
+        calculated = PlayerEvaluationService.calculate_potential_batch(overall, ages, work_ethic, np.zeros(size))
+        upside = self.rng.gamma(2.0, 4.0, size)
+        potential = np.clip(np.rint(np.maximum(overall + 2, calculated + upside - 8)), 1, 99)
+
+        body = np.array([POSITION_PROFILES.get(code, ((0, 0, 0), (74, 230)))[1] for code in codes], dtype=float)
+        heights = np.rint(body[position_index, 0] + self.rng.normal(0, 1.5, size))
+        weights = np.rint(body[position_index, 1] + self.rng.normal(0, 10, size)
+                          + (attributes[:, ATTRIBUTES.index("strength")] - 50) * 0.4)
+
+        combine = self._combine_results(attributes, weights)
+        injury_flag = self.rng.random(size) < 0.08
+        character_flag = self.rng.random(size) < 0.05
+
+        grade = board_grade(overall, potential, injury_flag, character_flag)
+        class_rank = np.empty(size, dtype=int)
+        class_rank[np.argsort(-grade, kind="stable")] = np.arange(1, size + 1)
+        projected_round = np.minimum((class_rank - 1) // TEAMS + 1, DRAFT_ROUNDS + 1)
+
+        position_rank = np.empty(size, dtype=int)
+        order = np.lexsort((class_rank, position_index))
+        sorted_positions = position_index[order]
+        group_starts = np.r_[0, np.flatnonzero(np.diff(sorted_positions)) + 1]
+        group_offsets = np.repeat(group_starts, np.diff(np.r_[group_starts, size]))
+        position_rank[order] = np.arange(size) - group_offsets + 1
+
+        first_names = self.rng.choice(FIRST_NAMES, size)
+        last_names = self.rng.choice(LAST_NAMES, size)
+        colleges = self.rng.choice(COLLEGES, size)
+
+        summary = {
+            "draft_year": year,
+            "size": size,
+            "class_strength": round(class_strength, 3),
+            "average_overall": round(float(overall.mean()), 1),
+            "average_potential": round(float(potential.mean()), 1),
+            "position_counts": {code: int(n) for code, n in zip(codes, np.bincount(position_index, minlength=len(codes)))}
+        }
+        if not persist:
+            summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+            return summary
+
+        position_indices = position_index.tolist()
+        first_names, last_names, colleges = first_names.tolist(), last_names.tolist(), colleges.tolist()
+        attribute_columns = {name: attributes[:, i].astype(int).tolist() for i, name in enumerate(ATTRIBUTES)}
+        player_rows = [
+            {
+                "first_name": first_names[i],
+                "last_name": last_names[i],
+                "position": codes[position_indices[i]],
+                "age": int(ages[i]),
+                "height": int(heights[i]),
+                "weight": int(weights[i]),
+                "years_pro": 0,
+                "college": colleges[i],
+                "draft_year": year,
+                "team_id": None,
+                "roster_status": "prospect",
+                "overall_rating": int(overall[i]),
+                "potential": int(potential[i]),
+                **{name: values[i] for name, values in attribute_columns.items()},
+                "injury_status": "healthy",
+                "injury_prone": bool(injury_flag[i])
+            }
+            for i in range(size)
+        ]
+        player_ids = self.db.execute(
+            insert(Player.__table__).returning(Player.__table__.c.id, sort_by_parameter_order=True),
+            player_rows
+        ).scalars().all()
+
+        combine_columns = {name: values.tolist() for name, values in combine.items()}
+        self.db.execute(DraftProspect.__table__.insert(), [
+            {
+                "player_id": player_id,
+                "draft_year": year,
+                "class_rank": int(class_rank[i]),
+                "position_rank": int(position_rank[i]),
+                "projected_round": int(projected_round[i]),
+                "class_strength": class_strength,
+                **{name: values[i] for name, values in combine_columns.items()},
+                "injury_flag": bool(injury_flag[i]),
+                "character_flag": bool(character_flag[i]),
+                "is_drafted": False
+            }
+            for i, player_id in enumerate(player_ids)
+        ])
+        self.db.commit()
+
+        summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return summary
+
+    def _overall_ratings(self, positions: List[Position], position_index: np.ndarray,
+                         attributes: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_overall_rating using each position's key attributes"""
+        key_weights = [0.5, 0.3, 0.2]
+        weighted_sum = np.zeros(len(position_index))
+        total_weight = np.zeros(len(position_index))
+
+        for index, position in enumerate(positions):
+            members = position_index == index
+            if not members.any():
+                continue
+            for weight, attr in zip(key_weights, [position.key_attribute_1, position.key_attribute_2,
+                                                  position.key_attribute_3]):
+                if attr in ATTRIBUTES:
+                    weighted_sum[members] += attributes[members, ATTRIBUTES.index(attr)] * weight
+                    total_weight[members] += weight
+
+        weighted_sum += attributes[:, PHYSICAL].mean(axis=1) * 0.2
+        weighted_sum += attributes[:, MENTAL].mean(axis=1) * 0.15
+        total_weight += 0.35
+
+        return np.clip((weighted_sum / total_weight).astype(int), 1, 99)
+
+    def _combine_results(self, attributes: np.ndarray, weights: np.ndarray) -> Dict[str, np.ndarray]:
+        """Simulate combine drills from the underlying athletic attributes"""
+        size = len(attributes)
+        speed = attributes[:, ATTRIBUTES.index("speed")]
+        strength = attributes[:, ATTRIBUTES.index("strength")]
+        agility = attributes[:, ATTRIBUTES.index("agility")]
+
+        def noise(scale):
+            return self.rng.normal(0, scale, size)
+
+        return {
+            "forty_yard_dash": np.round(np.clip(5.6 - speed * 0.0135 + (weights - 230) * 0.0015 + noise(0.05), 4.2, 5.8), 2),
+            "bench_press": np.clip(np.rint(strength * 0.42 - 4 + noise(2)), 0, 50).astype(int),
+            "vertical_jump": np.round(np.clip(18 + (speed + agility) * 0.12 + noise(1.5), 20, 46), 1),
+            "broad_jump": np.clip(np.rint(88 + (speed + strength) * 0.28 + noise(3)), 90, 145).astype(int),
+            "three_cone": np.round(np.clip(8.1 - agility * 0.012 + noise(0.08), 6.5, 8.4), 2),
+            "shuttle": np.round(np.clip(4.9 - agility * 0.007 + noise(0.05), 3.9, 5.0), 2)
+        }
+
+    def get_draft_class(self, year: int, position: Optional[str] = None,
+                        limit: int = 100, available_only: bool = False) -> List[Dict[str, any]]:
+        """Get a draft class ordered by consensus rank"""
+        query = self.db.query(DraftProspect, Player).join(
+            Player, Player.id == DraftProspect.player_id
+        ).filter(DraftProspect.draft_year == year)
+        if position:
+            query = query.filter(Player.position == position.upper())
+        if available_only:
+            query = query.filter(DraftProspect.is_drafted == False)
+
+        rows = query.order_by(DraftProspect.class_rank).limit(limit).all()
+        return [
+            {
+                "player_id": player.id,
+                "name": f"{player.first_name} {player.last_name}",
+                "position": player.position,
+                "college": player.college,
+                "age": player.age,
+                "overall_rating": player.overall_rating,
+                "potential": player.potential,
+                "class_rank": prospect.class_rank,
+                "position_rank": prospect.position_rank,
+                "projected_round": prospect.projected_round,
+                "combine": {
+                    "forty_yard_dash": prospect.forty_yard_dash,
+                    "bench_press": prospect.bench_press,
+                    "vertical_jump": prospect.vertical_jump,
+                    "broad_jump": prospect.broad_jump,
+                    "three_cone": prospect.three_cone,
+                    "shuttle": prospect.shuttle
+                },
+                "injury_flag": prospect.injury_flag,
+                "character_flag": prospect.character_flag,
+                "is_drafted": prospect.is_drafted
+            }
+            for prospect, player in rows
+        ]
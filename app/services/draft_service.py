@@ -0,0 +1,575 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, insert, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from datetime import datetime
+from ..database.models import (
+    Player, Position, Team, TeamSeasonStat, DraftProspect, DraftPick, Contract, TeamRookiePool,
+    CompensatoryPick
+)
+from ..services.draft_class_service import board_grade, DRAFT_ROUNDS
+from ..services.salary_cap_service import SalaryCapService
+from ..services.response_cache import response_cache
+from ..services.roster_service import RosterService
+from ..services.journal_service import TransactionJournal, journal_entry, cap_change
+import heapq
+import math
+import os
+import numpy as np
+import time
+
+# Only the top of the board is ever in range of a pick
+BOARD_DEPTH = 600
+
+# Grade points a full positional need is worth, and how much of a need one pick fills
+NEED_WEIGHT = 8.0
+NEED_FILL = 0.45
+
+# Starter quality below this counts as a need
+STARTER_TARGET_RATING = 75
+
+# How far teams' boards stray from consensus in a mock draft (grade points)
+MOCK_BOARD_NOISE = 2.5
+MOCK_NEED_JITTER = 0.25
+
+# Premium (or discount) teams put on a position when drafting
+POSITION_VALUE = {
+    'QB': 1.08, 'LT': 1.04, 'DE': 1.04, 'CB': 1.03, 'WR': 1.02, 'OLB': 1.01,
+    'K': 0.85, 'P': 0.85, 'LS': 0.8, 'FB': 0.92
+}
+
+# Length of a slotted rookie deal
+ROOKIE_CONTRACT_YEARS = 4
+
+# Below this many simulations the pool startup costs more than it saves
+MIN_PARALLEL_SIMULATIONS = 200
+
+def position_need(ratings: List[int], typical_roster: int) -> float:
+    """Need (0-1) at a position given its ratings sorted best first.
+
+    A position is needed when the team carries fewer players than usual or its
+    starters (the top half of the typical roster count) rate below the target.
+    """
+    typical = typical_roster or 1
+    depth_gap = max(0, typical - len(ratings)) / typical
+    starters = ratings[:math.ceil(typical / 2)]
+    if not starters:
+        return 1.0
+    quality_gap = max(0, STARTER_TARGET_RATING - sum(starters) / len(starters)) / 25
+    return min(1.0, 0.6 * depth_gap + 0.4 * quality_gap)
+
+def simulate_draft(board: Dict[str, np.ndarray], rng: np.random.Generator, noise: float = 0.0,
+                   need_jitter: float = 0.0) -> np.ndarray:
+    """Run one draft over a precomputed board without touching the database.
+
+    Every position keeps a max-heap of its available prospects, so a pick is a
+    vector lookup over each position's best remaining grade plus one heap pop.
+    Returns the overall pick number for each board prospect (0 = undrafted).
+    """
+    grades = board["grades"]
+    if noise:
+        grades = grades + rng.normal(0, noise, len(grades))
+    needs = board["needs"].copy()
+    if need_jitter:
+        needs *= rng.uniform(1 - need_jitter, 1 + need_jitter, needs.shape)
+
+    positions = board["positions"]
+    heaps = [[] for _ in range(needs.shape[1])]
+    for index in np.argsort(-grades, kind="stable"):
+        heaps[positions[index]].append((-grades[index], int(index)))  # Appending in order keeps each a valid heap
+
+    best = np.array([-heap[0][0] if heap else -np.inf for heap in heaps])
+    picks = np.zeros(len(grades), dtype=np.int16)
+
+    for overall_pick, team_index in enumerate(board["order"], 1):
+        team_needs = needs[team_index]
+        position = int(np.argmax(best + team_needs * NEED_WEIGHT))
+        if best[position] == -np.inf:
+            break  # Board exhausted
+
+        heap = heaps[position]
+        _, index = heapq.heappop(heap)
+        best[position] = -heap[0][0] if heap else -np.inf
+        picks[index] = overall_pick
+        team_needs[position] *= NEED_FILL
+
+    return picks
+
+def _run_mock_batch(board: Dict[str, np.ndarray], seed_sequence: np.random.SeedSequence,
+                    simulations: int) -> np.ndarray:
+    """Process pool worker: run a batch of noisy mock drafts"""
+    rng = np.random.default_rng(seed_sequence)
+    return np.stack([
+        simulate_draft(board, rng, MOCK_BOARD_NOISE, MOCK_NEED_JITTER)
+        for _ in range(simulations)
+    ])
+
+class DraftService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.salary_cap_service = SalaryCapService(db)
+
+    def get_draft_order(self, year: int) -> List[int]:
+        """Worst-to-first by the previous season; playoff teams pick last, champion at the end"""
+        stats = {}
+        for row in self.db.query(TeamSeasonStat).filter(
+            TeamSeasonStat.season == year - 1,
+            TeamSeasonStat.stat.in_(["wins", "losses", "ties", "points_for", "points_against",
+                                     "playoff_wins", "playoff_losses"])
+        ).all():
+            stats.setdefault(row.team_id, {})[row.stat] = row.value
+
+        def order_key(team_id):
+            record = stats.get(team_id, {})
+            wins, losses, ties = record.get("wins", 0), record.get("losses", 0), record.get("ties", 0)
+            games = wins + losses + ties
+            made_playoffs = record.get("playoff_wins", 0) + record.get("playoff_losses", 0) > 0
+            return (
+                made_playoffs,
+                record.get("playoff_wins", 0),
+                (wins + ties * 0.5) / games if games else 0.0,
+                record.get("points_for", 0) - record.get("points_against", 0),
+                team_id
+            )
+
+        team_ids = [team.id for team in self.db.query(Team).order_by(Team.id).all()]
+        return sorted(team_ids, key=order_key)
+
+    def build_board(self, year: int) -> Optional[Dict[str, any]]:
+        """Precompute everything a draft needs: prospect grades, positions, team needs and pick order"""
+        rows = self.db.execute(
+            select(
+                DraftProspect.player_id, Player.position, Player.overall_rating, Player.potential,
+                DraftProspect.injury_flag, DraftProspect.character_flag
+            )
+            .join(Player, Player.id == DraftProspect.player_id)
+            .where(DraftProspect.draft_year == year, DraftProspect.is_drafted == False)
+            .order_by(DraftProspect.class_rank)
+            .limit(BOARD_DEPTH)
+        ).all()
+        if not rows:
+            return None
+
+        positions = self.db.query(Position).order_by(Position.id).all()
+        codes = [p.code for p in positions]
+        code_index = {code: i for i, code in enumerate(codes)}
+
+        player_ids = np.array([row.player_id for row in rows])
+        position_index = np.array([code_index.get(row.position, 0) for row in rows])
+        overall = np.array([row.overall_rating or 50 for row in rows], dtype=float)
+        potential = np.array([row.potential or 50 for row in rows], dtype=float)
+        injury_flag = np.array([bool(row.injury_flag) for row in rows])
+        character_flag = np.array([bool(row.character_flag) for row in rows])
+
+        value = np.array([POSITION_VALUE.get(code, 1.0) for code in codes])
+        grades = board_grade(overall, potential, injury_flag, character_flag) * value[position_index]
+
+        team_order = self.get_draft_order(year)
+        needs = self.team_needs(team_order, positions)
+
+        # Same order every round, with compensatory picks at the end of their round
+        team_index = {team_id: i for i, team_id in enumerate(team_order)}
+        compensatory = {}
+        for pick in self.db.query(CompensatoryPick).filter(CompensatoryPick.draft_year == year).order_by(
+            CompensatoryPick.round, CompensatoryPick.order_in_round
+        ).all():
+            compensatory.setdefault(pick.round, []).append(team_index[pick.team_id])
+
+        order, rounds, picks_in_round = [], [], []
+        for draft_round in range(1, DRAFT_ROUNDS + 1):
+            round_order = list(range(len(team_order))) + compensatory.get(draft_round, [])
+            order.extend(round_order)
+            rounds.extend([draft_round] * len(round_order))
+            picks_in_round.extend(range(1, len(round_order) + 1))
+
+        return {
+            "year": year,
+            "player_ids": player_ids,
+            "positions": position_index,
+            "grades": grades,
+            "needs": needs,
+            "order": np.array(order),
+            "rounds": np.array(rounds),
+            "picks_in_round": np.array(picks_in_round),
+            "team_ids": np.array(team_order),
+            "position_codes": codes
+        }
+
+    def team_needs(self, team_ids: List[int], positions: List[Position]) -> np.ndarray:
+        """Teams x positions matrix of position_need from each active depth chart"""
+        team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        code_index = {p.code: i for i, p in enumerate(positions)}
+
+        depth_charts = {}
+        for row in self.db.execute(
+            select(Player.team_id, Player.position, Player.overall_rating)
+            .where(Player.team_id.in_(team_ids), Player.roster_status == "active")
+        ).all():
+            depth_charts.setdefault((row.team_id, row.position), []).append(row.overall_rating or 50)
+
+        needs = np.ones((len(team_ids), len(positions)))
+        for (team_id, code), ratings in depth_charts.items():
+            if code not in code_index:
+                continue
+            typical = positions[code_index[code]].typical_roster
+            needs[team_index[team_id], code_index[code]] = position_need(sorted(ratings, reverse=True), typical)
+
+        return needs
+
+    def run_mock_drafts(self, year: int, simulations: int = 1000, workers: int = None,
+                        limit: int = 100) -> Dict[str, any]:
+        """Run many noisy mock drafts in a process pool and report each prospect's pick range"""
+        started = time.perf_counter()
+        board = self.build_board(year)
+        if board is None:
+            return {"error": "No draft class available"}
+
+        # The pool only needs the numeric arrays
+        arrays = {key: board[key] for key in ("grades", "positions", "needs", "order")}
+        workers = workers or os.cpu_count() or 1
+        seed_sequence = np.random.SeedSequence(self.seed)
+
+        if workers == 1 or simulations < MIN_PARALLEL_SIMULATIONS:
+            picks = _run_mock_batch(arrays, seed_sequence, simulations)
+        else:
+            batch_sizes = [len(batch) for batch in np.array_split(np.arange(simulations), workers) if len(batch)]
+            with ProcessPoolExecutor(max_workers=len(batch_sizes)) as pool:
+                batches = pool.map(
+                    _run_mock_batch,
+                    [arrays] * len(batch_sizes),
+                    seed_sequence.spawn(len(batch_sizes)),
+                    batch_sizes
+                )
+                picks = np.concatenate(list(batches))
+
+        distribution = self._pick_distribution(board, picks)
+        return {
+            "draft_year": year,
+            "simulations": simulations,
+            "workers": workers,
+            "prospects": distribution[:limit],
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def _pick_distribution(self, board: Dict[str, any], picks: np.ndarray) -> List[Dict[str, any]]:
+        """Summarize simulations x prospects pick numbers into per-prospect ranges"""
+        drafted = picks > 0
+        times_drafted = drafted.sum(axis=0)
+
+        # Undrafted outcomes are ignored when computing pick percentiles
+        masked = np.where(drafted, picks, np.nan).astype(float)
+        ever_drafted = times_drafted > 0
+        percentiles = np.full((5, picks.shape[1]), np.nan)
+        if ever_drafted.any():
+            percentiles[:, ever_drafted] = np.nanpercentile(masked[:, ever_drafted], [0, 10, 50, 90, 100], axis=0)
+        mean_pick = np.full(picks.shape[1], np.nan)
+        mean_pick[ever_drafted] = np.nanmean(masked[:, ever_drafted], axis=0)
+
+        rounds = np.where(drafted, board["rounds"][np.maximum(picks, 1) - 1], 0)
+        round_counts = np.stack([(rounds == r).sum(axis=0) for r in range(1, DRAFT_ROUNDS + 1)], axis=1)
+
+        details = {
+            row.id: row for row in self.db.query(Player.id, Player.first_name, Player.last_name, Player.position)
+            .filter(Player.id.in_(board["player_ids"][ever_drafted].tolist())).all()
+        }
+
+        simulations = len(picks)
+        results = []
+        for index in np.argsort(np.where(ever_drafted, mean_pick, np.inf), kind="stable"):
+            if not ever_drafted[index]:
+                break
+            player = details[int(board["player_ids"][index])]
+            results.append({
+                "player_id": player.id,
+                "name": f"{player.first_name} {player.last_name}",
+                "position": player.position,
+                "drafted_probability": round(times_drafted[index] / simulations, 3),
+                "average_pick": round(float(mean_pick[index]), 1),
+                "earliest_pick": int(percentiles[0, index]),
+                "pick_10th_percentile": int(percentiles[1, index]),
+                "median_pick": int(percentiles[2, index]),
+                "pick_90th_percentile": int(percentiles[3, index]),
+                "latest_pick": int(percentiles[4, index]),
+                "round_probabilities": {
+                    r + 1: round(count / simulations, 3) for r, count in enumerate(round_counts[index]) if count
+                }
+            })
+        return results
+
+    def run_draft(self, year: int = None, commit: bool = True) -> Dict[str, any]:
+        """Run the real draft: every AI team picks by board and need, results are stored in bulk"""
+        started = time.perf_counter()
+        if year is None:
+            year = self.salary_cap_service.current_year
+
+        if self.db.query(DraftPick).filter(DraftPick.draft_year == year).first():
+            return {"error": "Draft already held for year"}
+
+        board = self.build_board(year)
+        if board is None:
+            return {"error": "No draft class available"}
+
+        picks = simulate_draft(board, self.rng)
+        drafted = np.flatnonzero(picks)
+        drafted = drafted[np.argsort(picks[drafted])]
+
+        selections = []
+        for index in drafted:
+            overall_pick = int(picks[index])
+            selections.append({
+                "draft_year": year,
+                "round": int(board["rounds"][overall_pick - 1]),
+                "pick_in_round": int(board["picks_in_round"][overall_pick - 1]),
+                "overall_pick": overall_pick,
+                "team_id": int(board["team_ids"][board["order"][overall_pick - 1]]),
+                "player_id": int(board["player_ids"][index])
+            })
+
+        try:
+            if selections:
+                self.db.execute(DraftPick.__table__.insert(), selections)
+
+                player_table = Player.__table__
+                self.db.execute(
+                    update(player_table)
+                    .where(player_table.c.id == bindparam("b_player_id"))
+                    .values(
+                        team_id=bindparam("b_team_id"),
+                        roster_status="active",
+                        draft_year=year,
+                        draft_round=bindparam("b_round"),
+                        draft_pick=bindparam("b_pick_in_round"),
+                        years_pro=0
+                    ),
+                    [
+                        {
+                            "b_player_id": s["player_id"],
+                            "b_team_id": s["team_id"],
+                            "b_round": s["round"],
+                            "b_pick_in_round": s["pick_in_round"]
+                        }
+                        for s in selections
+                    ]
+                )
+                self.db.execute(
+                    update(DraftProspect)
+                    .where(DraftProspect.player_id.in_([s["player_id"] for s in selections]))
+                    .values(is_drafted=True),
+                    execution_options={"synchronize_session": False}
+                )
+
+            # Everyone left on the board is an undrafted free agent
+            undrafted = self.db.execute(
+                update(Player)
+                .where(
+                    Player.id.in_(select(DraftProspect.player_id).where(
+                        DraftProspect.draft_year == year, DraftProspect.is_drafted == False
+                    )),
+                    Player.roster_status == "prospect"
+                )
+                .values(roster_status="free_agent"),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+
+            if commit:
+                self.db.commit()
+                response_cache.clear()
+                RosterService.clear_counters()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return {
+            "draft_year": year,
+            "drafted": len(selections),
+            "undrafted_free_agents": undrafted,
+            "picks": selections,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def sign_draft_class(self, year: int = None, commit: bool = True) -> Dict[str, any]:
+        """Sign every unsigned pick of a completed draft to a slotted rookie deal in one transaction.
+
+        Slot salaries come from the pick-by-pick rookie scale. When the class would
+        cost more than the league's rookie pool (the per-team pool times the number
+        of teams), the part of every slot above the rookie minimum is scaled down to
+        fit. Each team's rookie pool allocation is the first-year value of the picks
+        it made. Cap totals are recomputed once for all affected teams.
+        """
+        started = time.perf_counter()
+        cap = self.salary_cap_service
+        if year is None:
+            year = cap.current_year
+
+        picks = self.db.query(DraftPick).filter(
+            DraftPick.draft_year == year,
+            DraftPick.player_id != None
+        ).order_by(DraftPick.overall_pick).all()
+        if not picks:
+            return {"error": "No draft picks to sign"}
+
+        # Slot salaries for every pick in the draft, scaled to the rookie pool
+        raw = np.array([cap.rookie_slot_salaries(p.round, p.pick_in_round) for p in picks], dtype=float)
+        minimum = cap.rookie_minimum_salary
+        league_pool = cap.rookie_pool * len(self.db.query(Team.id).all())
+        above_minimum = np.maximum(raw[:, 0] - minimum, 0).sum()
+        factor = 1.0
+        if raw[:, 0].sum() > league_pool and above_minimum > 0:
+            factor = min(1.0, max(0.0, (league_pool - minimum * len(picks)) / above_minimum))
+        salaries = np.rint(minimum + np.maximum(raw - minimum, 0) * factor).astype(int)
+
+        allocations = {}
+        for pick, slot in zip(picks, salaries):
+            allocations[pick.team_id] = allocations.get(pick.team_id, 0) + int(slot[0])
+
+        unsigned = [(pick, slot) for pick, slot in zip(picks, salaries) if pick.contract_id is None]
+        if not unsigned:
+            return {"error": "Draft class already signed"}
+
+        # Deals run from the draft year; year_N columns count from the current
+        # league year, so a class signed late starts partway through its deal
+        elapsed = cap.current_year - year
+        # years is the term left, as the offseason rollover counts it down
+        years_left = max(1, ROOKIE_CONTRACT_YEARS - max(0, elapsed))
+        start_date = datetime.now()
+        end_date = datetime(year + ROOKIE_CONTRACT_YEARS, 3, 1)
+        contract_rows = []
+        for pick, slot in unsigned:
+            deal = [int(value) for value in slot[:ROOKIE_CONTRACT_YEARS]]
+            columns = [
+                deal[column + elapsed] if 0 <= column + elapsed < ROOKIE_CONTRACT_YEARS else 0
+                for column in range(5)
+            ]
+            contract_rows.append({
+                "player_id": pick.player_id,
+                "team_id": pick.team_id,
+                "total_value": sum(deal),
+                "guaranteed_money": sum(deal) if pick.round == 1 else deal[0],
+                "years": years_left,
+                **{f"year_{i}_salary": value for i, value in enumerate(columns, 1)},
+                **{f"year_{i}_cap_hit": value for i, value in enumerate(columns, 1)},
+                "signing_bonus": 0,
+                "roster_bonus": 0,
+                "is_rookie_contract": True,
+                "rookie_scale_year": elapsed + 1,
+                "contract_type": "rookie",
+                "start_date": start_date,
+                "end_date": end_date,
+                "is_active": True
+            })
+
+        used = {}
+        signed_counts = {}
+        for pick, slot in unsigned:
+            used[pick.team_id] = used.get(pick.team_id, 0) + int(slot[0])
+            signed_counts[pick.team_id] = signed_counts.get(pick.team_id, 0) + 1
+
+        try:
+            contract_table = Contract.__table__
+            contract_ids = self.db.execute(
+                insert(contract_table).returning(contract_table.c.id, sort_by_parameter_order=True),
+                contract_rows
+            ).scalars().all()
+
+            pick_table = DraftPick.__table__
+            self.db.execute(
+                update(pick_table)
+                .where(pick_table.c.id == bindparam("b_pick_id"))
+                .values(contract_id=bindparam("b_contract_id")),
+                [{"b_pick_id": pick.id, "b_contract_id": contract_id} for (pick, _), contract_id in zip(unsigned, contract_ids)]
+            )
+            TransactionJournal(self.db).record_many([
+                journal_entry(
+                    "signing", pick.team_id, pick.player_id, contract_id,
+                    contract_type="rookie", salary=int(slot[0]), years=years_left,
+                    **cap_change(cap.current_year, row["year_1_cap_hit"], contracts=1)
+                )
+                for (pick, slot), row, contract_id in zip(unsigned, contract_rows, contract_ids)
+            ])
+
+            pool_table = TeamRookiePool.__table__
+            pool_stmt = sqlite_insert(pool_table)
+            pool_stmt = pool_stmt.on_conflict_do_update(
+                index_elements=["team_id", "year"],
+                set_={
+                    "allocation": pool_stmt.excluded.allocation,
+                    "used": pool_table.c.used + pool_stmt.excluded.used,
+                    "picks_signed": pool_table.c.picks_signed + pool_stmt.excluded.picks_signed,
+                    "updated_at": datetime.utcnow()
+                }
+            )
+            self.db.execute(pool_stmt, [
+                {
+                    "team_id": team_id,
+                    "year": year,
+                    "allocation": allocations[team_id],
+                    "used": used[team_id],
+                    "picks_signed": signed_counts[team_id]
+                }
+                for team_id in used
+            ])
+
+            cap_totals = cap.refresh_team_cap_totals(list(used))
+
+            if commit:
+                self.db.commit()
+                response_cache.clear()
+                RosterService.clear_counters()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        pool_totals = {
+            row.team_id: row for row in self.db.query(TeamRookiePool).filter(
+                TeamRookiePool.year == year, TeamRookiePool.team_id.in_(list(used))
+            ).all()
+        }
+        teams = [
+            {
+                "team_id": team_id,
+                "picks_signed": signed_counts[team_id],
+                "rookie_cap_hit": used[team_id],
+                "rookie_pool_allocation": pool_totals[team_id].allocation,
+                "rookie_pool_remaining": pool_totals[team_id].allocation - pool_totals[team_id].used,
+                "cap_space_before": cap_totals[team_id]["cap_space"] + used[team_id],
+                "cap_space_after": cap_totals[team_id]["cap_space"]
+            }
+            for team_id in sorted(used)
+        ]
+
+        return {
+            "draft_year": year,
+            "contracts_signed": len(contract_ids),
+            "total_rookie_cap_hit": sum(used.values()),
+            "league_rookie_pool": league_pool,
+            "scale_factor": round(factor, 4),
+            "teams": teams,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def get_draft_results(self, year: int, team_id: Optional[int] = None) -> List[Dict[str, any]]:
+        """Get the picks made in a draft"""
+        query = self.db.query(DraftPick, Player).outerjoin(
+            Player, Player.id == DraftPick.player_id
+        ).filter(DraftPick.draft_year == year)
+        if team_id:
+            query = query.filter(DraftPick.team_id == team_id)
+
+        return [
+            {
+                "overall_pick": pick.overall_pick,
+                "round": pick.round,
+                "pick_in_round": pick.pick_in_round,
+                "team_id": pick.team_id,
+                "player_id": pick.player_id,
+                "name": f"{player.first_name} {player.last_name}" if player else None,
+                "position": player.position if player else None,
+                "overall_rating": player.overall_rating if player else None,
+                "potential": player.potential if player else None,
+                "contract_id": pick.contract_id
+            }
+            for pick, player in query.order_by(DraftPick.overall_pick).all()
+        ]
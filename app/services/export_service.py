@@ -0,0 +1,170 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, Boolean, DateTime, Float, Integer
+from typing import Dict, Iterator, List, Optional
+from ..database.models import (
+    Player, Contract, SalaryCap, TeamSalaryCap, Game, PlayerGameStat, TeamGameStat,
+    PlayerSeasonStat, PlayerCareerStat, TeamSeasonStat, TeamCareerStat
+)
+import csv
+import io
+import orjson
+
+# Tables that can be exported, by the name used in URLs and on the command line
+EXPORT_TABLES = {
+    model.__tablename__: model.__table__
+    for model in [
+        Player, Contract, SalaryCap, TeamSalaryCap, Game, PlayerGameStat, TeamGameStat,
+        PlayerSeasonStat, PlayerCareerStat, TeamSeasonStat, TeamCareerStat
+    ]
+}
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet")
+}
+
+# Filter -> columns it may apply to, first match wins
+EXPORT_FILTERS = {
+    "team_id": ["team_id"],
+    "player_id": ["player_id"],
+    "season": ["season", "year"]
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back whatever was written since the last drain"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+class ExportService:
+    """Streams whole tables out in CSV, NDJSON or Parquet.
+
+    Rows come off a server-side cursor (yield_per) one chunk at a time and
+    each chunk is encoded and yielded as soon as it is read, so memory stays
+    flat however many seasons of history a table holds.
+    """
+
+    def __init__(self, db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def export_query(table_name: str, filters: Optional[Dict[str, int]] = None):
+        """Select for an export table, raising ValueError for unknown tables or filters"""
+        if table_name not in EXPORT_TABLES:
+            raise ValueError(f"Unknown table: {table_name}, expected one of {', '.join(EXPORT_TABLES)}")
+        table = EXPORT_TABLES[table_name]
+        query = select(table).order_by(table.c.id)
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            column = next((table.c[c] for c in EXPORT_FILTERS.get(name, []) if c in table.c), None)
+            if column is None:
+                raise ValueError(f"{table_name} cannot be filtered by {name}")
+            query = query.where(column == value)
+        return query
+
+    def stream_rows(self, table_name: str, filters: Optional[Dict[str, int]] = None) -> Iterator[List[tuple]]:
+        """Chunks of row tuples read through a server-side cursor"""
+        result = self.db.execute(
+            self.export_query(table_name, filters),
+            execution_options={"yield_per": self.chunk_size}
+        )
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
+    @classmethod
+    def check_export(cls, table_name: str, format: str, filters: Optional[Dict[str, int]] = None):
+        """Raise ValueError for an export that cannot run, before any bytes are sent"""
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown format: {format}, expected one of {', '.join(EXPORT_FORMATS)}")
+        cls.export_query(table_name, filters)
+        if format == "parquet":
+            _parquet_schema(EXPORT_TABLES[table_name])
+
+    def export(self, table_name: str, format: str = "csv", filters: Optional[Dict[str, int]] = None) -> Iterator[bytes]:
+        """Encoded chunks of a table export"""
+        self.check_export(table_name, format, filters)
+        encoders = {"csv": self._encode_csv, "ndjson": self._encode_ndjson, "parquet": self._encode_parquet}
+        return encoders[format](table_name, self.stream_rows(table_name, filters))
+
+    def _encode_csv(self, table_name: str, chunks: Iterator[List[tuple]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_TABLES[table_name].c.keys())
+        for rows in chunks:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def _encode_ndjson(self, table_name: str, chunks: Iterator[List[tuple]]) -> Iterator[bytes]:
+        columns = EXPORT_TABLES[table_name].c.keys()
+        for rows in chunks:
+            yield b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+    def _encode_parquet(self, table_name: str, chunks: Iterator[List[tuple]]) -> Iterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = _parquet_schema(EXPORT_TABLES[table_name])
+        sink = _ChunkSink()
+        # Each chunk becomes its own row group, so a chunk's bytes can go out as soon as it is read
+        writer = pq.ParquetWriter(sink, schema)
+        try:
+            for rows in chunks:
+                columns = list(zip(*rows))
+                writer.write_batch(pa.RecordBatch.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+def _parquet_schema(table):
+    """Arrow schema for a table's columns; Parquet export needs pyarrow installed"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ValueError("Parquet export requires pyarrow to be installed")
+
+    def arrow_type(column):
+        if isinstance(column.type, Boolean):
+            return pa.bool_()
+        if isinstance(column.type, Integer):
+            return pa.int64()
+        if isinstance(column.type, Float):
+            return pa.float64()
+        if isinstance(column.type, DateTime):
+            return pa.timestamp("us")
+        return pa.string()
+
+    return pa.schema([pa.field(column.name, arrow_type(column)) for column in table.columns])
@@ -0,0 +1,388 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, func
+from typing import Dict, List, Optional
+from ..database.models import Player, Position, Contract, Team, FreeAgentSigning
+from ..services.salary_cap_service import SalaryCapService
+from ..services.contract_service import ContractService, MARKET_POSITION_MULTIPLIERS
+from ..services.draft_service import DraftService, NEED_FILL
+from ..services.response_cache import response_cache
+from ..services.roster_service import RosterService
+from ..services.journal_service import TransactionJournal, journal_entry, cap_change
+import heapq
+import numpy as np
+import time
+
+FREE_AGENCY_DAYS = 30
+ROSTER_LIMIT = 53
+VETERAN_MINIMUM_SALARY = 1125000
+
+# Teams value a player at market value scaled by their need at his position
+BASE_INTEREST = 0.5
+VALUATION_NOISE = 0.1
+
+# Bids a team can have outstanding at once, and signings it aims for
+MAX_OPEN_OFFERS = 3
+MAX_SIGNINGS_PER_TEAM = 12
+
+# Players start out asking for their market value and drop their price each
+# day they go unsigned, like a descending-clock auction
+ASKING_DECAY_PER_DAY = 0.88
+MIN_ASKING_FACTOR = 0.03
+
+# Teams only bid when their offer is a serious fraction of the asking price,
+# and look this far down their heap for such players on each pass
+MIN_OFFER_RATIO = 0.5
+MAX_LOOKAHEAD = 40
+
+def contract_years(age: int) -> int:
+    """Length of a free agent deal by age"""
+    if age <= 27:
+        return 3
+    if age <= 30:
+        return 2
+    return 1
+
+def run_market(market: Dict[str, np.ndarray], rng: np.random.Generator,
+               days: int = FREE_AGENCY_DAYS) -> Dict[str, any]:
+    """Run a whole free agency period over in-memory arrays.
+
+    Every team keeps a max-heap of the players it wants, keyed by its valuation
+    and tagged with the version of its need at that position, so signing a
+    player only re-keys stale entries as they reach the top. Every player keeps
+    a max-heap of the offers on the table. Each day all teams bid within their
+    uncommitted cap space on players whose asking price they can come close
+    to, then players decide best-offer-first with ContractService's acceptance
+    chance. Declined bids are returned to the team, which may come back once
+    the price drops; whenever a player signs, the teams he turned down get
+    their money back and bid again the same day, so signings cascade.
+    """
+    market_value = market["market_value"].astype(float)
+    work_ethic = market["work_ethic"].astype(float)
+    positions = market["positions"]
+    needs = market["needs"].copy()
+    team_count, player_count = needs.shape[0], len(market_value)
+
+    available = market["cap_space"].astype(float).copy()
+    slots = np.minimum(market["roster_space"], MAX_SIGNINGS_PER_TEAM).astype(int)
+    open_offers = np.zeros(team_count, dtype=int)
+    need_version = np.zeros(needs.shape, dtype=int)
+
+    # Each team's private opinion of every player
+    interest = rng.normal(1.0, VALUATION_NOISE, (team_count, player_count))
+    def valuation(team, player):
+        return market_value[player] * interest[team, player] * (BASE_INTEREST + needs[team, positions[player]])
+
+    team_heaps = []
+    for team in range(team_count):
+        values = market_value * interest[team] * (BASE_INTEREST + needs[team, positions])
+        heap = list(zip((-values).tolist(), range(player_count), [0] * player_count))
+        heapq.heapify(heap)
+        team_heaps.append(heap)
+
+    player_offers: List[List[tuple]] = [[] for _ in range(player_count)]
+    bid_pairs = set()
+    signed_team = np.full(player_count, -1, dtype=int)
+    signed_salary = np.zeros(player_count, dtype=np.int64)
+    signed_day = np.full(player_count, -1, dtype=int)
+    daily = []
+
+    def bid(team, pending, asking_factor):
+        """Offer the team's best remaining targets until its bids or money run out"""
+        heap = team_heaps[team]
+        made = 0
+        deferred = []
+        while heap and len(deferred) < MAX_LOOKAHEAD and open_offers[team] < min(MAX_OPEN_OFFERS, slots[team]):
+            value, player, version = heap[0]
+            position = positions[player]
+            if signed_team[player] >= 0 or (team, player) in bid_pairs:
+                heapq.heappop(heap)
+                continue
+            if version != need_version[team, position]:
+                heapq.heapreplace(heap, (-valuation(team, player), player, need_version[team, position]))
+                continue
+
+            ceiling = available[team] / max(1, slots[team] - open_offers[team])
+            if -value < VETERAN_MINIMUM_SALARY or ceiling < VETERAN_MINIMUM_SALARY:
+                break
+            asking = max(VETERAN_MINIMUM_SALARY, market_value[player] * asking_factor)
+            salary = int(max(VETERAN_MINIMUM_SALARY, min(-value, ceiling, asking)))
+            if salary < asking * MIN_OFFER_RATIO:
+                # Too pricey for now; revisit when the asking price has come down
+                deferred.append(heapq.heappop(heap))
+                continue
+
+            heapq.heappop(heap)
+            heapq.heappush(player_offers[player], (-salary, team))
+            bid_pairs.add((team, player))
+            available[team] -= salary
+            open_offers[team] += 1
+            heapq.heappush(pending, (-salary, player))
+            made += 1
+
+        for entry in deferred:
+            heapq.heappush(heap, entry)
+        return made
+
+    def withdraw(team, salary):
+        available[team] += salary
+        open_offers[team] -= 1
+
+    for day in range(days):
+        asking_factor = max(MIN_ASKING_FACTOR, ASKING_DECAY_PER_DAY ** day)
+        final_day = day == days - 1
+        # Offers made after a player already decided yesterday are still on the table
+        pending = [(offers[0][0], player) for player, offers in enumerate(player_offers) if offers]
+        heapq.heapify(pending)
+        offers_made = sum(bid(team, pending, asking_factor) for team in range(team_count) if slots[team] > 0)
+        decided = set()
+        signings = 0
+
+        while pending:
+            _, player = heapq.heappop(pending)
+            if player in decided or signed_team[player] >= 0:
+                continue
+            offers = player_offers[player]
+            # Teams that filled their roster since bidding pull their offers
+            while offers and slots[offers[0][1]] <= 0:
+                salary, team = heapq.heappop(offers)
+                withdraw(team, -salary)
+            if not offers:
+                continue
+            decided.add(player)
+
+            salary, team = -offers[0][0], offers[0][1]
+            chance = 1.0 if final_day else ContractService.calculate_acceptance_chance_batch(
+                np.array([max(VETERAN_MINIMUM_SALARY, market_value[player] * asking_factor)]), np.array([salary]),
+                np.array([False]), np.array([work_ethic[player]])
+            )[0]
+            if rng.random() >= chance:
+                # Every bid is declined; the teams may try again at a lower price
+                for declined_salary, declined_team in offers:
+                    withdraw(declined_team, -declined_salary)
+                    bid_pairs.discard((declined_team, player))
+                    heapq.heappush(team_heaps[declined_team], (-valuation(declined_team, player), player, need_version[declined_team, positions[player]]))
+                offers.clear()
+                continue
+
+            heapq.heappop(offers)
+            signed_team[player] = team
+            signed_salary[player] = salary
+            signed_day[player] = day
+            open_offers[team] -= 1
+            slots[team] -= 1
+            needs[team, positions[player]] *= NEED_FILL
+            need_version[team, positions[player]] += 1
+            signings += 1
+
+            # Losing bidders get their money back and go after their next target today
+            losers = [team] + [loser for _, loser in offers]
+            for loser_salary, loser in offers:
+                withdraw(loser, -loser_salary)
+            offers.clear()
+            for loser in losers:
+                if slots[loser] > 0:
+                    offers_made += bid(loser, pending, asking_factor)
+
+        daily.append({"day": day + 1, "offers": offers_made, "signings": signings})
+
+    # Offers still open at the end simply expire
+    return {
+        "signed_team": signed_team,
+        "signed_salary": signed_salary,
+        "signed_day": signed_day,
+        "daily": daily
+    }
+
+def benchmark_market(free_agents: int = 500, teams: int = 32, positions: int = 24,
+                     days: int = FREE_AGENCY_DAYS, seed: Optional[int] = None) -> Dict[str, any]:
+    """Time a full synthetic market without the database"""
+    rng = np.random.default_rng(seed)
+    overall = np.clip(rng.normal(65, 8, free_agents), 40, 95)
+    age = rng.integers(22, 36, free_agents)
+    market = {
+        "market_value": ContractService.calculate_market_value_batch(
+            overall, np.ones(free_agents), age, np.maximum(0, age - 22)
+        ),
+        "work_ethic": rng.integers(30, 100, free_agents),
+        "positions": rng.integers(0, positions, free_agents),
+        "needs": rng.random((teams, positions)),
+        "cap_space": rng.integers(5000000, 60000000, teams),
+        "roster_space": rng.integers(3, 15, teams)
+    }
+
+    started = time.perf_counter()
+    result = run_market(market, rng, days)
+    seconds = time.perf_counter() - started
+
+    signed = result["signed_team"] >= 0
+    return {
+        "free_agents": free_agents,
+        "teams": teams,
+        "days": days,
+        "signed": int(signed.sum()),
+        "offers": sum(day["offers"] for day in result["daily"]),
+        "seconds": round(seconds, 4),
+        "signings_per_second": round(int(signed.sum()) / seconds, 1) if seconds else None
+    }
+
+class FreeAgencyService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.rng = np.random.default_rng(seed)
+        self.salary_cap_service = SalaryCapService(db)
+
+    def load_market(self) -> Dict[str, any]:
+        """Read every free agent and each team's cap space, roster room and needs"""
+        rows = self.db.execute(
+            select(
+                Player.id, Player.first_name, Player.last_name, Player.position, Player.age,
+                Player.years_pro, Player.overall_rating, Player.work_ethic
+            ).where(Player.roster_status == "free_agent", Player.team_id == None)
+        ).all()
+
+        positions = self.db.query(Position).order_by(Position.id).all()
+        position_index = {p.code: i for i, p in enumerate(positions)}
+        team_ids = [row.id for row in self.db.query(Team.id).order_by(Team.id).all()]
+
+        cap_totals = self.salary_cap_service.calculate_team_cap_totals(team_ids)
+        roster_counts = dict(self.db.query(Player.team_id, func.count(Player.id)).filter(
+            Player.team_id.in_(team_ids), Player.roster_status == "active"
+        ).group_by(Player.team_id).all())
+
+        overall = np.array([row.overall_rating or 50 for row in rows], dtype=float)
+        age = np.array([row.age or 25 for row in rows], dtype=float)
+        return {
+            "players": rows,
+            "former_teams": self._former_teams([row.id for row in rows]),
+            "team_ids": team_ids,
+            "market_value": ContractService.calculate_market_value_batch(
+                overall,
+                np.array([MARKET_POSITION_MULTIPLIERS.get(row.position, 1.0) for row in rows]),
+                age,
+                np.array([row.years_pro or 0 for row in rows], dtype=float)
+            ),
+            "work_ethic": np.array([row.work_ethic or 50 for row in rows], dtype=float),
+            "positions": np.array([position_index.get(row.position, 0) for row in rows], dtype=int),
+            "needs": DraftService(self.db).team_needs(team_ids, positions),
+            "cap_space": np.array([max(0, cap_totals[t]["cap_space"]) for t in team_ids], dtype=np.int64),
+            "roster_space": np.array([max(0, ROSTER_LIMIT - roster_counts.get(t, 0)) for t in team_ids], dtype=int)
+        }
+
+    def _former_teams(self, player_ids: List[int]) -> Dict[int, int]:
+        """Team each free agent's last contract expired with; released players have none"""
+        latest = (
+            select(Contract.player_id, func.max(Contract.id).label("contract_id"))
+            .where(Contract.player_id.in_(player_ids), Contract.is_active == False)
+            .group_by(Contract.player_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(Contract.player_id, Contract.team_id, Contract.end_date)
+            .join(latest, latest.c.contract_id == Contract.id)
+        ).all()
+        current_year = self.salary_cap_service.current_year
+        return {
+            row.player_id: row.team_id for row in rows
+            if row.end_date and row.end_date.year <= current_year
+        }
+
+    def run_free_agency(self, year: int = None, days: int = FREE_AGENCY_DAYS,
+                        commit: bool = True) -> Dict[str, any]:
+        """Run the league's free agency and sign every deal in one transaction"""
+        started = time.perf_counter()
+        year = year or self.salary_cap_service.current_year
+        market = self.load_market()
+        players = market["players"]
+        if not players:
+            return {"year": year, "free_agents": 0, "signed": 0, "daily": []}
+
+        market_start = time.perf_counter()
+        result = run_market(market, self.rng, days)
+        market_seconds = time.perf_counter() - market_start
+
+        # Signings go through the roster limits in the order the market made them; the
+        # market only tracks 53-man room, so a deal breaking another limit falls through
+        signed = np.flatnonzero(result["signed_team"] >= 0)
+        signed = signed[np.argsort(result["signed_day"][signed], kind="stable")]
+        roster = RosterService(self.db, contract_moves=True)
+        roster_rejected = 0
+        contracts = []
+        cap_hits = []
+        signings = []
+        for i in signed:
+            row = players[i]
+            team_id = market["team_ids"][result["signed_team"][i]]
+            salary = int(result["signed_salary"][i])
+            if roster.apply_move({"type": "sign", "player_id": row.id, "team_id": team_id}):
+                roster_rejected += 1
+                continue
+            contract = self.salary_cap_service.create_veteran_contract(
+                row, team_id, salary, contract_years(row.age or 25)
+            )
+            contracts.append(self.salary_cap_service.contract_values(contract))
+            cap_hits.append(self.salary_cap_service.contract_cap_hit(contract))
+            signings.append({
+                "player_id": row.id,
+                "name": f"{row.first_name} {row.last_name}",
+                "position": row.position,
+                "overall_rating": row.overall_rating,
+                "team_id": team_id,
+                "salary": salary,
+                "years": contract.years,
+                "day": int(result["signed_day"][i]) + 1
+            })
+
+        try:
+            if contracts:
+                contract_table = Contract.__table__
+                contract_ids = self.db.execute(
+                    insert(contract_table).returning(contract_table.c.id, sort_by_parameter_order=True),
+                    contracts
+                ).scalars().all()
+                self.db.execute(insert(FreeAgentSigning.__table__), [
+                    {
+                        "year": year,
+                        "player_id": signing["player_id"],
+                        "team_id": signing["team_id"],
+                        "former_team_id": market["former_teams"].get(signing["player_id"]),
+                        "contract_id": contract_id,
+                        "average_salary": contract["total_value"] // contract["years"],
+                        "years": contract["years"],
+                        "day": signing["day"]
+                    }
+                    for signing, contract, contract_id in zip(signings, contracts, contract_ids)
+                ])
+                TransactionJournal(self.db).record_many([
+                    journal_entry(
+                        "signing", signing["team_id"], signing["player_id"], contract_id,
+                        contract_type="veteran", salary=signing["salary"], years=signing["years"],
+                        former_team_id=market["former_teams"].get(signing["player_id"]),
+                        **cap_change(self.salary_cap_service.current_year, cap_hit, contracts=1)
+                    )
+                    for signing, cap_hit, contract_id in zip(signings, cap_hits, contract_ids)
+                ])
+                roster.flush()
+                self.db.flush()
+                self.salary_cap_service.refresh_team_cap_totals(sorted({s["team_id"] for s in signings}))
+            if commit:
+                self.db.commit()
+                response_cache.clear()
+        except Exception:
+            self.db.rollback()
+            RosterService.clear_counters()
+            raise
+
+        signings.sort(key=lambda s: s["salary"], reverse=True)
+        return {
+            "year": year,
+            "free_agents": len(players),
+            "signed": len(signings),
+            "roster_rejected": roster_rejected,
+            "total_salary": sum(s["salary"] for s in signings),
+            "top_signings": signings[:25],
+            "daily": result["daily"],
+            "timings": {
+                "market": round(market_seconds, 3),
+                "total": round(time.perf_counter() - started, 3)
+            }
+        }
@@ -0,0 +1,358 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Dict, List, Optional
+from ..database.models import Game, Player, Play
+from ..services.stats_service import StatsService
+from ..services.salary_cap_service import SalaryCapService
+from datetime import datetime
+import random
+
+OFFENSE_POSITIONS = ['QB', 'RB', 'FB', 'WR', 'TE', 'LT', 'LG', 'C', 'RG', 'RT']
+DEFENSE_POSITIONS = ['DE', 'DT', 'NT', 'OLB', 'ILB', 'CB', 'SS', 'FS']
+
+QUARTER_SECONDS = 900
+
+# Injured players who sit out
+UNAVAILABLE_INJURY_STATUSES = ['out', 'season_ending']
+
+class GameSimulationService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.rng = random.Random(seed)
+        self.stats_service = StatsService(db)
+        self.salary_cap_service = SalaryCapService(db)
+
+    def simulate_game(self, home_team_id: int, away_team_id: int, week: int,
+                      season: int = None, game_type: str = "regular",
+                      game_id: Optional[int] = None, commit: bool = True) -> Dict[str, any]:
+        """Simulate a game play-by-play and record its box score.
+
+        Passing the id of an existing game re-simulates it in place; the stats
+        rollup replaces that game's previous lines rather than adding to them.
+        """
+        if season is None:
+            season = self.salary_cap_service.current_year
+
+        if game_id is not None:
+            game = self.db.query(Game).filter(Game.id == game_id).first()
+            if not game:
+                return {"error": "Game not found"}
+        else:
+            game = Game(
+                season=season,
+                week=week,
+                game_type=game_type,
+                home_team_id=home_team_id,
+                away_team_id=away_team_id
+            )
+            self.db.add(game)
+            self.db.flush()
+
+        rosters = self._load_rosters([game.home_team_id, game.away_team_id])
+        plays = self.simulate_plays(
+            rosters[game.home_team_id], rosters[game.away_team_id],
+            allow_tie=game.game_type != "playoff"
+        )
+
+        home_score = sum(p["points"] for p in plays if p["scoring_team_id"] == game.home_team_id)
+        away_score = sum(p["points"] for p in plays if p["scoring_team_id"] == game.away_team_id)
+
+        game.home_score = home_score
+        game.away_score = away_score
+        game.is_final = True
+        game.played_at = datetime.utcnow()
+
+        self._store_plays(game, plays)
+
+        player_lines, team_lines = self.build_box_score(game, plays, rosters)
+        self.stats_service.record_game(game, player_lines, team_lines, commit=False)
+
+        if commit:
+            self.db.commit()
+
+        return {
+            "game_id": game.id,
+            "home_team_id": game.home_team_id,
+            "away_team_id": game.away_team_id,
+            "home_score": home_score,
+            "away_score": away_score,
+            "total_plays": len(plays),
+            "plays": plays
+        }
+
+    def _store_plays(self, game: Game, plays: List[Dict[str, any]]):
+        """Replace the stored play-by-play for a game with a single bulk insert"""
+        self.db.query(Play).filter(Play.game_id == game.id).delete(synchronize_session=False)
+        if not plays:
+            return
+
+        columns = [column.name for column in Play.__table__.columns if column.name != "id"]
+        rows = []
+        for number, play in enumerate(plays, 1):
+            row = {column: play.get(column) for column in columns}
+            row.update(game_id=game.id, season=game.season, play_number=number)
+            rows.append(row)
+        self.db.execute(Play.__table__.insert(), rows)
+
+    def _load_rosters(self, team_ids: List[int]) -> Dict[int, Dict[str, any]]:
+        """Load active players for the teams in a single query and derive unit strengths"""
+        players = self.db.query(Player).filter(
+            Player.team_id.in_(team_ids),
+            Player.roster_status == "active",
+            func.coalesce(Player.injury_status, "healthy").not_in(UNAVAILABLE_INJURY_STATUSES)
+        ).order_by(Player.overall_rating.desc()).all()
+
+        rosters = {team_id: {"team_id": team_id, "by_position": {}} for team_id in team_ids}
+        for player in players:
+            rosters[player.team_id]["by_position"].setdefault(player.position, []).append(player)
+
+        for roster in rosters.values():
+            by_position = roster["by_position"]
+            offense = [p.overall_rating for pos in OFFENSE_POSITIONS for p in by_position.get(pos, [])[:2]]
+            defense = [p.overall_rating for pos in DEFENSE_POSITIONS for p in by_position.get(pos, [])[:2]]
+            roster["offense"] = sum(offense) / len(offense) if offense else 50
+            roster["defense"] = sum(defense) / len(defense) if defense else 50
+            roster["qb"] = self._starter(by_position, ['QB'])
+            roster["kicker"] = self._starter(by_position, ['K'])
+            roster["punter"] = self._starter(by_position, ['P'])
+
+        return rosters
+
+    def _starter(self, by_position: Dict[str, List[Player]], positions: List[str]) -> Optional[Player]:
+        """Return the highest rated player across the given positions"""
+        candidates = [p for pos in positions for p in by_position.get(pos, [])[:1]]
+        return max(candidates, key=lambda p: p.overall_rating) if candidates else None
+
+    def _pick_player(self, by_position: Dict[str, List[Player]], positions: List[str]) -> Optional[Player]:
+        """Pick a skill player weighted towards the top of the depth chart"""
+        candidates = [p for pos in positions for p in by_position.get(pos, [])[:3]]
+        if not candidates:
+            return None
+        weights = [p.overall_rating for p in candidates]
+        return self.rng.choices(candidates, weights=weights)[0]
+
+    def simulate_plays(self, home: Dict[str, any], away: Dict[str, any],
+                       allow_tie: bool = True) -> List[Dict[str, any]]:
+        """Simulate a full game and return the list of plays"""
+        plays = []
+        offense, defense = (home, away) if self.rng.random() < 0.5 else (away, home)
+        quarter = 1
+        seconds = QUARTER_SECONDS
+        yardline = 75  # Yards from the opponent's end zone
+        down, distance = 1, 10
+
+        while True:
+            if seconds <= 0:
+                if quarter == 2:
+                    # Second half kickoff
+                    offense, defense = defense, offense
+                    yardline, down, distance = 75, 1, 10
+                if quarter >= 4:
+                    home_points = sum(p["points"] for p in plays if p["scoring_team_id"] == home["team_id"])
+                    away_points = sum(p["points"] for p in plays if p["scoring_team_id"] == away["team_id"])
+                    if home_points != away_points or (allow_tie and quarter >= 5):
+                        break
+                quarter += 1
+                seconds = QUARTER_SECONDS
+
+            play = self._run_play(offense, defense, quarter, seconds, down, distance, yardline)
+            plays.append(play)
+            seconds -= play["elapsed"]
+
+            if play["points"] and quarter >= 5:
+                # Sudden death overtime
+                break
+
+            if play["is_touchdown"] or play["play_type"] in ("field_goal", "punt") or play["is_turnover"]:
+                if play["play_type"] == "punt":
+                    yardline = min(95, max(5, 100 - (yardline - play["yards_gained"])))
+                elif play["is_turnover"]:
+                    yardline = min(95, max(5, 100 - yardline))
+                elif play["play_type"] == "field_goal" and not play["points"]:
+                    yardline = min(80, 100 - yardline)
+                else:
+                    yardline = 75
+                offense, defense = defense, offense
+                down, distance = 1, 10
+                continue
+
+            yardline -= play["yards_gained"]
+            if play["yards_gained"] >= distance:
+                down, distance = 1, min(10, yardline)
+            elif down == 4:
+                # Turnover on downs
+                offense, defense = defense, offense
+                yardline = 100 - yardline
+                down, distance = 1, 10
+            else:
+                down += 1
+                distance -= play["yards_gained"]
+
+        return plays
+
+    def _run_play(self, offense: Dict[str, any], defense: Dict[str, any], quarter: int,
+                  seconds: int, down: int, distance: int, yardline: int) -> Dict[str, any]:
+        """Simulate a single play from the given situation"""
+        edge = (offense["offense"] - defense["defense"]) / 10
+        play = {
+            "offense_team_id": offense["team_id"],
+            "defense_team_id": defense["team_id"],
+            "quarter": quarter,
+            "seconds_remaining": max(0, seconds),
+            "down": down,
+            "distance": distance,
+            "yardline": yardline,
+            "play_type": None,
+            "yards_gained": 0,
+            "passer_id": None,
+            "rusher_id": None,
+            "receiver_id": None,
+            "kicker_id": None,
+            "is_complete": False,
+            "is_sack": False,
+            "is_touchdown": False,
+            "is_turnover": False,
+            "is_first_down": False,
+            "points": 0,
+            "scoring_team_id": None,
+            "elapsed": 0
+        }
+
+        if down == 4 and not (distance <= 1 and yardline < 50):
+            kicker = offense["kicker"]
+            if yardline <= 37:
+                kick_distance = yardline + 17
+                accuracy = (kicker.skill_1 if kicker else 60) / 100
+                make_chance = min(0.99, max(0.05, 1.25 - kick_distance * 0.012 - (1 - accuracy) * 0.3))
+                play.update(play_type="field_goal", kicker_id=kicker.id if kicker else None, elapsed=5)
+                if self.rng.random() < make_chance:
+                    play.update(points=3, scoring_team_id=offense["team_id"])
+                return play
+
+            punter = offense["punter"]
+            punt_yards = int(self.rng.gauss(45 + ((punter.skill_1 if punter else 60) - 60) / 5, 6))
+            play.update(play_type="punt", kicker_id=punter.id if punter else None,
+                        yards_gained=min(punt_yards, yardline - 1), elapsed=8)
+            return play
+
+        by_position = offense["by_position"]
+        pass_chance = 0.58 if distance > 5 else 0.45
+        if self.rng.random() < pass_chance:
+            passer = offense["qb"]
+            play.update(play_type="pass", passer_id=passer.id if passer else None)
+            qb_skill = passer.skill_1 if passer else 50
+
+            if self.rng.random() < 0.065 - edge * 0.005:
+                play.update(is_sack=True, yards_gained=-self.rng.randint(2, 10), elapsed=35)
+            elif self.rng.random() < 0.025 - (qb_skill - 50) * 0.0002:
+                play.update(is_turnover=True, elapsed=8)
+            elif self.rng.random() < 0.62 + (qb_skill - 70) * 0.004 + edge * 0.02:
+                receiver = self._pick_player(by_position, ['WR', 'TE', 'RB'])
+                yards = max(0, int(self.rng.gauss(10.5 + edge, 8)))
+                play.update(is_complete=True, receiver_id=receiver.id if receiver else None,
+                            yards_gained=yards, elapsed=32)
+            else:
+                play.update(elapsed=6)
+        else:
+            rusher = self._pick_player(by_position, ['RB', 'FB', 'QB'])
+            play.update(play_type="run", rusher_id=rusher.id if rusher else None, elapsed=38)
+            yards = int(self.rng.gauss(4.2 + edge * 0.8, 5))
+            if self.rng.random() < 0.01:
+                play.update(is_turnover=True, yards_gained=0)
+            else:
+                play["yards_gained"] = max(-5, yards)
+
+        if not play["is_turnover"]:
+            # Safeties are not modelled; the ball is downed at the one
+            play["yards_gained"] = max(play["yards_gained"], yardline - 99)
+            if play["yards_gained"] >= yardline:
+                play.update(yards_gained=yardline, is_touchdown=True, is_first_down=True,
+                            points=7, scoring_team_id=offense["team_id"])
+            elif play["yards_gained"] >= distance:
+                play["is_first_down"] = True
+
+        return play
+
+    def build_box_score(self, game: Game, plays: List[Dict[str, any]],
+                        rosters: Dict[int, Dict[str, any]]):
+        """Aggregate plays into per-player and per-team stat lines"""
+        positions = {}
+        for roster in rosters.values():
+            for players in roster["by_position"].values():
+                for player in players:
+                    positions[player.id] = (player.team_id, player.position)
+
+        player_lines = {}
+
+        def add(player_id, stat, value=1):
+            if player_id is None:
+                return
+            team_id, position = positions[player_id]
+            line = player_lines.setdefault(player_id, {"team_id": team_id, "position": position, "stats": {}})
+            line["stats"][stat] = line["stats"].get(stat, 0) + value
+
+        team_ids = [game.home_team_id, game.away_team_id]
+        team_lines = {team_id: {stat: 0 for stat in ["passing_yards", "rushing_yards", "turnovers", "first_downs"]}
+                      for team_id in team_ids}
+
+        for play in plays:
+            team_line = team_lines[play["offense_team_id"]]
+            yards = play["yards_gained"]
+            if play["play_type"] == "pass":
+                if play["is_sack"]:
+                    add(play["passer_id"], "sacks_taken")
+                else:
+                    add(play["passer_id"], "pass_attempts")
+                if play["is_complete"]:
+                    add(play["passer_id"], "pass_completions")
+                    add(play["passer_id"], "passing_yards", yards)
+                    add(play["receiver_id"], "receptions")
+                    add(play["receiver_id"], "receiving_yards", yards)
+                    team_line["passing_yards"] += yards
+                    if play["is_touchdown"]:
+                        add(play["passer_id"], "passing_tds")
+                        add(play["receiver_id"], "receiving_tds")
+                if play["is_turnover"]:
+                    add(play["passer_id"], "interceptions_thrown")
+            elif play["play_type"] == "run":
+                add(play["rusher_id"], "rush_attempts")
+                if play["is_turnover"]:
+                    add(play["rusher_id"], "fumbles_lost")
+                else:
+                    add(play["rusher_id"], "rushing_yards", yards)
+                    team_line["rushing_yards"] += yards
+                    if play["is_touchdown"]:
+                        add(play["rusher_id"], "rushing_tds")
+            elif play["play_type"] == "field_goal":
+                add(play["kicker_id"], "fg_attempts")
+                if play["points"]:
+                    add(play["kicker_id"], "fg_made")
+            elif play["play_type"] == "punt":
+                add(play["kicker_id"], "punts")
+                add(play["kicker_id"], "punt_yards", yards)
+
+            if play["is_turnover"]:
+                team_line["turnovers"] += 1
+            if play["is_first_down"]:
+                team_line["first_downs"] += 1
+
+        for line in player_lines.values():
+            line["stats"]["games_played"] = 1
+
+        scores = {game.home_team_id: game.home_score, game.away_team_id: game.away_score}
+        for team_id, opponent_id in [(game.home_team_id, game.away_team_id), (game.away_team_id, game.home_team_id)]:
+            line = team_lines[team_id]
+            line["total_yards"] = line["passing_yards"] + line["rushing_yards"]
+            line["points_for"] = scores[team_id]
+            line["points_against"] = scores[opponent_id]
+            line["games_played"] = 1
+            if game.game_type == "playoff":
+                # Playoff results stay out of the regular season record
+                line["playoff_wins"] = 1 if scores[team_id] > scores[opponent_id] else 0
+                line["playoff_losses"] = 1 if scores[team_id] < scores[opponent_id] else 0
+            else:
+                line["wins"] = 1 if scores[team_id] > scores[opponent_id] else 0
+                line["losses"] = 1 if scores[team_id] < scores[opponent_id] else 0
+                line["ties"] = 1 if scores[team_id] == scores[opponent_id] else 0
+
+        return player_lines, team_lines
@@ -0,0 +1,282 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, bindparam, Boolean, DateTime, Float, Integer, String
+from sqlalchemy.exc import DBAPIError
+from typing import Dict, IO, Iterator, List, Optional, Set, Tuple
+from ..database.models import Player, Contract, Team
+from ..services.salary_cap_service import SalaryCapService
+from ..services.response_cache import response_cache
+from ..services.roster_service import RosterService
+from ..services.journal_service import TransactionJournal
+from datetime import datetime
+import csv
+import io
+import orjson
+import time
+
+# Tables that can be imported, by the name used in URLs and on the command line
+IMPORT_TABLES = {model.__tablename__: model.__table__ for model in [Player, Contract]}
+
+IMPORT_FORMATS = ["ndjson", "csv"]
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Per-row errors kept in the report; the rejected count covers the rest
+MAX_REPORTED_ERRORS = 100
+
+class ImportService:
+    """Streams players and contracts in from NDJSON or CSV.
+
+    Rows are read and validated a batch at a time and each batch is upserted
+    by id in its own transaction: rows with an id that exists update only the
+    columns they carry, the rest are inserted. Bad rows, and every row of a
+    batch the database refuses, are reported with their line number and
+    skipped without stopping the import. Team cap
+    totals and the response cache are refreshed once at the end.
+    """
+
+    def __init__(self, db: Session, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    @staticmethod
+    def check_import(table_name: str, format: str):
+        """Raise ValueError for an import that cannot run"""
+        if table_name not in IMPORT_TABLES:
+            raise ValueError(f"Unknown table: {table_name}, expected one of {', '.join(IMPORT_TABLES)}")
+        if format not in IMPORT_FORMATS:
+            raise ValueError(f"Unknown format: {format}, expected one of {', '.join(IMPORT_FORMATS)}")
+
+    @staticmethod
+    def read_rows(source: IO[bytes], format: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+        """(line number, row, parse error) for each record of a binary stream"""
+        if format == "csv":
+            reader = csv.DictReader(io.TextIOWrapper(source, encoding="utf-8-sig", newline=""))
+            for row in reader:
+                # Empty CSV cells are missing values
+                yield reader.line_num, {k: (v if v != "" else None) for k, v in row.items() if k is not None}, None
+            return
+
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                yield line_number, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Expected a JSON object"
+                continue
+            yield line_number, row, None
+
+    def import_rows(self, table_name: str, source: IO[bytes], format: str = "ndjson") -> Dict[str, any]:
+        """Import a stream of rows into players or contracts"""
+        self.check_import(table_name, format)
+        started = time.perf_counter()
+        table = IMPORT_TABLES[table_name]
+
+        self.converters = {column.name: _converter(column) for column in table.columns}
+        # NOT NULL columns without a default, which every new row must fill
+        self.required = [
+            column.name for column in table.columns
+            if not column.nullable and not column.primary_key and column.default is None
+        ]
+        self.team_ids = {team_id for (team_id,) in self.db.execute(select(Team.id)).all()}
+        self.player_ids = (
+            {player_id for (player_id,) in self.db.execute(select(Player.id)).all()}
+            if table_name == "contracts" else set()
+        )
+        affected_teams: Set[int] = set()
+        report = {"table": table_name, "rows": 0, "inserted": 0, "updated": 0, "rejected": 0, "errors": []}
+
+        batch = []
+        for line_number, row, error in self.read_rows(source, format):
+            report["rows"] += 1
+            if error is None:
+                row, errors = self.validate_row(table, row)
+            else:
+                errors = [error]
+            if errors:
+                _reject(report, line_number, errors)
+                continue
+            batch.append((line_number, row))
+            if len(batch) >= self.batch_size:
+                self._write_batch(table, batch, report, affected_teams)
+                batch = []
+        if batch:
+            self._write_batch(table, batch, report, affected_teams)
+
+        if table_name == "contracts" and affected_teams:
+            SalaryCapService(self.db).refresh_team_cap_totals(sorted(affected_teams))
+            # Imported rows can touch any column, so the journal gets each team's new totals
+            TransactionJournal(self.db).record_cap_totals("import", sorted(affected_teams))
+            self.db.commit()
+        response_cache.clear()
+        if table_name == "players":
+            RosterService.clear_counters()
+
+        report["errors"].sort(key=lambda error: error["line"])
+        report["teams_refreshed"] = len(affected_teams) if table_name == "contracts" else 0
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+    def validate_row(self, table, row: dict) -> Tuple[dict, List[str]]:
+        """Coerce a raw row to column types, returning the clean row and any errors"""
+        clean, errors = {}, []
+        for key, value in row.items():
+            convert = self.converters.get(key)
+            if convert is None:
+                errors.append(f"Unknown column: {key}")
+                continue
+            try:
+                clean[key] = convert(value)
+            except (TypeError, ValueError) as e:
+                errors.append(f"{key}: {e}")
+                clean[key] = value
+
+        if clean.get("id") is None:
+            clean.pop("id", None)
+            errors.extend(self._missing_required(clean))
+        else:
+            # Whether the other required columns are needed depends on the id existing
+            errors.extend(f"{name} cannot be empty" for name, value in clean.items() if value is None and not table.c[name].nullable)
+
+        team_id = clean.get("team_id")
+        if team_id is not None and team_id not in self.team_ids:
+            errors.append(f"Team {team_id} does not exist")
+        if "player_id" in table.c and clean.get("player_id") is not None and clean["player_id"] not in self.player_ids:
+            errors.append(f"Player {clean['player_id']} does not exist")
+        return clean, errors
+
+    def _missing_required(self, row: dict) -> List[str]:
+        return [f"{name} is required" for name in self.required if row.get(name) is None]
+
+    def _write_batch(self, table, batch: List[Tuple[int, dict]], report: Dict[str, any], affected_teams: Set[int]):
+        """Upsert one batch in a single transaction.
+
+        The writes run in a savepoint: if the database refuses any of them
+        the whole batch is rolled back and each of its rows is reported as
+        rejected, and the import carries on with the next batch.
+        """
+        ids = [row["id"] for _, row in batch if "id" in row]
+        existing = {}
+        if ids:
+            existing = {
+                row_id: team_id for row_id, team_id in self.db.execute(
+                    select(table.c.id, table.c.team_id).where(table.c.id.in_(ids))
+                ).all()
+            }
+
+        # Rows whose id is new are inserts, so they need every required column
+        inserts, updates, written = [], [], []
+        for line_number, row in batch:
+            if row.get("id") in existing:
+                updates.append(row)
+                written.append(line_number)
+                continue
+            errors = self._missing_required(row) if "id" in row else []
+            if errors:
+                _reject(report, line_number, errors)
+                continue
+            inserts.append(row)
+            written.append(line_number)
+            if "id" in row:
+                # Later rows with the same id update this one
+                existing[row["id"]] = None
+
+        now = datetime.utcnow()
+        if "updated_at" in table.c:
+            updates = [row if "updated_at" in row else {**row, "updated_at": now} for row in updates]
+        savepoint = self.db.begin_nested()
+        try:
+            # executemany needs one key set per statement
+            for group in _group_by_keys(inserts).values():
+                self.db.execute(table.insert(), group)
+            for keys, group in _group_by_keys(updates).items():
+                columns = [key for key in keys if key != "id"]
+                if not columns:
+                    continue
+                self.db.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("b_id"))
+                    .values(**{key: bindparam(f"b_{key}") for key in columns}),
+                    [{f"b_{key}": value for key, value in row.items()} for row in group]
+                )
+            savepoint.commit()
+        except DBAPIError as e:
+            savepoint.rollback()
+            for line_number in written:
+                _reject(report, line_number, [f"Batch rolled back: {e.orig}"])
+            return
+        self.db.commit()
+
+        report["inserted"] += len(inserts)
+        report["updated"] += len(updates)
+        affected_teams.update(team_id for team_id in existing.values() if team_id is not None)
+        affected_teams.update(row["team_id"] for row in inserts + updates if row.get("team_id") is not None)
+
+def _group_by_keys(rows: List[dict]) -> Dict[Tuple[str, ...], List[dict]]:
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
+
+def _reject(report: Dict[str, any], line_number: int, errors: List[str]):
+    report["rejected"] += 1
+    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+        report["errors"].append({"line": line_number, "errors": errors})
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "1", "yes"):
+        return True
+    if text in ("false", "0", "no"):
+        return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+def _to_int(value):
+    # Accept "12" and 12.0 (CSV and spreadsheet output) but not 12.5 or true
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    try:
+        number = float(value) if not isinstance(value, bool) else None
+    except ValueError:
+        number = None
+    if number is None or not number.is_integer():
+        raise ValueError(f"expected an integer, got {value!r}")
+    return int(number)
+
+def _to_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+
+def _converter(column):
+    """Function turning a raw NDJSON or CSV value into the column's Python type"""
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        convert = _to_bool
+    elif isinstance(column_type, Integer):
+        convert = _to_int
+    elif isinstance(column_type, Float):
+        convert = float
+    elif isinstance(column_type, DateTime):
+        convert = _to_datetime
+    elif isinstance(column_type, String) and column_type.length:
+        length = column_type.length
+        def convert(value):
+            text = str(value)
+            if len(text) > length:
+                raise ValueError(f"longer than {length} characters")
+            return text
+    else:
+        convert = str
+    return lambda value: None if value is None else convert(value)
@@ -0,0 +1,205 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, case
+from typing import Dict, List, Optional
+from ..database.models import Player, PlayerInjury, PlayerGameStat, Game
+import numpy as np
+
+# Regular season plus playoffs; injuries running past this heal over the offseason
+SEASON_WEEKS = 22
+
+# Weekly injury hazard for a healthy, average-workload 26-year-old
+BASE_WEEKLY_HAZARD = 0.012
+AGE_HAZARD_PER_YEAR = 0.04  # Added per year over 26
+INJURY_PRONE_MULTIPLIER = 1.8
+PRACTICE_SQUAD_EXPOSURE = 0.3
+TOUCHES_PER_EXTRA_EXPOSURE = 40  # Touches in a game that double baseline exposure
+
+# Players with this many injuries across the current and previous season become injury prone
+INJURY_PRONE_THRESHOLD = 3
+
+# Statistics that count towards a player's weekly workload
+WORKLOAD_STATS = ["pass_attempts", "rush_attempts", "receptions", "sacks_taken", "fg_attempts", "punts"]
+
+INJURY_TYPES = ["hamstring", "ankle", "knee", "shoulder", "concussion", "back", "foot", "groin", "wrist", "calf"]
+
+class InjuryService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def weekly_hazard(ages: np.ndarray, injury_prone: np.ndarray, exposure: np.ndarray) -> np.ndarray:
+        """Convert age, injury proneness and workload exposure into weekly injury probabilities"""
+        age_factor = 1 + np.maximum(0, ages - 26) * AGE_HAZARD_PER_YEAR
+        prone_factor = np.where(injury_prone, INJURY_PRONE_MULTIPLIER, 1.0)
+        hazard = BASE_WEEKLY_HAZARD * age_factor * prone_factor * exposure
+        return 1 - np.exp(-hazard)
+
+    @staticmethod
+    def status_for_weeks(weeks_out: int) -> str:
+        """Injury report label for an expected absence"""
+        if weeks_out <= 1:
+            return "questionable"
+        elif weeks_out <= 8:
+            return "out"
+        else:
+            return "season_ending"
+
+    def process_week(self, season: int, week: int, commit: bool = True) -> Dict[str, any]:
+        """Heal recovered players and sample new injuries for every rostered player"""
+        current_key = season * 100 + week
+
+        # Recovery queue: only injuries due back by this week are touched
+        recovered = self.db.query(PlayerInjury.id, PlayerInjury.player_id).filter(
+            PlayerInjury.is_active == True,
+            PlayerInjury.return_key <= current_key
+        ).all()
+        recovered_ids = [row.player_id for row in recovered]
+        if recovered:
+            self.db.execute(
+                update(PlayerInjury)
+                .where(PlayerInjury.id.in_([row.id for row in recovered]))
+                .values(is_active=False),
+                execution_options={"synchronize_session": False}
+            )
+
+        new_injuries = self._sample_injuries(season, week)
+
+        status_changes = {player_id: "healthy" for player_id in recovered_ids}
+        status_changes.update({injury["player_id"]: injury["injury_status"] for injury in new_injuries})
+
+        newly_prone = []
+        if new_injuries:
+            self.db.execute(PlayerInjury.__table__.insert(), new_injuries)
+            newly_prone = self._newly_injury_prone(season, [i["player_id"] for i in new_injuries])
+
+        if status_changes:
+            values = {"injury_status": case(status_changes, value=Player.id)}
+            if newly_prone:
+                values["injury_prone"] = case(
+                    {player_id: True for player_id in newly_prone},
+                    value=Player.id,
+                    else_=Player.injury_prone
+                )
+            self.db.execute(
+                update(Player).where(Player.id.in_(list(status_changes))).values(**values),
+                execution_options={"synchronize_session": False}
+            )
+
+        if commit:
+            self.db.commit()
+
+        return {
+            "season": season,
+            "week": week,
+            "recovered": len(recovered_ids),
+            "new_injuries": len(new_injuries),
+            "newly_injury_prone": len(newly_prone),
+            "injuries": [
+                {key: injury[key] for key in ["player_id", "team_id", "injury_type", "injury_status", "weeks_out"]}
+                for injury in new_injuries
+            ]
+        }
+
+    def _weekly_workloads(self, season: int, week: int) -> Dict[int, int]:
+        """Touches per player in this week's games"""
+        rows = self.db.query(PlayerGameStat.player_id, func.sum(PlayerGameStat.value)).join(
+            Game, Game.id == PlayerGameStat.game_id
+        ).filter(
+            Game.season == season,
+            Game.week == week,
+            PlayerGameStat.stat.in_(WORKLOAD_STATS)
+        ).group_by(PlayerGameStat.player_id).all()
+        return dict(rows)
+
+    def _sample_injuries(self, season: int, week: int) -> List[Dict[str, any]]:
+        """Draw new injuries for the whole league in one vectorized pass"""
+        rows = self.db.execute(
+            select(
+                Player.id, Player.team_id, func.coalesce(Player.age, 26),
+                func.coalesce(Player.injury_prone, False), Player.roster_status
+            ).where(
+                Player.team_id.isnot(None),
+                Player.roster_status.in_(["active", "practice_squad"]),
+                func.coalesce(Player.injury_status, "healthy") == "healthy"
+            )
+        ).all()
+        if not rows:
+            return []
+
+        player_ids = np.array([row[0] for row in rows])
+        team_ids = np.array([row[1] for row in rows])
+        ages = np.array([row[2] for row in rows], dtype=float)
+        injury_prone = np.array([bool(row[3]) for row in rows])
+        practice_squad = np.array([row[4] == "practice_squad" for row in rows])
+
+        workloads = self._weekly_workloads(season, week)
+        touches = np.array([workloads.get(int(pid), 0) for pid in player_ids], dtype=float)
+        exposure = np.where(practice_squad, PRACTICE_SQUAD_EXPOSURE, 1.0) + touches / TOUCHES_PER_EXTRA_EXPOSURE
+
+        probabilities = self.weekly_hazard(ages, injury_prone, exposure)
+        injured = self.rng.random(len(player_ids)) < probabilities
+        count = int(injured.sum())
+        if not count:
+            return []
+
+        # Recovery timelines are heavy tailed: mostly a week or two, occasionally the season
+        weeks_out = np.clip(np.ceil(self.rng.lognormal(mean=0.6, sigma=0.9, size=count)), 1, 20).astype(int)
+        injury_types = self.rng.integers(0, len(INJURY_TYPES), size=count)
+
+        injuries = []
+        for player_id, team_id, weeks, type_index in zip(
+            player_ids[injured], team_ids[injured], weeks_out, injury_types
+        ):
+            weeks = int(weeks)
+            if week + weeks > SEASON_WEEKS:
+                return_season, return_week = season + 1, 1
+            else:
+                return_season, return_week = season, week + weeks
+            injuries.append({
+                "player_id": int(player_id),
+                "team_id": int(team_id),
+                "injury_type": INJURY_TYPES[type_index],
+                "injury_status": self.status_for_weeks(weeks),
+                "weeks_out": weeks,
+                "season": season,
+                "week": week,
+                "return_season": return_season,
+                "return_week": return_week,
+                "return_key": return_season * 100 + return_week,
+                "is_active": True
+            })
+        return injuries
+
+    def _newly_injury_prone(self, season: int, player_ids: List[int]) -> List[int]:
+        """Players whose recent injury count crosses the injury-prone threshold"""
+        rows = self.db.query(PlayerInjury.player_id).filter(
+            PlayerInjury.player_id.in_(player_ids),
+            PlayerInjury.season >= season - 1
+        ).group_by(PlayerInjury.player_id).having(
+            func.count(PlayerInjury.id) >= INJURY_PRONE_THRESHOLD
+        ).all()
+        return [row.player_id for row in rows]
+
+    def get_injury_report(self, team_id: Optional[int] = None) -> List[Dict[str, any]]:
+        """Get active injuries ordered by expected return"""
+        query = self.db.query(PlayerInjury, Player.first_name, Player.last_name, Player.position).join(
+            Player, Player.id == PlayerInjury.player_id
+        ).filter(PlayerInjury.is_active == True)
+        if team_id:
+            query = query.filter(PlayerInjury.team_id == team_id)
+
+        return [
+            {
+                "player_id": injury.player_id,
+                "name": f"{first_name} {last_name}",
+                "position": position,
+                "team_id": injury.team_id,
+                "injury_type": injury.injury_type,
+                "injury_status": injury.injury_status,
+                "weeks_out": injury.weeks_out,
+                "injured": {"season": injury.season, "week": injury.week},
+                "expected_return": {"season": injury.return_season, "week": injury.return_week}
+            }
+            for injury, first_name, last_name, position in query.order_by(PlayerInjury.return_key).all()
+        ]
@@ -0,0 +1,247 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, func
+from typing import Dict, List, Optional
+from ..database.models import JournalEvent, JournalConsumer, SalaryCap, TeamCapLedger
+from ..services.salary_cap_service import SalaryCapService
+from datetime import datetime
+import json
+
+EVENT_TYPES = [
+    "signing", "extension", "franchise_tag", "restructure", "release", "retirement", "expiration",
+    "import", "cap_snapshot", "roster_move"
+]
+
+# Events that change a team's contracts, and so its cap totals. Each carries
+# its cap year and either a cap_change (what the event added to the team's
+# totals) or cap_totals (the team's totals after it, for bulk changes)
+CAP_EVENT_TYPES = {
+    "signing", "extension", "franchise_tag", "restructure", "release", "retirement", "expiration",
+    "import", "cap_snapshot"
+}
+
+DEFAULT_CONSUMER_BATCH = 1000
+
+def journal_entry(event_type: str, team_id: Optional[int] = None, player_id: Optional[int] = None,
+                  contract_id: Optional[int] = None, **data) -> Dict[str, any]:
+    """Column values for one journal event, for bulk inserts"""
+    return {
+        "event_type": event_type,
+        "team_id": team_id,
+        "player_id": player_id,
+        "contract_id": contract_id,
+        "data": json.dumps(data) if data else None
+    }
+
+def cap_change(year: int, cap_used: int = 0, dead_money: int = 0, contracts: int = 0) -> Dict[str, any]:
+    """Event data for a change to one team's cap totals in a cap year"""
+    return {
+        "cap_year": year,
+        "cap_change": {"cap_used": int(cap_used), "dead_money": int(dead_money), "contracts": contracts}
+    }
+
+def cap_totals(year: int, totals: Dict[str, int]) -> Dict[str, any]:
+    """Event data for a team's whole cap totals, from SalaryCapService.calculate_team_cap_totals"""
+    return {
+        "cap_year": year,
+        "cap_totals": {
+            "adjusted_cap": totals["adjusted_cap"],
+            "cap_used": totals["total_cap_used"],
+            "dead_money": totals["total_dead_money"],
+            "contracts": totals["total_contracts"]
+        }
+    }
+
+class TransactionJournal:
+    """Append-only log of league transactions.
+
+    Events are written by the service making the change, in the same
+    transaction, so the journal holds exactly the committed changes. Event
+    ids are offsets: derived views remember the last one they applied and
+    only read what came after it.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, event_type: str, team_id: Optional[int] = None, player_id: Optional[int] = None,
+               contract_id: Optional[int] = None, **data):
+        """Append one event to the current transaction"""
+        self.record_many([journal_entry(event_type, team_id, player_id, contract_id, **data)])
+
+    def record_many(self, entries: List[Dict[str, any]]):
+        """Append many journal_entry rows with one executemany"""
+        if entries:
+            self.db.execute(insert(JournalEvent.__table__), entries)
+
+    def record_cap_totals(self, event_type: str = "cap_snapshot", team_ids: Optional[List[int]] = None, **data):
+        """Append each team's current cap totals, for changes too broad to journal per contract"""
+        self.db.flush()
+        cap = SalaryCapService(self.db)
+        self.record_many([
+            journal_entry(event_type, team_id, **cap_totals(cap.current_year, totals), **data)
+            for team_id, totals in cap.calculate_team_cap_totals(team_ids).items()
+        ])
+
+    def ensure_cap_snapshot(self):
+        """Snapshot every team's cap totals if the journal has none to fold from yet
+
+        New leagues get theirs when they are seeded; this covers leagues
+        started before cap events carried their totals.
+        """
+        has_snapshot = self.db.execute(
+            select(JournalEvent.id).where(JournalEvent.event_type == "cap_snapshot").limit(1)
+        ).first()
+        if not has_snapshot:
+            self.record_cap_totals()
+            self.db.commit()
+
+    def events(self, after: int = 0, limit: int = DEFAULT_CONSUMER_BATCH,
+               event_type: Optional[str] = None, team_id: Optional[int] = None,
+               until: Optional[int] = None) -> List[JournalEvent]:
+        """Events past an offset (and up to another, if given), oldest first"""
+        query = self.db.query(JournalEvent).filter(JournalEvent.id > after)
+        if until is not None:
+            query = query.filter(JournalEvent.id <= until)
+        if event_type:
+            query = query.filter(JournalEvent.event_type == event_type)
+        if team_id:
+            query = query.filter(JournalEvent.team_id == team_id)
+        return query.order_by(JournalEvent.id).limit(limit).all()
+
+    def latest_offset(self) -> int:
+        return self.db.execute(select(func.max(JournalEvent.id))).scalar() or 0
+
+    def get_consumers(self) -> List[Dict[str, any]]:
+        """Every registered consumer with its offset and how far behind it is"""
+        latest = self.latest_offset()
+        offsets = {row.name: row.last_event_id for row in self.db.query(JournalConsumer).all()}
+        return [
+            {"name": name, "offset": offsets.get(name, 0), "lag": latest - offsets.get(name, 0)}
+            for name in CONSUMERS
+        ]
+
+    def catch_up(self, name: str, batch_size: int = DEFAULT_CONSUMER_BATCH,
+                 to_offset: Optional[int] = None) -> Dict[str, any]:
+        """Fold every event a consumer has not seen yet into its view.
+
+        Each batch's view changes commit together with the consumer's new
+        offset, so an interrupted run resumes where it stopped and no event
+        is applied twice.
+        """
+        if name not in CONSUMERS:
+            raise ValueError(f"Unknown consumer: {name}, expected one of {', '.join(CONSUMERS)}")
+        self.ensure_cap_snapshot()
+        _, consumer = CONSUMERS[name]
+        state = self.db.query(JournalConsumer).filter(JournalConsumer.name == name).first()
+        if state is None:
+            state = JournalConsumer(name=name, last_event_id=0)
+            self.db.add(state)
+        start = state.last_event_id or 0
+
+        applied = 0
+        try:
+            while True:
+                events = self.events(state.last_event_id or 0, batch_size, until=to_offset)
+                if not events:
+                    break
+                consumer(self.db, events)
+                state.last_event_id = events[-1].id
+                state.updated_at = datetime.utcnow()
+                self.db.commit()
+                applied += len(events)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return {"name": name, "from_offset": start, "offset": state.last_event_id, "events_applied": applied}
+
+    def replay(self, name: str, to_offset: Optional[int] = None,
+               batch_size: int = DEFAULT_CONSUMER_BATCH) -> Dict[str, any]:
+        """Rebuild a consumer's view from scratch as of an offset (the latest by default)
+
+        The view is emptied and every event up to the offset folded into it
+        again, starting from the last cap snapshot at or before it; offsets
+        older than the first snapshot cannot be rebuilt.
+        """
+        if name not in CONSUMERS:
+            raise ValueError(f"Unknown consumer: {name}, expected one of {', '.join(CONSUMERS)}")
+        self.ensure_cap_snapshot()
+        to_offset = self.latest_offset() if to_offset is None else to_offset
+        first_snapshot = self.db.execute(
+            select(func.min(JournalEvent.id)).where(JournalEvent.event_type == "cap_snapshot")
+        ).scalar()
+        if first_snapshot is not None and to_offset < first_snapshot:
+            raise ValueError(f"No cap snapshot at or before offset {to_offset}, the first is at {first_snapshot}")
+
+        view, _ = CONSUMERS[name]
+        self.db.execute(delete(view))
+        state = self.db.query(JournalConsumer).filter(JournalConsumer.name == name).first()
+        if state is None:
+            state = JournalConsumer(name=name)
+            self.db.add(state)
+        state.last_event_id = 0
+        self.db.flush()
+        return self.catch_up(name, batch_size, to_offset)
+
+    def get_cap_ledger(self, year: Optional[int] = None) -> List[TeamCapLedger]:
+        """The team_cap_totals view for a cap year (the latest folded by default)"""
+        if year is None:
+            year = self.db.execute(select(func.max(TeamCapLedger.year))).scalar()
+        return self.db.query(TeamCapLedger).filter(TeamCapLedger.year == year).order_by(TeamCapLedger.team_id).all()
+
+def fold_cap_totals(db: Session, events: List[JournalEvent]):
+    """Fold cap events into the team_cap_ledger view, one row per team and cap year
+
+    cap_totals replace a row's figures and cap_change adds to them, so the
+    view only ever depends on the journal, never on the live contracts.
+    """
+    changes = []
+    for event in events:
+        if event.event_type in CAP_EVENT_TYPES and event.team_id and event.data:
+            data = json.loads(event.data)
+            if "cap_year" in data:
+                changes.append((event, data))
+    if not changes:
+        return
+
+    keys = {(event.team_id, data["cap_year"]) for event, data in changes}
+    rows = {
+        (row.team_id, row.year): row for row in db.query(TeamCapLedger).filter(
+            TeamCapLedger.team_id.in_({team_id for team_id, _ in keys}),
+            TeamCapLedger.year.in_({year for _, year in keys})
+        ).all()
+    }
+    for event, data in changes:
+        key = (event.team_id, data["cap_year"])
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = TeamCapLedger(
+                team_id=event.team_id, year=data["cap_year"], adjusted_cap=_adjusted_cap(db, data["cap_year"]),
+                total_cap_used=0, total_dead_money=0, total_contracts=0
+            )
+            db.add(row)
+        if "cap_totals" in data:
+            totals = data["cap_totals"]
+            row.adjusted_cap = totals["adjusted_cap"]
+            row.total_cap_used = totals["cap_used"]
+            row.total_dead_money = totals["dead_money"]
+            row.total_contracts = totals["contracts"]
+        else:
+            change = data["cap_change"]
+            row.total_cap_used += change["cap_used"]
+            row.total_dead_money += change["dead_money"]
+            row.total_contracts += change["contracts"]
+        row.cap_space = row.adjusted_cap - row.total_cap_used - row.total_dead_money
+        row.last_event_id = event.id
+    db.flush()
+
+def _adjusted_cap(db: Session, year: int) -> int:
+    adjusted_cap = db.execute(select(SalaryCap.adjusted_cap).where(SalaryCap.year == year)).scalar()
+    return adjusted_cap if adjusted_cap is not None else SalaryCapService(db).base_cap
+
+# Derived views kept up to date from the journal, by consumer name: the
+# table holding the view, and the function folding a batch of events into it
+CONSUMERS = {
+    "team_cap_totals": (TeamCapLedger, fold_cap_totals)
+}
@@ -0,0 +1,80 @@
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional
+from ..database.connection import current_league, league_pool, LeaguePool, LEAGUE_ID
+from ..database.init_db import init_database
+from ..services.save_service import backup_database
+import asyncio
+import os
+
+# Header naming the league a request is for; requests without it use the app database
+LEAGUE_HEADER = b"x-league-id"
+
+# How often idle leagues are closed when no requests arrive to trigger it
+LEAGUE_SWEEP_SECONDS = 60
+
+class LeagueService:
+    """Hosted leagues: one SQLite file each, opened on demand through the league pool"""
+
+    def __init__(self, pool: LeaguePool = league_pool):
+        self.pool = pool
+
+    def get_league(self, league_id: str) -> Optional[Dict[str, any]]:
+        if not self.pool.exists(league_id):
+            return None
+        return {
+            "league_id": league_id,
+            "open": league_id in self.pool.leagues,
+            "size_bytes": os.path.getsize(self.pool.league_path(league_id))
+        }
+
+    def list_leagues(self) -> List[Dict[str, any]]:
+        """Every league on disk, open or not"""
+        return [self.get_league(league_id) for league_id in self.pool.list_leagues()]
+
+    def create_league(self, league_id: str, template: Optional[str] = None) -> Dict[str, any]:
+        """Create a league with the default teams and players, or as a copy of another league"""
+        self.pool.check_league_id(league_id)
+        if self.pool.exists(league_id):
+            raise ValueError(f"League {league_id} already exists")
+        if template is not None:
+            if not self.pool.exists(template):
+                raise LookupError(f"League {template} not found")
+            os.makedirs(os.path.dirname(self.pool.league_path(league_id)), exist_ok=True)
+            backup_database(self.pool.league_path(template), self.pool.league_path(league_id))
+        else:
+            league = self.pool.get(league_id, create=True)
+            init_database(league.engine, league.session_factory)
+        return self.get_league(league_id)
+
+class LeagueMiddleware:
+    """ASGI middleware binding each request to the league in its X-League-Id header"""
+
+    def __init__(self, app, pool: LeaguePool = league_pool):
+        self.app = app
+        self.pool = pool
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        league_id = dict(scope["headers"]).get(LEAGUE_HEADER, b"").decode()
+        if not league_id:
+            return await self.app(scope, receive, send)
+
+        if not LEAGUE_ID.match(league_id):
+            response = ORJSONResponse({"detail": f"Invalid league id: {league_id!r}"}, status_code=400)
+            return await response(scope, receive, send)
+        if league_id not in self.pool.leagues and not self.pool.exists(league_id):
+            response = ORJSONResponse({"detail": f"League {league_id} not found"}, status_code=404)
+            return await response(scope, receive, send)
+
+        token = current_league.set(league_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_league.reset(token)
+
+async def close_idle_leagues(pool: LeaguePool = league_pool, interval: float = LEAGUE_SWEEP_SECONDS):
+    """Close idle leagues periodically, for the lifetime of the app"""
+    while True:
+        await asyncio.sleep(interval)
+        pool.close_idle()
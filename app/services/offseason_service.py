@@ -0,0 +1,271 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, case, bindparam, Integer
+from typing import Dict, Optional
+from ..database.models import Contract, Player, SalaryCap
+from ..services.salary_cap_service import SalaryCapService
+from ..services.player_evaluation import PlayerEvaluationService
+from ..services.response_cache import response_cache
+from ..services.roster_service import RosterService
+from ..services.journal_service import TransactionJournal, journal_entry
+import numpy as np
+import time
+
+# Yearly league revenue growth applied to the cap and rookie pool
+CAP_GROWTH = 0.07
+
+# Attribute groups progressed together
+PHYSICAL_ATTRIBUTES = ["speed", "strength", "agility"]
+MENTAL_ATTRIBUTES = ["football_iq", "leadership"]
+SKILL_ATTRIBUTES = ["skill_1", "skill_2", "skill_3"]
+
+CONTRACT_YEARS = 5
+
+class OffseasonService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.rng = np.random.default_rng(seed)
+        self.salary_cap_service = SalaryCapService(db)
+
+    def rollover_season(self) -> Dict[str, any]:
+        """Advance the league one year in a single transaction.
+
+        Ages players, applies progression and regression, retires veterans
+        (charging their remaining bonus as dead money), shifts every
+        contract's year columns and remaining term (expiring finished deals)
+        and rolls dead money forward, then opens the next salary cap year.
+        """
+        started = time.perf_counter()
+        old_year = self.salary_cap_service.current_year
+        new_year = old_year + 1
+
+        try:
+            self._open_cap_year(old_year, new_year)
+            contracts = self._advance_contracts(new_year)
+            aged = self._age_players()
+            ratings = self._progress_ratings()
+            retired = self._retire_players()
+            # Every contract moved a year, so the new cap year is journaled as whole totals
+            TransactionJournal(self.db).record_cap_totals(season_rollover=new_year)
+            self.db.commit()
+            response_cache.clear()
+            RosterService.clear_counters()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return {
+            "success": True,
+            "previous_year": old_year,
+            "current_year": new_year,
+            "players_aged": aged,
+            "players_progressed": ratings["progressed"],
+            "players_regressed": ratings["regressed"],
+            "players_retired": retired,
+            **contracts,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def _open_cap_year(self, old_year: int, new_year: int):
+        """Record the outgoing cap year if needed and create the next one"""
+        cap = self.salary_cap_service
+        if not self.db.query(SalaryCap).filter(SalaryCap.year == old_year).first():
+            self.db.add(SalaryCap(
+                year=old_year,
+                base_cap=cap.base_cap,
+                adjusted_cap=cap.base_cap,
+                rookie_pool=cap.rookie_pool
+            ))
+
+        new_base_cap = int(cap.base_cap * (1 + CAP_GROWTH))
+        self.db.add(SalaryCap(
+            year=new_year,
+            base_cap=new_base_cap,
+            adjusted_cap=new_base_cap,
+            rookie_pool=int(cap.rookie_pool * (1 + CAP_GROWTH))
+        ))
+        self.db.flush()
+
+    def _advance_contracts(self, new_year: int) -> Dict[str, int]:
+        """Expire finished deals, shift year columns and roll dead money forward"""
+        end_year = func.cast(func.strftime('%Y', Contract.end_date), Integer)
+
+        expiring = self.db.query(Contract.id, Contract.team_id, Contract.player_id).filter(
+            Contract.is_active == True,
+            end_year <= new_year
+        ).all()
+        expired_player_ids = [row.player_id for row in expiring]
+        TransactionJournal(self.db).record_many([
+            journal_entry("expiration", row.team_id, row.player_id, row.id, season_rollover=new_year)
+            for row in expiring
+        ])
+        expired = self.db.execute(
+            update(Contract)
+            .where(Contract.is_active == True, end_year <= new_year)
+            .values(is_active=False),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+        # Salaries and cap hits move up a year; deals running past the last
+        # column keep repeating their final year's figures
+        runs_past_columns = end_year - new_year >= CONTRACT_YEARS
+        shifted = {}
+        for prefix, suffix in [("year_", "_salary"), ("year_", "_cap_hit")]:
+            for year in range(1, CONTRACT_YEARS):
+                shifted[f"{prefix}{year}{suffix}"] = getattr(Contract, f"{prefix}{year + 1}{suffix}")
+            last = getattr(Contract, f"{prefix}{CONTRACT_YEARS}{suffix}")
+            shifted[f"{prefix}{CONTRACT_YEARS}{suffix}"] = case((runs_past_columns, last), else_=0)
+        shifted["rookie_scale_year"] = case(
+            (Contract.is_rookie_contract == True, Contract.rookie_scale_year + 1),
+            else_=Contract.rookie_scale_year
+        )
+        # The year just played used up one year of the term and its share of
+        # the signing bonus; what is left keeps prorating over the years left
+        remaining_years = func.max(Contract.years, 1, type_=Integer)
+        shifted["signing_bonus"] = (
+            func.coalesce(Contract.signing_bonus, 0) - func.coalesce(Contract.signing_bonus, 0) // remaining_years
+        )
+        shifted["years"] = func.max(Contract.years - 1, 1, type_=Integer)
+        advanced = self.db.execute(
+            update(Contract).where(Contract.is_active == True).values(**shifted),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+        # Dead money still owed on released deals moves up a year, so a post-June 1
+        # release's deferred charge lands on the new league year
+        dead_money = {
+            f"dead_money_year_{year}": getattr(Contract, f"dead_money_year_{year + 1}")
+            for year in range(1, CONTRACT_YEARS)
+        }
+        dead_money[f"dead_money_year_{CONTRACT_YEARS}"] = 0
+        self.db.execute(
+            update(Contract).where(Contract.is_active == False).values(**dead_money),
+            execution_options={"synchronize_session": False}
+        )
+
+        # Players whose only deal expired hit free agency
+        free_agents = 0
+        if expired_player_ids:
+            still_signed = select(Contract.player_id).where(Contract.is_active == True)
+            free_agents = self.db.execute(
+                update(Player)
+                .where(Player.id.in_(expired_player_ids), Player.id.not_in(still_signed))
+                .values(team_id=None, roster_status="free_agent"),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+
+        return {
+            "contracts_advanced": advanced,
+            "contracts_expired": expired,
+            "new_free_agents": free_agents
+        }
+
+    def _age_players(self) -> int:
+        """Age every active career by a year"""
+        return self.db.execute(
+            update(Player)
+            .where(func.coalesce(Player.roster_status, "") != "retired")
+            .values(
+                age=func.coalesce(Player.age, 21) + 1,
+                years_pro=func.coalesce(Player.years_pro, 0) + 1
+            ),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+    def _progress_ratings(self) -> Dict[str, int]:
+        """Apply age-based progression and regression curves to every player at once"""
+        attributes = PHYSICAL_ATTRIBUTES + MENTAL_ATTRIBUTES + SKILL_ATTRIBUTES
+        columns = ["age", "years_pro", "work_ethic", "overall_rating", "potential"] + attributes
+        rows = self.db.execute(
+            select(Player.id, *[func.coalesce(getattr(Player, c), 50) for c in columns])
+            .where(func.coalesce(Player.roster_status, "") != "retired")
+        ).all()
+        if not rows:
+            return {"progressed": 0, "regressed": 0}
+
+        matrix = np.array(rows, dtype=float)
+        player_ids = matrix[:, 0].astype(int)
+        data = {name: matrix[:, i + 1] for i, name in enumerate(columns)}
+        age, years_pro, work_ethic = data["age"], data["years_pro"], data["work_ethic"]
+        overall, potential = data["overall_rating"], data["potential"]
+
+        # Same inputs as calculate_potential: room to grow, age and work ethic
+        growth_room = np.maximum(0, potential - overall)
+        work_ethic_factor = 0.8 + (work_ethic / 100) * 0.4
+        curve = np.select(
+            [age <= 23, age <= 26, age <= 29, age <= 32],
+            [0.35 * growth_room, 0.2 * growth_room, 0.0, -1.5],
+            default=-3.5
+        )
+        # Hard workers develop faster and decline slower
+        curve = np.where(curve >= 0, curve * work_ethic_factor, curve * (2 - work_ethic_factor))
+        development = curve + self.rng.normal(0, 1.5, len(player_ids))
+
+        physical_decline = np.where(age >= 29, -(age - 28) * 0.5, 0.0)
+        experience_gain = np.where(years_pro <= 6, 1.0, 0.0)
+
+        updates = {"overall_rating": np.clip(np.rint(overall + development), 1, 99)}
+        for attribute in PHYSICAL_ATTRIBUTES:
+            updates[attribute] = np.clip(np.rint(data[attribute] + development + physical_decline), 1, 99)
+        for attribute in MENTAL_ATTRIBUTES:
+            updates[attribute] = np.clip(np.rint(data[attribute] + development * 0.5 + experience_gain), 1, 99)
+        for attribute in SKILL_ATTRIBUTES:
+            updates[attribute] = np.clip(np.rint(data[attribute] + development), 1, 99)
+
+        new_overall = updates["overall_rating"]
+        calculated = PlayerEvaluationService.calculate_potential_batch(new_overall, age, work_ethic, years_pro)
+        updates["potential"] = np.maximum(new_overall, np.rint((potential + calculated) / 2))
+
+        names = list(updates)
+        values = np.column_stack([updates[name] for name in names]).astype(int)
+        params = [
+            {"b_id": int(player_id), **{f"b_{name}": int(v) for name, v in zip(names, row)}}
+            for player_id, row in zip(player_ids, values)
+        ]
+        self.db.execute(
+            update(Player.__table__)
+            .where(Player.__table__.c.id == bindparam("b_id"))
+            .values(**{name: bindparam(f"b_{name}") for name in names}),
+            params
+        )
+
+        return {
+            "progressed": int((new_overall > overall).sum()),
+            "regressed": int((new_overall < overall).sum())
+        }
+
+    def _retire_players(self) -> int:
+        """Retire veterans based on age and remaining ability"""
+        rows = self.db.execute(
+            select(Player.id, func.coalesce(Player.age, 21), func.coalesce(Player.overall_rating, 50))
+            .where(func.coalesce(Player.roster_status, "") != "retired", Player.age >= 30)
+        ).all()
+        if not rows:
+            return 0
+
+        matrix = np.array(rows, dtype=float)
+        age, overall = matrix[:, 1], matrix[:, 2]
+        chance = np.clip((age - 30) * 0.08 + (70 - overall) * 0.01, 0.02, 0.95)
+        retiring = matrix[self.rng.random(len(rows)) < chance, 0].astype(int).tolist()
+        if not retiring:
+            return 0
+
+        # Retiring ends a deal like a release: the bonus still to prorate becomes dead money
+        contracts = self.db.query(Contract).filter(
+            Contract.player_id.in_(retiring), Contract.is_active == True
+        ).populate_existing().all()
+        entries = []
+        for contract in contracts:
+            result = self.salary_cap_service.release_player(contract)
+            entries.append(journal_entry(
+                "retirement", contract.team_id, contract.player_id, contract.id,
+                dead_money_current=result["dead_money_current"], dead_money_next=result["dead_money_next"]
+            ))
+        self.db.flush()
+        TransactionJournal(self.db).record_many(entries)
+        self.db.execute(
+            update(Player)
+            .where(Player.id.in_(retiring))
+            .values(team_id=None, roster_status="retired"),
+            execution_options={"synchronize_session": False}
+        )
+        return len(retiring)
@@ -1,11 +1,20 @@
 from sqlalchemy.orm import Session
 from typing import Dict, List, Tuple
 from ..database.models import Player, Position
+from ..services.analytics_service import AnalyticsService
+import numpy as np
 import math
 
+# Trade value premium by position
+TRADE_POSITION_VALUES = {
+    'QB': 1.5, 'DE': 1.3, 'WR': 1.2, 'CB': 1.1,
+    'LT': 1.2, 'TE': 1.0, 'RB': 0.9, 'ILB': 0.9
+}
+
 class PlayerEvaluationService:
     def __init__(self, db: Session):
         self.db = db
+        self.analytics_service = AnalyticsService(db)
     
     def calculate_overall_rating(self, player: Player) -> int:
         """Calculate overall rating based on position-specific attributes"""
@@ -62,6 +71,32 @@ class PlayerEvaluationService:
         potential = int(base_potential * age_factor * work_ethic_factor * experience_factor)
         return max(1, min(99, potential))
     
+    @staticmethod
+    def calculate_potential_batch(overall: np.ndarray, age: np.ndarray,
+                                  work_ethic: np.ndarray, years_pro: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_potential for whole-league updates"""
+        age_factor = np.maximum(0.8, 1.2 - (age - 21) * 0.02)
+        work_ethic_factor = 0.8 + (work_ethic / 100) * 0.4
+        experience_factor = np.maximum(0.7, 1.3 - (years_pro * 0.05))
+        
+        potential = (overall * age_factor * work_ethic_factor * experience_factor).astype(int)
+        return np.clip(potential, 1, 99)
+    
+    @staticmethod
+    def calculate_trade_value_batch(overall: np.ndarray, age: np.ndarray, years_pro: np.ndarray,
+                                    position_multiplier: np.ndarray, war: np.ndarray) -> np.ndarray:
+        """Vectorized get_trade_value; war is NaN where there is no production data"""
+        age_multiplier = np.select(
+            [age <= 25, age <= 28, age <= 31, age <= 34],
+            [1.5, 1.2, 1.0, 0.7],
+            default=0.4
+        )
+        contract_multiplier = np.where(years_pro > 8, 0.8, 1.0)
+        performance_multiplier = np.where(np.isnan(war), 1.0, 1.0 + np.clip(np.nan_to_num(war) * 0.1, -0.3, 0.5))
+        
+        trade_value = overall * 1000000 * age_multiplier * contract_multiplier * position_multiplier * performance_multiplier
+        return trade_value.astype(np.int64)
+    
     def get_position_grade(self, player: Player) -> str:
         """Get letter grade for player based on overall rating"""
         if player.overall_rating >= 90:
@@ -113,7 +148,7 @@ class PlayerEvaluationService:
         else:
             return "High Risk"
     
-    def get_trade_value(self, player: Player) -> Dict[str, any]:
+    def get_trade_value(self, player: Player, season: int = None) -> Dict[str, any]:
         """Calculate trade value for a player"""
         base_value = player.overall_rating * 1000000  # $1M per overall point
         
@@ -133,19 +168,23 @@ class PlayerEvaluationService:
         contract_multiplier = 0.8 if player.years_pro > 8 else 1.0
         
         # Position value adjustment
-        position_values = {
-            'QB': 1.5, 'DE': 1.3, 'WR': 1.2, 'CB': 1.1,
-            'LT': 1.2, 'TE': 1.0, 'RB': 0.9, 'ILB': 0.9
-        }
-        position_multiplier = position_values.get(player.position, 1.0)
+        position_multiplier = TRADE_POSITION_VALUES.get(player.position, 1.0)
+        
+        # On-field production adjustment (wins above replacement from the play store),
+        # read only from analytics already computed so one player never costs a season's worth
+        production = self.analytics_service.get_player_war(player.id, season, cached_only=True)
+        war = production["war"] if production else None
+        performance_multiplier = 1.0 + max(-0.3, min(0.5, war * 0.1)) if war is not None else 1.0
         
-        trade_value = int(base_value * age_multiplier * contract_multiplier * position_multiplier)
+        trade_value = int(base_value * age_multiplier * contract_multiplier * position_multiplier * performance_multiplier)
         
         return {
             "estimated_value": trade_value,
             "age_multiplier": age_multiplier,
             "position_multiplier": position_multiplier,
-            "contract_multiplier": contract_multiplier
+            "contract_multiplier": contract_multiplier,
+            "performance_multiplier": round(performance_multiplier, 3),
+            "war": war
         }
     
     def get_comparison_data(self, player: Player, position: str = None) -> Dict[str, any]:
@@ -1,6 +1,57 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select
+from typing import Callable, Dict, List, Optional, Tuple
 from ..database.models import Player, Team, Position
+from ..services.roster_service import RosterService, roster_counters, roster_move_type
+from ..services.response_cache import response_cache
+from ..services.journal_service import TransactionJournal
+
+PLAYER_COLUMNS = [
+    "id", "first_name", "last_name", "position", "jersey_number", "age", "height", "weight",
+    "years_pro", "college", "draft_year", "draft_round", "draft_pick", "team_id", "roster_status",
+    "overall_rating", "potential", "speed", "strength", "agility", "football_iq", "leadership",
+    "work_ethic", "skill_1", "skill_2", "skill_3", "injury_status", "injury_prone"
+]
+
+# Selectable response field -> (columns it is built from, value from a result row)
+PLAYER_FIELDS: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, any]], any]]] = {
+    column: ((column,), lambda row, column=column: row[column]) for column in PLAYER_COLUMNS
+}
+PLAYER_FIELDS.update({
+    "name": (("first_name", "last_name"), lambda row: f"{row['first_name']} {row['last_name']}"),
+    "team": (("team_name",), lambda row: row["team_name"]),
+    "ratings": (
+        ("overall_rating", "potential", "speed", "strength", "agility", "football_iq", "leadership", "work_ethic"),
+        lambda row: {
+            "overall": row["overall_rating"],
+            "potential": row["potential"],
+            "speed": row["speed"],
+            "strength": row["strength"],
+            "agility": row["agility"],
+            "football_iq": row["football_iq"],
+            "leadership": row["leadership"],
+            "work_ethic": row["work_ethic"]
+        }
+    ),
+    "status": (
+        ("roster_status", "injury_status", "injury_prone"),
+        lambda row: {
+            "roster_status": row["roster_status"],
+            "injury_status": row["injury_status"],
+            "injury_prone": row["injury_prone"]
+        }
+    )
+})
+
+def parse_player_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Requested fields from a comma separated fields= parameter, or None for the full response"""
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in requested if field not in PLAYER_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown player fields: {', '.join(unknown)}. Available: {', '.join(PLAYER_FIELDS)}")
+    return requested
 
 class PlayerService:
     def __init__(self, db: Session):
@@ -26,13 +77,45 @@ class PlayerService:
     
     def search_players(self, search_term: str, team_id: Optional[int] = None) -> List[Player]:
         """Search players by name"""
-        query = self.db.query(Player).filter(
+        return self.db.query(Player).filter(*self.search_criteria(search_term, team_id)).all()
+    
+    @staticmethod
+    def search_criteria(search_term: str, team_id: Optional[int] = None) -> list:
+        """Filter clauses for a name search"""
+        criteria = [
             (Player.first_name.ilike(f"%{search_term}%")) |
             (Player.last_name.ilike(f"%{search_term}%"))
-        )
+        ]
         if team_id:
-            query = query.filter(Player.team_id == team_id)
-        return query.all()
+            criteria.append(Player.team_id == team_id)
+        return criteria
+    
+    def select_player_fields(self, fields: List[str], *criteria, order_by=None,
+                             offset: Optional[int] = None, limit: Optional[int] = None) -> List[Dict[str, any]]:
+        """Only the requested fields of matching players
+        
+        Runs a Core select of just the columns those fields are built from
+        (joining teams only when the team name is asked for), so neither
+        unused columns nor ORM objects are loaded.
+        """
+        names = list(dict.fromkeys(column for field in fields for column in PLAYER_FIELDS[field][0]))
+        columns = [Team.name.label(name) if name == "team_name" else getattr(Player, name) for name in names]
+        statement = select(*columns).select_from(Player)
+        if "team_name" in names:
+            statement = statement.outerjoin(Team, Team.id == Player.team_id)
+        statement = statement.where(*criteria)
+        if order_by is not None:
+            statement = statement.order_by(order_by)
+        if offset:
+            statement = statement.offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        
+        values = [(field, PLAYER_FIELDS[field][1]) for field in fields]
+        return [
+            {field: value(row) for field, value in values}
+            for row in self.db.execute(statement).mappings()
+        ]
     
     def get_position_info(self, position_code: str) -> Optional[Position]:
         """Get position information by code"""
@@ -43,10 +126,21 @@ class PlayerService:
         return self.db.query(Position).all()
     
     def update_player_status(self, player_id: int, new_status: str) -> bool:
-        """Update player roster status"""
+        """Update player roster status; moves that break a roster limit are refused"""
         player = self.get_player_by_id(player_id)
         if player:
+            move_type = roster_move_type(player.roster_status, new_status)
+            if move_type and player.team_id and RosterService(self.db).check_move(
+                {"type": move_type, "player_id": player_id, "team_id": player.team_id}
+            ):
+                return False
+            TransactionJournal(self.db).record(
+                "roster_move", player.team_id, player_id,
+                move=move_type, from_status=player.roster_status, status=new_status
+            )
             player.roster_status = new_status
             self.db.commit()
+            roster_counters(self.db).move(player_id, player.team_id, new_status, player.position)
+            response_cache.invalidate(team_ids=[player.team_id], player_ids=[player_id])
             return True
         return False
@@ -0,0 +1,245 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from ..database.connection import current_league, league_state
+import hashlib
+import re
+import threading
+
+RESPONSE_CACHE_SIZE = 2000
+
+# Entries per hosted league; only open leagues hold a cache, see LeaguePool
+LEAGUE_RESPONSE_CACHE_SIZE = 250
+
+# Clients may keep a copy but must revalidate it with If-None-Match every time
+CACHE_CONTROL = "no-cache"
+
+# League-wide views (totals across every team) carry this tag; only writes
+# that change those totals invalidate it
+LEAGUE_TAG = "league"
+
+def _ids_to_tags(match: re.Match) -> List[str]:
+    """team:1, player:2, contract:3 tags from a route's named path parameters"""
+    return [f"{name.split('_')[0]}:{value}" for name, value in match.groupdict().items() if value]
+
+# Cached GET routes: path pattern -> tags for the entry
+CACHED_ROUTES: List[Tuple[re.Pattern, Callable[[re.Match], List[str]]]] = [
+    (re.compile(r"^/api/teams/$"), lambda m: ["teams"]),
+    (re.compile(r"^/api/teams/(?P<team_id>\d+)$"), _ids_to_tags),
+    (re.compile(r"^/api/teams/(?P<team_id>\d+)/roster$"), _ids_to_tags),
+    (re.compile(r"^/api/teams/(?P<team_id>\d+)/dashboard$"), _ids_to_tags),
+    (re.compile(r"^/api/players/team/(?P<team_id>\d+)/depth-chart$"), _ids_to_tags),
+    (re.compile(r"^/api/salary-cap/overview$"), lambda m: [LEAGUE_TAG]),
+    (re.compile(r"^/api/salary-cap/league/overview$"), lambda m: [LEAGUE_TAG]),
+    (re.compile(r"^/api/salary-cap/team/(?P<team_id>\d+)(/summary|/contracts)?$"), _ids_to_tags),
+    (re.compile(r"^/api/salary-cap/contract/(?P<contract_id>\d+)$"), _ids_to_tags),
+    (re.compile(r"^/api/salary-cap/player/(?P<player_id>\d+)/(contract|contract-history)$"), _ids_to_tags),
+]
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check: a list of entity tags or "*", compared weakly (RFC 9110 13.1.2)"""
+    if_none_match = if_none_match.strip()
+    if not if_none_match:
+        return False
+    if if_none_match == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+class ResponseCache:
+    """LRU cache of serialized GET responses, invalidated by tag.
+
+    Entries are tagged with the teams, players and contracts they show; a
+    write invalidates exactly the entries carrying its tags, and league-wide
+    views only when it changes league totals. A generation counter keeps a response computed while an
+    invalidation happened from being stored stale.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Tuple[bytes, bytes, str, Tuple[str, ...]]]" = OrderedDict()
+        self.tags: Dict[str, Set[str]] = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.metrics = {"hits": 0, "misses": 0, "not_modified": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str) -> Optional[Tuple[bytes, bytes, str, Tuple[str, ...]]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.metrics["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.metrics["hits"] += 1
+            return entry
+
+    def put(self, key: str, body: bytes, content_type: bytes, tags: Iterable[str], generation: int) -> str:
+        """Store a response unless the cache was invalidated since it started; returns its ETag"""
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        tags = tuple(tags)
+        with self.lock:
+            if generation != self.generation:
+                return etag
+            self._remove(key)
+            self.entries[key] = (body, content_type, etag, tags)
+            for tag in tags:
+                self.tags.setdefault(tag, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.metrics["evictions"] += 1
+        return etag
+
+    def _remove(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[3]:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def invalidate(self, team_ids: Iterable[int] = (), player_ids: Iterable[int] = (),
+                   contract_ids: Iterable[int] = (), league: bool = False) -> int:
+        """Drop every entry showing one of these teams, players or contracts.
+
+        league=True also drops the league-wide views, for writes that change
+        league totals such as team cap figures.
+        """
+        tags = [LEAGUE_TAG] if league else []
+        tags += [f"team:{team_id}" for team_id in team_ids if team_id is not None]
+        tags += [f"player:{player_id}" for player_id in player_ids if player_id is not None]
+        tags += [f"contract:{contract_id}" for contract_id in contract_ids if contract_id is not None]
+        with self.lock:
+            self.generation += 1
+            keys = set()
+            for tag in tags:
+                keys |= self.tags.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            self.metrics["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self):
+        """Drop everything, for bulk writes that touch the whole league"""
+        with self.lock:
+            self.generation += 1
+            self.metrics["invalidations"] += len(self.entries)
+            self.entries.clear()
+            self.tags.clear()
+
+    def get_metrics(self) -> Dict[str, any]:
+        with self.lock:
+            lookups = self.metrics["hits"] + self.metrics["misses"]
+            return {
+                **self.metrics,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hit_ratio": round(self.metrics["hits"] / lookups, 3) if lookups else None
+            }
+
+class LeagueResponseCaches:
+    """A ResponseCache per league, for the league bound to the current request.
+
+    Each league's cache lives in its LeaguePool entry, so one league's
+    writes never invalidate another's entries and closing a league frees
+    its cache. Attribute access goes to the current league's cache, so
+    callers use this exactly like a single ResponseCache.
+    """
+
+    def current(self) -> ResponseCache:
+        state = league_state()
+        cache = state.get("response_cache")
+        if cache is None:
+            size = RESPONSE_CACHE_SIZE if current_league.get() is None else LEAGUE_RESPONSE_CACHE_SIZE
+            cache = state.setdefault("response_cache", ResponseCache(size))
+        return cache
+
+    def __getattr__(self, name):
+        return getattr(self.current(), name)
+
+response_cache = LeagueResponseCaches()
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving the cached routes from response_cache"""
+
+    def __init__(self, app, cache: LeagueResponseCaches = response_cache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        tags = None
+        for pattern, route_tags in CACHED_ROUTES:
+            match = pattern.match(path)
+            if match:
+                tags = route_tags(match)
+                break
+        if tags is None:
+            return await self.app(scope, receive, send)
+
+        query = scope.get("query_string", b"").decode()
+        key = path + "?" + "&".join(sorted(query.split("&"))) if query else path
+        if_none_match = dict(scope["headers"]).get(b"if-none-match", b"").decode()
+
+        # The request's league stays fixed, so resolve its cache once
+        cache = self.cache.current()
+        entry = cache.get(key)
+        if entry is not None:
+            body, content_type, etag, _ = entry
+            if etag_matches(if_none_match, etag):
+                return await self._not_modified(send, cache, etag)
+            return await self._send(send, 200, body, content_type, etag)
+
+        generation = cache.generation
+        start = {}
+        chunks = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+        headers = [(k, v) for k, v in start.get("headers", []) if k.lower() != b"content-length"]
+        if start.get("status") != 200:
+            headers.append((b"content-length", str(len(body)).encode()))
+            await send({"type": "http.response.start", "status": start.get("status", 500), "headers": headers})
+            return await send({"type": "http.response.body", "body": body})
+
+        content_type = dict((k.lower(), v) for k, v in headers).get(b"content-type", b"application/json")
+        etag = cache.put(key, body, content_type, tags, generation)
+        if etag_matches(if_none_match, etag):
+            return await self._not_modified(send, cache, etag)
+        await self._send(send, 200, body, content_type, etag)
+
+    async def _send(self, send, status: int, body: bytes, content_type: bytes, etag: str):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+                (b"etag", etag.encode()),
+                (b"cache-control", CACHE_CONTROL.encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _not_modified(self, send, cache: ResponseCache, etag: str):
+        cache.metrics["not_modified"] += 1
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", etag.encode()), (b"cache-control", CACHE_CONTROL.encode())]
+        })
+        await send({"type": "http.response.body", "body": b""})
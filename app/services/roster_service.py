@@ -0,0 +1,279 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, bindparam
+from collections import ChainMap
+from typing import Dict, List, Optional, Tuple
+from ..database.connection import league_state
+from ..database.models import Player, Position
+from ..services.response_cache import response_cache
+from ..services.journal_service import TransactionJournal, journal_entry
+import threading
+
+ACTIVE_ROSTER_LIMIT = 53
+PRACTICE_SQUAD_LIMIT = 16
+INJURED_RESERVE_LIMIT = 12
+
+STATUS_LIMITS = {
+    "active": ACTIVE_ROSTER_LIMIT,
+    "practice_squad": PRACTICE_SQUAD_LIMIT,
+    "injured_reserve": INJURED_RESERVE_LIMIT
+}
+STATUS_LIMIT_CODES = {
+    "active": "roster_limit",
+    "practice_squad": "practice_squad_limit",
+    "injured_reserve": "injured_reserve_limit"
+}
+
+# Move type -> (statuses the player may be in, status after the move)
+MOVE_TRANSITIONS = {
+    "sign": (("free_agent",), "active"),
+    "sign_practice_squad": (("free_agent",), "practice_squad"),
+    "release": (("active", "practice_squad", "injured_reserve", "suspended"), "free_agent"),
+    "promote": (("practice_squad",), "active"),
+    "demote": (("active",), "practice_squad"),
+    "move_to_ir": (("active",), "injured_reserve"),
+    "activate_from_ir": (("injured_reserve",), "active")
+}
+
+# Moves that start or end a contract; ContractService makes these along with the contract
+CONTRACT_MOVES = {"sign", "sign_practice_squad", "release"}
+
+def roster_move_type(current_status: str, new_status: str) -> Optional[str]:
+    """The roster move a plain status change amounts to, if it is one"""
+    for move_type, (allowed, target) in MOVE_TRANSITIONS.items():
+        if current_status in allowed and target == new_status and move_type != "release":
+            return move_type
+    return None
+
+def _count(status_counts: Dict[Tuple[int, str], int], position_counts: Dict[Tuple[int, str], int],
+           team_id: Optional[int], status: str, position: str, delta: int):
+    if team_id is None:
+        return
+    key = (team_id, status)
+    status_counts[key] = status_counts.get(key, 0) + delta
+    if status == "active":
+        key = (team_id, position)
+        position_counts[key] = position_counts.get(key, 0) + delta
+
+class RosterCounters:
+    """A league's roster counts, read once and then kept current on writes.
+
+    Holds each rostered or free agent player's (team, status, position), counts
+    per team and status, and active counts per team and position.
+    """
+
+    def __init__(self, db: Session):
+        self.position_limits = {p.code: p.max_roster for p in db.query(Position).all()}
+        self.players: Dict[int, Tuple[Optional[int], str, str]] = {}
+        self.status_counts: Dict[Tuple[int, str], int] = {}
+        self.position_counts: Dict[Tuple[int, str], int] = {}
+        self.lock = threading.Lock()
+        for player_id, team_id, status, position in db.execute(
+            select(Player.id, Player.team_id, Player.roster_status, Player.position)
+            .where((Player.team_id != None) | (Player.roster_status == "free_agent"))
+        ).all():
+            self.players[player_id] = (team_id, status, position)
+            _count(self.status_counts, self.position_counts, team_id, status, position, 1)
+
+    def move(self, player_id: int, team_id: Optional[int], status: str, position: str):
+        """Record a player's new team and status once it is written"""
+        with self.lock:
+            if player_id in self.players:
+                _count(self.status_counts, self.position_counts, *self.players.pop(player_id), -1)
+            if team_id is not None or status == "free_agent":
+                self.players[player_id] = (team_id, status, position)
+                _count(self.status_counts, self.position_counts, team_id, status, position, 1)
+
+def roster_counters(db: Session) -> RosterCounters:
+    """The current league's roster counters, loaded on first use"""
+    state = league_state()
+    counters = state.get("roster_counters")
+    if counters is None:
+        counters = state.setdefault("roster_counters", RosterCounters(db))
+    return counters
+
+class RosterService:
+    """Roster limits enforced from in-memory counters.
+
+    The league's counters are loaded once and shared by every request. A
+    service layers its own moves over them, so each move is checked and
+    applied with a handful of dictionary lookups, and the moves reach the
+    shared counters only when flush writes them.
+
+    Signings and releases are contract moves: only services that also create
+    or end the contract (ContractService, free agency and the AI GMs) may
+    make them, with contract_moves=True.
+    """
+
+    def __init__(self, db: Session, contract_moves: bool = False):
+        self.db = db
+        self.contract_moves = contract_moves
+        self.counters = roster_counters(db)
+        self.position_limits = self.counters.position_limits
+        self._layer()
+
+        self.pending: Dict[int, Tuple[Optional[int], str]] = {}
+        self.pending_events: List[Dict[str, any]] = []
+
+    def _layer(self):
+        # Writes go to the first map, reads fall through to the shared counters
+        self.players = ChainMap({}, self.counters.players)
+        self.status_counts = ChainMap({}, self.counters.status_counts)
+        self.position_counts = ChainMap({}, self.counters.position_counts)
+
+    def _count(self, team_id: Optional[int], status: str, position: str, delta: int):
+        _count(self.status_counts, self.position_counts, team_id, status, position, delta)
+
+    @staticmethod
+    def clear_counters():
+        """Drop the current league's counters after writes that bypass RosterService"""
+        league_state().pop("roster_counters", None)
+
+    def check_move(self, move: Dict[str, any]) -> List[Dict[str, any]]:
+        """Errors that would stop a move, without applying it"""
+        move_type, player_id = move.get("type"), move.get("player_id")
+        def error(code, message, **details):
+            return {"type": move_type, "player_id": player_id, "code": code, "message": message, **details}
+
+        if move_type not in MOVE_TRANSITIONS:
+            return [error("unknown_move", f"Unknown move type, expected one of {', '.join(MOVE_TRANSITIONS)}")]
+        if move_type in CONTRACT_MOVES and not self.contract_moves:
+            return [error("contract_move", "Signings and releases change contracts, make them through ContractService")]
+        if player_id not in self.players:
+            return [error("player_not_found", "Player is not on a roster or in free agency")]
+
+        allowed, new_status = MOVE_TRANSITIONS[move_type]
+        current_team, status, position = self.players[player_id]
+        team_id = move.get("team_id") or current_team
+        if status not in allowed:
+            return [error("invalid_status", f"Player is {status}, expected {' or '.join(allowed)}", status=status)]
+        if team_id is None:
+            return [error("team_required", "A team is required to sign a free agent")]
+        if current_team is not None and current_team != team_id:
+            return [error("wrong_team", "Player is on another team", team_id=current_team)]
+        if new_status not in STATUS_LIMITS:
+            return []
+
+        errors = []
+        current = self.status_counts.get((team_id, new_status), 0)
+        if current >= STATUS_LIMITS[new_status]:
+            errors.append(error(
+                STATUS_LIMIT_CODES[new_status], f"Team already has {current} players on {new_status.replace('_', ' ')}",
+                team_id=team_id, limit=STATUS_LIMITS[new_status], current=current
+            ))
+        position_limit = self.position_limits.get(position)
+        if new_status == "active" and position_limit:
+            current = self.position_counts.get((team_id, position), 0)
+            if current >= position_limit:
+                errors.append(error(
+                    "position_limit", f"Team already has {current} active players at {position}",
+                    team_id=team_id, position=position, limit=position_limit, current=current
+                ))
+        return errors
+
+    def apply_move(self, move: Dict[str, any]) -> List[Dict[str, any]]:
+        """Check a move and, if it is legal, update the counters and queue it for writing"""
+        errors = self.check_move(move)
+        if errors:
+            return errors
+
+        player_id = move["player_id"]
+        current_team, status, position = self.players[player_id]
+        new_status = MOVE_TRANSITIONS[move["type"]][1]
+        new_team = None if new_status == "free_agent" else (move.get("team_id") or current_team)
+
+        self._count(current_team, status, position, -1)
+        self._count(new_team, new_status, position, 1)
+        self.players[player_id] = (new_team, new_status, position)
+        self.pending[player_id] = (new_team, new_status)
+        self.pending_events.append(journal_entry(
+            "roster_move", new_team if new_team is not None else current_team, player_id,
+            move=move["type"], from_team_id=current_team, from_status=status, status=new_status
+        ))
+        return []
+
+    def validate_moves(self, moves: List[Dict[str, any]], apply: bool = False) -> Dict[str, any]:
+        """Check a batch of moves in order, each seeing the ones before it.
+
+        With apply=False the moves go to a throwaway layer, so the batch is
+        only a dry run; with apply=True the legal moves stay queued.
+        """
+        snapshot = None
+        if not apply:
+            snapshot = (self.players, self.status_counts, self.position_counts, dict(self.pending), list(self.pending_events))
+            self.players = self.players.new_child()
+            self.status_counts = self.status_counts.new_child()
+            self.position_counts = self.position_counts.new_child()
+        results = []
+        for index, move in enumerate(moves):
+            errors = self.apply_move(move)
+            results.append({"index": index, "valid": not errors, "errors": errors})
+        if snapshot:
+            self.players, self.status_counts, self.position_counts, self.pending, self.pending_events = snapshot
+
+        return {
+            "valid": all(result["valid"] for result in results),
+            "moves": len(moves),
+            "rejected": sum(not result["valid"] for result in results),
+            "results": results
+        }
+
+    def flush(self) -> int:
+        """Write queued moves to the players table in one statement, and to the journal.
+
+        The moves are applied to the league's shared counters here; a caller
+        that rolls the transaction back afterwards must call clear_counters.
+        """
+        if not self.pending:
+            return 0
+        player_table = Player.__table__
+        self.db.execute(
+            update(player_table)
+            .where(player_table.c.id == bindparam("b_id"))
+            .values(team_id=bindparam("b_team_id"), roster_status=bindparam("b_status")),
+            [
+                {"b_id": player_id, "b_team_id": team_id, "b_status": status}
+                for player_id, (team_id, status) in self.pending.items()
+            ]
+        )
+        TransactionJournal(self.db).record_many(self.pending_events)
+        for player_id, (team_id, status) in self.pending.items():
+            self.counters.move(player_id, team_id, status, self.players[player_id][2])
+        self._layer()
+        written = len(self.pending)
+        self.pending = {}
+        self.pending_events = []
+        return written
+
+    def execute_moves(self, moves: List[Dict[str, any]]) -> Dict[str, any]:
+        """Apply a batch of moves all-or-nothing"""
+        result = self.validate_moves(moves)
+        if not result["valid"]:
+            return result
+        previous_teams = {player_id: self.players[player_id][0] for player_id in {m["player_id"] for m in moves}}
+        self.validate_moves(moves, apply=True)
+        try:
+            self.flush()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            self.clear_counters()
+            raise
+        response_cache.invalidate(
+            team_ids=set(previous_teams.values()) | {self.players[player_id][0] for player_id in previous_teams},
+            player_ids=previous_teams
+        )
+        return result
+
+    def get_team_limits(self, team_id: int) -> Dict[str, any]:
+        """A team's counts against every roster limit"""
+        return {
+            "team_id": team_id,
+            "statuses": {
+                status: {"count": self.status_counts.get((team_id, status), 0), "limit": limit}
+                for status, limit in STATUS_LIMITS.items()
+            },
+            "positions": {
+                code: {"count": self.position_counts.get((team_id, code), 0), "limit": limit}
+                for code, limit in sorted(self.position_limits.items())
+            }
+        }
@@ -1,9 +1,13 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, case, bindparam
 from typing import Dict, List, Tuple, Optional
 from ..database.models import Contract, Team, Player, SalaryCap, TeamSalaryCap
 from datetime import datetime, date
 import math
 
+# Veteran base salary by contract year, relative to year one (5% raises)
+VETERAN_SALARY_ESCALATION = [1.0, 1.05, 1.10, 1.15, 1.20]
+
 class SalaryCapService:
     def __init__(self, db: Session):
         self.db = db
@@ -14,6 +18,15 @@ class SalaryCapService:
         self.minimum_spend = 230000000  # 90% of base cap
         self.rookie_pool = 10000000  # Estimated rookie pool
         
+        # The league year advances with each season rollover; contract year_N
+        # columns are always relative to the latest salary cap year on record
+        league_year = self.db.query(SalaryCap).order_by(SalaryCap.year.desc()).first()
+        if league_year:
+            self.current_year = league_year.year
+            self.base_cap = league_year.base_cap
+            self.minimum_spend = int(league_year.base_cap * 0.9)
+            self.rookie_pool = league_year.rookie_pool
+        
         # Rookie wage scale (2024 figures)
         self.rookie_scale = {
             1: {1: 10000000, 2: 12000000, 3: 14000000, 4: 18000000, 5: 22000000},
@@ -24,6 +37,8 @@ class SalaryCapService:
             6: {1: 2500000, 2: 2600000, 3: 2700000, 4: 2800000, 5: 2900000},
             7: {1: 2000000, 2: 2100000, 3: 2200000, 4: 2300000, 5: 2400000}
         }
+        self.rookie_minimum_salary = 795000
+        self.teams_per_round = 32
     
     def get_current_salary_cap(self) -> Dict[str, int]:
         """Get current year salary cap information"""
@@ -63,16 +78,24 @@ class SalaryCapService:
         
         return cap_hits
     
-    def calculate_team_salary_cap(self, team_id: int, year: int = None) -> Dict[str, any]:
-        """Calculate comprehensive salary cap for a team"""
+    def calculate_team_salary_cap(self, team_id: int, year: int = None,
+                                  team_contracts: Optional[List[Contract]] = None) -> Dict[str, any]:
+        """Calculate comprehensive salary cap for a team
+        
+        team_contracts, when given, are all of the team's contracts (active and
+        inactive) already loaded by the caller, and no further queries are run.
+        """
         if year is None:
             year = self.current_year
         
         # Get all active contracts for the team
-        contracts = self.db.query(Contract).filter(
-            Contract.team_id == team_id,
-            Contract.is_active == True
-        ).all()
+        if team_contracts is None:
+            contracts = self.db.query(Contract).filter(
+                Contract.team_id == team_id,
+                Contract.is_active == True
+            ).all()
+        else:
+            contracts = [contract for contract in team_contracts if contract.is_active]
         
         # Calculate cap hits for all contracts
         total_cap_used = 0
@@ -96,7 +119,10 @@ class SalaryCapService:
                 })
         
         # Calculate dead money
-        dead_money = self.calculate_team_dead_money(team_id, year)
+        dead_money = self.calculate_team_dead_money(
+            team_id, year,
+            None if team_contracts is None else [contract for contract in team_contracts if not contract.is_active]
+        )
         total_dead_money = sum(dead_money.values())
         
         # Top 51 rule: Only top 51 contracts count against cap during offseason
@@ -119,9 +145,104 @@ class SalaryCapService:
             "contracts": contract_details
         }
     
-    def calculate_team_dead_money(self, team_id: int, year: int) -> Dict[str, int]:
+    @staticmethod
+    def current_cap_hit():
+        """SQL expression for a contract's current-year cap hit
+        
+        Falls back to salary plus bonus proration, as calculate_contract_cap_hits
+        does, for contracts whose cap hits were never stored.
+        """
+        proration = func.coalesce(Contract.signing_bonus, 0) / func.max(Contract.years, 1)
+        return case(
+            (Contract.year_1_cap_hit > 0, Contract.year_1_cap_hit),
+            (Contract.year_1_salary > 0, Contract.year_1_salary + proration),
+            else_=0
+        )
+    
+    @staticmethod
+    def contract_cap_hit(contract: Contract) -> int:
+        """A contract's current-year cap hit, computed as current_cap_hit does in SQL"""
+        if (contract.year_1_cap_hit or 0) > 0:
+            return int(contract.year_1_cap_hit)
+        if (contract.year_1_salary or 0) > 0:
+            return int(contract.year_1_salary + (contract.signing_bonus or 0) // max(contract.years or 1, 1))
+        return 0
+    
+    def calculate_team_cap_totals(self, team_ids: List[int] = None) -> Dict[int, Dict[str, int]]:
+        """Current-year cap totals for many teams with two grouped queries"""
+        cap_hit = self.current_cap_hit()
+        cap_used_query = select(
+            Contract.team_id,
+            func.coalesce(func.sum(cap_hit), 0),
+            func.count(Contract.id)
+        ).where(Contract.is_active == True).group_by(Contract.team_id)
+        dead_money_query = select(
+            Contract.team_id,
+            func.coalesce(func.sum(Contract.dead_money_year_1), 0)
+        ).where(Contract.is_active == False).group_by(Contract.team_id)
+        if team_ids is not None:
+            cap_used_query = cap_used_query.where(Contract.team_id.in_(team_ids))
+            dead_money_query = dead_money_query.where(Contract.team_id.in_(team_ids))
+        else:
+            team_ids = [row.id for row in self.db.query(Team.id).all()]
+        
+        cap_used = {team_id: (int(used), count) for team_id, used, count in self.db.execute(cap_used_query).all()}
+        dead_money = {team_id: int(dead) for team_id, dead in self.db.execute(dead_money_query).all()}
+        
+        totals = {}
+        for team_id in team_ids:
+            used, count = cap_used.get(team_id, (0, 0))
+            dead = dead_money.get(team_id, 0)
+            totals[team_id] = {
+                "adjusted_cap": self.base_cap,
+                "total_cap_used": used,
+                "cap_space": self.base_cap - used - dead,
+                "total_dead_money": dead,
+                "top_51_count": min(count, 51),
+                "total_contracts": count
+            }
+        return totals
+    
+    def refresh_team_cap_totals(self, team_ids: List[int] = None) -> Dict[int, Dict[str, int]]:
+        """Recompute stored current-year cap totals for many teams
+        
+        Used after bulk contract changes instead of one calculate_team_salary_cap
+        call per team. Returns the new totals keyed by team id.
+        """
+        totals = self.calculate_team_cap_totals(team_ids)
+        team_ids = list(totals)
+        
+        existing = {
+            row.team_id for row in self.db.query(TeamSalaryCap.team_id).filter(
+                TeamSalaryCap.year == self.current_year,
+                TeamSalaryCap.team_id.in_(team_ids)
+            ).all()
+        }
+        updates = [
+            {"b_team_id": team_id, **{f"b_{key}": value for key, value in values.items()}}
+            for team_id, values in totals.items() if team_id in existing
+        ]
+        if updates:
+            table = TeamSalaryCap.__table__
+            self.db.execute(
+                update(table)
+                .where(table.c.team_id == bindparam("b_team_id"), table.c.year == self.current_year)
+                .values(updated_at=datetime.utcnow(), **{key: bindparam(f"b_{key}") for key in totals[team_ids[0]]}),
+                updates
+            )
+        inserts = [
+            {"team_id": team_id, "year": self.current_year, **values}
+            for team_id, values in totals.items() if team_id not in existing
+        ]
+        if inserts:
+            self.db.execute(TeamSalaryCap.__table__.insert(), inserts)
+        
+        return totals
+    
+    def calculate_team_dead_money(self, team_id: int, year: int,
+                                  inactive_contracts: Optional[List[Contract]] = None) -> Dict[str, int]:
         """Calculate dead money for a team in a specific year"""
-        contracts = self.db.query(Contract).filter(
+        contracts = inactive_contracts if inactive_contracts is not None else self.db.query(Contract).filter(
             Contract.team_id == team_id,
             Contract.is_active == False  # Inactive contracts may have dead money
         ).all()
@@ -135,30 +256,44 @@ class SalaryCapService:
         
         return dead_money
     
-    def create_rookie_contract(self, player: Player, team_id: int, draft_round: int, 
-                              draft_pick: int, years: int = 4) -> Contract:
-        """Create a rookie contract based on draft position"""
+    def rookie_slot_salaries(self, draft_round: int, draft_pick: int) -> List[int]:
+        """Year 1-5 salaries for a draft slot.
+        
+        The first-year figure slides from the round's scale value towards the
+        next round's as the pick moves through the round (the last round slides
+        to the rookie minimum); later years escalate like the round's scale.
+        """
         if draft_round > 7:
             draft_round = 7  # Undrafted free agents
+        draft_pick = min(max(draft_pick, 1), self.teams_per_round)
         
-        # Get base salary from rookie scale
-        base_salary = self.rookie_scale[draft_round][1]
+        round_scale = self.rookie_scale[draft_round]
+        next_value = self.rookie_scale[draft_round + 1][1] if draft_round < 7 else self.rookie_minimum_salary
+        slot_value = round_scale[1] - (round_scale[1] - next_value) * (draft_pick - 1) / self.teams_per_round
+        
+        return [int(slot_value * round_scale[year] / round_scale[1]) for year in range(1, 6)]
+    
+    def create_rookie_contract(self, player: Player, team_id: int, draft_round: int, 
+                              draft_pick: int, years: int = 4) -> Contract:
+        """Create a rookie contract based on draft position"""
+        # Get slotted salaries from the pick-by-pick rookie scale
+        salaries = self.rookie_slot_salaries(draft_round, draft_pick)
         
         # Calculate total value
-        total_value = base_salary * years
+        total_value = sum(salaries[:years])
         
         # Create contract
         contract = Contract(
             player_id=player.id,
             team_id=team_id,
             total_value=total_value,
-            guaranteed_money=base_salary,  # First year guaranteed
+            guaranteed_money=salaries[0],  # First year guaranteed
             years=years,
-            year_1_salary=base_salary,
-            year_2_salary=base_salary,
-            year_3_salary=base_salary,
-            year_4_salary=base_salary,
-            year_5_salary=base_salary if years > 4 else 0,
+            year_1_salary=salaries[0],
+            year_2_salary=salaries[1],
+            year_3_salary=salaries[2],
+            year_4_salary=salaries[3],
+            year_5_salary=salaries[4] if years > 4 else 0,
             is_rookie_contract=True,
             rookie_scale_year=1,
             contract_type="rookie",
@@ -188,10 +323,10 @@ class SalaryCapService:
             guaranteed_money=signing_bonus,
             years=years,
             year_1_salary=annual_salary,
-            year_2_salary=annual_salary + (annual_salary * 0.05),  # 5% increase
-            year_3_salary=annual_salary + (annual_salary * 0.10),  # 10% increase
-            year_4_salary=annual_salary + (annual_salary * 0.15) if years > 3 else 0,
-            year_5_salary=annual_salary + (annual_salary * 0.20) if years > 4 else 0,
+            year_2_salary=annual_salary * VETERAN_SALARY_ESCALATION[1],
+            year_3_salary=annual_salary * VETERAN_SALARY_ESCALATION[2],
+            year_4_salary=annual_salary * VETERAN_SALARY_ESCALATION[3] if years > 3 else 0,
+            year_5_salary=annual_salary * VETERAN_SALARY_ESCALATION[4] if years > 4 else 0,
             signing_bonus=signing_bonus,
             roster_bonus=roster_bonus,
             contract_type="veteran",
@@ -205,6 +340,28 @@ class SalaryCapService:
         
         return contract
     
+    @staticmethod
+    def contract_values(contract: Contract) -> Dict[str, any]:
+        """Column values of an unsaved contract, for bulk inserts
+        
+        Every contract yields the same keys, whatever its length, so a batch can
+        go to one executemany: unset columns take their scalar default (or NULL),
+        and only columns with generated defaults such as created_at are left out.
+        """
+        values = {}
+        for column in Contract.__table__.columns:
+            if column.primary_key:
+                continue
+            value = getattr(contract, column.name)
+            if value is None:
+                if column.default is None:
+                    values[column.name] = None
+                elif column.default.is_scalar:
+                    values[column.name] = column.default.arg
+                continue
+            values[column.name] = round(value) if isinstance(value, float) else value
+        return values
+    
     def restructure_contract(self, contract: Contract, 
                            restructure_amount: int) -> Dict[str, any]:
         """Restructure a contract to create cap space"""
@@ -0,0 +1,228 @@
+from typing import Dict, List, Optional
+from ..database import connection
+from datetime import datetime
+import gzip
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+SAVE_DIR = os.environ.get("NFL_GM_SAVE_DIR", "saves")
+
+# Slots beyond this many, counting from the most recently saved or loaded, are gzipped
+KEEP_UNCOMPRESSED = 3
+
+SLOT_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+# One save or load at a time, so a load never restores a half-written slot
+_slot_lock = threading.Lock()
+
+def backup_database(source_path: str, target_path: str):
+    """Copy a live SQLite database with the online backup API.
+
+    The copy runs in one step under a shared lock on the source, so it is a
+    consistent snapshot: readers carry on and writers wait only for the copy.
+    """
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+def read_league_metadata(path: str) -> Dict[str, any]:
+    """Headline facts about the league stored in a database file"""
+    queries = {
+        "league_year": "SELECT MAX(year) FROM salary_caps",
+        "seasons": "SELECT COUNT(DISTINCT season) FROM games",
+        "players": "SELECT COUNT(*) FROM players",
+        "journal_offset": "SELECT MAX(id) FROM journal_events"
+    }
+    metadata = {}
+    db = sqlite3.connect(path)
+    try:
+        for key, query in queries.items():
+            try:
+                metadata[key] = db.execute(query).fetchone()[0]
+            except sqlite3.OperationalError:
+                # Saves from before the table existed
+                metadata[key] = None
+    finally:
+        db.close()
+    return metadata
+
+class SaveService:
+    """Named save slots for the league database.
+
+    A save copies the live database into its own file with the SQLite
+    online backup API and writes the slot's metadata next to it. Loading
+    closes the pooled connections, copies a slot back over the live database
+    and swaps in a fresh engine with empty caches, so nothing from before the
+    load survives it. Older slots are gzipped to save disk and unpacked
+    again when loaded.
+    """
+
+    def __init__(self, save_dir: Optional[str] = None):
+        league_id = connection.current_league.get()
+        if save_dir is None and league_id is not None:
+            # Hosted leagues keep their saves next to their database
+            save_dir = os.path.join(os.path.dirname(connection.league_pool.league_path(league_id)), "saves")
+        self.save_dir = save_dir or SAVE_DIR
+
+    def _path(self, name: str, suffix: str) -> str:
+        return os.path.join(self.save_dir, f"{name}{suffix}")
+
+    @staticmethod
+    def check_name(name: str):
+        """Raise ValueError for a name that cannot be used as a slot file"""
+        if not SLOT_NAME.match(name):
+            raise ValueError(
+                f"Invalid save name: {name!r}, use up to 64 letters, digits, '.', '_' or '-'"
+            )
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self._path(name, ".json"))
+
+    def get_slot(self, name: str) -> Optional[Dict[str, any]]:
+        """Metadata for one slot, or None if there is no such save"""
+        self.check_name(name)
+        try:
+            with open(self._path(name, ".json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def list_slots(self) -> List[Dict[str, any]]:
+        """Every save slot, most recently used first"""
+        if not os.path.isdir(self.save_dir):
+            return []
+        slots = []
+        for file_name in os.listdir(self.save_dir):
+            if file_name.endswith(".json"):
+                with open(os.path.join(self.save_dir, file_name)) as f:
+                    slots.append(json.load(f))
+        return sorted(slots, key=_last_used, reverse=True)
+
+    def _write_metadata(self, slot: Dict[str, any]):
+        path = self._path(slot["name"], ".json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(slot, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def save(self, name: str, description: Optional[str] = None, overwrite: bool = False) -> Dict[str, any]:
+        """Snapshot the live database into a named slot"""
+        self.check_name(name)
+        live_path = connection.database_path()
+        started = time.perf_counter()
+        with _slot_lock:
+            if self.exists(name) and not overwrite:
+                raise ValueError(f"Save {name} already exists")
+            os.makedirs(self.save_dir, exist_ok=True)
+
+            # Copy to a temporary file first so a failed save leaves any old slot intact
+            slot_path = self._path(name, ".db")
+            backup_database(live_path, slot_path + ".tmp")
+            os.replace(slot_path + ".tmp", slot_path)
+            if os.path.exists(self._path(name, ".db.gz")):
+                os.remove(self._path(name, ".db.gz"))
+
+            size = os.path.getsize(slot_path)
+            slot = {
+                "name": name,
+                "description": description,
+                "created_at": datetime.utcnow().isoformat(),
+                "loaded_at": None,
+                **read_league_metadata(slot_path),
+                "size_bytes": size,
+                "file_bytes": size,
+                "compressed": False
+            }
+            self._write_metadata(slot)
+
+        return {**slot, "elapsed_seconds": round(time.perf_counter() - started, 3)}
+
+    def load(self, name: str) -> Dict[str, any]:
+        """Replace the live database with a saved slot"""
+        slot = self.get_slot(name)
+        if slot is None:
+            raise ValueError(f"No save named {name}")
+        live_path = connection.database_path()
+        started = time.perf_counter()
+        with _slot_lock:
+            # A slot being loaded is in use again, so it is kept unpacked
+            if slot["compressed"]:
+                self._decompress(slot)
+
+            # No pooled connection may hold the file open while it is overwritten
+            connection.dispose_engine()
+            backup_database(self._path(name, ".db"), live_path)
+            # Fresh engine and empty league state, so no connection or cache
+            # carries anything over from before the load
+            connection.swap_engine()
+
+            slot["loaded_at"] = datetime.utcnow().isoformat()
+            self._write_metadata(slot)
+
+        return {**slot, "elapsed_seconds": round(time.perf_counter() - started, 3)}
+
+    def delete(self, name: str) -> bool:
+        """Remove a slot and its files"""
+        self.check_name(name)
+        with _slot_lock:
+            if not self.exists(name):
+                return False
+            for suffix in (".db", ".db.gz", ".json"):
+                if os.path.exists(self._path(name, suffix)):
+                    os.remove(self._path(name, suffix))
+        return True
+
+    def compress_old_slots(self, keep: Optional[int] = None) -> List[str]:
+        """Gzip every slot past the `keep` most recently used; returns the slots compressed"""
+        keep = KEEP_UNCOMPRESSED if keep is None else keep
+        compressed = []
+        for slot in self.list_slots()[keep:]:
+            if not slot["compressed"] and self._compress(slot):
+                compressed.append(slot["name"])
+        return compressed
+
+    def _compress(self, slot: Dict[str, any]) -> bool:
+        # Compressing takes seconds, so it runs outside the lock and only the
+        # swap to the .gz file waits for saves and loads
+        slot_path = self._path(slot["name"], ".db")
+        handle, temp_path = tempfile.mkstemp(dir=self.save_dir, suffix=".gz.tmp")
+        try:
+            with open(slot_path, "rb") as source, os.fdopen(handle, "wb") as raw, \
+                    gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            with _slot_lock:
+                current = self.get_slot(slot["name"])
+                # Skip a slot that was replaced, loaded or deleted meanwhile
+                if current != slot:
+                    return False
+                os.replace(temp_path, slot_path + ".gz")
+                slot["compressed"] = True
+                slot["file_bytes"] = os.path.getsize(slot_path + ".gz")
+                self._write_metadata(slot)
+                os.remove(slot_path)
+            return True
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _decompress(self, slot: Dict[str, any]):
+        slot_path = self._path(slot["name"], ".db")
+        with gzip.open(slot_path + ".gz", "rb") as source, open(slot_path + ".tmp", "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        os.replace(slot_path + ".tmp", slot_path)
+        slot["compressed"] = False
+        slot["file_bytes"] = os.path.getsize(slot_path)
+        self._write_metadata(slot)
+        os.remove(slot_path + ".gz")
+
+def _last_used(slot: Dict[str, any]) -> str:
+    return max(slot["created_at"], slot["loaded_at"] or "")
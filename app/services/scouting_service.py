@@ -0,0 +1,206 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from ..database.connection import league_state
+from ..database.models import Player, Position, Scout, ScoutingEffort, DraftProspect
+from ..services.draft_class_service import FIRST_NAMES, LAST_NAMES, board_grade
+import numpy as np
+
+# Attributes a scouting report estimates
+SCOUTED_ATTRIBUTES = [
+    "overall_rating", "potential",
+    "speed", "strength", "agility",
+    "football_iq", "leadership", "work_ethic",
+    "skill_1", "skill_2", "skill_3"
+]
+
+# Rating points of error for an average scout with no time invested
+BASE_ERROR = 8.0
+POTENTIAL_ERROR_MULTIPLIER = 1.6  # Upside is harder to judge than current ability
+SPECIALTY_ERROR_MULTIPLIER = 0.75
+HOURS_TO_HALVE_ERROR = 12  # Error shrinks with the square root of 1 + hours / this
+
+SCOUTS_PER_TEAM = 3
+SPECIALTIES = ["offense", "defense", "special_teams"]
+
+# Reports kept in memory across requests; only players a team has viewed are ever here
+REPORT_CACHE_SIZE = 50000
+
+def _report_cache() -> "OrderedDict[Tuple[int, int], Tuple[tuple, Dict[str, any]]]":
+    """The current league's reports, keyed by (team_id, player_id) -> (fingerprint, report)"""
+    return league_state().setdefault("scouting_reports", OrderedDict())
+
+def _seeded_noise(team_id: int, player_id: int, scout_id: int) -> np.ndarray:
+    """Standard normal draws that are always the same for a team, player and scout"""
+    rng = np.random.default_rng([team_id, player_id, scout_id])
+    return rng.standard_normal(len(SCOUTED_ATTRIBUTES))
+
+class ScoutingService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_team_scouts(self, team_id: int) -> List[Scout]:
+        """Get a team's active scouts, hiring a default staff the first time"""
+        scouts = self.db.query(Scout).filter(Scout.team_id == team_id, Scout.is_active == True).order_by(Scout.id).all()
+        if scouts:
+            return scouts
+
+        rng = np.random.default_rng([team_id, 0])
+        for specialty in SPECIALTIES[:SCOUTS_PER_TEAM]:
+            self.db.add(Scout(
+                team_id=team_id,
+                first_name=str(rng.choice(FIRST_NAMES)),
+                last_name=str(rng.choice(LAST_NAMES)),
+                accuracy=int(np.clip(rng.normal(60, 15), 20, 95)),
+                specialty=specialty
+            ))
+        self.db.commit()
+        return self.db.query(Scout).filter(Scout.team_id == team_id, Scout.is_active == True).order_by(Scout.id).all()
+
+    def add_scouting_time(self, team_id: int, player_id: int, hours: float) -> Dict[str, any]:
+        """Invest scouting time in a player; the team's cached report is invalidated"""
+        if not self.db.query(Player.id).filter(Player.id == player_id).first():
+            return {"error": "Player not found"}
+
+        table = ScoutingEffort.__table__
+        stmt = sqlite_insert(table).values(team_id=team_id, player_id=player_id, hours=hours)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["team_id", "player_id"],
+            set_={"hours": table.c.hours + stmt.excluded.hours, "updated_at": datetime.utcnow()}
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        _report_cache().pop((team_id, player_id), None)
+
+        total = self.db.query(ScoutingEffort.hours).filter(
+            ScoutingEffort.team_id == team_id,
+            ScoutingEffort.player_id == player_id
+        ).scalar()
+        return {"team_id": team_id, "player_id": player_id, "hours": total}
+
+    def get_report(self, team_id: int, player_id: int) -> Optional[Dict[str, any]]:
+        """Get a team's view of a player"""
+        player = self.db.query(Player).filter(Player.id == player_id).first()
+        if not player:
+            return None
+        return self.get_reports(team_id, [player])[0]
+
+    def get_reports(self, team_id: int, players: List[Player]) -> List[Dict[str, any]]:
+        """Get a team's view of several players, generating reports only for those not cached.
+
+        A team sees its own players exactly. Everyone else is seen through each
+        scout's fixed error for that player, shrunk by the scout's accuracy,
+        specialty and the time the team has invested, then combined across
+        scouts weighted by how much each one can be trusted.
+        """
+        scouts = self.get_team_scouts(team_id)
+        staff = tuple((s.id, s.accuracy, s.specialty) for s in scouts)
+        hours = {
+            row.player_id: row.hours for row in self.db.query(ScoutingEffort.player_id, ScoutingEffort.hours).filter(
+                ScoutingEffort.team_id == team_id,
+                ScoutingEffort.player_id.in_([p.id for p in players])
+            ).all()
+        }
+        groups = {p.code: p.position_group for p in self.db.query(Position).all()}
+
+        cache = _report_cache()
+        reports = []
+        for player in players:
+            key = (team_id, player.id)
+            fingerprint = (staff, hours.get(player.id, 0), player.team_id == team_id, player.updated_at)
+            cached = cache.get(key)
+            if cached and cached[0] == fingerprint:
+                cache.move_to_end(key)
+                reports.append(cached[1])
+                continue
+
+            report = self._build_report(team_id, player, scouts, hours.get(player.id, 0), groups.get(player.position))
+            cache[key] = (fingerprint, report)
+            if len(cache) > REPORT_CACHE_SIZE:
+                cache.popitem(last=False)
+            reports.append(report)
+
+        return reports
+
+    def _build_report(self, team_id: int, player: Player, scouts: List[Scout],
+                      hours: float, position_group: Optional[str]) -> Dict[str, any]:
+        """Generate one report from the deterministic per-scout noise"""
+        true_values = np.array([getattr(player, name) or 50 for name in SCOUTED_ATTRIBUTES], dtype=float)
+        attribute_scale = np.ones(len(SCOUTED_ATTRIBUTES))
+        attribute_scale[SCOUTED_ATTRIBUTES.index("potential")] = POTENTIAL_ERROR_MULTIPLIER
+
+        if player.team_id == team_id or not scouts:
+            error = np.zeros(len(SCOUTED_ATTRIBUTES)) if player.team_id == team_id else BASE_ERROR * attribute_scale
+            estimate = true_values
+        else:
+            effort_factor = 1 / np.sqrt(1 + hours / HOURS_TO_HALVE_ERROR)
+            estimates = []
+            precisions = []
+            for scout in scouts:
+                scout_error = BASE_ERROR * (1.5 - (scout.accuracy or 50) / 100) * effort_factor
+                if scout.specialty and scout.specialty == position_group:
+                    scout_error *= SPECIALTY_ERROR_MULTIPLIER
+                sd = scout_error * attribute_scale
+                estimates.append(true_values + _seeded_noise(team_id, player.id, scout.id) * sd)
+                precisions.append(1 / sd ** 2)
+
+            # Inverse-variance weighting of the scouts' views
+            precisions = np.array(precisions)
+            estimate = (np.array(estimates) * precisions).sum(axis=0) / precisions.sum(axis=0)
+            error = 1 / np.sqrt(precisions.sum(axis=0))
+
+        estimate = np.clip(np.rint(estimate), 1, 99).astype(int)
+        low = np.clip(np.rint(estimate - 1.64 * error), 1, 99).astype(int)
+        high = np.clip(np.rint(estimate + 1.64 * error), 1, 99).astype(int)
+
+        return {
+            "team_id": team_id,
+            "player_id": player.id,
+            "name": f"{player.first_name} {player.last_name}",
+            "position": player.position,
+            "player_team_id": player.team_id,
+            "scouting_hours": hours,
+            "confidence": round(float(1 - min(1.0, error[0] / BASE_ERROR)), 2),
+            "attributes": {
+                name: {"estimate": int(estimate[i]), "low": int(low[i]), "high": int(high[i])}
+                for i, name in enumerate(SCOUTED_ATTRIBUTES)
+            }
+        }
+
+    def get_draft_board(self, team_id: int, year: int, limit: int = 100) -> List[Dict[str, any]]:
+        """A team's own board for a draft class, ordered by its scouted grades"""
+        players = self.db.query(Player).join(
+            DraftProspect, DraftProspect.player_id == Player.id
+        ).filter(
+            DraftProspect.draft_year == year,
+            DraftProspect.is_drafted == False
+        ).order_by(DraftProspect.class_rank).limit(limit).all()
+
+        reports = []
+        for report in self.get_reports(team_id, players):
+            attributes = report["attributes"]
+            grade = board_grade(attributes["overall_rating"]["estimate"], attributes["potential"]["estimate"], False, False)
+            reports.append({**report, "grade": round(grade, 1)})
+        reports.sort(key=lambda x: x["grade"], reverse=True)
+        return reports
+
+    @staticmethod
+    def get_cache_info() -> Dict[str, any]:
+        """Size of the in-memory report cache"""
+        cache = _report_cache()
+        teams = {}
+        for team_id, _ in cache:
+            teams[team_id] = teams.get(team_id, 0) + 1
+        return {"cached_reports": len(cache), "max_reports": REPORT_CACHE_SIZE, "reports_by_team": teams}
+
+    @staticmethod
+    def clear_cache(team_id: Optional[int] = None):
+        """Drop cached reports, for one team or everyone"""
+        cache = _report_cache()
+        if team_id is None:
+            cache.clear()
+            return
+        for key in [key for key in cache if key[0] == team_id]:
+            del cache[key]
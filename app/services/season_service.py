@@ -0,0 +1,212 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from ..database.models import Game, Team, TeamSeasonStat
+from ..services.game_simulation_service import GameSimulationService
+from ..services.injury_service import InjuryService
+from ..services.salary_cap_service import SalaryCapService
+
+REGULAR_SEASON_WEEKS = 17
+PLAYOFF_TEAMS_PER_CONFERENCE = 7
+
+# Playoff rounds are played in the weeks after the regular season
+PLAYOFF_ROUNDS = ["wild_card", "divisional", "conference", "championship"]
+
+class SeasonService:
+    def __init__(self, db: Session, seed: Optional[int] = None):
+        self.db = db
+        self.game_simulation_service = GameSimulationService(db, seed)
+        self.injury_service = InjuryService(db, seed)
+        self.salary_cap_service = SalaryCapService(db)
+
+    def generate_schedule(self, season: int = None) -> Dict[str, any]:
+        """Create the regular season schedule with a rotating round robin"""
+        if season is None:
+            season = self.salary_cap_service.current_year
+
+        if self.db.query(Game).filter(Game.season == season, Game.game_type == "regular").first():
+            return {"error": "Schedule already exists for season"}
+
+        team_ids = [team.id for team in self.db.query(Team).order_by(Team.id).all()]
+        if len(team_ids) % 2:
+            team_ids.append(None)  # Bye slot
+
+        # Circle method: fix the first team and rotate the rest each round,
+        # starting from a different round each season for variety
+        count = len(team_ids)
+        rounds = count - 1
+        offset = season % rounds
+        games = []
+        for week in range(1, REGULAR_SEASON_WEEKS + 1):
+            round_index = (offset + week - 1) % rounds
+            rotation = team_ids[1:]
+            rotation = rotation[round_index:] + rotation[:round_index]
+            order = [team_ids[0]] + rotation
+            for i in range(count // 2):
+                home, away = order[i], order[count - 1 - i]
+                if home is None or away is None:
+                    continue
+                if (week + season + i) % 2:
+                    home, away = away, home
+                games.append({
+                    "season": season,
+                    "week": week,
+                    "game_type": "regular",
+                    "home_team_id": home,
+                    "away_team_id": away,
+                    "home_score": 0,
+                    "away_score": 0,
+                    "is_final": False
+                })
+
+        self.db.execute(Game.__table__.insert(), games)
+        self.db.commit()
+
+        return {"season": season, "weeks": REGULAR_SEASON_WEEKS, "games": len(games)}
+
+    def simulate_week(self, season: int, week: int, process_injuries: bool = True) -> Dict[str, any]:
+        """Simulate every unplayed game in a week, then run the weekly injury report"""
+        games = self.db.query(Game).filter(
+            Game.season == season,
+            Game.week == week,
+            Game.is_final == False
+        ).all()
+
+        results = []
+        for game in games:
+            result = self.game_simulation_service.simulate_game(
+                game.home_team_id, game.away_team_id, game.week,
+                season=season, game_id=game.id, commit=False
+            )
+            results.append({
+                "game_id": result["game_id"],
+                "home_team_id": result["home_team_id"],
+                "away_team_id": result["away_team_id"],
+                "home_score": result["home_score"],
+                "away_score": result["away_score"],
+                "total_plays": result["total_plays"]
+            })
+
+        injuries = None
+        if process_injuries:
+            injuries = self.injury_service.process_week(season, week, commit=False)
+        self.db.commit()
+
+        return {
+            "season": season,
+            "week": week,
+            "games": results,
+            "new_injuries": injuries["new_injuries"] if injuries else 0
+        }
+
+    def simulate_regular_season(self, season: int) -> Dict[str, any]:
+        """Simulate every week of the regular season"""
+        games = 0
+        plays = 0
+        for week in range(1, REGULAR_SEASON_WEEKS + 1):
+            week_result = self.simulate_week(season, week)
+            games += len(week_result["games"])
+            plays += sum(g["total_plays"] for g in week_result["games"])
+        return {"season": season, "games": games, "plays": plays}
+
+    def get_standings(self, season: int) -> Dict[str, List[Dict[str, any]]]:
+        """Get standings by conference from the team season summary rows"""
+        stats = {}
+        for row in self.db.query(TeamSeasonStat).filter(
+            TeamSeasonStat.season == season,
+            TeamSeasonStat.stat.in_(["wins", "losses", "ties", "points_for", "points_against"])
+        ).all():
+            stats.setdefault(row.team_id, {})[row.stat] = row.value
+
+        standings = {}
+        for team in self.db.query(Team).all():
+            record = stats.get(team.id, {})
+            wins, losses, ties = record.get("wins", 0), record.get("losses", 0), record.get("ties", 0)
+            games = wins + losses + ties
+            standings.setdefault(team.conference, []).append({
+                "team_id": team.id,
+                "team_name": f"{team.city} {team.name}",
+                "division": team.division,
+                "wins": wins,
+                "losses": losses,
+                "ties": ties,
+                "win_percentage": round((wins + ties * 0.5) / games, 3) if games else 0.0,
+                "point_differential": record.get("points_for", 0) - record.get("points_against", 0)
+            })
+
+        for teams in standings.values():
+            teams.sort(key=lambda x: (x["win_percentage"], x["point_differential"], -x["team_id"]), reverse=True)
+
+        return standings
+
+    def get_playoff_seeds(self, season: int) -> Dict[str, List[Dict[str, any]]]:
+        """Seed each conference: division winners first, then wild cards"""
+        seeds = {}
+        for conference, teams in self.get_standings(season).items():
+            division_winners = []
+            seen_divisions = set()
+            for team in teams:
+                if team["division"] not in seen_divisions:
+                    seen_divisions.add(team["division"])
+                    division_winners.append(team)
+            wild_cards = [team for team in teams if team not in division_winners]
+            seeded = division_winners + wild_cards
+            seeds[conference] = [
+                {**team, "seed": seed}
+                for seed, team in enumerate(seeded[:PLAYOFF_TEAMS_PER_CONFERENCE], 1)
+            ]
+        return seeds
+
+    def run_playoffs(self, season: int) -> Dict[str, any]:
+        """Simulate the playoff bracket through the championship game"""
+        if self.db.query(Game).filter(Game.season == season, Game.game_type == "playoff").first():
+            return {"error": "Playoffs already played for season"}
+
+        seeds = self.get_playoff_seeds(season)
+        alive = {conference: list(teams) for conference, teams in seeds.items()}
+        rounds = []
+        week = REGULAR_SEASON_WEEKS
+
+        for round_name in PLAYOFF_ROUNDS:
+            week += 1
+            matchups = []
+            if round_name == "championship":
+                finalists = [teams[0] for teams in alive.values() if teams]
+                if len(finalists) == 2:
+                    finalists.sort(key=lambda x: (x["win_percentage"], x["point_differential"]), reverse=True)
+                    matchups.append((None, finalists[0], finalists[1]))
+            else:
+                for conference, teams in alive.items():
+                    teams.sort(key=lambda x: x["seed"])
+                    if round_name == "wild_card" and len(teams) > 1:
+                        # Top seed gets a bye
+                        playing = teams[1:]
+                    else:
+                        playing = teams
+                    for i in range(len(playing) // 2):
+                        matchups.append((conference, playing[i], playing[-1 - i]))
+
+            results = []
+            for conference, home, away in matchups:
+                result = self.game_simulation_service.simulate_game(
+                    home["team_id"], away["team_id"], week,
+                    season=season, game_type="playoff", commit=False
+                )
+                home_won = result["home_score"] > result["away_score"]
+                winner, loser = (home, away) if home_won else (away, home)
+                if conference is not None:
+                    alive[conference].remove(loser)
+                results.append({
+                    "game_id": result["game_id"],
+                    "home_team_id": home["team_id"],
+                    "away_team_id": away["team_id"],
+                    "home_score": result["home_score"],
+                    "away_score": result["away_score"],
+                    "winner_team_id": winner["team_id"]
+                })
+
+            self.injury_service.process_week(season, week, commit=False)
+            self.db.commit()
+            rounds.append({"round": round_name, "week": week, "games": results})
+
+        champion = rounds[-1]["games"][0]["winner_team_id"] if rounds and rounds[-1]["games"] else None
+        return {"season": season, "seeds": seeds, "rounds": rounds, "champion_team_id": champion}
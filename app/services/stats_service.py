@@ -0,0 +1,280 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Dict, List, Optional
+from ..database.models import (
+    Game, Player, Team, PlayerGameStat, TeamGameStat, PlayerSeasonStat,
+    PlayerCareerStat, TeamSeasonStat, TeamCareerStat
+)
+
+# Stats tracked per player per game
+PLAYER_STATS = [
+    "games_played",
+    "pass_attempts", "pass_completions", "passing_yards", "passing_tds", "interceptions_thrown", "sacks_taken",
+    "rush_attempts", "rushing_yards", "rushing_tds", "fumbles_lost",
+    "receptions", "receiving_yards", "receiving_tds",
+    "fg_attempts", "fg_made", "punts", "punt_yards"
+]
+
+# Stats tracked per team per game
+TEAM_STATS = [
+    "games_played", "wins", "losses", "ties", "playoff_wins", "playoff_losses", "points_for", "points_against",
+    "total_yards", "passing_yards", "rushing_yards", "turnovers", "first_downs"
+]
+
+class StatsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_game(self, game: Game, player_lines: Dict[int, Dict[str, any]],
+                    team_lines: Dict[int, Dict[str, int]], commit: bool = True) -> Dict[str, any]:
+        """Record a finished game's box score and roll it into season and career totals.
+
+        player_lines maps player_id -> {"team_id", "position", "stats": {stat: value}}
+        and team_lines maps team_id -> {stat: value}. Recording the same game id again
+        only applies the difference against the previously stored lines, so
+        re-simulated games never double count.
+        """
+        old_player_values = {
+            (row.player_id, row.stat): (row.value, row.team_id)
+            for row in self.db.query(PlayerGameStat).filter(PlayerGameStat.game_id == game.id).all()
+        }
+        old_team_values = {
+            (row.team_id, row.stat): row.value
+            for row in self.db.query(TeamGameStat).filter(TeamGameStat.game_id == game.id).all()
+        }
+
+        new_player_values = {}
+        player_info = {}
+        for player_id, line in player_lines.items():
+            player_info[player_id] = (line["team_id"], line.get("position"))
+            for stat, value in line["stats"].items():
+                if value:
+                    new_player_values[(player_id, stat)] = value
+
+        new_team_values = {
+            (team_id, stat): value
+            for team_id, stats in team_lines.items()
+            for stat, value in stats.items()
+            if value
+        }
+
+        # Work out what actually changed since the last time this game was recorded
+        player_deltas = []
+        for key in set(old_player_values) | set(new_player_values):
+            old_value, old_team_id = old_player_values.get(key, (0, None))
+            delta = new_player_values.get(key, 0) - old_value
+            if delta:
+                player_id, stat = key
+                team_id, position = player_info.get(player_id, (old_team_id, None))
+                player_deltas.append({
+                    "player_id": player_id,
+                    "team_id": team_id,
+                    "position": position,
+                    "stat": stat,
+                    "value": delta
+                })
+
+        team_deltas = []
+        for key in set(old_team_values) | set(new_team_values):
+            delta = new_team_values.get(key, 0) - old_team_values.get(key, 0)
+            if delta:
+                team_id, stat = key
+                team_deltas.append({"team_id": team_id, "stat": stat, "value": delta})
+
+        # Replace the stored game lines
+        self.db.query(PlayerGameStat).filter(PlayerGameStat.game_id == game.id).delete(synchronize_session=False)
+        self.db.query(TeamGameStat).filter(TeamGameStat.game_id == game.id).delete(synchronize_session=False)
+
+        if new_player_values:
+            self.db.execute(PlayerGameStat.__table__.insert(), [
+                {
+                    "game_id": game.id,
+                    "player_id": player_id,
+                    "team_id": player_info[player_id][0],
+                    "season": game.season,
+                    "stat": stat,
+                    "value": value
+                }
+                for (player_id, stat), value in new_player_values.items()
+            ])
+        if new_team_values:
+            self.db.execute(TeamGameStat.__table__.insert(), [
+                {"game_id": game.id, "team_id": team_id, "season": game.season, "stat": stat, "value": value}
+                for (team_id, stat), value in new_team_values.items()
+            ])
+
+        self._apply_player_deltas(game.season, player_deltas)
+        self._apply_team_deltas(game.season, team_deltas)
+
+        if commit:
+            self.db.commit()
+
+        return {
+            "game_id": game.id,
+            "player_rows_changed": len(player_deltas),
+            "team_rows_changed": len(team_deltas)
+        }
+
+    def _apply_player_deltas(self, season: int, deltas: List[Dict[str, any]]):
+        """Upsert player stat deltas into the season and career summary tables"""
+        if not deltas:
+            return
+
+        season_table = PlayerSeasonStat.__table__
+        season_stmt = sqlite_insert(season_table)
+        season_stmt = season_stmt.on_conflict_do_update(
+            index_elements=["player_id", "season", "stat"],
+            set_={
+                "value": season_table.c.value + season_stmt.excluded.value,
+                "team_id": func.coalesce(season_stmt.excluded.team_id, season_table.c.team_id),
+                "position": func.coalesce(season_stmt.excluded.position, season_table.c.position)
+            }
+        )
+        self.db.execute(season_stmt, [{**delta, "season": season} for delta in deltas])
+
+        career_table = PlayerCareerStat.__table__
+        career_stmt = sqlite_insert(career_table)
+        career_stmt = career_stmt.on_conflict_do_update(
+            index_elements=["player_id", "stat"],
+            set_={
+                "value": career_table.c.value + career_stmt.excluded.value,
+                "position": func.coalesce(career_stmt.excluded.position, career_table.c.position)
+            }
+        )
+        self.db.execute(career_stmt, [
+            {"player_id": d["player_id"], "position": d["position"], "stat": d["stat"], "value": d["value"]}
+            for d in deltas
+        ])
+
+    def _apply_team_deltas(self, season: int, deltas: List[Dict[str, any]]):
+        """Upsert team stat deltas into the season and franchise summary tables"""
+        if not deltas:
+            return
+
+        season_table = TeamSeasonStat.__table__
+        season_stmt = sqlite_insert(season_table)
+        season_stmt = season_stmt.on_conflict_do_update(
+            index_elements=["team_id", "season", "stat"],
+            set_={"value": season_table.c.value + season_stmt.excluded.value}
+        )
+        self.db.execute(season_stmt, [{**delta, "season": season} for delta in deltas])
+
+        career_table = TeamCareerStat.__table__
+        career_stmt = sqlite_insert(career_table)
+        career_stmt = career_stmt.on_conflict_do_update(
+            index_elements=["team_id", "stat"],
+            set_={"value": career_table.c.value + career_stmt.excluded.value}
+        )
+        self.db.execute(career_stmt, deltas)
+
+    def get_player_leaders(self, stat: str, season: Optional[int] = None,
+                           position: Optional[str] = None, limit: int = 10) -> List[Dict[str, any]]:
+        """Get league leaders for a stat, for one season or across careers"""
+        summary = PlayerSeasonStat if season is not None else PlayerCareerStat
+
+        query = self.db.query(
+            summary.player_id, summary.position, summary.value,
+            Player.first_name, Player.last_name, Player.team_id
+        ).join(Player, Player.id == summary.player_id).filter(summary.stat == stat)
+
+        if season is not None:
+            query = query.filter(PlayerSeasonStat.season == season)
+        if position:
+            query = query.filter(summary.position == position.upper())
+
+        rows = query.order_by(summary.value.desc()).limit(limit).all()
+
+        return [
+            {
+                "rank": rank,
+                "player_id": row.player_id,
+                "name": f"{row.first_name} {row.last_name}",
+                "position": row.position,
+                "team_id": row.team_id,
+                "value": row.value
+            }
+            for rank, row in enumerate(rows, 1)
+        ]
+
+    def get_team_leaders(self, stat: str, season: int, limit: int = 32) -> List[Dict[str, any]]:
+        """Get team rankings for a stat in a season"""
+        rows = self.db.query(
+            TeamSeasonStat.team_id, TeamSeasonStat.value, Team.city, Team.name
+        ).join(Team, Team.id == TeamSeasonStat.team_id).filter(
+            TeamSeasonStat.season == season,
+            TeamSeasonStat.stat == stat
+        ).order_by(TeamSeasonStat.value.desc()).limit(limit).all()
+
+        return [
+            {
+                "rank": rank,
+                "team_id": row.team_id,
+                "team_name": f"{row.city} {row.name}",
+                "value": row.value
+            }
+            for rank, row in enumerate(rows, 1)
+        ]
+
+    def get_player_stats(self, player_id: int) -> Dict[str, any]:
+        """Get season-by-season and career stat lines for a player"""
+        seasons = {}
+        for row in self.db.query(PlayerSeasonStat).filter(PlayerSeasonStat.player_id == player_id).all():
+            season = seasons.setdefault(row.season, {"season": row.season, "team_id": row.team_id, "stats": {}})
+            season["stats"][row.stat] = row.value
+
+        career = {
+            row.stat: row.value
+            for row in self.db.query(PlayerCareerStat).filter(PlayerCareerStat.player_id == player_id).all()
+        }
+
+        return {
+            "player_id": player_id,
+            "seasons": [seasons[season] for season in sorted(seasons)],
+            "career": career
+        }
+
+    def get_team_stats(self, team_id: int, season: Optional[int] = None) -> Dict[str, any]:
+        """Get a team's season totals (or franchise totals when no season is given)"""
+        if season is None:
+            rows = self.db.query(TeamCareerStat).filter(TeamCareerStat.team_id == team_id).all()
+        else:
+            rows = self.db.query(TeamSeasonStat).filter(
+                TeamSeasonStat.team_id == team_id,
+                TeamSeasonStat.season == season
+            ).all()
+
+        return {
+            "team_id": team_id,
+            "season": season,
+            "stats": {row.stat: row.value for row in rows}
+        }
+
+    def get_game_box_score(self, game_id: int) -> Optional[Dict[str, any]]:
+        """Get the stored box score for a game"""
+        game = self.db.query(Game).filter(Game.id == game_id).first()
+        if not game:
+            return None
+
+        teams = {}
+        for row in self.db.query(TeamGameStat).filter(TeamGameStat.game_id == game_id).all():
+            teams.setdefault(row.team_id, {})[row.stat] = row.value
+
+        players = {}
+        for row in self.db.query(PlayerGameStat).filter(PlayerGameStat.game_id == game_id).all():
+            line = players.setdefault(row.player_id, {"player_id": row.player_id, "team_id": row.team_id, "stats": {}})
+            line["stats"][row.stat] = row.value
+
+        return {
+            "game_id": game.id,
+            "season": game.season,
+            "week": game.week,
+            "game_type": game.game_type,
+            "home_team_id": game.home_team_id,
+            "away_team_id": game.away_team_id,
+            "home_score": game.home_score,
+            "away_score": game.away_score,
+            "is_final": game.is_final,
+            "teams": teams,
+            "players": list(players.values())
+        }
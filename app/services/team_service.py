@@ -1,5 +1,7 @@
 from sqlalchemy.orm import Session
+from typing import Dict, Optional
 from ..database.models import Team, Player, Contract
+from .salary_cap_service import SalaryCapService
 
 class TeamService:
     def __init__(self, db: Session):
@@ -42,3 +44,44 @@ class TeamService:
     def get_team_by_abbreviation(self, abbreviation: str) -> Team:
         """Get team by abbreviation"""
         return self.db.query(Team).filter(Team.abbreviation == abbreviation).first()
+    
+    def get_team_dashboard(self, team_id: int, status: str = "active") -> Optional[Dict[str, any]]:
+        """Team overview, roster and salary cap in one payload
+        
+        The team, its players and its contracts are each loaded once and every
+        section is built from them, instead of three endpoints repeating the
+        team lookup and running their own count and contract queries. The
+        roster is left as Player objects for the response model to map.
+        """
+        team = self.get_team_by_id(team_id)
+        if not team:
+            return None
+        
+        players = self.db.query(Player).filter(Player.team_id == team_id).all()
+        contracts = self.db.query(Contract).filter(Contract.team_id == team_id).all()
+        
+        roster = [player for player in players if player.roster_status == status]
+        active_count = sum(1 for player in players if player.roster_status == "active")
+        salary_cap_used = sum(contract.year_1_salary for contract in contracts if contract.is_active)
+        cap_info = SalaryCapService(self.db).calculate_team_salary_cap(team_id, team_contracts=contracts)
+        
+        return {
+            "team": {
+                "id": team.id,
+                "name": team.name,
+                "city": team.city,
+                "abbreviation": team.abbreviation,
+                "conference": team.conference,
+                "division": team.division,
+                "stadium": team.stadium_name,
+                "capacity": team.capacity,
+                "colors": {
+                    "primary": team.primary_color,
+                    "secondary": team.secondary_color
+                },
+                "roster_count": active_count,
+                "salary_cap_used": salary_cap_used
+            },
+            "roster": roster,
+            "salary_cap": cap_info
+        }
@@ -0,0 +1,328 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from itertools import combinations
+from typing import Dict, List, Optional
+from ..database.models import Player, Position, Contract
+from ..services.salary_cap_service import SalaryCapService
+from ..services.player_evaluation import PlayerEvaluationService, TRADE_POSITION_VALUES
+from ..services.analytics_service import AnalyticsService
+from ..services.draft_service import position_need
+import heapq
+import numpy as np
+import time
+
+# Most valuable players per team considered for packages
+TRADE_POOL_SIZE = 16
+
+# Package sizes: (players the team gives, players it receives)
+MAX_PLAYERS_GIVEN = 3
+MAX_PLAYERS_RECEIVED = 3
+MAX_PLAYERS_IN_TRADE = 5
+
+# Largest value gap either side accepts, as a share of the bigger package
+DEFAULT_VALUE_TOLERANCE = 0.15
+
+# Score lost per unit of relative value imbalance
+IMBALANCE_PENALTY = 1.0
+
+class TradeService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.salary_cap_service = SalaryCapService(db)
+        self.analytics_service = AnalyticsService(db)
+
+    def load_trade_snapshot(self) -> Dict[str, any]:
+        """Load every active player's trade value, cap hit and depth chart slot as arrays"""
+        cap_hit = self.salary_cap_service.current_cap_hit()
+        rows = self.db.execute(
+            select(
+                Player.id, Player.team_id, Player.position, Player.first_name, Player.last_name,
+                Player.overall_rating, Player.age, Player.years_pro, cap_hit
+            )
+            .outerjoin(Contract, (Contract.player_id == Player.id) & (Contract.is_active == True))
+            .where(Player.team_id != None, Player.roster_status == "active")
+        ).all()
+
+        positions = {p.code: p.typical_roster for p in self.db.query(Position).all()}
+
+        season = self.analytics_service.get_latest_season()
+        analytics = self.analytics_service.get_season_analytics(season) if season is not None else None
+        production = analytics["players"] if analytics else {}
+
+        overall = np.array([row.overall_rating or 50 for row in rows], dtype=float)
+        values = PlayerEvaluationService.calculate_trade_value_batch(
+            overall,
+            np.array([row.age or 25 for row in rows], dtype=float),
+            np.array([row.years_pro or 0 for row in rows], dtype=float),
+            np.array([TRADE_POSITION_VALUES.get(row.position, 1.0) for row in rows]),
+            np.array([production[row.id]["war"] if row.id in production else np.nan for row in rows])
+        )
+
+        depth_charts = {}
+        for row in rows:
+            depth_charts.setdefault((row.team_id, row.position), []).append(row.overall_rating or 50)
+        for ratings in depth_charts.values():
+            ratings.sort(reverse=True)
+
+        return {
+            "rows": rows,
+            "team_ids": np.array([row.team_id for row in rows]),
+            "values": values,
+            "cap_hits": np.array([int(row[-1] or 0) for row in rows], dtype=np.int64),
+            "depth_charts": depth_charts,
+            "typical_roster": positions,
+            "cap_totals": self.salary_cap_service.calculate_team_cap_totals()
+        }
+
+    def _need_change(self, snapshot: Dict[str, any], team_id: int, position: str,
+                     rating: int, adding: bool) -> float:
+        """How much a team's need at a position drops (positive) by adding or losing one player"""
+        ratings = snapshot["depth_charts"].get((team_id, position), [])
+        typical = snapshot["typical_roster"].get(position)
+        before = position_need(ratings, typical)
+        if adding:
+            after_ratings = sorted(ratings + [rating], reverse=True)
+        else:
+            after_ratings = list(ratings)
+            if rating in after_ratings:
+                after_ratings.remove(rating)
+        return before - position_need(after_ratings, typical)
+
+    def _player_need_changes(self, snapshot: Dict[str, any], team_id: int,
+                             indices: np.ndarray, adding: bool) -> np.ndarray:
+        """_need_change for each player index, with a trailing 0 for the empty package slot"""
+        rows = snapshot["rows"]
+        changes = [
+            self._need_change(snapshot, team_id, rows[i].position, rows[i].overall_rating or 50, adding)
+            for i in indices
+        ]
+        return np.array(changes + [0.0])
+
+    def _package_need_change(self, snapshot: Dict[str, any], team_id: int,
+                             incoming: List[int], outgoing: List[int]) -> float:
+        """Total need reduction for a team receiving and sending players"""
+        return float(
+            self._player_need_changes(snapshot, team_id, incoming, True).sum()
+            + self._player_need_changes(snapshot, team_id, outgoing, False).sum()
+        )
+
+    def _team_pool(self, snapshot: Dict[str, any], team_id: int, required: Optional[int] = None) -> np.ndarray:
+        """Indices of a team's most valuable players, always including a required player"""
+        members = np.flatnonzero(snapshot["team_ids"] == team_id)
+        members = members[np.argsort(-snapshot["values"][members], kind="stable")][:TRADE_POOL_SIZE]
+        if required is not None and required not in members:
+            members = np.append(members[:TRADE_POOL_SIZE - 1], required)
+        return members
+
+    @staticmethod
+    def _sparse_table(array: np.ndarray, combine) -> List[np.ndarray]:
+        """Sparse table for O(1) range min/max queries over a fixed array"""
+        levels = [array]
+        width = 1
+        while width * 2 <= len(array):
+            previous = levels[-1]
+            levels.append(combine(previous[:-width], previous[width:]))
+            width *= 2
+        return levels
+
+    @staticmethod
+    def _range_query(levels: List[np.ndarray], lows: np.ndarray, highs: np.ndarray, combine, empty: float) -> np.ndarray:
+        """Vectorized min/max over array[low:high] for every (low, high) pair"""
+        lengths = highs - lows
+        result = np.full(len(lows), empty)
+        valid = lengths > 0
+        if not valid.any():
+            return result
+        level = np.zeros(len(lows), dtype=int)
+        level[valid] = np.floor(np.log2(lengths[valid])).astype(int)
+        for k in np.unique(level[valid]):
+            rows = valid & (level == k)
+            table = levels[k]
+            result[rows] = combine(table[lows[rows]], table[highs[rows] - (1 << k)])
+        return result
+
+    @staticmethod
+    def _packages(pool_size: int, max_size: int) -> np.ndarray:
+        """Every package of 1..max_size pool members, padded with pool_size (an empty slot)"""
+        packages = []
+        for size in range(1, max_size + 1):
+            for combo in combinations(range(pool_size), size):
+                packages.append(list(combo) + [pool_size] * (max_size - size))
+        return np.array(packages, dtype=int).reshape(-1, max_size)
+
+    def find_trades(self, team_id: int, target_player_id: Optional[int] = None,
+                    target_position: Optional[str] = None, limit: int = 10,
+                    value_tolerance: float = DEFAULT_VALUE_TOLERANCE) -> Dict[str, any]:
+        """Search 1-for-1 through 3-for-2 packages with every other team.
+
+        Proposals keep the two sides' trade values within the tolerance, leave
+        both teams under the cap and lower both teams' positional needs. Each
+        team's packages are precomputed as value, cap and need arrays; the
+        other side's packages are then scanned in order of their best possible
+        score, so whole partners and packages are skipped (branch and bound)
+        once they cannot beat the current top proposals.
+        """
+        started = time.perf_counter()
+        snapshot = self.load_trade_snapshot()
+        rows = snapshot["rows"]
+        index_by_id = {row.id: i for i, row in enumerate(rows)}
+
+        target_index = None
+        if target_player_id is not None:
+            target_index = index_by_id.get(target_player_id)
+            if target_index is None:
+                return {"error": "Target player is not on an active roster"}
+            if rows[target_index].team_id == team_id:
+                return {"error": "Target player is already on this team"}
+        if target_position:
+            target_position = target_position.upper()
+
+        values = snapshot["values"].astype(float)
+        cap_hits = snapshot["cap_hits"]
+        cap_totals = snapshot["cap_totals"]
+        if team_id not in cap_totals:
+            return {"error": "Team not found"}
+
+        # Our side: packages we could give, fixed for every partner
+        our_pool = self._team_pool(snapshot, team_id)
+        if not len(our_pool):
+            return {"error": "Team has no tradeable players"}
+        our_packages = self._packages(len(our_pool), MAX_PLAYERS_GIVEN)
+        our_values = np.append(values[our_pool], 0)[our_packages].sum(axis=1)
+        our_caps = np.append(cap_hits[our_pool], 0)[our_packages].sum(axis=1)
+        our_losses = -self._player_need_changes(snapshot, team_id, our_pool, False)[our_packages].sum(axis=1)
+        our_sizes = (our_packages < len(our_pool)).sum(axis=1)
+
+        order = np.argsort(our_values, kind="stable")
+        our_packages, our_values, our_caps, our_losses, our_sizes = (
+            our_packages[order], our_values[order], our_caps[order], our_losses[order], our_sizes[order]
+        )
+        our_loss_table = self._sparse_table(our_losses, np.minimum)
+        our_space = cap_totals[team_id]["cap_space"]
+
+        partner_ids = [rows[target_index].team_id] if target_index is not None else [
+            partner for partner in cap_totals if partner != team_id
+        ]
+
+        # Score every partner package's upper bound first
+        candidates = []
+        partners = {}
+        for partner_id in partner_ids:
+            pool = self._team_pool(snapshot, partner_id, target_index)
+            if not len(pool):
+                continue
+            packages = self._packages(len(pool), MAX_PLAYERS_RECEIVED)
+            their_values = np.append(values[pool], 0)[packages].sum(axis=1)
+            their_caps = np.append(cap_hits[pool], 0)[packages].sum(axis=1)
+            their_losses = -self._player_need_changes(snapshot, partner_id, pool, False)[packages].sum(axis=1)
+            our_gains = self._player_need_changes(snapshot, team_id, pool, True)[packages].sum(axis=1)
+            # Partner's gain from each of our (sorted) packages
+            their_gains = self._player_need_changes(snapshot, partner_id, our_pool, True)[our_packages].sum(axis=1)
+            sizes = (packages < len(pool)).sum(axis=1)
+
+            # Tolerance window into our value-sorted packages for each of theirs; the
+            # bound uses the best need effects reachable inside that window
+            lows = np.searchsorted(our_values, their_values * (1 - value_tolerance), side="left")
+            highs = np.searchsorted(our_values, their_values / (1 - value_tolerance), side="right")
+            keep = highs > lows
+            min_our_loss = self._range_query(our_loss_table, lows, highs, np.minimum, np.inf)
+            max_their_gain = self._range_query(self._sparse_table(their_gains, np.maximum), lows, highs, np.maximum, -np.inf)
+            keep &= our_gains - min_our_loss > 0
+            if target_index is not None:
+                keep &= (packages == np.flatnonzero(pool == target_index)[0]).any(axis=1)
+            if target_position:
+                in_position = np.append([rows[i].position == target_position for i in pool], False)
+                keep &= in_position[packages].any(axis=1)
+
+            bounds = (our_gains - min_our_loss) + (max_their_gain - their_losses)
+            keep &= bounds > 0
+            partners[partner_id] = {
+                "pool": pool, "packages": packages, "their_gains": their_gains,
+                "space": cap_totals[partner_id]["cap_space"]
+            }
+            for i in np.flatnonzero(keep):
+                candidates.append((
+                    -bounds[i], partner_id, int(i), their_values[i], their_caps[i],
+                    their_losses[i], our_gains[i], sizes[i], lows[i], highs[i]
+                ))
+
+        candidates.sort(key=lambda x: x[0])
+
+        best = []  # Min-heap of (score, tiebreak, proposal)
+        evaluated = 0
+        for negative_bound, partner_id, package, their_value, their_cap, their_loss, our_gain, size, low, high in candidates:
+            if len(best) >= limit and -negative_bound <= best[0][0]:
+                break  # No remaining package can beat the current top proposals
+            evaluated += 1
+            partner = partners[partner_id]
+
+            window = slice(low, high)
+
+            # Cap legality after the swap for both sides
+            cap_ok = (our_space + our_caps[window] - their_cap >= 0) & (partner["space"] + their_cap - our_caps[window] >= 0)
+            size_ok = our_sizes[window] + size <= MAX_PLAYERS_IN_TRADE
+            our_net = our_gain - our_losses[window]
+            their_net = partner["their_gains"][window] - their_loss
+            ok = cap_ok & size_ok & (our_net > 0) & (their_net > 0)
+            if not ok.any():
+                continue
+
+            imbalance = np.abs(our_values[window] - their_value) / np.maximum(our_values[window], their_value)
+            scores = np.where(ok, our_net + their_net - IMBALANCE_PENALTY * imbalance, -np.inf)
+            choice = int(np.argmax(scores))
+            score = float(scores[choice])
+            if len(best) >= limit and score <= best[0][0]:
+                continue
+
+            proposal = (partner_id, package, low + choice)
+            entry = (score, len(candidates) - evaluated, proposal)
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heapreplace(best, entry)
+
+        proposals = []
+        for score, _, (partner_id, package, ours) in sorted(best, reverse=True):
+            partner = partners[partner_id]
+            gives = [int(our_pool[i]) for i in our_packages[ours] if i < len(our_pool)]
+            receives = [int(partner["pool"][i]) for i in partner["packages"][package] if i < len(partner["pool"])]
+            value_given = int(values[gives].sum())
+            value_received = int(values[receives].sum())
+            cap_change = int(cap_hits[receives].sum() - cap_hits[gives].sum())
+            proposals.append({
+                "team_id": team_id,
+                "partner_team_id": partner_id,
+                "team_gives": [self._trade_player(snapshot, i) for i in gives],
+                "team_receives": [self._trade_player(snapshot, i) for i in receives],
+                "value_given": value_given,
+                "value_received": value_received,
+                "value_balance": round(value_received / value_given, 3) if value_given else None,
+                "team_cap_space_after": cap_totals[team_id]["cap_space"] - cap_change,
+                "partner_cap_space_after": partner["space"] + cap_change,
+                "team_need_improvement": round(self._package_need_change(snapshot, team_id, receives, gives), 3),
+                "partner_need_improvement": round(self._package_need_change(snapshot, partner_id, gives, receives), 3),
+                "score": round(score, 3)
+            })
+
+        return {
+            "team_id": team_id,
+            "target_player_id": target_player_id,
+            "target_position": target_position,
+            "partners_searched": len(partners),
+            "packages_considered": len(candidates),
+            "packages_evaluated": evaluated,
+            "proposals": proposals,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def _trade_player(self, snapshot: Dict[str, any], index: int) -> Dict[str, any]:
+        row = snapshot["rows"][index]
+        return {
+            "player_id": row.id,
+            "name": f"{row.first_name} {row.last_name}",
+            "position": row.position,
+            "overall_rating": row.overall_rating,
+            "age": row.age,
+            "trade_value": int(snapshot["values"][index]),
+            "cap_hit": int(snapshot["cap_hits"][index])
+        }
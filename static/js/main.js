@@ -37,14 +37,8 @@ function handleTeamSelection(teamId) {
     
     console.log('Team selected:', teamId);
     
-    // Load team overview
-    loadTeamOverview(teamId);
-    
-    // Load roster summary
-    loadRosterSummary(teamId);
-    
-    // Load salary cap
-    loadSalaryCap(teamId);
+    // Overview, roster summary and salary cap come from one request
+    loadTeamDashboard(teamId);
 }
 
 // API helper functions
@@ -0,0 +1,54 @@
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = tempfile.mkdtemp(prefix="nfl_gm_tests_")
+
+# Point the app at throwaway files before any app module creates its engine
+os.environ["NFL_GM_DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DIR, 'nfl_gm.db')}"
+os.environ["NFL_GM_LEAGUE_DIR"] = os.path.join(TEST_DIR, "leagues")
+os.environ["NFL_GM_SAVE_DIR"] = os.path.join(TEST_DIR, "saves")
+
+# Seed data and static files are read relative to the repository root
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+
+from app.database.connection import current_league, league_pool, session_factory
+from app.services.league_service import LeagueService
+
+def new_league() -> str:
+    """Create a league seeded with the default teams, players and contracts"""
+    league_id = f"test-{uuid.uuid4().hex[:12]}"
+    LeagueService().create_league(league_id)
+    return league_id
+
+@pytest.fixture
+def league():
+    """A fresh league, bound as the current league for the test"""
+    league_id = new_league()
+    token = current_league.set(league_id)
+    yield league_id
+    current_league.reset(token)
+    league_pool.close(league_id)
+
+@pytest.fixture
+def db(league):
+    session = session_factory()()
+    yield session
+    session.close()
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
+
+def pytest_sessionfinish(session, exitstatus):
+    league_pool.close_all()
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
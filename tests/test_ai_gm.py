@@ -0,0 +1,83 @@
+from app.database.models import Contract, JournalEvent, Player
+from app.services.ai_gm_service import AIGMService, PHILOSOPHIES
+
+def add_free_agents(db, count: int, position: str = "QB", rating: int = 70):
+    players = [
+        Player(first_name="Free", last_name=f"Agent{i}", position=position, roster_status="free_agent",
+               overall_rating=rating - i, age=27, years_pro=5)
+        for i in range(count)
+    ]
+    db.add_all(players)
+    db.commit()
+    return [player.id for player in players]
+
+def team_actions(actions, team_id: int):
+    return [(action["type"], action["player_id"]) for action in actions if action["team_id"] == team_id]
+
+def test_planners_react_to_injuries_and_thin_positions(db):
+    free_agents = add_free_agents(db, 3)
+    db.get(Player, 5).injury_status = "season_ending"
+    db.commit()
+    gm = AIGMService(db, seed=1)
+
+    actions = gm.plan_week(gm.build_snapshot(), 2024, 1, workers=1)
+
+    mine = team_actions(actions, 1)
+    assert ("move_to_ir", 5) in mine
+    signing = next(action for action in actions if action["team_id"] == 1 and action["type"] == "sign_free_agent")
+    assert signing["alternatives"][0] == free_agents[0]
+
+def test_parallel_planning_matches_a_single_worker(db):
+    add_free_agents(db, 3)
+    gm = AIGMService(db, seed=1)
+    snapshot = gm.build_snapshot()
+
+    serial = gm.plan_week(snapshot, 2024, 1, workers=1)
+    parallel = gm.plan_week(snapshot, 2024, 1, workers=2)
+
+    key = lambda action: (action["team_id"], action["type"], action["player_id"])
+    assert sorted(serial, key=key) == sorted(parallel, key=key)
+
+def test_user_teams_are_left_alone(db):
+    add_free_agents(db, 3)
+    gm = AIGMService(db, seed=1)
+    assert gm.set_strategy(1, is_user_controlled=True)["is_user_controlled"]
+
+    actions = gm.plan_week(gm.build_snapshot(user_team_id=2), 2024, 1, workers=1)
+
+    assert not team_actions(actions, 1) and not team_actions(actions, 2)
+    assert gm.set_strategy(1, philosophy="tank")["error"].startswith("Unknown philosophy")
+    assert gm.get_strategies()[3].philosophy == PHILOSOPHIES[3 % len(PHILOSOPHIES)]
+
+def test_the_writer_gives_each_free_agent_to_one_team(db):
+    first, second = add_free_agents(db, 2)
+    gm = AIGMService(db, seed=1)
+    signing = {"type": "sign_free_agent", "priority": 50, "contract_id": None,
+               "alternatives": [first, second], "salaries": [2000000, 2000000]}
+    actions = [
+        {**signing, "team_id": team_id, "player_id": first} for team_id in (1, 2, 3)
+    ]
+
+    result = gm.apply_actions(actions, week=0)
+    db.commit()
+
+    # Two players for three teams: the first two in the rotation sign, the third finds nobody left
+    assert (result["actions_applied"], result["actions_rejected"]) == (2, 1)
+    signed = {contract.player_id: contract.team_id for contract in db.query(Contract).filter(
+        Contract.player_id.in_([first, second]), Contract.is_active == True
+    )}
+    assert signed == {first: 1, second: 2}
+    assert db.get(Player, second).team_id == 2
+    assert db.query(JournalEvent).filter(JournalEvent.event_type == "signing").count() == 2
+
+def test_a_week_commits_its_moves(db):
+    add_free_agents(db, 3)
+    db.get(Player, 5).injury_status = "season_ending"
+    db.commit()
+
+    result = AIGMService(db, seed=1).run_week(2024, 1, workers=1)
+
+    assert result["teams_planned"] == 32
+    assert result["applied"]["move_to_ir"] >= 1
+    db.expire_all()
+    assert db.get(Player, 5).roster_status == "injured_reserve"
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from app.database.models import Game, Play, Player
+from app.services.analytics_service import AnalyticsService
+from app.services.player_evaluation import PlayerEvaluationService
+
+SEASON = 2030
+
+def add_plays(db, count: int = 40):
+    """A game where QB 5 (team 1) throws to TE 6 on every play and every fourth scores"""
+    game = Game(season=SEASON, week=1, home_team_id=1, away_team_id=2, is_final=True)
+    db.add(game)
+    db.flush()
+    db.add_all([
+        Play(
+            game_id=game.id, season=SEASON, play_number=number, offense_team_id=1, defense_team_id=2,
+            quarter=1 + number * 4 // count, down=1 + number % 3, distance=10, yardline=75 - number % 50,
+            play_type="pass", passer_id=5, receiver_id=6, is_complete=number % 2 == 0,
+            points=7 if number % 4 == 3 else 0, scoring_team_id=1 if number % 4 == 3 else None
+        )
+        for number in range(count)
+    ])
+    db.commit()
+
+def test_trade_value_reads_only_cached_analytics(db):
+    add_plays(db)
+    evaluation = PlayerEvaluationService(db)
+    player = db.get(Player, 5)
+
+    assert evaluation.get_trade_value(player, SEASON)["war"] is None
+    assert AnalyticsService(db).get_season_analytics(SEASON, cached_only=True) is None
+
+    war = AnalyticsService(db).get_player_war(5, SEASON)["war"]
+    assert evaluation.get_trade_value(player, SEASON)["war"] == war
+
+    # New plays make the cached season stale, so it is not used until recomputed
+    add_plays(db)
+    assert evaluation.get_trade_value(player, SEASON)["war"] is None
+
+def test_epa_credits_scores_and_players(db):
+    add_plays(db)
+    analytics = AnalyticsService(db)
+    plays = analytics.load_season_plays(SEASON)
+    ep_table = analytics.build_expected_points_table(plays)
+    epa = analytics.calculate_epa(plays, ep_table)
+
+    # A touchdown is worth its seven points less what the offense expected from the spot
+    scores = plays["points"] > 0
+    assert np.allclose(epa[scores], 7 - ep_table[analytics._state_index(plays)][scores])
+
+    season = analytics.get_season_analytics(SEASON)
+    assert season["total_plays"] == 40
+    assert season["league_epa_per_play"] == pytest.approx(epa.mean())
+    # The passer is credited every pass, the receiver only the completions
+    assert (season["players"][5]["plays"], season["players"][6]["plays"]) == (40, 20)
+    assert season["players"][5]["epa"] == round(float(epa.sum()), 2)
+    assert (season["teams"][1]["offensive_plays"], season["teams"][2]["offensive_plays"]) == (40, 0)
+
+def test_season_analytics_are_cached_until_the_plays_change(db):
+    add_plays(db)
+    analytics = AnalyticsService(db)
+    first = analytics.get_season_analytics(SEASON)
+    assert analytics.get_season_analytics(SEASON) is first
+
+    add_plays(db)
+    second = analytics.get_season_analytics(SEASON)
+    assert second is not first
+    assert second["total_plays"] == 80
+
+def test_analytics_endpoints(client, league, db):
+    add_plays(db)
+    headers = {"X-League-Id": league}
+
+    table = client.get(f"/api/analytics/season/{SEASON}/expected-points", headers=headers).json()
+    assert len(table["rows"]) == 16 and len(table["rows"][0]["expected_points"]) == 10
+    war = client.get("/api/analytics/player/5", params={"season": SEASON}, headers=headers).json()
+    assert war["plays"] == 40
+    players = client.get(f"/api/analytics/season/{SEASON}/players", params={"position": "TE"}, headers=headers).json()
+    assert [player["player_id"] for player in players] == [6]
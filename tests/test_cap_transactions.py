@@ -0,0 +1,67 @@
+from app.database.models import Contract, JournalEvent, Player
+from app.services.contract_service import ContractService
+
+def contract_state(db, contract_id: int):
+    contract = db.query(Contract).filter(Contract.id == contract_id).one()
+    return contract.year_1_salary, contract.signing_bonus, contract.is_active
+
+def test_failed_operation_rolls_back_the_whole_batch(db):
+    before = {contract_id: contract_state(db, contract_id) for contract_id in (5, 6)}
+
+    result = ContractService(db).execute_transactions([
+        {"type": "restructure", "contract_id": 5, "restructure_amount": 5000000},
+        {"type": "release", "contract_id": 6},
+        {"type": "release", "contract_id": 999}
+    ])
+
+    assert not result["success"]
+    assert result["failed_index"] == 2
+    assert [op["success"] for op in result["results"]] == [True, True, False]
+    db.expire_all()
+    assert {contract_id: contract_state(db, contract_id) for contract_id in (5, 6)} == before
+    assert db.query(JournalEvent).filter(JournalEvent.event_type != "cap_snapshot").count() == 0
+
+def test_missing_fields_fail_before_anything_is_applied(db):
+    result = ContractService(db).execute_transactions([
+        {"type": "release", "contract_id": 6},
+        {"type": "restructure", "contract_id": 5}
+    ])
+
+    assert result["failed_index"] == 1
+    assert result["results"][1]["result"]["error"] == "Missing restructure_amount"
+    db.expire_all()
+    assert contract_state(db, 6)[2]
+
+def test_successful_batch_commits_every_operation(db):
+    result = ContractService(db).execute_transactions([
+        {"type": "restructure", "contract_id": 5, "restructure_amount": 5000000},
+        {"type": "release", "contract_id": 6}
+    ])
+
+    assert result["success"]
+    assert [cap["team_id"] for cap in result["cap"]] == [1]
+    db.expire_all()
+    assert contract_state(db, 5) == (25000000, 190000000, True)
+    assert not contract_state(db, 6)[2]
+    events = db.query(JournalEvent).filter(JournalEvent.event_type != "cap_snapshot").order_by(JournalEvent.id)
+    assert [event.event_type for event in events] == ["restructure", "roster_move", "release"]
+    assert db.get(Player, 6).roster_status == "free_agent"
+
+def test_extension_decisions_are_reproducible_from_the_seed(db):
+    # An offer near market value makes the decision a real draw; the trailing bad
+    # release rolls every run back, whichever way the player decided
+    batch = [
+        {"type": "extend", "player_id": 7, "team_id": 2, "base_salary": 150000000, "years": 2},
+        {"type": "release", "contract_id": 999}
+    ]
+    decisions = {}
+    for seed in range(20):
+        runs = [ContractService(db, seed).execute_transactions(batch) for _ in range(2)]
+        assert [run["seed"] for run in runs] == [seed, seed]
+        assert runs[0]["results"] == runs[1]["results"]
+        decisions[seed] = runs[0]["results"][0]["success"]
+    assert set(decisions.values()) == {True, False}
+
+    unseeded = ContractService(db).execute_transactions(batch)
+    replay = ContractService(db, unseeded["seed"]).execute_transactions(batch)
+    assert replay["results"] == unseeded["results"]
@@ -0,0 +1,91 @@
+from datetime import datetime
+from app.database.models import CompensatoryPick, Contract, FreeAgentSigning, Player, PlayerSeasonStat
+from app.services.compensatory_pick_service import CompensatoryPickService, MAX_PICKS_PER_TEAM
+
+YEAR = 2024
+MILLION = 1000000
+
+def sign(db, team_id: int, former_team_id, salary: float, years_pro: int = 5, games=None) -> int:
+    player = Player(first_name="Free", last_name=f"Agent{salary}", position="WR", years_pro=years_pro)
+    db.add(player)
+    db.flush()
+    db.add(FreeAgentSigning(year=YEAR, player_id=player.id, team_id=team_id, former_team_id=former_team_id,
+                            average_salary=int(salary * MILLION), years=3, day=1))
+    if games is not None:
+        db.add(PlayerSeasonStat(player_id=player.id, season=YEAR - 1, stat="games_played", value=games))
+    return player.id
+
+def fill_league(db):
+    """Contracts averaging $1M-$92M a year, so a salary's round follows from how many deals top it"""
+    db.add_all([
+        Contract(player_id=1, team_id=13, years=1, total_value=salary * MILLION, is_active=True,
+                 start_date=datetime(2024, 3, 1), end_date=datetime(2025, 3, 1))
+        for salary in range(1, 93)
+    ])
+
+def picks_by_team(result):
+    return [(pick["team_id"], pick["round"], pick["order_in_round"], pick["lost_player_id"]) for pick in result["picks"]]
+
+def test_net_losses_earn_picks_by_round_and_value(db):
+    fill_league(db)
+    top_loss = sign(db, 11, 10, 100)
+    sign(db, 12, 10, 87.5)  # Cancelled by the same-round gain below
+    gain = sign(db, 10, 13, 87.5)
+    # Team 14's later-round gain leaves its loss uncancelled, but it lost no more than it gained
+    sign(db, 15, 14, 85.5)
+    late_gain = sign(db, 14, 16, 80.5)
+    capped = [sign(db, 20, 15, salary) for salary in (101, 102, 103, 104, 105)]
+    played = sign(db, 21, 19, 77, games=17)  # A full season lifts a seventh-rounder into round three
+    sign(db, 22, 17, 100, years_pro=2)
+    sign(db, 23, None, 100)
+    sign(db, 18, 18, 100)
+    db.commit()
+
+    result = CompensatoryPickService(db).calculate(YEAR)
+
+    assert (result["draft_year"], result["qualifying_signings"]) == (YEAR + 1, 11)
+    assert picks_by_team(result) == [
+        (15, 3, 1, capped[4]), (15, 3, 2, capped[3]), (15, 3, 3, capped[2]), (15, 3, 4, capped[1]),
+        (10, 3, 5, top_loss), (19, 3, 6, played), (13, 4, 1, gain), (16, 6, 1, late_gain)
+    ]
+    assert len([pick for pick in result["picks"] if pick["team_id"] == 15]) == MAX_PICKS_PER_TEAM
+    assert result["picks"][5]["value"] == int(77 * MILLION * 1.2)
+    teams = {team["team_id"]: team for team in result["teams"]}
+    assert (teams[10]["qualifying_losses"], teams[10]["qualifying_gains"], teams[10]["uncancelled_losses"]) == (2, 1, 1)
+    assert (teams[14]["qualifying_losses"], teams[14]["uncancelled_losses"]) == (1, 1)
+    assert 14 not in [pick["team_id"] for pick in result["picks"]]
+
+def test_results_are_cached_until_the_signings_change(db):
+    fill_league(db)
+    sign(db, 11, 10, 100)
+    db.commit()
+    compensatory = CompensatoryPickService(db)
+
+    first = compensatory.calculate(YEAR)
+    assert compensatory.calculate(YEAR) is first
+    sign(db, 12, 10, 99)
+    db.commit()
+    assert len(compensatory.calculate(YEAR)["picks"]) == 2
+
+def test_awarding_replaces_the_draft_s_picks(db):
+    fill_league(db)
+    sign(db, 11, 10, 100)
+    sign(db, 12, 10, 99)
+    db.commit()
+    compensatory = CompensatoryPickService(db)
+
+    assert compensatory.award(YEAR)["awarded"] == 2
+    assert compensatory.award(YEAR)["awarded"] == 2
+
+    picks = compensatory.get_picks(YEAR + 1)
+    assert [(pick.team_id, pick.round, pick.order_in_round) for pick in picks] == [(10, 3, 1), (10, 3, 2)]
+    assert db.query(CompensatoryPick).count() == 2
+
+def test_compensatory_endpoints(client, league):
+    headers = {"X-League-Id": league}
+
+    calculated = client.get(f"/api/draft/compensatory/{YEAR}", headers=headers)
+    awarded = client.post(f"/api/draft/compensatory/{YEAR}/award", headers=headers)
+
+    assert calculated.status_code == 200 and calculated.json()["picks"] == []
+    assert awarded.json() == {"draft_year": YEAR + 1, "awarded": 0, "picks": []}
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from app.database.models import CompensatoryPick, Contract, DraftPick, JournalEvent, Player
+from app.services.draft_class_service import DraftClassService
+from app.services.draft_service import DraftService, position_need, simulate_draft, DRAFT_ROUNDS, NEED_WEIGHT
+
+YEAR = 2025
+
+def test_position_need_from_depth_and_starter_quality():
+    assert position_need([], 4) == 1.0
+    assert position_need([90, 85, 80, 80], 4) == 0.0
+    assert 0 < position_need([90], 4) < position_need([60], 4) < 1.0
+
+def test_a_pick_weighs_need_against_the_board():
+    # Two teams, a QB (position 0) graded above a WR (position 1); team 0 badly needs a WR
+    board = {
+        "grades": np.array([80.0, 80.0 - NEED_WEIGHT / 2, 60.0]),
+        "positions": np.array([0, 1, 1]),
+        "needs": np.array([[0.0, 1.0], [0.0, 0.0]]),
+        "order": np.array([0, 1, 0])
+    }
+
+    picks = simulate_draft(board, np.random.default_rng(0))
+
+    assert picks.tolist() == [2, 1, 3]
+
+def test_mock_drafts_are_reproducible_from_the_seed(db):
+    DraftClassService(db, seed=1).generate_class(YEAR, size=300)
+
+    serial = [DraftService(db, seed=9).run_mock_drafts(YEAR, simulations=50, workers=1) for _ in range(2)]
+    assert serial[0]["prospects"] == serial[1]["prospects"]
+    parallel = [DraftService(db, seed=9).run_mock_drafts(YEAR, simulations=200, workers=2) for _ in range(2)]
+    assert parallel[0]["prospects"] == parallel[1]["prospects"]
+
+    prospects = serial[0]["prospects"]
+    assert [prospect["average_pick"] for prospect in prospects] == sorted(p["average_pick"] for p in prospects)
+    for prospect in prospects:
+        assert prospect["earliest_pick"] <= prospect["median_pick"] <= prospect["latest_pick"]
+        assert sum(prospect["round_probabilities"].values()) == pytest.approx(prospect["drafted_probability"], abs=0.01)
+
+def test_compensatory_picks_close_their_round(db):
+    DraftClassService(db, seed=1).generate_class(YEAR, size=300)
+    db.add(CompensatoryPick(team_id=7, draft_year=YEAR, round=3, order_in_round=1, lost_player_id=7))
+    db.commit()
+
+    board = DraftService(db).build_board(YEAR)
+
+    assert len(board["order"]) == 32 * DRAFT_ROUNDS + 1
+    third_round = board["rounds"] == 3
+    assert board["picks_in_round"][third_round].max() == 33
+    assert board["team_ids"][board["order"][third_round][-1]] == 7
+
+def signed_contracts(db, year: int):
+    return db.query(Contract).join(DraftPick, DraftPick.contract_id == Contract.id).filter(DraftPick.draft_year == year).all()
+
+def hold_draft(db, year: int):
+    DraftClassService(db, seed=1).generate_class(year, size=300)
+    return DraftService(db, seed=2).run_draft(year)
+
+def test_the_draft_assigns_every_pick_once(db):
+    draft = hold_draft(db, 2024)
+
+    assert draft["drafted"] == 32 * DRAFT_ROUNDS
+    assert [pick["overall_pick"] for pick in draft["picks"]] == list(range(1, draft["drafted"] + 1))
+    assert len({pick["player_id"] for pick in draft["picks"]}) == draft["drafted"]
+    assert draft["undrafted_free_agents"] == 300 - draft["drafted"]
+    player = db.get(Player, draft["picks"][0]["player_id"])
+    assert (player.team_id, player.roster_status) == (draft["picks"][0]["team_id"], "active")
+    assert "error" in DraftService(db).run_draft(2024)
+
+def test_rookies_sign_within_the_rookie_pool(db):
+    hold_draft(db, 2024)
+
+    result = DraftService(db).sign_draft_class(2024)
+
+    assert result["contracts_signed"] == 32 * DRAFT_ROUNDS
+    assert result["total_rookie_cap_hit"] <= result["league_rookie_pool"] or result["scale_factor"] == 1.0
+    for team in result["teams"]:
+        assert team["rookie_pool_remaining"] == 0
+        assert team["cap_space_before"] - team["cap_space_after"] == team["rookie_cap_hit"]
+    assert db.query(DraftPick).filter(DraftPick.draft_year == 2024, DraftPick.contract_id == None).count() == 0
+    contracts = signed_contracts(db, 2024)
+    assert {(contract.years, contract.rookie_scale_year) for contract in contracts} == {(4, 1)}
+    assert sum(contract.year_1_cap_hit for contract in contracts) == result["total_rookie_cap_hit"]
+    assert db.query(JournalEvent).filter(JournalEvent.event_type == "signing").count() == len(contracts)
+    assert DraftService(db).sign_draft_class(2024) == {"error": "Draft class already signed"}
+
+def test_a_late_class_signs_for_the_years_left(db):
+    hold_draft(db, 2023)
+
+    DraftService(db).sign_draft_class(2023)
+
+    contract = signed_contracts(db, 2023)[0]
+    assert (contract.years, contract.rookie_scale_year, contract.end_date.year) == (3, 2, 2027)
+    assert contract.year_4_salary == 0 and contract.year_3_salary > 0
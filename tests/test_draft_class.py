@@ -0,0 +1,46 @@
+from collections import defaultdict
+from app.database.models import DraftProspect, Player
+from app.services.draft_class_service import DraftClassService, DRAFT_ROUNDS, TEAMS
+
+def test_a_seeded_class_is_reproducible_and_strength_shifts_it(db):
+    first = DraftClassService(db, seed=4).generate_class(2030, size=500, persist=False)
+    second = DraftClassService(db, seed=4).generate_class(2030, size=500, persist=False)
+    for summary in (first, second):
+        summary.pop("elapsed_seconds")
+    assert first == second
+    assert sum(first["position_counts"].values()) == 500
+
+    weak = DraftClassService(db, seed=4).generate_class(2030, size=500, class_strength=-2, persist=False)
+    strong = DraftClassService(db, seed=4).generate_class(2030, size=500, class_strength=2, persist=False)
+    assert strong["average_overall"] > weak["average_overall"]
+
+def test_persisted_class_ranks_every_prospect(db):
+    DraftClassService(db, seed=5).generate_class(2030, size=300)
+
+    rows = db.query(DraftProspect, Player).join(Player, Player.id == DraftProspect.player_id).filter(
+        DraftProspect.draft_year == 2030
+    ).all()
+    assert len(rows) == 300
+    assert sorted(prospect.class_rank for prospect, _ in rows) == list(range(1, 301))
+
+    by_position = defaultdict(list)
+    for prospect, player in rows:
+        assert player.roster_status == "prospect" and player.team_id is None
+        assert player.potential >= min(player.overall_rating + 2, 99)
+        assert prospect.projected_round == min((prospect.class_rank - 1) // TEAMS + 1, DRAFT_ROUNDS + 1)
+        by_position[player.position].append(prospect)
+    # Position ranks count up in consensus order within each position
+    for prospects in by_position.values():
+        prospects.sort(key=lambda prospect: prospect.class_rank)
+        assert [prospect.position_rank for prospect in prospects] == list(range(1, len(prospects) + 1))
+
+def test_draft_class_endpoint_lists_the_board(client, league):
+    headers = {"X-League-Id": league}
+    response = client.post("/api/draft/classes", params={"year": 2030, "size": 100}, headers=headers)
+    assert response.status_code == 200
+
+    board = client.get("/api/draft/classes/2030", params={"limit": 200}, headers=headers).json()
+    assert [prospect["class_rank"] for prospect in board] == list(range(1, 101))
+    quarterbacks = client.get("/api/draft/classes/2030", params={"position": "qb"}, headers=headers).json()
+    assert quarterbacks and {prospect["position"] for prospect in quarterbacks} == {"QB"}
+    assert [prospect["position_rank"] for prospect in quarterbacks] == list(range(1, len(quarterbacks) + 1))
@@ -0,0 +1,64 @@
+import json
+import os
+import pytest
+from app.database.connection import database_path
+from app.database.init_db import init_database
+from app.dynasty import DynastyRunner
+
+@pytest.fixture
+def runner(tmp_path):
+    """A runner over the app database, seeded like a new league"""
+    init_database()
+    return DynastyRunner(
+        database_path=database_path(), checkpoint_dir=str(tmp_path / "checkpoints"),
+        checkpoint_every=2, metrics_file=str(tmp_path / "metrics.jsonl"), seed=7, keep_checkpoints=2
+    )
+
+def fake_seasons(runner, monkeypatch):
+    """Replace the simulation with numbered seasons, so the loop itself is what runs"""
+    played = []
+
+    def run_season():
+        season = runner.current_season() + len(played)
+        played.append(season)
+        return {"season": season, "games": 0, "plays": 0, "seconds": 0.0}
+    monkeypatch.setattr(runner, "run_season", run_season)
+    return played
+
+def test_checkpoints_follow_the_cadence_and_keep_the_newest(runner, monkeypatch):
+    played = fake_seasons(runner, monkeypatch)
+
+    runner.run(5)
+
+    assert len(played) == 5
+    snapshots = sorted(name for name in os.listdir(runner.checkpoint_dir) if name.endswith(".db"))
+    # Seasons 2 and 4 by cadence and the last one, of which the newest two are kept
+    assert snapshots == [f"season_{played[3]}.db", f"season_{played[4]}.db"]
+    with open(runner.state_file) as f:
+        state = json.load(f)
+    assert (state["completed_seasons"], state["target_seasons"], state["last_season"]) == (5, 5, played[4])
+    with open(runner.metrics_file) as f:
+        assert [json.loads(line)["completed_seasons"] for line in f] == [1, 2, 3, 4, 5]
+
+def test_resume_continues_from_the_latest_checkpoint(runner, monkeypatch):
+    played = fake_seasons(runner, monkeypatch)
+    runner.run(2)
+    assert len(played) == 2
+
+    runner.run(3, resume=True)
+    assert len(played) == 3
+
+    # A finished run resumes to nothing left to do
+    runner.run(2, resume=True)
+    assert len(played) == 3
+
+def test_a_season_plays_through_every_stage(runner):
+    before = runner.current_season()
+
+    metrics = runner.run_season()
+
+    assert metrics["season"] == before
+    assert runner.current_season() == before + 1
+    assert metrics["games"] > 0 and metrics["plays"] > 0 and metrics["champion_team_id"]
+    assert metrics["drafted"] > 0
+    assert set(metrics["stage_seconds"]) == {"schedule", "regular_season", "playoffs", "rollover", "draft", "free_agency"}
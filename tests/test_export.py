@@ -0,0 +1,69 @@
+import csv
+import io
+import orjson
+import pytest
+from app.database.models import Contract, Player, SalaryCap
+from app.services.export_service import ExportService, EXPORT_TABLES
+from app.services.import_service import ImportService
+
+def export(db, table: str, format: str = "ndjson", chunk_size: int = 3, **filters) -> bytes:
+    return b"".join(ExportService(db, chunk_size).export(table, format, filters))
+
+def test_exports_stream_every_row_a_chunk_at_a_time(db):
+    chunks = list(ExportService(db, chunk_size=3).export("players", "ndjson"))
+
+    assert len(chunks) == 3
+    rows = [orjson.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [row["id"] for row in rows] == [player.id for player in db.query(Player).order_by(Player.id)]
+    assert list(rows[0]) == EXPORT_TABLES["players"].c.keys()
+
+    table = list(csv.reader(io.StringIO(export(db, "players", "csv").decode())))
+    assert table[0] == EXPORT_TABLES["players"].c.keys()
+    assert [int(row[0]) for row in table[1:]] == [row["id"] for row in rows]
+
+def test_filters_pick_the_matching_column(db):
+    contracts = [orjson.loads(line) for line in export(db, "contracts", team_id=1).splitlines()]
+    assert sorted(row["player_id"] for row in contracts) == [5, 6]
+
+    caps = [orjson.loads(line) for line in export(db, "salary_caps", season=2024).splitlines()]
+    assert [row["year"] for row in caps] == [2024] * db.query(SalaryCap).filter(SalaryCap.year == 2024).count()
+
+def test_parquet_writes_a_row_group_per_chunk(db):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    parquet = pq.ParquetFile(io.BytesIO(export(db, "players", "parquet")))
+
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("id").to_pylist() == [player.id for player in db.query(Player).order_by(Player.id)]
+
+def test_bad_exports_fail_before_streaming(db, client, league):
+    for table, format, filters in [("teams", "csv", {}), ("players", "xml", {}), ("players", "csv", {"season": 2024})]:
+        with pytest.raises(ValueError):
+            ExportService.check_export(table, format, filters)
+    response = client.get("/api/export/players", params={"season": 2024}, headers={"X-League-Id": league})
+    assert response.status_code == 400
+
+def test_the_endpoint_sends_a_download(client, league, db):
+    response = client.get("/api/export/players", params={"format": "ndjson", "chunk_size": 2}, headers={"X-League-Id": league})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="players.ndjson"'
+    assert response.content == export(db, "players")
+
+@pytest.mark.parametrize("format", ["ndjson", "csv"])
+def test_an_export_imports_back_unchanged(db, format):
+    players, contracts = export(db, "players", format), export(db, "contracts", format)
+    for player in db.query(Player):
+        player.age += 1
+    db.get(Contract, 5).year_1_salary = 1
+    db.commit()
+
+    player_report = ImportService(db).import_rows("players", io.BytesIO(players), format)
+    contract_report = ImportService(db).import_rows("contracts", io.BytesIO(contracts), format)
+
+    assert (player_report["updated"], player_report["rejected"]) == (8, 0)
+    assert (contract_report["updated"], contract_report["rejected"]) == (8, 0)
+    db.expire_all()
+    assert export(db, "players", format) == players
+    assert export(db, "contracts", format) == contracts
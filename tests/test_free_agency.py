@@ -0,0 +1,65 @@
+from datetime import datetime
+import numpy as np
+from app.database.models import Contract, FreeAgentSigning, Player
+from app.services.free_agency_service import FreeAgencyService, run_market, VETERAN_MINIMUM_SALARY
+
+def synthetic_market(seed: int = 0, teams: int = 4, players: int = 40):
+    rng = np.random.default_rng(seed)
+    return {
+        "market_value": rng.integers(2000000, 20000000, players).astype(float),
+        "work_ethic": rng.integers(30, 100, players),
+        "positions": rng.integers(0, 5, players),
+        "needs": rng.random((teams, 5)),
+        "cap_space": rng.integers(10000000, 60000000, teams),
+        "roster_space": rng.integers(1, 6, teams)
+    }
+
+def test_the_market_respects_cap_and_roster_room():
+    market = synthetic_market()
+
+    result = run_market(market, np.random.default_rng(1))
+
+    signed = result["signed_team"] >= 0
+    assert signed.any()
+    for team in range(len(market["cap_space"])):
+        mine = result["signed_team"] == team
+        assert mine.sum() <= market["roster_space"][team]
+        assert result["signed_salary"][mine].sum() <= market["cap_space"][team]
+    assert (result["signed_salary"][signed] >= VETERAN_MINIMUM_SALARY).all()
+    assert sum(day["signings"] for day in result["daily"]) == signed.sum()
+
+def test_a_seeded_market_is_reproducible():
+    runs = [run_market(synthetic_market(), np.random.default_rng(5)) for _ in range(2)]
+    for key in ("signed_team", "signed_salary", "signed_day"):
+        assert (runs[0][key] == runs[1][key]).all()
+    assert runs[0]["daily"] == runs[1]["daily"]
+
+def test_free_agency_signs_contracts_and_records_former_teams(db):
+    # Player 6's deal ran out last year; the other free agents were never signed
+    contract = db.get(Contract, 6)
+    contract.is_active, contract.end_date = False, datetime(2024, 3, 1)
+    db.get(Player, 6).team_id, db.get(Player, 6).roster_status = None, "free_agent"
+    db.add_all([
+        Player(first_name="Free", last_name=f"Agent{i}", position=position, roster_status="free_agent",
+               overall_rating=75, age=26, years_pro=4, work_ethic=80)
+        for i, position in enumerate(["RB", "WR", "CB", "DE", "LT"])
+    ])
+    db.commit()
+    assert FreeAgencyService(db).load_market()["former_teams"] == {6: 1}
+
+    result = FreeAgencyService(db, seed=3).run_free_agency(2024)
+
+    assert result["free_agents"] == 6
+    assert result["signed"] + result["roster_rejected"] <= 6 and result["signed"] > 0
+    db.expire_all()
+    signings = db.query(FreeAgentSigning).filter(FreeAgentSigning.year == 2024).all()
+    assert len(signings) == result["signed"]
+    for signing in signings:
+        player = db.get(Player, signing.player_id)
+        assert (player.team_id, player.roster_status) == (signing.team_id, "active")
+        new_contract = db.get(Contract, signing.contract_id)
+        assert new_contract.is_active and new_contract.team_id == signing.team_id
+        assert signing.former_team_id == (1 if signing.player_id == 6 else None)
+
+def test_an_empty_market_does_nothing(db):
+    assert FreeAgencyService(db).run_free_agency(2024) == {"year": 2024, "free_agents": 0, "signed": 0, "daily": []}
@@ -0,0 +1,115 @@
+import io
+import orjson
+from sqlalchemy import text
+from app.database.models import Contract, JournalEvent, Player, TeamSalaryCap
+from app.services.import_service import ImportService, MAX_REPORTED_ERRORS
+from app.services.salary_cap_service import SalaryCapService
+
+def ndjson(*rows) -> io.BytesIO:
+    return io.BytesIO(b"".join(orjson.dumps(row) + b"\n" for row in rows))
+
+def player(last_name: str, **values) -> dict:
+    return {"first_name": "Test", "last_name": last_name, "position": "WR", **values}
+
+def test_batch_refused_by_the_database_is_reported_and_skipped(db):
+    db.execute(text(
+        "CREATE TRIGGER refuse_player BEFORE INSERT ON players WHEN NEW.last_name = 'Refused' "
+        "BEGIN SELECT RAISE(ABORT, 'refused'); END"
+    ))
+    db.commit()
+    before = db.query(Player).count()
+
+    report = ImportService(db, batch_size=2).import_rows("players", ndjson(
+        player("First"), player("Refused"), player("Third"), {"id": 5, "age": 31}
+    ))
+
+    assert (report["rows"], report["inserted"], report["updated"], report["rejected"]) == (4, 1, 1, 2)
+    assert [error["line"] for error in report["errors"]] == [1, 2]
+    assert "refused" in report["errors"][0]["errors"][0]
+    db.expire_all()
+    assert db.query(Player).count() == before + 1
+    assert db.query(Player).filter(Player.last_name == "First").count() == 0
+    assert db.get(Player, 5).age == 31
+
+def test_bad_rows_are_reported_by_line_and_skipped(db):
+    source = io.BytesIO(b"\n".join([
+        orjson.dumps(player("Good", age=24)),
+        b"{not json",
+        b"[1, 2]",
+        orjson.dumps(player("Typo", agee=24)),
+        orjson.dumps(player("Old", age="old")),
+        orjson.dumps({"last_name": "Nameless", "position": "WR"}),
+        orjson.dumps(player("Lost", team_id=99)),
+        b"",
+        orjson.dumps(player("Rounded", age=25.0, injury_prone="yes")),
+    ]))
+
+    report = ImportService(db).import_rows("players", source)
+
+    assert (report["rows"], report["inserted"], report["updated"], report["rejected"]) == (8, 2, 0, 6)
+    errors = {error["line"]: error["errors"] for error in report["errors"]}
+    assert errors[2][0].startswith("Invalid JSON")
+    assert errors[3] == ["Expected a JSON object"]
+    assert errors[4] == ["Unknown column: agee"]
+    assert errors[5][0].startswith("age: expected an integer")
+    assert errors[6] == ["first_name is required"]
+    assert errors[7] == ["Team 99 does not exist"]
+    rounded = db.query(Player).filter(Player.last_name == "Rounded").one()
+    assert (rounded.age, rounded.injury_prone) == (25, True)
+
+def test_csv_rows_update_by_id_and_insert_the_rest(db):
+    source = io.BytesIO(
+        b"id,first_name,last_name,position,age\n"
+        b",Csv,Rookie,RB,22\n"
+        b"9001,Csv,Veteran,TE,\n"
+        b"9001,Csv,Veteran,TE,30\n"
+        b"5,,,,33\n"
+    )
+
+    report = ImportService(db, batch_size=2).import_rows("players", source, "csv")
+
+    # Empty cells are missing values, which an update cannot write into NOT NULL columns
+    assert (report["inserted"], report["updated"], report["rejected"]) == (2, 1, 1)
+    assert report["errors"] == [{"line": 5, "errors": [
+        "first_name cannot be empty", "last_name cannot be empty", "position cannot be empty"
+    ]}]
+    assert ImportService(db).import_rows("players", io.BytesIO(b"id,age\n5,33\n"), "csv")["updated"] == 1
+    db.expire_all()
+    assert (db.get(Player, 9001).age, db.get(Player, 5).age, db.get(Player, 5).last_name) == (30, 33, "Jackson")
+    assert db.query(Player).filter(Player.last_name == "Rookie").one().age == 22
+
+def test_contract_imports_refresh_team_cap_totals(db):
+    before = db.query(JournalEvent).count()
+
+    report = ImportService(db).import_rows("contracts", ndjson(
+        {"id": 5, "team_id": 2},
+        {"player_id": 12345, "team_id": 1, "years": 1, "start_date": "2024-03-01", "end_date": "2025-03-01"}
+    ))
+
+    assert (report["updated"], report["rejected"], report["teams_refreshed"]) == (1, 1, 2)
+    assert report["errors"][0]["errors"] == ["Player 12345 does not exist"]
+    year = SalaryCapService(db).current_year
+    totals = SalaryCapService(db).calculate_team_cap_totals([1, 2])
+    for team_id in (1, 2):
+        stored = db.query(TeamSalaryCap).filter(TeamSalaryCap.team_id == team_id, TeamSalaryCap.year == year).one()
+        assert stored.cap_space == totals[team_id]["cap_space"]
+    assert db.query(JournalEvent).filter(JournalEvent.event_type == "import").count() == 2
+    assert db.query(JournalEvent).count() == before + 2
+
+def test_reported_errors_are_capped(db):
+    report = ImportService(db).import_rows("players", ndjson(*[{"age": i} for i in range(MAX_REPORTED_ERRORS + 5)]))
+
+    assert report["rejected"] == MAX_REPORTED_ERRORS + 5
+    assert len(report["errors"]) == MAX_REPORTED_ERRORS
+
+def test_the_import_endpoint(client, league):
+    headers = {"X-League-Id": league}
+    files = {"file": ("players.csv", b"id,age\n5,34\n6,x\n", "text/csv")}
+
+    report = client.post("/api/import/players", files=files, headers=headers).json()
+
+    assert (report["updated"], report["rejected"]) == (1, 1)
+    assert report["errors"][0]["line"] == 3
+    assert client.get("/api/players/5", headers=headers).json()["age"] == 34
+    assert client.post("/api/import/players", files={"file": ("players.xml", b"", "text/xml")}, headers=headers).status_code == 400
+    assert client.post("/api/import/teams?format=csv", files=files, headers=headers).status_code == 400
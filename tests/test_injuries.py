@@ -0,0 +1,62 @@
+import numpy as np
+from app.database.models import Player, PlayerInjury
+from app.services.injury_service import InjuryService, SEASON_WEEKS
+
+def add_injury(db, player_id: int, season: int, week: int, weeks_out: int, is_active: bool = True):
+    return_week = week + weeks_out
+    db.add(PlayerInjury(
+        player_id=player_id, team_id=1, injury_type="ankle", injury_status="out", weeks_out=weeks_out,
+        season=season, week=week, return_season=season, return_week=return_week,
+        return_key=season * 100 + return_week, is_active=is_active
+    ))
+    db.commit()
+
+def test_hazard_rises_with_age_proneness_and_workload():
+    hazard = InjuryService.weekly_hazard(
+        np.array([26.0, 34.0, 26.0, 26.0]), np.array([False, False, True, False]), np.array([1.0, 1.0, 1.0, 2.0])
+    )
+    assert hazard[0] < min(hazard[1:])
+    assert InjuryService.weekly_hazard(np.array([22.0]), np.array([False]), np.array([1.0]))[0] == hazard[0]
+    assert [InjuryService.status_for_weeks(weeks) for weeks in (1, 8, 9)] == ["questionable", "out", "season_ending"]
+
+def test_a_seeded_week_is_reproducible(db):
+    first = InjuryService(db, seed=3).process_week(2030, 1, commit=False)
+    db.rollback()
+    second = InjuryService(db, seed=3).process_week(2030, 1, commit=False)
+    assert first == second
+
+def test_injured_players_recover_when_due(db, monkeypatch):
+    monkeypatch.setattr(InjuryService, "weekly_hazard", staticmethod(lambda ages, prone, exposure: np.zeros(len(ages))))
+    add_injury(db, 5, 2030, 1, 2)
+    db.get(Player, 5).injury_status = "out"
+    db.commit()
+
+    assert InjuryService(db, seed=0).process_week(2030, 2)["recovered"] == 0
+    result = InjuryService(db, seed=0).process_week(2030, 3)
+
+    assert result["recovered"] == 1
+    db.expire_all()
+    assert db.get(Player, 5).injury_status == "healthy"
+    assert not db.query(PlayerInjury).filter(PlayerInjury.player_id == 5, PlayerInjury.week == 1).one().is_active
+
+def test_every_healthy_rostered_player_is_drawn(db, monkeypatch):
+    # Certain injury for everyone: each healthy rostered player gets one, nobody else does
+    monkeypatch.setattr(InjuryService, "weekly_hazard", staticmethod(lambda ages, prone, exposure: np.ones(len(ages))))
+    add_injury(db, 6, 2030, 1, 1, is_active=False)
+    add_injury(db, 6, 2030, 3, 1, is_active=False)
+    healthy = {
+        player.id for player in db.query(Player).filter(
+            Player.team_id.isnot(None), Player.roster_status.in_(["active", "practice_squad"])
+        )
+    }
+
+    result = InjuryService(db, seed=0).process_week(2030, SEASON_WEEKS)
+
+    assert {injury["player_id"] for injury in result["injuries"]} == healthy
+    assert result["newly_injury_prone"] == 1
+    db.expire_all()
+    assert db.get(Player, 6).injury_prone
+    # Anything past the last week heals over the offseason
+    latest = db.query(PlayerInjury).filter(PlayerInjury.week == SEASON_WEEKS)
+    assert {(injury.return_season, injury.return_week) for injury in latest} == {(2031, 1)}
+    assert InjuryService(db, seed=0).process_week(2031, 1)["recovered"] == len(healthy)
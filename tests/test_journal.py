@@ -0,0 +1,96 @@
+import io
+import json
+import pytest
+from app.services.contract_service import ContractService
+from app.services.import_service import ImportService
+from app.services.journal_service import TransactionJournal
+from app.services.offseason_service import OffseasonService
+from app.services.salary_cap_service import SalaryCapService
+
+TEAMS = [1, 2, 5]
+
+@pytest.fixture
+def events(db):
+    """Three committed cap transactions, for teams 1, 5 and 2 in that order; the release also moves its player"""
+    journal = TransactionJournal(db)
+    baseline = journal.latest_offset()
+    contracts = ContractService(db)
+    assert contracts.restructure_contract(5, 5000000)["success"]
+    assert contracts.release_player(3)["success"]
+    assert contracts.restructure_contract(7, 5000000)["success"]
+    return journal.events(after=baseline)
+
+def live_totals(db):
+    totals = SalaryCapService(db).calculate_team_cap_totals(TEAMS)
+    return {team_id: (values["total_cap_used"], values["total_dead_money"]) for team_id, values in totals.items()}
+
+def ledger(db):
+    return {
+        row.team_id: (row.total_cap_used, row.total_dead_money)
+        for row in TransactionJournal(db).get_cap_ledger() if row.team_id in TEAMS
+    }
+
+def test_new_leagues_start_with_a_cap_snapshot(db):
+    events = TransactionJournal(db).events()
+    assert {event.event_type for event in events} == {"cap_snapshot"}
+    assert len(events) == 32
+
+def test_events_are_offsets_in_commit_order(db, events):
+    assert [(event.event_type, event.team_id) for event in events] == [
+        ("restructure", 1), ("roster_move", 5), ("release", 5), ("restructure", 2)
+    ]
+    journal = TransactionJournal(db)
+    assert journal.latest_offset() == events[-1].id
+    assert [event.id for event in journal.events(after=events[1].id)] == [events[2].id, events[3].id]
+
+def test_cap_events_carry_their_change(db, events):
+    release = json.loads(events[2].data)
+    # Contract 3: 20M salary plus 150M of bonus over five years, all of it dead money
+    assert (release["cap_year"], release["cap_change"]) == (
+        2024, {"cap_used": -50000000, "dead_money": 150000000, "contracts": -1}
+    )
+
+def test_catch_up_folds_only_unseen_events(db, events):
+    journal = TransactionJournal(db)
+
+    first = journal.catch_up("team_cap_totals")
+    assert (first["from_offset"], first["offset"]) == (0, events[-1].id)
+    assert journal.catch_up("team_cap_totals")["events_applied"] == 0
+    assert journal.get_consumers() == [{"name": "team_cap_totals", "offset": events[-1].id, "lag": 0}]
+    assert ledger(db) == live_totals(db)
+
+def test_replay_rebuilds_the_view_as_of_an_offset(db, events):
+    journal = TransactionJournal(db)
+    before_release = live_totals(db)
+    contracts = ContractService(db)
+    # Later writes must not leak into a rebuild of an earlier offset
+    assert contracts.release_player(5)["success"]
+
+    result = journal.replay("team_cap_totals", to_offset=events[0].id)
+    assert result["offset"] == events[0].id
+    as_of_first = ledger(db)
+    assert as_of_first[1] == before_release[1]
+    assert as_of_first[5][1] == 0
+
+    journal.replay("team_cap_totals")
+    assert ledger(db) == live_totals(db)
+
+def test_rollover_and_imports_fold_into_the_ledger(db, events):
+    journal = TransactionJournal(db)
+    OffseasonService(db, seed=1).rollover_season()
+    ImportService(db).import_rows("contracts", io.BytesIO(b'{"id": 7, "year_1_salary": 1000000}\n'))
+
+    assert {event.event_type for event in journal.events(after=events[-1].id, limit=10000)} >= {
+        "expiration", "cap_snapshot", "import"
+    }
+    journal.catch_up("team_cap_totals")
+    assert {row.year for row in journal.get_cap_ledger()} == {2025}
+    assert ledger(db) == live_totals(db)
+
+def test_replay_before_the_first_snapshot_is_refused(db):
+    with pytest.raises(ValueError):
+        TransactionJournal(db).replay("team_cap_totals", to_offset=0)
+
+def test_unknown_consumer_is_rejected(db):
+    with pytest.raises(ValueError):
+        TransactionJournal(db).replay("nope")
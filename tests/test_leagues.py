@@ -0,0 +1,58 @@
+import pytest
+from conftest import new_league
+from app.database.connection import current_league, league_pool, league_state
+
+@pytest.fixture
+def leagues():
+    league_ids = [new_league(), new_league()]
+    yield league_ids
+    for league_id in league_ids:
+        league_pool.close(league_id)
+
+def state_of(league_id: str):
+    token = current_league.set(league_id)
+    try:
+        return league_state()
+    finally:
+        current_league.reset(token)
+
+def test_writes_stay_in_their_league(client, leagues):
+    first, second = ({"X-League-Id": league_id} for league_id in leagues)
+    original = client.get("/api/salary-cap/contract/5", headers=second).json()
+
+    response = client.post(
+        "/api/salary-cap/contract/5/restructure", params={"restructure_amount": 5000000}, headers=first
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/salary-cap/contract/5", headers=first).json() != original
+    assert client.get("/api/salary-cap/contract/5", headers=second).json() == original
+    events = client.get("/api/journal/events", headers=second).json()
+    assert {event["event_type"] for event in events} == {"cap_snapshot"}
+
+def test_caches_are_kept_per_league(client, leagues):
+    first, second = ({"X-League-Id": league_id} for league_id in leagues)
+
+    assert client.get("/api/teams/2", headers=first).status_code == 200
+    assert client.get("/api/scouting/team/1/player/7", headers=first).status_code == 200
+    assert client.post("/api/roster/moves", json=[{"type": "move_to_ir", "player_id": 5}], headers=first).json()["valid"]
+
+    assert "/api/teams/2" in state_of(leagues[0])["response_cache"].entries
+    assert "response_cache" not in state_of(leagues[1])
+    assert client.get("/api/scouting/cache", headers=first).json()["cached_reports"] == 1
+    assert client.get("/api/scouting/cache", headers=second).json()["cached_reports"] == 0
+
+    limits = client.get("/api/roster/team/1/limits", headers=second).json()
+    assert limits["statuses"]["injured_reserve"]["count"] == 0
+
+def test_closing_a_league_drops_its_state(client, leagues):
+    headers = {"X-League-Id": leagues[0]}
+    client.get("/api/teams/1", headers=headers)
+    assert state_of(leagues[0])
+
+    assert league_pool.close(leagues[0])
+    assert state_of(leagues[0]) == {}
+
+def test_unknown_and_invalid_leagues_are_refused(client):
+    assert client.get("/api/teams/1", headers={"X-League-Id": "no-such-league"}).status_code == 404
+    assert client.get("/api/teams/1", headers={"X-League-Id": "../etc"}).status_code == 400
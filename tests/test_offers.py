@@ -0,0 +1,55 @@
+from app.database.models import Contract
+from app.services.contract_service import ContractService, OFFER_MAX_YEARS
+from app.services.salary_cap_service import VETERAN_SALARY_ESCALATION
+
+def cheapest(result, target):
+    entry = next(entry for entry in result["targets"] if entry["target"] == target)
+    return min(offer["year_1_cap_hit"] for offer in entry["offers"])
+
+def test_offers_reach_their_target_at_the_lowest_first_year_hit(db):
+    result = ContractService(db).optimize_offer(5, 1, [0.4, 0.5])
+
+    assert [entry["target"] for entry in result["targets"]] == [0.4, 0.5]
+    for entry in result["targets"]:
+        assert entry["reachable"]
+        assert 0 < len(entry["offers"]) <= OFFER_MAX_YEARS
+        hits = [offer["year_1_cap_hit"] for offer in entry["offers"]]
+        assert hits == sorted(hits)
+        for offer in entry["offers"]:
+            assert offer["acceptance_chance"] >= entry["target"] * 100 - 0.05
+            proration = offer["signing_bonus"] // offer["years"]
+            assert offer["cap_hits"] == [
+                int(offer["base_salary"] * VETERAN_SALARY_ESCALATION[year]) + proration
+                for year in range(offer["years"])
+            ]
+            assert offer["total_value"] == offer["base_salary"] * offer["years"] + offer["signing_bonus"]
+    assert cheapest(result, 0.4) <= cheapest(result, 0.5)
+
+def test_unreachable_targets_and_loyalty(db):
+    services = ContractService(db)
+    loyal = services.optimize_offer(5, 1, [0.5, 0.99])
+
+    assert loyal["targets"][1] == {"target": 0.99, "reachable": False, "offers": []}
+    assert loyal["max_acceptance_chance"] <= 95.0
+
+    # Once the deal is gone the player no longer gives the old team a discount
+    db.get(Contract, 5).is_active = False
+    db.commit()
+    open_market = services.optimize_offer(5, 1, [0.5])
+    assert cheapest(loyal, 0.5) < cheapest(open_market, 0.5)
+    assert open_market["market_value"] == loyal["market_value"]
+
+def test_offers_for_other_teams_players_are_refused(db):
+    services = ContractService(db)
+    assert services.optimize_offer(5, 2) == {"error": "Player is under contract with another team"}
+    assert services.optimize_offer(12345, 1) == {"error": "Player not found"}
+
+def test_the_offer_optimizer_endpoint(client, league):
+    headers = {"X-League-Id": league}
+    url = "/api/salary-cap/player/5/offer-optimizer"
+
+    response = client.get(url, params={"team_id": 1, "targets": [0.6, 0.5]}, headers=headers)
+    assert response.status_code == 200
+    assert [entry["target"] for entry in response.json()["targets"]] == [0.5, 0.6]
+    assert client.get(url, params={"team_id": 1, "targets": [1.5]}, headers=headers).status_code == 400
+    assert client.get(url, params={"team_id": 2}, headers=headers).status_code == 400
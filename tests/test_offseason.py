@@ -0,0 +1,79 @@
+import pytest
+from app.database.models import Contract, JournalEvent, Player, SalaryCap
+from app.services.offseason_service import OffseasonService, CAP_GROWTH
+from app.services.salary_cap_service import SalaryCapService
+
+def test_rollover_shifts_columns_and_prorates_the_remaining_bonus(db):
+    result = OffseasonService(db, seed=1).rollover_season()
+
+    assert (result["previous_year"], result["current_year"]) == (2024, 2025)
+    db.expire_all()
+    contract = db.get(Contract, 5)
+    assert (contract.years, contract.signing_bonus) == (4, 148000000)
+    assert (contract.year_1_salary, contract.year_4_salary, contract.year_5_salary) == (32000000, 38000000, 0)
+    # Same yearly proration as before, now over the years left
+    assert SalaryCapService(db).calculate_team_cap_totals([1])[1]["total_cap_used"] == 32000000 + 37000000
+
+    # Deals ending in the new league year expire and their players become free agents
+    assert not db.get(Contract, 6).is_active
+    assert db.get(Player, 6).roster_status == "free_agent"
+
+def test_retirement_charges_the_remaining_bonus_as_dead_money(db):
+    player = db.get(Player, 3)
+    player.age, player.overall_rating = 44, 20
+    db.commit()
+
+    OffseasonService(db, seed=1).rollover_season()
+
+    db.expire_all()
+    assert db.get(Player, 3).roster_status == "retired"
+    contract = db.get(Contract, 3)
+    assert not contract.is_active
+    assert (contract.years, contract.dead_money_year_1) == (4, 120000000)
+    event = db.query(JournalEvent).filter(JournalEvent.event_type == "retirement", JournalEvent.player_id == 3).one()
+    assert (event.team_id, event.contract_id) == (5, 3)
+    assert SalaryCapService(db).calculate_team_cap_totals([5])[5]["total_dead_money"] == 120000000
+
+def test_rollover_opens_the_next_cap_year_and_ages_everyone(db):
+    cap = SalaryCapService(db)
+    ages = dict(db.query(Player.id, Player.age).filter(Player.roster_status != "retired").all())
+
+    OffseasonService(db, seed=1).rollover_season()
+
+    db.expire_all()
+    new_cap = db.query(SalaryCap).filter(SalaryCap.year == 2025).one()
+    assert new_cap.base_cap == int(cap.base_cap * (1 + CAP_GROWTH))
+    assert SalaryCapService(db).current_year == 2025
+    assert {player.id: player.age for player in db.query(Player).filter(Player.id.in_(ages))} == {
+        player_id: (age or 21) + 1 for player_id, age in ages.items()
+    }
+
+def test_young_players_progress_and_veterans_decline(db):
+    young = Player(first_name="Young", last_name="Prospect", position="WR", age=21, years_pro=0,
+                   overall_rating=50, potential=90, work_ethic=90)
+    veteran = Player(first_name="Old", last_name="Hand", position="WR", age=29, years_pro=10,
+                     overall_rating=80, potential=80, work_ethic=50)
+    db.add_all([young, veteran])
+    db.commit()
+
+    OffseasonService(db, seed=2).rollover_season()
+
+    db.refresh(young)
+    db.refresh(veteran)
+    assert young.overall_rating > 55
+    assert young.potential >= young.overall_rating
+    assert veteran.overall_rating < 80 or veteran.roster_status == "retired"
+
+def test_a_failed_rollover_changes_nothing(db, monkeypatch):
+    def fail(self):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(OffseasonService, "_retire_players", fail)
+    ages = dict(db.query(Player.id, Player.age).all())
+
+    with pytest.raises(RuntimeError):
+        OffseasonService(db, seed=1).rollover_season()
+
+    db.expire_all()
+    assert db.query(SalaryCap).filter(SalaryCap.year == 2025).count() == 0
+    assert dict(db.query(Player.id, Player.age).all()) == ages
+    assert db.get(Contract, 6).is_active
@@ -0,0 +1,46 @@
+import pytest
+from app.services.player_service import parse_player_fields
+
+def test_parsing_drops_blanks_and_repeats():
+    assert parse_player_fields(None) is None
+    assert parse_player_fields(" id, name,,id ") == ["id", "name"]
+    with pytest.raises(ValueError, match="Unknown player fields: salary"):
+        parse_player_fields("id,salary")
+
+def test_sparse_fields_match_the_full_response(client, league):
+    headers = {"X-League-Id": league}
+    fields = ["id", "name", "team", "ratings", "status", "position"]
+
+    full = client.get("/api/players/5", headers=headers).json()
+    sparse = client.get("/api/players/5", params={"fields": ",".join(fields)}, headers=headers).json()
+
+    assert list(sparse) == fields
+    assert sparse["name"] == f"{full['first_name']} {full['last_name']}"
+    for field in ("id", "team", "ratings", "status", "position"):
+        assert sparse[field] == full[field]
+    assert client.get("/api/players/12345", params={"fields": "id"}, headers=headers).status_code == 404
+
+def test_sparse_lists_keep_filters_order_and_paging(client, league):
+    headers = {"X-League-Id": league}
+
+    listed = client.get("/api/players/", params={"position": "qb", "limit": 3, "offset": 1}, headers=headers).json()
+    sparse = client.get("/api/players/", params={"position": "qb", "limit": 3, "offset": 1, "fields": "id"},
+                        headers=headers).json()
+    assert sparse == [{"id": player["id"]} for player in listed]
+
+    top = client.get("/api/players/positions/qb/top", params={"limit": 2, "fields": "id,overall_rating"}, headers=headers).json()
+    assert top == [{"id": 1, "overall_rating": 95}, {"id": 5, "overall_rating": 91}]
+
+    roster = client.get("/api/teams/1/roster", params={"fields": "id,team"}, headers=headers).json()
+    assert roster["team"]["id"] == 1
+    assert sorted(roster["roster"], key=lambda player: player["id"]) == [
+        {"id": 5, "team": roster["team"]["name"]}, {"id": 6, "team": roster["team"]["name"]}
+    ]
+
+def test_unknown_fields_are_a_bad_request(client, league):
+    headers = {"X-League-Id": league}
+    for url in ("/api/players/", "/api/players/5", "/api/players/search/a", "/api/players/positions/qb/top",
+                "/api/teams/1/roster"):
+        response = client.get(url, params={"fields": "id,salary"}, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Unknown player fields: salary")
@@ -0,0 +1,90 @@
+from app.services.response_cache import ResponseCache, LEAGUE_TAG, etag_matches, response_cache
+
+def fill(cache: ResponseCache):
+    for key, tags in [
+        ("/api/teams/1", ["team:1"]),
+        ("/api/teams/2", ["team:2"]),
+        ("/api/salary-cap/player/5/contract", ["player:5"]),
+        ("/api/salary-cap/contract/7", ["contract:7"]),
+        ("/api/salary-cap/league/overview", [LEAGUE_TAG])
+    ]:
+        cache.put(key, b"{}", b"application/json", tags, cache.generation)
+
+def test_invalidate_drops_only_tagged_entries():
+    cache = ResponseCache()
+    fill(cache)
+
+    assert cache.invalidate(team_ids=[1]) == 1
+    assert set(cache.entries) == {
+        "/api/teams/2", "/api/salary-cap/player/5/contract",
+        "/api/salary-cap/contract/7", "/api/salary-cap/league/overview"
+    }
+
+    assert cache.invalidate(player_ids=[5], contract_ids=[7]) == 2
+    assert set(cache.entries) == {"/api/teams/2", "/api/salary-cap/league/overview"}
+
+def test_league_views_only_dropped_for_league_writes():
+    cache = ResponseCache()
+    fill(cache)
+
+    cache.invalidate(team_ids=[3], player_ids=[99])
+    assert "/api/salary-cap/league/overview" in cache.entries
+
+    assert cache.invalidate(team_ids=[2], league=True) == 2
+    assert "/api/salary-cap/league/overview" not in cache.entries
+    assert "/api/teams/1" in cache.entries
+
+def test_response_computed_across_an_invalidation_is_not_stored():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate(team_ids=[1])
+
+    cache.put("/api/teams/1", b"{}", b"application/json", ["team:1"], generation)
+    assert cache.get("/api/teams/1") is None
+
+def test_roster_move_keeps_league_views_cached(client, league):
+    headers = {"X-League-Id": league}
+    for url in ["/api/teams/1", "/api/teams/2", "/api/salary-cap/league/overview"]:
+        assert client.get(url, headers=headers).status_code == 200
+
+    response = client.post("/api/roster/moves", json=[{"type": "demote", "player_id": 6}], headers=headers)
+    assert response.json()["valid"]
+    assert set(response_cache.current().entries) == {"/api/teams/2", "/api/salary-cap/league/overview"}
+
+def test_contract_write_drops_league_views(client, league):
+    headers = {"X-League-Id": league}
+    for url in ["/api/teams/1", "/api/teams/2", "/api/salary-cap/league/overview"]:
+        assert client.get(url, headers=headers).status_code == 200
+
+    response = client.post(
+        "/api/salary-cap/contract/5/restructure", params={"restructure_amount": 5000000}, headers=headers
+    )
+    assert response.status_code == 200
+    assert set(response_cache.current().entries) == {"/api/teams/2"}
+
+def test_if_none_match_uses_weak_comparison():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches("", etag)
+
+def test_conditional_get_is_revalidated_until_a_write(client, league):
+    headers = {"X-League-Id": league}
+    first = client.get("/api/teams/1", headers=headers)
+    etag = first.headers["etag"]
+
+    for if_none_match in [etag, f"W/{etag}", f'"stale", {etag}', "*"]:
+        response = client.get("/api/teams/1", headers={**headers, "If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    response = client.post("/api/roster/moves", json=[{"type": "move_to_ir", "player_id": 5}], headers=headers)
+    assert response.json()["valid"]
+
+    response = client.get("/api/teams/1", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["roster_count"] != first.json()["roster_count"]
@@ -0,0 +1,48 @@
+from fastapi.routing import APIRoute
+from app.api.schemas import PlayerListItem
+from app.benchmarks import parse_args, run_serialization_benchmark
+from app.database.models import Player
+
+def test_player_rows_combine_the_name():
+    player = Player(id=1, first_name="Joe", last_name="Burrow", position="QB", overall_rating=90)
+
+    row = PlayerListItem.model_validate(player, from_attributes=True).model_dump()
+
+    assert row == {"id": 1, "position": "QB", "jersey_number": None, "age": None, "overall_rating": 90,
+                   "team_id": None, "roster_status": None, "name": "Joe Burrow"}
+
+def test_player_lists_keep_their_shape(client, league, db):
+    headers = {"X-League-Id": league}
+
+    players = client.get("/api/players/", params={"team_id": 1}, headers=headers).json()
+
+    assert players == [
+        {
+            "id": player.id, "position": player.position, "jersey_number": player.jersey_number, "age": player.age,
+            "overall_rating": player.overall_rating, "team_id": player.team_id,
+            "roster_status": player.roster_status, "name": f"{player.first_name} {player.last_name}"
+        }
+        for player in db.query(Player).filter(Player.team_id == 1)
+    ]
+    assert client.get("/api/players/", headers=headers).headers["content-type"] == "application/json"
+
+def test_error_dicts_pass_through_the_union_models(client, league):
+    response = client.get("/api/salary-cap/contract/12345", headers={"X-League-Id": league})
+    assert response.status_code == 200
+    assert list(response.json()) == ["error"]
+
+def test_every_json_route_declares_its_model():
+    from app.main import app
+
+    untyped = [
+        route.path for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith("/api") and route.response_model is None
+    ]
+    # Table exports stream rows rather than return a document
+    assert untyped == ["/api/export/{table}"]
+
+def test_the_serialization_paths_encode_the_same_body():
+    results = run_serialization_benchmark(parse_args(["serialization", "--players", "200", "--runs", "1"]))
+
+    assert {result["variant"] for result in results} == {"dict", "model", "model_json"}
+    assert len({result["bytes"] for result in results}) == 1
@@ -0,0 +1,139 @@
+from app.database.models import Contract, Player
+from app.services.contract_service import ContractService
+from app.services.roster_service import RosterService, PRACTICE_SQUAD_LIMIT
+
+def add_players(db, count: int, position: str, status: str, team_id: int = 1):
+    players = [
+        Player(first_name="Test", last_name=f"{position}{i}", position=position, team_id=team_id, roster_status=status)
+        for i in range(count)
+    ]
+    db.add_all(players)
+    db.commit()
+    return [player.id for player in players]
+
+def error_codes(result):
+    return [[error["code"] for error in move["errors"]] for move in result["results"]]
+
+def test_full_practice_squad_rejects_demotion(db):
+    add_players(db, PRACTICE_SQUAD_LIMIT, "WR", "practice_squad")
+
+    result = RosterService(db).validate_moves([{"type": "demote", "player_id": 6}])
+
+    assert not result["valid"]
+    error = result["results"][0]["errors"][0]
+    assert error["code"] == "practice_squad_limit"
+    assert (error["team_id"], error["limit"], error["current"]) == (1, PRACTICE_SQUAD_LIMIT, PRACTICE_SQUAD_LIMIT)
+
+def test_position_limit_counts_earlier_moves_in_the_batch(db):
+    # Player 5 plus three more fills the four active QB spots
+    active = add_players(db, 3, "QB", "active")
+    backup = add_players(db, 1, "QB", "practice_squad")[0]
+    roster = RosterService(db)
+
+    result = roster.validate_moves([{"type": "promote", "player_id": backup}])
+    assert error_codes(result) == [["position_limit"]]
+
+    result = roster.validate_moves([
+        {"type": "demote", "player_id": active[0]},
+        {"type": "promote", "player_id": backup}
+    ])
+    assert result["valid"]
+
+def test_dry_run_leaves_counters_unchanged(db):
+    roster = RosterService(db)
+    before = roster.get_team_limits(1)
+
+    result = roster.validate_moves([{"type": "move_to_ir", "player_id": 5}, {"type": "move_to_ir", "player_id": 6}])
+
+    assert result["valid"]
+    assert roster.get_team_limits(1) == before
+    assert not roster.pending
+
+def test_status_and_team_errors(db):
+    result = RosterService(db).validate_moves([
+        {"type": "promote", "player_id": 5},
+        {"type": "demote", "player_id": 5, "team_id": 2},
+        {"type": "demote", "player_id": 12345},
+        {"type": "trade", "player_id": 5}
+    ])
+
+    assert error_codes(result) == [["invalid_status"], ["wrong_team"], ["player_not_found"], ["unknown_move"]]
+    assert result["rejected"] == 4
+
+def test_contract_moves_are_refused_without_contracts(db):
+    free_agent = add_players(db, 1, "RB", "free_agent", team_id=None)[0]
+
+    result = RosterService(db).validate_moves([
+        {"type": "sign", "player_id": free_agent, "team_id": 1},
+        {"type": "release", "player_id": 6}
+    ])
+    assert error_codes(result) == [["contract_move"], ["contract_move"]]
+
+    assert RosterService(db, contract_moves=True).validate_moves([
+        {"type": "sign", "player_id": free_agent, "team_id": 1}
+    ])["valid"]
+
+def test_rejected_batch_writes_nothing(db):
+    add_players(db, PRACTICE_SQUAD_LIMIT, "WR", "practice_squad")
+
+    result = RosterService(db).execute_moves([
+        {"type": "move_to_ir", "player_id": 5},
+        {"type": "demote", "player_id": 6}
+    ])
+
+    assert not result["valid"]
+    db.expire_all()
+    assert db.get(Player, 5).roster_status == "active"
+
+def test_applied_moves_update_the_shared_counters(db):
+    roster = RosterService(db)
+    assert roster.execute_moves([{"type": "move_to_ir", "player_id": 5}])["valid"]
+
+    db.expire_all()
+    assert db.get(Player, 5).roster_status == "injured_reserve"
+    later = RosterService(db)
+    assert later.counters is roster.counters
+    limits = later.get_team_limits(1)
+    assert limits["statuses"]["injured_reserve"]["count"] == 1
+    assert limits["statuses"]["active"]["count"] == 1
+    assert limits["positions"]["QB"]["count"] == 0
+
+def test_roster_api_signs_and_releases_through_contracts(client, league, db):
+    free_agent = add_players(db, 1, "RB", "free_agent", team_id=None)[0]
+    headers = {"X-League-Id": league}
+
+    response = client.post("/api/roster/moves", json=[
+        {"type": "sign", "player_id": free_agent, "team_id": 1, "base_salary": 2000000, "years": 2},
+        {"type": "release", "player_id": 6}
+    ], headers=headers)
+
+    assert response.json()["valid"]
+    db.expire_all()
+    signed = db.query(Contract).filter(Contract.player_id == free_agent, Contract.is_active == True).one()
+    assert (signed.team_id, signed.year_1_salary, signed.years) == (1, 2000000, 2)
+    released = db.get(Contract, 6)
+    assert not released.is_active and released.dead_money_year_1 == 15000000
+    assert (db.get(Player, free_agent).team_id, db.get(Player, 6).roster_status) == (1, "free_agent")
+    limits = client.get("/api/roster/team/1/limits", headers=headers).json()
+    assert limits["positions"]["RB"]["count"] == 1
+    assert limits["positions"]["TE"]["count"] == 0
+
+def test_contract_signings_respect_roster_limits(db):
+    add_players(db, 3, "QB", "active")
+    free_agent = add_players(db, 1, "QB", "free_agent", team_id=None)[0]
+    contracts = ContractService(db)
+
+    assert "active players at QB" in contracts.franchise_tag_player(free_agent, 1)["error"]
+    assert "active players at QB" in contracts.negotiate_contract_extension(free_agent, 1, 1000000, 1)["error"]
+    assert db.query(Contract).filter(Contract.player_id == free_agent).count() == 0
+
+def test_failed_contract_batch_restores_the_counters(db):
+    before = RosterService(db).get_team_limits(1)
+
+    result = ContractService(db).execute_transactions([
+        {"type": "release", "contract_id": 6},
+        {"type": "release", "contract_id": 999}
+    ])
+
+    assert not result["success"]
+    assert RosterService(db).get_team_limits(1) == before
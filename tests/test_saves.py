@@ -0,0 +1,80 @@
+from app.database.connection import current_league, league_pool, session_factory
+from app.database.models import Contract
+from app.services.save_service import SaveService
+
+def state_of(league_id: str):
+    token = current_league.set(league_id)
+    try:
+        return league_pool.get(league_id).state
+    finally:
+        current_league.reset(token)
+
+def latest_offset(client, headers):
+    events = client.get("/api/journal/events", params={"limit": 10000}, headers=headers).json()
+    return max(event["id"] for event in events)
+
+def test_load_restores_the_saved_league(client, league):
+    headers = {"X-League-Id": league}
+    saved_contract = client.get("/api/salary-cap/contract/5", headers=headers).json()
+    saved_team = client.get("/api/teams/1", headers=headers).json()
+    saved = client.post("/api/saves/before", headers=headers).json()
+
+    # Change the league after the save and warm every cache on the changed state
+    assert client.post(
+        "/api/salary-cap/contract/5/restructure", params={"restructure_amount": 5000000}, headers=headers
+    ).status_code == 200
+    assert client.post("/api/roster/moves", json=[{"type": "move_to_ir", "player_id": 6}], headers=headers).json()["valid"]
+    assert client.get("/api/salary-cap/contract/5", headers=headers).json() != saved_contract
+    assert client.get("/api/teams/1", headers=headers).json() != saved_team
+    assert latest_offset(client, headers) > saved["journal_offset"]
+    stale_session = session_factory()()
+    assert stale_session.get(Contract, 5).year_1_salary == 25000000
+
+    response = client.post("/api/saves/before/load", headers=headers)
+    assert response.status_code == 200
+    assert latest_offset(client, headers) == saved["journal_offset"]
+
+    # The pooled engine and the league's caches were replaced
+    assert "response_cache" not in state_of(league)
+    assert "roster_counters" not in state_of(league)
+    assert client.get("/api/salary-cap/contract/5", headers=headers).json() == saved_contract
+    assert client.get("/api/teams/1", headers=headers).json() == saved_team
+    limits = client.get("/api/roster/team/1/limits", headers=headers).json()
+    assert limits["statuses"]["injured_reserve"]["count"] == 0
+    fresh_session = session_factory()()
+    try:
+        assert fresh_session.get(Contract, 5).year_1_salary == 30000000
+    finally:
+        fresh_session.close()
+        stale_session.close()
+
+def test_compressed_slots_load_like_plain_ones(db, league):
+    saves = SaveService()
+    saves.save("first")
+    contract = db.get(Contract, 7)
+    contract.year_1_salary = 1
+    db.commit()
+    saves.save("second")
+
+    assert saves.compress_old_slots(keep=0) == ["second", "first"]
+    assert all(slot["compressed"] for slot in saves.list_slots())
+
+    saves.load("first")
+    assert not saves.get_slot("first")["compressed"]
+    session = session_factory()()
+    try:
+        assert session.get(Contract, 7).year_1_salary != 1
+    finally:
+        session.close()
+    assert saves.list_slots()[0]["name"] == "first"
+
+def test_slot_names_and_overwrites_are_checked(client, league):
+    headers = {"X-League-Id": league}
+    assert client.post("/api/saves/slot", headers=headers).status_code == 200
+    assert client.post("/api/saves/slot", headers=headers).status_code == 400
+    assert client.post("/api/saves/slot", params={"overwrite": True}, headers=headers).status_code == 200
+    assert client.post("/api/saves/..%2Fescape", headers=headers).status_code in (400, 404)
+    assert client.post("/api/saves/missing/load", headers=headers).status_code == 404
+    assert [slot["name"] for slot in client.get("/api/saves/", headers=headers).json()] == ["slot"]
+    assert client.delete("/api/saves/slot", headers=headers).status_code == 200
+    assert client.get("/api/saves/", headers=headers).json() == []
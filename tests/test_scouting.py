@@ -0,0 +1,53 @@
+from app.database.models import Player
+from app.services.draft_class_service import DraftClassService
+from app.services.scouting_service import ScoutingService, SCOUTED_ATTRIBUTES
+
+def width(report, attribute="overall_rating"):
+    return report["attributes"][attribute]["high"] - report["attributes"][attribute]["low"]
+
+def test_teams_see_their_own_players_exactly(db):
+    report = ScoutingService(db).get_report(1, 5)
+    player = db.get(Player, 5)
+
+    assert report["confidence"] == 1.0
+    for name in SCOUTED_ATTRIBUTES:
+        value = getattr(player, name) or 50
+        assert report["attributes"][name] == {"estimate": value, "low": value, "high": value}
+
+def test_other_teams_get_a_stable_noisy_view(db):
+    scouting = ScoutingService(db)
+    report = scouting.get_report(2, 5)
+
+    assert report["confidence"] < 1.0
+    assert width(report) > 0 and width(report, "potential") > width(report)
+    # Generated once and served from the cache after that
+    assert scouting.get_report(2, 5) is report
+    ScoutingService.clear_cache()
+    assert scouting.get_report(2, 5) == report
+    views = [scouting.get_report(team_id, 5)["attributes"] for team_id in range(2, 12)]
+    assert len({str(view) for view in views}) > 1
+
+def test_scouting_time_narrows_the_report(db):
+    scouting = ScoutingService(db)
+    before = scouting.get_report(2, 5)
+
+    assert scouting.add_scouting_time(2, 5, 24)["hours"] == 24
+    assert scouting.add_scouting_time(2, 5, 24)["hours"] == 48
+    after = scouting.get_report(2, 5)
+
+    assert after is not before
+    assert after["confidence"] > before["confidence"]
+    assert width(after) <= width(before)
+    assert scouting.add_scouting_time(2, 12345, 1) == {"error": "Player not found"}
+
+def test_draft_board_ranks_by_the_team_s_own_grades(db):
+    DraftClassService(db, seed=1).generate_class(2025, size=60)
+    scouting = ScoutingService(db)
+
+    board = scouting.get_draft_board(3, 2025, limit=40)
+
+    assert len(board) == 40
+    assert [report["grade"] for report in board] == sorted((report["grade"] for report in board), reverse=True)
+    assert ScoutingService.get_cache_info()["reports_by_team"] == {3: 40}
+    ScoutingService.clear_cache(3)
+    assert ScoutingService.get_cache_info()["cached_reports"] == 0
@@ -0,0 +1,53 @@
+from app.database.models import Game
+from app.services.stats_service import StatsService
+
+def add_game(db, season: int = 2030, week: int = 1):
+    game = Game(season=season, week=week, home_team_id=1, away_team_id=2, is_final=True)
+    db.add(game)
+    db.commit()
+    return game
+
+def qb_line(yards: int, tds: int = 0):
+    return {5: {"team_id": 1, "position": "QB", "stats": {"games_played": 1, "passing_yards": yards, "passing_tds": tds}}}
+
+def team_lines(points: int):
+    return {1: {"games_played": 1, "wins": 1, "points_for": points}, 2: {"games_played": 1, "losses": 1, "points_against": points}}
+
+def test_re_recording_a_game_applies_only_the_difference(db):
+    stats = StatsService(db)
+    game = add_game(db)
+    stats.record_game(game, qb_line(300, 2), team_lines(24))
+
+    result = stats.record_game(game, qb_line(250, 2), team_lines(24))
+    assert (result["player_rows_changed"], result["team_rows_changed"]) == (1, 0)
+    assert stats.record_game(game, qb_line(250, 2), team_lines(24))["player_rows_changed"] == 0
+
+    player = stats.get_player_stats(5)
+    assert player["seasons"][0]["stats"] == {"games_played": 1, "passing_yards": 250, "passing_tds": 2}
+    assert player["career"] == player["seasons"][0]["stats"]
+    assert stats.get_team_stats(1, 2030)["stats"] == {"games_played": 1, "wins": 1, "points_for": 24}
+
+def test_stats_dropped_on_a_re_record_leave_the_totals(db):
+    stats = StatsService(db)
+    game = add_game(db)
+    stats.record_game(game, qb_line(300, 2), team_lines(24))
+
+    stats.record_game(game, qb_line(300), team_lines(24))
+
+    assert stats.get_player_stats(5)["career"]["passing_tds"] == 0
+    box_score = stats.get_game_box_score(game.id)
+    assert box_score["players"] == [{"player_id": 5, "team_id": 1, "stats": {"games_played": 1, "passing_yards": 300}}]
+
+def test_seasons_roll_up_into_careers_and_leaders(db):
+    stats = StatsService(db)
+    stats.record_game(add_game(db, 2030, 1), qb_line(300), team_lines(24))
+    stats.record_game(add_game(db, 2030, 2), qb_line(200), team_lines(17))
+    stats.record_game(add_game(db, 2031, 1), qb_line(100), team_lines(3))
+
+    seasons = stats.get_player_stats(5)["seasons"]
+    assert [(season["season"], season["stats"]["passing_yards"]) for season in seasons] == [(2030, 500), (2031, 100)]
+    assert stats.get_player_stats(5)["career"]["games_played"] == 3
+    assert stats.get_player_leaders("passing_yards", season=2031)[0]["value"] == 100
+    assert stats.get_player_leaders("passing_yards", position="qb")[0]["value"] == 600
+    assert stats.get_team_stats(1)["stats"]["points_for"] == 44
+    assert [row["team_id"] for row in stats.get_team_leaders("points_against", 2030)] == [2]
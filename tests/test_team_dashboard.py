@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.database.models import Player
+
+@contextmanager
+def count_queries():
+    queries = []
+    listener = lambda conn, cursor, statement, *args: queries.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        yield queries
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+
+def test_the_dashboard_matches_the_separate_endpoints(client, league):
+    headers = {"X-League-Id": league}
+    with count_queries() as dashboard_queries:
+        dashboard = client.get("/api/teams/1/dashboard", headers=headers).json()
+    with count_queries() as separate_queries:
+        team = client.get("/api/teams/1", headers=headers).json()
+        roster = client.get("/api/teams/1/roster", headers=headers).json()
+        cap = client.get("/api/salary-cap/team/1", headers=headers).json()
+
+    colors = dashboard["team"].pop("colors")
+    assert dashboard["team"] == team
+    assert colors == next(t["colors"] for t in client.get("/api/teams/", headers=headers).json() if t["id"] == 1)
+    assert dashboard["roster"] == roster["roster"]
+    assert dashboard["salary_cap"] == cap
+    assert 0 < len(dashboard_queries) < len(separate_queries)
+
+def test_the_dashboard_roster_follows_the_status(client, league, db):
+    headers = {"X-League-Id": league}
+    db.get(Player, 5).roster_status = "injured_reserve"
+    db.commit()
+
+    dashboard = client.get("/api/teams/1/dashboard", params={"status": "injured_reserve"}, headers=headers).json()
+
+    assert [player["id"] for player in dashboard["roster"]] == [5]
+    assert dashboard["team"]["roster_count"] == 1
+    assert client.get("/api/teams/99/dashboard", headers=headers).status_code == 404
@@ -0,0 +1,63 @@
+import pytest
+from app.database.models import Player
+from app.services.trade_service import TradeService, DEFAULT_VALUE_TOLERANCE, MAX_PLAYERS_IN_TRADE
+
+def add_players(db, team_id: int, position: str, ratings):
+    players = [
+        Player(first_name="Trade", last_name=f"{position}{i}", position=position, team_id=team_id,
+               roster_status="active", overall_rating=rating, age=26, years_pro=4)
+        for i, rating in enumerate(ratings)
+    ]
+    db.add_all(players)
+    db.commit()
+    return [player.id for player in players]
+
+@pytest.fixture
+def surpluses(db):
+    """Team 1 is deep at QB with no receivers; team 3 is deep at WR with no quarterback"""
+    quarterbacks = add_players(db, 1, "QB", [80, 78])
+    receivers = add_players(db, 3, "WR", [82, 80, 78, 76, 75, 74, 73])
+    return quarterbacks, receivers
+
+def test_proposals_balance_value_and_help_both_sides(db, surpluses):
+    result = TradeService(db).find_trades(1, limit=20)
+
+    assert result["proposals"]
+    assert any(proposal["partner_team_id"] == 3 for proposal in result["proposals"])
+    for proposal in result["proposals"]:
+        given, received = proposal["value_given"], proposal["value_received"]
+        assert abs(given - received) <= DEFAULT_VALUE_TOLERANCE * max(given, received) + 1
+        assert proposal["team_need_improvement"] > 0 and proposal["partner_need_improvement"] > 0
+        assert proposal["team_cap_space_after"] >= 0 and proposal["partner_cap_space_after"] >= 0
+        assert len(proposal["team_gives"]) + len(proposal["team_receives"]) <= MAX_PLAYERS_IN_TRADE
+    scores = [proposal["score"] for proposal in result["proposals"]]
+    assert scores == sorted(scores, reverse=True)
+
+def test_pruning_keeps_the_best_proposal(db, surpluses):
+    trades = TradeService(db)
+    full = trades.find_trades(1, limit=50)
+    top = trades.find_trades(1, limit=1)
+
+    assert top["proposals"][0]["score"] == full["proposals"][0]["score"]
+    assert top["packages_evaluated"] <= full["packages_evaluated"]
+
+def test_targets_narrow_the_search(db, surpluses):
+    _, receivers = surpluses
+    trades = TradeService(db)
+
+    targeted = trades.find_trades(1, target_player_id=receivers[0])
+    assert targeted["partners_searched"] == 1
+    assert targeted["proposals"]
+    for proposal in targeted["proposals"]:
+        assert receivers[0] in [player["player_id"] for player in proposal["team_receives"]]
+
+    by_position = trades.find_trades(1, target_position="wr")
+    for proposal in by_position["proposals"]:
+        assert "WR" in [player["position"] for player in proposal["team_receives"]]
+
+def test_invalid_targets_are_reported(db, surpluses):
+    quarterbacks, _ = surpluses
+    trades = TradeService(db)
+    assert trades.find_trades(1, target_player_id=quarterbacks[0]) == {"error": "Target player is already on this team"}
+    assert trades.find_trades(1, target_player_id=12345)["error"] == "Target player is not on an active roster"
+    assert trades.find_trades(99)["error"] == "Team not found"